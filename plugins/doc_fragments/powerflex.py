@@ -50,6 +50,105 @@ class ModuleDocFragment(object):
             type: int
             required: false
             default: 120
+        session_cache:
+            description:
+            - Whether to reuse the PowerFlex gateway session across tasks.
+            - C(true) - The token obtained at login is cached on disk and
+              reused by later tasks with the same I(hostname), I(port) and
+              I(username) until I(session_cache_ttl) expires or the gateway
+              rejects it.
+            - C(false) - Every task logs in to the gateway.
+            type: bool
+            required: false
+            default: false
+        session_cache_ttl:
+            description:
+            - Number of seconds a cached session is reused.
+            - Applicable only when I(session_cache) is C(true).
+            type: int
+            required: false
+            default: 240
+        session_cache_dir:
+            description:
+            - Directory in which the session cache files are stored.
+            - Defaults to C(~/.ansible/tmp/powerflex_sessions).
+            - The directory is created with C(0700) and the cache files with
+              C(0600) permissions.
+            type: path
+            required: false
+        lookup_cache:
+            description:
+            - Whether to list the protection domains, storage pools, fault
+              sets, snapshot policies, SDCs and device groups the module looks
+              objects up in only once per task.
+            - C(true) - Lookups by name or id are served from the listed
+              objects. Any change the module makes to an object drops the
+              listed objects of its type.
+            - C(false) - Every lookup queries the gateway.
+            - Lookups are always served this way when I(object_cache) is
+              C(true).
+            type: bool
+            required: false
+            default: false
+        object_cache:
+            description:
+            - Whether to share the lists of protection domains, storage
+              pools, fault sets, snapshot policies, SDCs and device groups
+              the module looks objects up in with later tasks.
+            - C(true) - The lists are cached on disk per I(hostname),
+              I(port) and I(username) and reused until I(object_cache_ttl)
+              expires. Any change a module of the collection makes to an
+              object drops the cached list of its type.
+            - C(false) - Every task lists the objects it looks up.
+            - Changes made outside of the collection are only seen once the
+              cached list expired.
+            type: bool
+            required: false
+            default: false
+        object_cache_ttl:
+            description:
+            - Number of seconds a cached object list is reused.
+            - Applicable only when I(object_cache) is C(true).
+            type: int
+            required: false
+            default: 300
+        object_cache_max_entries:
+            description:
+            - Maximum number of object lists kept in I(object_cache_dir).
+            - The least recently used lists are evicted first.
+            - Applicable only when I(object_cache) is C(true).
+            type: int
+            required: false
+            default: 64
+        object_cache_dir:
+            description:
+            - Directory in which the object cache files are stored.
+            - Defaults to C(~/.ansible/tmp/powerflex_objects).
+            - The directory is created with C(0700) and the cache files with
+              C(0600) permissions.
+            type: path
+            required: false
+        timings:
+            description:
+            - Whether to return the timing of the REST requests sent to the
+              gateway in the C(_timings) key of the module result.
+            - The number of requests, seconds and response bytes are
+              summarized in total, per phase (C(login), C(read) and
+              C(write)) and per method and endpoint, with object ids
+              replaced by C({id}).
+            type: bool
+            required: false
+            default: false
+        trace_file:
+            description:
+            - Path of a file the REST requests sent to the gateway are
+              appended to as OpenTelemetry spans when the module exits.
+            - Each module run is written as one line holding OTLP JSON trace
+              data, with a span per request as child of a span covering the
+              module run.
+            - The file is written on the host running the module.
+            type: path
+            required: false
     requirements:
       - A Dell PowerFlex storage system version 3.6 or later.
       - PyPowerFlex 2.0.0.
@@ -57,3 +156,29 @@ class ModuleDocFragment(object):
       - The modules present in the collection named as 'dellemc.powerflex'
         are built to support the Dell PowerFlex storage platform.
 '''
+
+    # Documentation fragment for the modules waiting for long running
+    # operations
+    WAIT = r'''
+    options:
+        wait:
+            description:
+            - Whether to wait for the long running operation started by the
+              task to complete before returning.
+            - The progress is polled in the module with the session of the
+              task, the delay between two polls starting at 2 seconds and
+              doubling up to 30 seconds while the progress does not change.
+            - The history of the progress is returned in C(wait_details).
+            - Not applicable in check mode.
+            type: bool
+            required: false
+            default: false
+        wait_timeout:
+            description:
+            - Maximum number of seconds to wait for the operation to
+              complete.
+            - Applicable only when I(wait) is C(true).
+            type: int
+            required: false
+            default: 3600
+'''
@@ -0,0 +1,333 @@
+# Copyright: (c) 2026, Dell Technologies
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible inventory plugin building hosts from the topology of Dell Technologies (Dell) PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+name: powerflex
+version_added: '3.1.0'
+short_description: PowerFlex topology inventory source
+description:
+- Builds hosts from the SDSs, SDCs, MDMs and SDTs of a PowerFlex storage
+  system, each listed with a single gateway query.
+- Hosts are grouped by role, protection domain and fault set, and get the
+  key attributes of their PowerFlex objects as host variables.
+- The topology can be kept in the Ansible inventory cache, so that warm
+  runs do not query the gateway until I(cache_timeout) expires.
+- The configuration file name must end with C(powerflex.yml) or
+  C(powerflex.yaml).
+author:
+- Dell Technologies (@dellemc) <ansible.team@dell.com>
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description:
+    - Name of the plugin.
+    required: true
+    type: str
+    choices: ['dellemc.powerflex.powerflex']
+  hostname:
+    description:
+    - IP or FQDN of the PowerFlex gateway.
+    required: true
+    type: str
+    aliases:
+    - gateway_host
+    env:
+    - name: POWERFLEX_HOSTNAME
+  username:
+    description:
+    - The username of the PowerFlex gateway.
+    required: true
+    type: str
+    env:
+    - name: POWERFLEX_USERNAME
+  password:
+    description:
+    - The password of the PowerFlex gateway.
+    required: true
+    type: str
+    env:
+    - name: POWERFLEX_PASSWORD
+  validate_certs:
+    description:
+    - Whether or not to validate the SSL certificate of the gateway.
+    type: bool
+    default: true
+    aliases:
+    - verifycert
+    env:
+    - name: POWERFLEX_VALIDATE_CERTS
+  port:
+    description:
+    - Port number of the PowerFlex gateway.
+    type: int
+    default: 443
+  timeout:
+    description:
+    - Time in seconds after which the connection gets terminated.
+    type: int
+    default: 120
+  entities:
+    description:
+    - Types of PowerFlex objects added as hosts.
+    - C(sdt) requires PowerFlex 4.5 or later.
+    type: list
+    elements: str
+    choices: ['sds', 'sdc', 'mdm', 'sdt']
+    default: ['sds', 'sdc', 'mdm']
+  hostnames:
+    description:
+    - Attribute the hosts are named after.
+    - C(name) - The name of the object, its first IP if it has no name.
+    - C(ip) - The first IP of the object.
+    - Objects of different types with the same host name are merged into
+      one host.
+    type: str
+    choices: ['name', 'ip']
+    default: name
+  group_prefix:
+    description:
+    - Prefix of the names of the groups created by the plugin.
+    type: str
+    default: powerflex_
+notes:
+  - The plugin requires PyPowerFlex on the host running Ansible.
+  - Groups are named C(<group_prefix><role>) for the roles C(sds), C(sdc),
+    C(mdm) and C(sdt), C(<group_prefix>mdm_<mdm role>) for the MDM roles
+    C(primary), C(secondary), C(tiebreaker) and C(standby),
+    C(<group_prefix>pd_<protection domain name>) for protection domains and
+    C(<group_prefix>pd_<protection domain name>_fs_<fault set name>) for
+    fault sets, as children of their protection domain group.
+'''
+
+EXAMPLES = r'''
+# powerflex.yml
+# The gateway and its password are read from the POWERFLEX_HOSTNAME and
+# POWERFLEX_PASSWORD environment variables.
+plugin: dellemc.powerflex.powerflex
+username: admin
+validate_certs: false
+entities:
+  - sds
+  - sdc
+  - mdm
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/powerflex_inventory
+cache_timeout: 600
+keyed_groups:
+  - key: powerflex_sds_state
+    prefix: sds_state
+'''
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.basic import missing_required_lib
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
+    import utils
+
+ROLES = ('sds', 'sdc', 'mdm', 'sdt')
+MDM_ROLES = (
+    ('master', 'primary'),
+    ('slaves', 'secondary'),
+    ('tieBreakers', 'tiebreaker'),
+    ('standbyMDMs', 'standby')
+)
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'dellemc.powerflex.powerflex'
+
+    def verify_file(self, path):
+        """ Check whether the file is a configuration of the plugin """
+        return super(InventoryModule, self).verify_file(path) and \
+            path.endswith(('powerflex.yml', 'powerflex.yaml'))
+
+    def get_connection(self):
+        """ Connect to the PowerFlex gateway """
+        if not utils.HAS_POWERFLEX_SDK:
+            raise AnsibleError(missing_required_lib("PyPowerFlex V 2.0.0 or above"))
+        try:
+            return utils.get_powerflex_gateway_host_connection(dict(
+                hostname=self.get_option('hostname'),
+                port=self.get_option('port'),
+                validate_certs=self.get_option('validate_certs'),
+                username=self.get_option('username'),
+                password=self.get_option('password'),
+                timeout=self.get_option('timeout')))
+        except Exception as e:
+            raise AnsibleError('Connecting to the PowerFlex gateway %s failed with error %s'
+                               % (self.get_option('hostname'), str(e)))
+
+    def get_topology(self):
+        """ Query the objects of every entity once and build the variables
+            of their hosts
+            :return: Variables by host name
+            :rtype: dict
+        """
+        conn = self.get_connection()
+        entities = self.get_option('entities')
+        hosts = {}
+        try:
+            protection_domains = {}
+            if 'sds' in entities or 'sdt' in entities:
+                protection_domains = dict((pd['id'], pd) for pd in conn.protection_domain.get())
+            if 'sds' in entities:
+                fault_sets = dict((fs['id'], fs) for fs in conn.fault_set.get())
+                for sds in conn.sds.get():
+                    self.add_sds(hosts, sds, protection_domains, fault_sets)
+            if 'sdc' in entities:
+                for sdc in conn.sdc.get():
+                    self.add_sdc(hosts, sdc)
+            if 'mdm' in entities:
+                cluster = conn.system.get_mdm_cluster_details() or {}
+                for key, mdm_role in MDM_ROLES:
+                    mdms = cluster.get(key) or []
+                    for mdm in mdms if isinstance(mdms, list) else [mdms]:
+                        self.add_mdm(hosts, mdm, mdm_role)
+            if 'sdt' in entities:
+                for sdt in conn.sdt.get():
+                    self.add_sdt(hosts, sdt, protection_domains)
+        except Exception as e:
+            raise AnsibleError('Getting the PowerFlex topology failed with error %s' % str(e))
+        return hosts
+
+    def get_host(self, hosts, role, name, ips):
+        """ Get the variables of the host of an object, adding the host
+            when it is not known yet """
+        ips = [ip for ip in ips if ip]
+        host_name = name if self.get_option('hostnames') == 'name' and name \
+            else (ips[0] if ips else name)
+        if not host_name:
+            return None
+        host = hosts.setdefault(host_name, dict(powerflex_roles=[], powerflex_ips=[]))
+        if role not in host['powerflex_roles']:
+            host['powerflex_roles'].append(role)
+        for ip in ips:
+            if ip not in host['powerflex_ips']:
+                host['powerflex_ips'].append(ip)
+        if host['powerflex_ips']:
+            host.setdefault('ansible_host', host['powerflex_ips'][0])
+        return host
+
+    def add_sds(self, hosts, sds, protection_domains, fault_sets):
+        """ Add the host of an SDS """
+        ip_list = sds.get('ipList') or []
+        host = self.get_host(hosts, 'sds', sds.get('name'), [ip.get('ip') for ip in ip_list])
+        if host is None:
+            return
+        host.update(
+            powerflex_sds_id=sds['id'],
+            powerflex_sds_state=sds.get('sdsState'),
+            powerflex_sds_membership_state=sds.get('membershipState'),
+            powerflex_sds_ip_roles=dict((ip.get('ip'), ip.get('role')) for ip in ip_list))
+        self.update_protection_domain(host, sds.get('protectionDomainId'), protection_domains)
+        fault_set = fault_sets.get(sds.get('faultSetId'))
+        if fault_set:
+            host.update(powerflex_fault_set_id=fault_set['id'],
+                        powerflex_fault_set_name=fault_set.get('name'))
+
+    def add_sdc(self, hosts, sdc):
+        """ Add the host of an SDC """
+        ips = sdc.get('sdcIps') or [sdc.get('sdcIp')]
+        host = self.get_host(hosts, 'sdc', sdc.get('name'), ips)
+        if host is None:
+            return
+        host.update(
+            powerflex_sdc_id=sdc['id'],
+            powerflex_sdc_guid=sdc.get('sdcGuid'),
+            powerflex_sdc_approved=sdc.get('sdcApproved'),
+            powerflex_sdc_os_type=sdc.get('osType'),
+            powerflex_sdc_mdm_connection_state=sdc.get('mdmConnectionState'))
+
+    def add_mdm(self, hosts, mdm, mdm_role):
+        """ Add the host of an MDM """
+        host = self.get_host(hosts, 'mdm', mdm.get('name'),
+                             (mdm.get('managementIPs') or []) + (mdm.get('ips') or []))
+        if host is None:
+            return
+        host.update(
+            powerflex_mdm_id=mdm.get('id'),
+            powerflex_mdm_role=mdm_role,
+            powerflex_mdm_status=mdm.get('status'))
+
+    def add_sdt(self, hosts, sdt, protection_domains):
+        """ Add the host of an SDT """
+        ip_list = sdt.get('ipList') or []
+        host = self.get_host(hosts, 'sdt', sdt.get('name'), [ip.get('ip') for ip in ip_list])
+        if host is None:
+            return
+        host.update(
+            powerflex_sdt_id=sdt['id'],
+            powerflex_sdt_state=sdt.get('sdtState'),
+            powerflex_sdt_ip_roles=dict((ip.get('ip'), ip.get('role')) for ip in ip_list))
+        self.update_protection_domain(host, sdt.get('protectionDomainId'), protection_domains)
+
+    @staticmethod
+    def update_protection_domain(host, protection_domain_id, protection_domains):
+        """ Add the protection domain of an object to its host """
+        protection_domain = protection_domains.get(protection_domain_id)
+        if protection_domain:
+            host.update(powerflex_protection_domain_id=protection_domain['id'],
+                        powerflex_protection_domain_name=protection_domain.get('name'))
+
+    def populate(self, hosts):
+        """ Add the hosts and their groups to the inventory """
+        prefix = self.get_option('group_prefix')
+        strict = self.get_option('strict')
+        for host_name, host_vars in hosts.items():
+            self.inventory.add_host(host_name)
+            for key, value in host_vars.items():
+                self.inventory.set_variable(host_name, key, value)
+            for group in self.get_groups(prefix, host_vars):
+                self.inventory.add_host(host_name, group=group)
+            self._set_composite_vars(self.get_option('compose'), host_vars, host_name, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), host_vars, host_name, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_vars, host_name, strict=strict)
+
+    def get_groups(self, prefix, host_vars):
+        """ Add the groups of a host to the inventory
+            :return: Names of the groups of the host
+            :rtype: list
+        """
+        groups = [prefix + role for role in host_vars['powerflex_roles']]
+        if host_vars.get('powerflex_mdm_role'):
+            groups.append('%smdm_%s' % (prefix, host_vars['powerflex_mdm_role']))
+        pd_group = None
+        if host_vars.get('powerflex_protection_domain_name'):
+            pd_group = self._sanitize_group_name(
+                '%spd_%s' % (prefix, host_vars['powerflex_protection_domain_name']))
+            groups.append(pd_group)
+        groups = [self.inventory.add_group(group) for group in groups]
+        if pd_group and host_vars.get('powerflex_fault_set_name'):
+            fs_group = self.inventory.add_group(self._sanitize_group_name(
+                '%s_fs_%s' % (pd_group, host_vars['powerflex_fault_set_name'])))
+            self.inventory.add_child(pd_group, fs_group)
+            groups.append(fs_group)
+        return groups
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        hosts = None
+        if use_cache:
+            try:
+                hosts = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if hosts is None:
+            hosts = self.get_topology()
+        if update_cache:
+            self._cache[cache_key] = hosts
+        self.populate(hosts)
@@ -0,0 +1,70 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+def index_entities(entities, keys=('name',)):
+    """
+    Index entities listed with a single query
+    :param entities: List of entities
+    :param keys: Attributes the entities are looked up by besides the id
+    :return: The entities by id, and the lists of entities by attribute value
+    :rtype: tuple
+    """
+    by_id = {}
+    by_key = dict((key, {}) for key in keys)
+    for entity in entities or []:
+        by_id[entity['id']] = entity
+        for key in keys:
+            by_key[key].setdefault(entity.get(key), []).append(entity)
+    return by_id, by_key
+
+
+def prepare_output(plan, name_key, actions):
+    """
+    Get the outcome of a spec from its plan
+    :param plan: Dictionary with the entity, its changes and its error
+    :param name_key: Key of the entity name in the plan
+    :param actions: Names of the changes, in the order they are applied
+    :return: Outcome of the spec
+    :rtype: dict
+    """
+    # A create that failed before returning an id changed nothing
+    failed_create = plan['error'] and 'create' in plan['changes'] \
+        and plan['id'] is None
+    output = {name_key: plan[name_key]}
+    output.update(
+        id=plan['id'],
+        changed=bool(plan['changes']) and not failed_create,
+        actions=[action for action in actions if action in plan['changes']],
+        error=plan['error']
+    )
+    return output
+
+
+def get_summary(results):
+    """
+    Count the specs per outcome
+    :param results: Plans with their outcome
+    :return: Number of specs per outcome
+    :rtype: dict
+    """
+    summary = dict(total=len(results), created=0, modified=0, deleted=0,
+                   unchanged=0, failed=0)
+    for plan in results:
+        changes = plan['changes']
+        if plan['error']:
+            summary['failed'] += 1
+        elif 'create' in changes:
+            summary['created'] += 1
+        elif 'delete' in changes:
+            summary['deleted'] += 1
+        elif changes:
+            summary['modified'] += 1
+        else:
+            summary['unchanged'] += 1
+    return summary
@@ -0,0 +1,137 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.session_cache \
+    import release_session, share_session
+
+LOG = utils.get_logger('concurrency')
+
+
+class TaskFailure(Exception):
+
+    """
+    Raised in place of fail_json while tasks run in worker threads.
+    """
+
+    def __init__(self, msg, **kwargs):
+        """
+        Initialize the task failure
+        :param msg: Failure message passed to fail_json
+        :param kwargs: Additional fail_json arguments
+        """
+        super().__init__(msg)
+        self.msg = msg
+        self.kwargs = kwargs
+
+
+class TaskResult:
+
+    """
+    Outcome of one task run by run_tasks.
+    """
+
+    def __init__(self, item, result=None, error=None):
+        """
+        Initialize the task result
+        :param item: Item the task was run for
+        :param result: Value returned by the task
+        :param error: Error message if the task failed
+        """
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+
+@contextmanager
+def collect_failures(module):
+    """
+    Make module.fail_json raise TaskFailure while the context is active,
+    so a failing task neither exits from a worker thread nor stops the
+    other tasks.
+    :param module: Ansible module object
+    """
+    fail_json = module.fail_json
+
+    def raise_failure(msg, **kwargs):
+        raise TaskFailure(msg, **kwargs)
+
+    module.fail_json = raise_failure
+    try:
+        yield
+    finally:
+        module.fail_json = fail_json
+
+
+def run_concurrently(func, items, max_workers=1, fail_fast=False):
+    """
+    Call func for every item using at most max_workers threads.
+    :param func: Callable taking one item
+    :param items: Items to process
+    :param max_workers: Maximum number of concurrent calls
+    :param fail_fast: Whether to stop at the first failed item when the
+                      items are processed one at a time, as a serial loop
+                      would. The items not processed have no TaskResult.
+    :return: TaskResult per item, in the order of items
+    :rtype: list
+    """
+    def run(item):
+        try:
+            return TaskResult(item, result=func(item))
+        except TaskFailure as e:
+            return TaskResult(item, error=e.msg)
+        except Exception as e:
+            LOG.error("Task for %s failed with error %s", item, str(e))
+            return TaskResult(item, error=str(e))
+
+    items = list(items)
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        results = []
+        for item in items:
+            results.append(run(item))
+            if fail_fast and results[-1].failed:
+                break
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(run, items))
+
+
+def run_tasks(module, powerflex_conn, func, items, max_workers=1,
+              fail_fast=False):
+    """
+    Run func for every item, collecting failures instead of exiting.
+    When more than one worker is used the connection is switched to a
+    shared session first, as the SDK is not safe for concurrent logins,
+    and the session is logged out once the tasks are done.
+    :param module: Ansible module object
+    :param powerflex_conn: PowerFlex connection used by func
+    :param func: Callable taking one item
+    :param items: Items to process
+    :param max_workers: Maximum number of concurrent calls
+    :param fail_fast: Whether to stop at the first failed item when the
+                      items are processed one at a time
+    :return: TaskResult per item, in the order of items
+    :rtype: list
+    """
+    if not max_workers or max_workers <= 1:
+        with collect_failures(module):
+            return run_concurrently(func, items, max_workers, fail_fast)
+    share_session(powerflex_conn)
+    try:
+        with collect_failures(module):
+            return run_concurrently(func, items, max_workers, fail_fast)
+    finally:
+        release_session(powerflex_conn)
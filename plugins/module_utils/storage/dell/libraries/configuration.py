@@ -119,3 +119,46 @@ class Configuration:
             error_msg = f"Failed to get the associated SDS with error '{str(e)}'"
             LOG.error(error_msg)
             self.module.fail_json(msg=error_msg)
+
+    def get_nvme_controllers(self):
+        """Get the NVMe controllers of all NVMe hosts
+            :return: NVMe controller details
+            :rtype: list
+        """
+        host = self.powerflex_conn.host
+        try:
+            # List every controller with a single request where the
+            # gateway supports it.
+            r, response = host.send_get_request(
+                host.base_entity_list_or_create_url, entity='NvmeController')
+            if r.status_code == 200:
+                return response
+            LOG.info("Listing NVMe controllers failed with status %s, "
+                     "querying them per NVMe host", r.status_code)
+        except Exception as e:
+            LOG.info("Listing NVMe controllers failed with error '%s', "
+                     "querying them per NVMe host", str(e))
+
+        try:
+            controllers = []
+            nvme_hosts = self.powerflex_conn.sdc.get(filter_fields={'hostType': 'NVMeHost'})
+            for nvme_host in nvme_hosts:
+                controllers.extend(host.get_related(
+                    entity_id=nvme_host.get('id'), related='NvmeController'))
+            return controllers
+
+        except Exception as e:
+            error_msg = f"Failed to get the NVMe controllers with error '{str(e)}'"
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg)
+
+    def get_nvme_controllers_by_sdt(self):
+        """Group the NVMe controllers by the SDT they are connected to
+            :return: SDT ID to NVMe controllers mapping
+            :rtype: dict
+        """
+        controllers_map = {}
+        for controller in self.get_nvme_controllers():
+            if controller.get('sdtId') is not None:
+                controllers_map.setdefault(controller['sdtId'], []).append(controller)
+        return controllers_map
@@ -0,0 +1,120 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+DELTA_STATE_VERSION = 1
+IGNORED_KEYS = ('links',)
+
+
+def get_fingerprint(entity):
+    """
+    Get the fingerprint of an entity as returned by the gateway
+    :param entity: Entity dictionary
+    :return: Hash of the entity without its links
+    :rtype: str
+    """
+    relevant = dict((key, value) for key, value in entity.items()
+                    if key not in IGNORED_KEYS)
+    return hashlib.sha256(
+        json.dumps(relevant, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class DeltaState:
+
+    """
+    Fingerprint index of the entities returned by earlier runs, kept in a
+    JSON state file.
+
+    Each subset stores the fingerprint of every entity by id together
+    with the filters it was gathered with. Changing the filters or the
+    gateway starts a new index for the subset, so every entity is
+    reported as added again.
+    """
+
+    def __init__(self, path, hostname):
+        """
+        Initialize the delta state
+        :param path: Path of the state file
+        :param hostname: PowerFlex gateway the state belongs to
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.hostname = hostname
+        self.delta = {}
+        self._subsets = {}
+        self._lock = threading.Lock()
+        state = self._read()
+        if state.get('version') == DELTA_STATE_VERSION \
+                and state.get('hostname') == hostname:
+            self._subsets = state.get('subsets') or {}
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as state_file:
+                return json.load(state_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def select_changed(self, subset, entities, filter_dict=None):
+        """
+        Record the entities of a subset and keep the ones added or modified
+        since the previous run
+        :param subset: Name of the gather_subset
+        :param entities: Entities gathered for the subset
+        :param filter_dict: Filters the subset was gathered with
+        :return: Entities that were added or modified
+        :rtype: list
+        """
+        filters = json.dumps(filter_dict or {}, sort_keys=True)
+        with self._lock:
+            previous = self._subsets.get(subset) or {}
+        if previous.get('filters') != filters:
+            previous = {}
+        old_fingerprints = previous.get('fingerprints') or {}
+
+        fingerprints = {}
+        changed = []
+        added = []
+        modified = []
+        for entity in entities or []:
+            fingerprint = get_fingerprint(entity)
+            fingerprints[entity['id']] = fingerprint
+            if entity['id'] not in old_fingerprints:
+                added.append(entity['id'])
+                changed.append(entity)
+            elif old_fingerprints[entity['id']] != fingerprint:
+                modified.append(entity['id'])
+                changed.append(entity)
+        removed = [entity_id for entity_id in old_fingerprints
+                   if entity_id not in fingerprints]
+
+        with self._lock:
+            self._subsets[subset] = {'filters': filters,
+                                     'fingerprints': fingerprints}
+            self.delta[subset] = {'added': added, 'modified': modified,
+                                  'removed': removed}
+        return changed
+
+    def save(self):
+        """Write the state file, replacing the previous one"""
+        state = {'version': DELTA_STATE_VERSION, 'hostname': self.hostname,
+                 'subsets': self._subsets}
+        fd, tmp_path = tempfile.mkstemp(
+            prefix='.' + os.path.basename(self.path),
+            dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, 'w') as state_file:
+                json.dump(state, state_file, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
@@ -0,0 +1,310 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import csv
+import gzip
+import json
+import os
+import tempfile
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+def iter_pages(items, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Split a list of entities into pages
+    :param items: Entities to split
+    :param page_size: Maximum number of entities per page
+    :return: Generator of lists of at most page_size entities
+    """
+    page_size = max(page_size or DEFAULT_PAGE_SIZE, 1)
+    for start in range(0, len(items or []), page_size):
+        yield items[start:start + page_size]
+
+
+class NdjsonExport:
+
+    """
+    Gzip compressed NDJSON file of entities, one JSON object per line.
+
+    Each entity is written with an additional ``subset`` key naming the
+    gather_subset it belongs to. The file is written next to its final
+    path and only moved in place once the export completed, so a failed
+    export never leaves a partial file behind.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the export
+        :param path: Path of the compressed NDJSON file
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.counts = {}
+        self._tmp_path = None
+        self._file = None
+
+    def __enter__(self):
+        directory = os.path.dirname(self.path)
+        fd, self._tmp_path = tempfile.mkstemp(
+            prefix='.' + os.path.basename(self.path), dir=directory)
+        self._file = gzip.GzipFile(fileobj=os.fdopen(fd, 'wb'), mode='wb')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        fileobj = self._file.fileobj
+        self._file.close()
+        fileobj.close()
+        if exc_type is None:
+            os.chmod(self._tmp_path, 0o644)
+            os.replace(self._tmp_path, self.path)
+        else:
+            os.remove(self._tmp_path)
+        return False
+
+    def write(self, subset, entities):
+        """
+        Append entities of a subset to the file
+        :param subset: Name of the gather_subset
+        :param entities: List of entity dictionaries
+        """
+        self.counts.setdefault(subset, 0)
+        for entity in entities or []:
+            record = dict(entity, subset=subset)
+            self._file.write((json.dumps(record, sort_keys=True) + '\n').encode('utf-8'))
+            self.counts[subset] += 1
+
+
+def flatten_entity(entity, prefix=''):
+    """
+    Flatten an entity into a single level of columns
+    :param entity: Entity dictionary
+    :param prefix: Column name prefix of the nested keys
+    :return: Values by column name. Nested dictionaries give one column per
+             key joined with a dot, lists of dictionaries with a name give
+             one column group per name and other lists are JSON encoded
+    :rtype: dict
+    """
+    row = {}
+    for key, value in entity.items():
+        column = prefix + str(key)
+        if isinstance(value, list) and value and all(
+                isinstance(item, dict) and 'name' in item for item in value):
+            value = dict((item['name'], dict((k, v) for k, v in item.items() if k != 'name'))
+                         for item in value)
+        if isinstance(value, dict):
+            row.update(flatten_entity(value, column + '.'))
+        elif isinstance(value, (list, tuple)):
+            row[column] = json.dumps(value, sort_keys=True)
+        else:
+            row[column] = value
+    return row
+
+
+def get_column_type(values):
+    """
+    Get the type shared by the values of a column
+    :param values: Values of the column, None for a missing value
+    :return: One of bool, int, float and str. Columns with mixed types
+             other than int and float are str columns
+    :rtype: type
+    """
+    types = set(type(value) for value in values if value is not None)
+    if not types:
+        return str
+    if types == {bool}:
+        return bool
+    if types <= {int, float}:
+        return float if float in types else int
+    return str
+
+
+def get_column_values(values, column_type):
+    """
+    :param values: Values of a column
+    :param column_type: Type of the column
+    :return: The values converted to the column type, None kept as is
+    """
+    if column_type is not str:
+        return [None if value is None else column_type(value) for value in values]
+    return [value if value is None or isinstance(value, str)
+            else json.dumps(value) for value in values]
+
+
+class ColumnarTable:
+
+    """
+    Flattened entities of one subset kept as columns of equal length.
+    """
+
+    def __init__(self):
+        """Initialize the table"""
+        self.columns = {}
+        self.num_rows = 0
+
+    def append(self, entity):
+        """
+        Add an entity as a row, with None in the columns it has no value for
+        :param entity: Entity dictionary
+        """
+        row = flatten_entity(entity)
+        for column, value in row.items():
+            if column not in self.columns:
+                self.columns[column] = [None] * self.num_rows
+            self.columns[column].append(value)
+        self.num_rows += 1
+        for values in self.columns.values():
+            if len(values) < self.num_rows:
+                values.append(None)
+
+    def get_typed_columns(self):
+        """
+        :return: The typed values and type of every column, sorted by name
+        :rtype: list
+        """
+        typed_columns = []
+        for column in sorted(self.columns):
+            column_type = get_column_type(self.columns[column])
+            typed_columns.append((column, column_type,
+                                  get_column_values(self.columns[column], column_type)))
+        return typed_columns
+
+
+def write_csv(path, table):
+    """
+    Write a table to a CSV file with a header row. Missing values are
+    empty fields and booleans are written as true or false
+    :param path: Path of the file
+    :param table: ColumnarTable instance
+    """
+    typed_columns = table.get_typed_columns()
+    with open(path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow([column for column, column_type, values in typed_columns])
+        for index in range(table.num_rows):
+            writer.writerow([format_csv_value(values[index])
+                             for column, column_type, values in typed_columns])
+
+
+def format_csv_value(value):
+    """
+    :param value: Typed value of a column
+    :return: The value as written to a CSV field
+    """
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return value
+
+
+def to_arrow_table(table):
+    """
+    :param table: ColumnarTable instance
+    :return: The table as pyarrow Table
+    """
+    arrow_types = {bool: pa.bool_(), int: pa.int64(), float: pa.float64(), str: pa.string()}
+    return pa.table(dict(
+        (column, pa.array(values, type=arrow_types[column_type]))
+        for column, column_type, values in table.get_typed_columns()))
+
+
+def write_parquet(path, table):
+    """
+    Write a table to a Parquet file
+    :param path: Path of the file
+    :param table: ColumnarTable instance
+    """
+    pq.write_table(to_arrow_table(table), path)
+
+
+def write_feather(path, table):
+    """
+    Write a table to a Feather file
+    :param path: Path of the file
+    :param table: ColumnarTable instance
+    """
+    feather.write_feather(to_arrow_table(table), path)
+
+
+COLUMNAR_FORMATS = {
+    'csv': ('.csv', write_csv),
+    'parquet': ('.parquet', write_parquet),
+    'feather': ('.feather', write_feather)
+}
+ARROW_FORMATS = ('parquet', 'feather')
+
+
+class ColumnarExport:
+
+    """
+    Directory of one columnar file per subset, for analytics tools to read
+    without parsing JSON.
+
+    Nested keys of the entities, their statistics included, are flattened
+    into one typed column each. Every file is written next to its final
+    path and only moved in place once the export completed, so a failed
+    export never leaves a partial file behind.
+    """
+
+    def __init__(self, path, output_format):
+        """
+        Initialize the export
+        :param path: Path of the directory the files are written to
+        :param output_format: One of csv, parquet and feather
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.output_format = output_format
+        self.counts = {}
+        self.files = {}
+        self._tables = {}
+
+    def __enter__(self):
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            extension, write_func = COLUMNAR_FORMATS[self.output_format]
+            for subset, table in self._tables.items():
+                path = os.path.join(self.path, subset + extension)
+                self._write_file(path, write_func, table)
+                self.files[subset] = path
+        self._tables = {}
+        return False
+
+    def _write_file(self, path, write_func, table):
+        fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path),
+                                        dir=self.path)
+        os.close(fd)
+        try:
+            write_func(tmp_path, table)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def write(self, subset, entities):
+        """
+        Append entities of a subset to its table
+        :param subset: Name of the gather_subset
+        :param entities: List of entity dictionaries
+        """
+        table = self._tables.setdefault(subset, ColumnarTable())
+        for entity in entities or []:
+            table.append(entity)
+        self.counts[subset] = table.num_rows
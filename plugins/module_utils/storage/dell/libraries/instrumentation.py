@@ -0,0 +1,296 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Timing of the REST requests sent by the PowerFlex SDK during a module run"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import binascii
+import json
+import os
+import re
+import threading
+import time
+
+from urllib.parse import urlparse
+
+try:
+    from PyPowerFlex import base_client
+    HAS_POWERFLEX_SDK = True
+except ImportError:
+    HAS_POWERFLEX_SDK = False
+
+LOGIN_PATHS = ('/api/login', '/api/logout', '/api/version',
+               '/rest/auth/login', '/rest/auth/logout')
+ID_PATTERNS = (
+    (re.compile(r'::[^/]+'), '::{id}'),
+    (re.compile(r'/[0-9a-fA-F]{16,}(?=/|$)'), '/{id}')
+)
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_ERROR = 2
+
+
+def get_endpoint(url):
+    """
+    :param url: URL of a request
+    :return: Path of the URL with the object ids replaced by {id}
+    :rtype: str
+    """
+    path = urlparse(url).path
+    for pattern, replacement in ID_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def get_phase(method, endpoint):
+    """
+    :param method: HTTP method of a request
+    :param endpoint: Endpoint of the request
+    :return: One of login, read and write
+    :rtype: str
+    """
+    if endpoint.endswith(LOGIN_PATHS):
+        return 'login'
+    return 'read' if method.upper() == 'GET' else 'write'
+
+
+def get_random_id(num_bytes):
+    """
+    :param num_bytes: Number of random bytes
+    :return: Trace or span id of that many bytes, hex encoded
+    :rtype: str
+    """
+    return binascii.hexlify(os.urandom(num_bytes)).decode()
+
+
+class RequestTimings:
+
+    """
+    Endpoint, method, status, size and latency of every REST request sent
+    during a module run.
+
+    The requests are summarized per phase and per endpoint, and can be
+    exported as OpenTelemetry spans in the OTLP JSON encoding, as children
+    of one span covering the module run.
+    """
+
+    def __init__(self, service_name='dellemc.powerflex'):
+        """
+        Initialize the timings
+        :param service_name: Name of the module run in the exported spans
+        """
+        self.service_name = service_name
+        self.start = time.time()
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(self, method, url, start, seconds, status=None, size=0, error=None):
+        """
+        Record a request
+        :param method: HTTP method
+        :param url: URL of the request
+        :param start: Start time of the request, in seconds since the epoch
+        :param seconds: Latency of the request
+        :param status: HTTP status of the response, None without response
+        :param size: Number of bytes of the response body
+        :param error: Error raised instead of a response
+        """
+        endpoint = get_endpoint(url)
+        with self._lock:
+            self.records.append(dict(
+                method=method.upper(), url=url, endpoint=endpoint,
+                phase=get_phase(method, endpoint), start=start,
+                seconds=seconds, status=status, bytes=size, error=error))
+
+    def summary(self):
+        """
+        :return: Number of requests, seconds and bytes in total, per phase
+                 and per endpoint, the slowest endpoints first
+        :rtype: dict
+        """
+        with self._lock:
+            records = list(self.records)
+        phases = dict((phase, dict(requests=0, seconds=0.0))
+                      for phase in ('login', 'read', 'write'))
+        endpoints = {}
+        for record in records:
+            phases[record['phase']]['requests'] += 1
+            phases[record['phase']]['seconds'] += record['seconds']
+            endpoint = endpoints.setdefault(
+                (record['method'], record['endpoint']),
+                dict(method=record['method'], endpoint=record['endpoint'],
+                     requests=0, seconds=0.0, max_seconds=0.0, bytes=0, errors=0))
+            endpoint['requests'] += 1
+            endpoint['seconds'] += record['seconds']
+            endpoint['max_seconds'] = max(endpoint['max_seconds'], record['seconds'])
+            endpoint['bytes'] += record['bytes']
+            if record['error'] or (record['status'] or 0) >= 400:
+                endpoint['errors'] += 1
+        for item in list(phases.values()) + list(endpoints.values()):
+            for key in ('seconds', 'max_seconds'):
+                if key in item:
+                    item[key] = round(item[key], 6)
+        return dict(
+            requests=len(records),
+            seconds=round(sum(record['seconds'] for record in records), 6),
+            bytes=sum(record['bytes'] for record in records),
+            phases=phases,
+            endpoints=sorted(endpoints.values(), key=lambda item: -item['seconds']))
+
+    def to_otlp(self, end=None):
+        """
+        :param end: End time of the module run, now if not given
+        :return: The module run and its requests as OTLP JSON trace data
+        :rtype: dict
+        """
+        with self._lock:
+            records = list(self.records)
+        trace_id = get_random_id(16)
+        root_id = get_random_id(8)
+        spans = [dict(
+            traceId=trace_id, spanId=root_id, name=self.service_name,
+            kind=SPAN_KIND_INTERNAL,
+            startTimeUnixNano=str(int(self.start * 1e9)),
+            endTimeUnixNano=str(int((end or time.time()) * 1e9)),
+            attributes=[], status={})]
+        for record in records:
+            host = urlparse(record['url']).hostname
+            attributes = [
+                get_attribute('http.request.method', record['method']),
+                get_attribute('url.path', record['endpoint']),
+                get_attribute('server.address', host),
+                get_attribute('powerflex.phase', record['phase']),
+                get_attribute('http.response.body.size', record['bytes'])]
+            if record['status'] is not None:
+                attributes.append(get_attribute('http.response.status_code', record['status']))
+            failed = record['error'] or (record['status'] or 0) >= 400
+            spans.append(dict(
+                traceId=trace_id, spanId=get_random_id(8), parentSpanId=root_id,
+                name='%s %s' % (record['method'], record['endpoint']),
+                kind=SPAN_KIND_CLIENT,
+                startTimeUnixNano=str(int(record['start'] * 1e9)),
+                endTimeUnixNano=str(int((record['start'] + record['seconds']) * 1e9)),
+                attributes=attributes,
+                status=dict(code=STATUS_CODE_ERROR, message=record['error'] or '')
+                if failed else {}))
+        return dict(resourceSpans=[dict(
+            resource=dict(attributes=[get_attribute('service.name', self.service_name)]),
+            scopeSpans=[dict(scope=dict(name='dellemc.powerflex'), spans=spans)])])
+
+    def write_trace(self, path):
+        """
+        Append the trace of the module run to a file, as one JSON line
+        :param path: Path of the trace file
+        """
+        line = json.dumps(self.to_otlp(), sort_keys=True) + '\n'
+        with open(os.path.expanduser(path), 'a') as trace_file:
+            trace_file.write(line)
+
+
+def get_attribute(key, value):
+    """
+    :return: Attribute of an OTLP JSON span
+    :rtype: dict
+    """
+    if isinstance(value, bool):
+        return dict(key=key, value=dict(boolValue=value))
+    if isinstance(value, int):
+        return dict(key=key, value=dict(intValue=str(value)))
+    return dict(key=key, value=dict(stringValue=str(value)))
+
+
+class InstrumentedRequests:
+
+    """
+    Stand-in for the requests module used by the PowerFlex SDK, timing
+    every request sent through it.
+    """
+
+    def __init__(self, requests_module, timings):
+        """
+        :param requests_module: The requests module
+        :param timings: RequestTimings instance the requests are recorded in
+        """
+        self.requests_module = requests_module
+        self.timings = timings
+
+    def __getattr__(self, name):
+        return getattr(self.requests_module, name)
+
+    def _send(self, method, url, send_func, *args, **kwargs):
+        start = time.time()
+        started = time.perf_counter()
+        try:
+            response = send_func(*args, **kwargs)
+        except Exception as e:
+            self.timings.record(method, url, start, time.perf_counter() - started,
+                                error=str(e))
+            raise
+        self.timings.record(method, url, start, time.perf_counter() - started,
+                            status=getattr(response, 'status_code', None),
+                            size=len(getattr(response, 'content', None) or b''))
+        return response
+
+    def request(self, method, url, **kwargs):
+        return self._send(method, url, self.requests_module.request, method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self._send('GET', url, self.requests_module.get, url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._send('POST', url, self.requests_module.post, url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._send('PUT', url, self.requests_module.put, url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._send('DELETE', url, self.requests_module.delete, url, **kwargs)
+
+
+def instrument_requests(timings):
+    """
+    Time the requests the PowerFlex SDK sends from now on
+    :param timings: RequestTimings instance the requests are recorded in
+    """
+    requests_module = base_client.requests
+    if isinstance(requests_module, InstrumentedRequests):
+        requests_module = requests_module.requests_module
+    base_client.requests = InstrumentedRequests(requests_module, timings)
+
+
+def instrument_module(module):
+    """
+    Time the requests of a module run as requested by the common module
+    parameters. With timings the summary is returned in the _timings key
+    of the module result, with a trace file the requests are appended to
+    it as OpenTelemetry spans when the module exits.
+    :param module: AnsibleModule instance
+    :return: RequestTimings instance, None if not requested
+    """
+    return_timings = module.params.get('timings')
+    trace_file = module.params.get('trace_file')
+    if not HAS_POWERFLEX_SDK or not (return_timings or trace_file):
+        return None
+    timings = RequestTimings(getattr(module, '_name', None) or 'dellemc.powerflex')
+    instrument_requests(timings)
+
+    def wrap(exit_func):
+        def exit_with_timings(*args, **kwargs):
+            if return_timings:
+                kwargs['_timings'] = timings.summary()
+            if trace_file:
+                try:
+                    timings.write_trace(trace_file)
+                except (IOError, OSError) as e:
+                    module.warn('Writing the trace file %s failed with error %s'
+                                % (trace_file, str(e)))
+            return exit_func(*args, **kwargs)
+        return exit_with_timings
+
+    module.exit_json = wrap(module.exit_json)
+    module.fail_json = wrap(module.fail_json)
+    return timings
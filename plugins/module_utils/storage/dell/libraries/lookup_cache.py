@@ -0,0 +1,217 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+import threading
+
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
+    import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.object_cache \
+    import get_object_cache
+
+try:
+    from PyPowerFlex import PowerFlexClient
+    from PyPowerFlex.utils import filter_response
+    HAS_POWERFLEX_SDK = True
+except ImportError:
+    PowerFlexClient = object
+    HAS_POWERFLEX_SDK = False
+
+LOG = utils.get_logger('lookup_cache')
+
+CACHED_ENTITIES = ('protection_domain', 'storage_pool', 'fault_set',
+                   'snapshot_policy', 'sdc', 'device_group')
+
+# Writes sent by these entities also change objects of cached types.
+RELATED_ENTITIES = {
+    'host': ('sdc',),
+    'system': CACHED_ENTITIES,
+    'deployment': CACHED_ENTITIES
+}
+
+
+class LookupCache:
+
+    """
+    Lookups of protection domains, storage pools, fault sets, snapshot
+    policies, SDCs and device groups done during one module run.
+
+    The SDK lists every object of a type and filters the list on the
+    client for each lookup, so the list is fetched once per type and the
+    lookups by name or id are served from indexes built on it. A write
+    sent for a type drops everything cached for that type. With an object
+    cache the lists are also shared with later module runs until they
+    expire or a write drops them.
+    """
+
+    def __init__(self, object_cache=None):
+        """
+        Initialize the lookup cache
+        :param object_cache: PowerFlexObjectCache the lists are shared with
+        """
+        self._lists = {}
+        self._indexes = {}
+        self._instances = {}
+        self._object_cache = object_cache
+        self._lock = threading.RLock()
+
+    def get(self, entity, get_func, entity_id=None, filter_fields=None):
+        """
+        Get objects of a type, fetching them only on a cache miss
+        :param entity: Name of the entity on the PowerFlex connection
+        :param get_func: Original get method of the entity
+        :param entity_id: ID of the object
+        :param filter_fields: Fields to filter the objects by
+        :return: Copy of the object, or of the list of matching objects
+        """
+        with self._lock:
+            if entity_id:
+                result = self._get_instance(entity, get_func, entity_id)
+            else:
+                result = self._filter(entity, get_func, filter_fields)
+            return copy.deepcopy(result)
+
+    def _get_instance(self, entity, get_func, entity_id):
+        instances = self._instances.setdefault(entity, {})
+        if entity_id not in instances:
+            listed = self._lookup(entity, 'id', entity_id) \
+                if self._load(entity) else []
+            instances[entity_id] = listed[0] if listed \
+                else get_func(entity_id=entity_id)
+        return instances[entity_id]
+
+    def _load(self, entity):
+        if entity not in self._lists and self._object_cache is not None:
+            objects = self._object_cache.get(entity)
+            if objects is not None:
+                self._lists[entity] = objects
+                self._indexes[entity] = {}
+        return entity in self._lists
+
+    def _filter(self, entity, get_func, filter_fields):
+        if not self._load(entity):
+            LOG.debug("Listing %s objects", entity)
+            self._lists[entity] = get_func()
+            self._indexes[entity] = {}
+            if self._object_cache is not None:
+                self._object_cache.set(entity, self._lists[entity])
+        if not filter_fields:
+            return self._lists[entity]
+        if len(filter_fields) == 1:
+            key, value = list(filter_fields.items())[0]
+            if value is not None and not isinstance(value, (list, tuple, dict)):
+                return self._lookup(entity, key, value)
+        return filter_response(self._lists[entity], filter_fields)
+
+    def _lookup(self, entity, key, value):
+        indexes = self._indexes[entity]
+        if key not in indexes:
+            index = indexes[key] = {}
+            for item in self._lists[entity]:
+                item_value = item.get(key)
+                for index_value in item_value if isinstance(item_value, list) \
+                        else [item_value]:
+                    try:
+                        index.setdefault(index_value, []).append(item)
+                    except TypeError:
+                        continue
+        return indexes[key].get(value, [])
+
+    def invalidate(self, *entities):
+        """
+        Drop the cached objects of types
+        :param entities: Names of the entities, all of them if empty
+        """
+        with self._lock:
+            for entity in entities or list(self._lists) + list(self._instances):
+                self._lists.pop(entity, None)
+                self._indexes.pop(entity, None)
+                self._instances.pop(entity, None)
+            if self._object_cache is not None:
+                self._object_cache.invalidate(*entities)
+
+
+def bind_lookup_cache(entity_name, entity, lookup_cache):
+    """
+    Serve the lookups of a PyPowerFlex entity from the lookup cache and
+    invalidate the cache after every write the entity sends
+    :param entity_name: Name of the entity on the PowerFlex connection
+    :param entity: PyPowerFlex request object
+    :param lookup_cache: LookupCache instance
+    """
+    if getattr(entity, '_lookup_cache', None) is lookup_cache:
+        return
+    send_request_func = entity.send_request
+    invalidated = (entity_name,) + tuple(RELATED_ENTITIES.get(entity_name, ()))
+
+    def send_request(method, url, params=None, use_base_url=True, **url_params):
+        response = send_request_func(method, url, params, use_base_url, **url_params)
+        if method != entity.GET:
+            lookup_cache.invalidate(*invalidated)
+        return response
+
+    entity.send_request = send_request
+    entity._lookup_cache = lookup_cache
+    get_func = entity._uncached_get = entity.get
+    if entity_name not in CACHED_ENTITIES:
+        return
+
+    def get(entity_id=None, filter_fields=None, fields=None):
+        if fields or (entity_id and filter_fields):
+            return get_func(entity_id=entity_id, filter_fields=filter_fields,
+                            fields=fields)
+        return lookup_cache.get(entity_name, get_func, entity_id, filter_fields)
+
+    entity.get = get
+
+
+def uncached_get(entity):
+    """
+    Get method of a PyPowerFlex entity that always queries the gateway,
+    even if the lookups of the entity are served from a lookup cache
+    :param entity: PyPowerFlex request object
+    :return: Get method of the entity
+    """
+    if isinstance(getattr(entity, '_lookup_cache', None), LookupCache):
+        return entity._uncached_get
+    return entity.get
+
+
+def memoize_lookups(conn, object_cache=None):
+    """
+    Memoize the lookups made on an initialized client for the rest of
+    the module run. Clients other than PyPowerFlex ones are left
+    untouched.
+    :param conn: Initialized PyPowerFlex client
+    :param object_cache: PowerFlexObjectCache the lists are shared with
+    :return: LookupCache bound to the client, or None
+    """
+    if not HAS_POWERFLEX_SDK or not isinstance(conn, PowerFlexClient):
+        return None
+    lookup_cache = LookupCache(object_cache)
+    for attr_name in PowerFlexClient.__slots__:
+        try:
+            entity = getattr(conn, attr_name)
+        except Exception:
+            continue
+        if hasattr(entity, 'send_request'):
+            bind_lookup_cache(attr_name, entity, lookup_cache)
+    return lookup_cache
+
+
+def get_lookup_cache(conn, module_params):
+    """
+    Memoize the lookups made on the client as requested by the common
+    module parameters. Lookups sharing the object cache are memoized too.
+    :param conn: Initialized PyPowerFlex client
+    :param module_params: Parameters of the module
+    :return: LookupCache bound to the client, None if not enabled
+    """
+    if not module_params.get('lookup_cache') and not module_params.get('object_cache'):
+        return None
+    return memoize_lookups(conn, get_object_cache(module_params))
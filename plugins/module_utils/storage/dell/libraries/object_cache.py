@@ -0,0 +1,165 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Persistent cache of PowerFlex object lists shared by module runs"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+
+DEFAULT_OBJECT_CACHE_DIR = '~/.ansible/tmp/powerflex_objects'
+DEFAULT_OBJECT_CACHE_TTL = 300
+DEFAULT_OBJECT_CACHE_MAX_ENTRIES = 64
+
+
+class PowerFlexObjectCache:
+
+    """
+    On-disk cache of the object lists of a PowerFlex gateway, one file per
+    object type keyed by (hostname, port, username).
+
+    Lists are reused for ``ttl`` seconds after they were listed. At most ``max_entries`` lists of
+    all gateways are kept in the cache directory, the least recently used
+    ones are evicted first. Reads and writes are serialized with an
+    exclusive file lock shared by all tasks using the directory.
+    """
+
+    def __init__(self, hostname, port, username,
+                 ttl=DEFAULT_OBJECT_CACHE_TTL, cache_dir=None,
+                 max_entries=DEFAULT_OBJECT_CACHE_MAX_ENTRIES):
+        """
+        Initialize the object cache
+        :param hostname: PowerFlex gateway hostname
+        :param port: PowerFlex gateway port
+        :param username: PowerFlex username
+        :param ttl: Number of seconds a cached list stays valid
+        :param cache_dir: Directory holding the cache files
+        :param max_entries: Maximum number of cached lists in the directory
+        """
+        self.ttl = ttl
+        self.max_entries = max(max_entries or DEFAULT_OBJECT_CACHE_MAX_ENTRIES, 1)
+        self.cache_dir = os.path.expanduser(
+            cache_dir or DEFAULT_OBJECT_CACHE_DIR)
+        self.key = hashlib.sha256(
+            "{0}:{1}:{2}".format(hostname, port, username).encode()).hexdigest()
+        self.lock_path = os.path.join(self.cache_dir, '.lock')
+
+    def _get_path(self, entity):
+        return os.path.join(self.cache_dir, "{0}.{1}.json".format(self.key, entity))
+
+    def _ensure_dir(self):
+        try:
+            os.makedirs(self.cache_dir, mode=0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        os.chmod(self.cache_dir, 0o700)
+
+    @contextmanager
+    def _file_lock(self):
+        self._ensure_dir()
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def get(self, entity):
+        """
+        Get the cached objects of a type, marking them as recently used
+        :param entity: Name of the entity on the PowerFlex connection
+        :return: The objects, None on a cache miss
+        :rtype: list
+        """
+        path = self._get_path(entity)
+        with self._file_lock():
+            try:
+                with open(path, 'r') as cache_file:
+                    entry = json.load(cache_file)
+            except (IOError, OSError, ValueError):
+                return None
+            if entry.get('created_at', 0) + self.ttl <= time.time():
+                return None
+            os.utime(path, None)
+            return entry.get('objects')
+
+    def set(self, entity, objects):
+        """
+        Store the objects of a type and evict the least recently used lists
+        beyond the size bound
+        :param entity: Name of the entity on the PowerFlex connection
+        :param objects: List of objects
+        """
+        path = self._get_path(entity)
+        entry = {'created_at': time.time(), 'objects': objects}
+        with self._file_lock():
+            tmp_path = "{0}.{1}.tmp".format(path, os.getpid())
+            fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(entry, cache_file)
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def invalidate(self, *entities):
+        """
+        Drop the cached objects of types of this gateway
+        :param entities: Names of the entities, all of them if empty
+        """
+        with self._file_lock():
+            if entities:
+                paths = [self._get_path(entity) for entity in entities]
+            else:
+                paths = [os.path.join(self.cache_dir, name)
+                         for name in os.listdir(self.cache_dir)
+                         if name.startswith(self.key + '.')]
+            for path in paths:
+                self._remove(path)
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except OSError:
+                continue
+        paths = [path for mtime, path in sorted(entries)]
+        for path in paths[:max(len(paths) - self.max_entries, 0)]:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def get_object_cache(module_params):
+    """
+    Create the object cache requested by the common module parameters
+    :param module_params: Parameters of the module
+    :return: PowerFlexObjectCache instance, None if not enabled
+    """
+    if not module_params.get('object_cache'):
+        return None
+    return PowerFlexObjectCache(
+        hostname=module_params['hostname'],
+        port=module_params['port'],
+        username=module_params['username'],
+        ttl=module_params.get('object_cache_ttl') or DEFAULT_OBJECT_CACHE_TTL,
+        cache_dir=module_params.get('object_cache_dir'),
+        max_entries=module_params.get('object_cache_max_entries'))
@@ -11,6 +11,10 @@ from pathlib import Path
 
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import get_lookup_cache
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.instrumentation \
+    import instrument_module
 
 
 LOG = utils.get_logger('powerflex_base')
@@ -39,10 +43,13 @@ class PowerFlexBase:
 
         utils.ensure_required_libs(self.module)
         self.result = {"changed": False}
+        self.timings = instrument_module(self.module)
 
         try:
             self.powerflex_conn = utils.get_powerflex_gateway_host_connection(
                 self.module.params)
+            self.lookup_cache = get_lookup_cache(
+                self.powerflex_conn, self.module.params)
             LOG.info("Got the PowerFlex system connection object instance")
         except Exception as e:
             LOG.error(str(e))
@@ -0,0 +1,59 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+def get_name_map(entity_client, entity_ids):
+    """
+    Get the names of objects, listed with a single query
+    :param entity_client: Client of the entity, e.g. the volume client of
+                          a PowerFlex connection
+    :param entity_ids: IDs of the objects
+    :return: Names of the objects by id, the objects not found are left out
+    :rtype: dict
+    """
+    entity_ids = set(entity_ids)
+    if not entity_ids:
+        return {}
+    return dict((entity['id'], entity['name'])
+                for entity in entity_client.get(fields=['id', 'name']) or []
+                if entity['id'] in entity_ids)
+
+
+def enrich_replication_pairs(powerflex_conn, pairs, volume_names=True,
+                             rcg_names=True, rcg=None):
+    """
+    Add the local volume and replication consistency group names to
+    replication pairs, joining them in memory with the volumes and RCGs
+    listed once for all the pairs
+    :param powerflex_conn: PowerFlex connection
+    :param pairs: Replication pairs as returned by the gateway
+    :param volume_names: Whether to add localVolumeName
+    :param rcg_names: Whether to add replicationConsistencyGroupName
+    :param rcg: RCG all the pairs belong to, so the RCGs are not listed
+    :return: The pairs, without their links
+    :rtype: list
+    """
+    volume_name_map = {}
+    if volume_names:
+        volume_name_map = get_name_map(
+            powerflex_conn.volume, (pair['localVolumeId'] for pair in pairs))
+    rcg_name_map = None
+    if rcg_names and rcg is None:
+        rcg_name_map = get_name_map(
+            powerflex_conn.replication_consistency_group,
+            (pair['replicationConsistencyGroupId'] for pair in pairs))
+    for pair in pairs:
+        pair.pop('links', None)
+        if pair['localVolumeId'] in volume_name_map:
+            pair['localVolumeName'] = volume_name_map[pair['localVolumeId']]
+        if rcg_names and rcg is not None:
+            pair['replicationConsistencyGroupName'] = rcg['name']
+        elif rcg_name_map is not None:
+            pair['replicationConsistencyGroupName'] = \
+                rcg_name_map.get(pair['replicationConsistencyGroupId'])
+    return pairs
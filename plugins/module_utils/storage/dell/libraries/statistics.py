@@ -0,0 +1,172 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from datetime import datetime
+
+DEFAULT_CHUNK_SIZE = 500
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+AGGREGATIONS = {
+    'last': lambda values: values[-1],
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'avg': lambda values: sum(values) / len(values)
+}
+
+
+def iter_chunks(ids, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Split a list of object ids into the ids of one metrics query each
+    :param ids: Object ids
+    :param chunk_size: Maximum number of ids per query
+    :return: Generator of lists of at most chunk_size ids
+    """
+    chunk_size = max(chunk_size or DEFAULT_CHUNK_SIZE, 1)
+    for start in range(0, len(ids), chunk_size):
+        yield ids[start:start + chunk_size]
+
+
+def parse_timestamp(timestamp):
+    """
+    :param timestamp: Timestamp of a metrics response
+    :return: The timestamp as datetime, None if it can not be parsed
+    """
+    try:
+        return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_window_start(timestamps, window):
+    """
+    Get the index of the first sample within the time window
+    :param timestamps: Timestamps of the samples, oldest first
+    :param window: Length of the window in seconds, ending at the newest
+                   sample. All samples are kept when not given
+    :return: Index of the first sample to keep
+    :rtype: int
+    """
+    if not window or not timestamps:
+        return 0
+    parsed = [parse_timestamp(timestamp) for timestamp in timestamps]
+    if parsed[-1] is None:
+        return 0
+    for index, timestamp in enumerate(parsed):
+        if timestamp is not None and \
+                (parsed[-1] - timestamp).total_seconds() <= window:
+            return index
+    return len(timestamps) - 1
+
+
+class StatisticsTable:
+
+    """
+    Metrics of objects of one resource type in columnar form.
+
+    Every metric maps to one column holding a value per object, in the
+    order of ``ids``. Without aggregation the value is the series of the
+    samples within the window, otherwise a single number. Objects the
+    gateway returned no value for hold None.
+    """
+
+    def __init__(self, ids, metrics=None, window=None, aggregation=None):
+        """
+        Initialize the statistics table
+        :param ids: Ids of the objects, in the order of the columns
+        :param metrics: Names of the metrics, all returned ones if empty
+        :param window: Length of the time window in seconds
+        :param aggregation: Name of the function applied to the samples
+                            of the window, the series is kept if not given
+        """
+        self.ids = list(ids)
+        self.metrics = list(metrics or [])
+        self.window = window
+        self.aggregation = aggregation
+        self.timestamps = []
+        self.columns = dict((metric, [None] * len(self.ids))
+                            for metric in self.metrics)
+        self._positions = dict((obj_id, index)
+                               for index, obj_id in enumerate(self.ids))
+
+    def add_response(self, response):
+        """
+        Add the resources of one metrics query response to the columns
+        :param response: Response of utility.query_metrics
+        """
+        timestamps = response.get('timestamps') or []
+        start = get_window_start(timestamps, self.window)
+        if len(timestamps[start:]) > len(self.timestamps):
+            self.timestamps = timestamps[start:]
+        for resource in response.get('resources') or []:
+            position = self._positions.get(resource.get('id'))
+            if position is None:
+                continue
+            for metric in resource.get('metrics') or []:
+                column = self.columns.get(metric.get('name'))
+                if column is None:
+                    if self.metrics:
+                        continue
+                    column = self.columns[metric['name']] = [None] * len(self.ids)
+                column[position] = self.get_value(
+                    (metric.get('values') or [])[start:])
+
+    def get_value(self, values):
+        """
+        :param values: Samples of a metric within the window
+        :return: The series, or its aggregate
+        """
+        if not self.aggregation:
+            return values
+        numbers = [value for value in values
+                   if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        if not numbers:
+            return None
+        return AGGREGATIONS[self.aggregation](numbers)
+
+    def get_column(self, metric):
+        """
+        :param metric: Name of the metric
+        :return: Values of the metric per object, in the order of ids
+        """
+        return self.columns.get(metric, [None] * len(self.ids))
+
+    def to_dict(self):
+        """
+        :return: The table as a JSON serializable dictionary
+        :rtype: dict
+        """
+        return dict(
+            ids=self.ids,
+            timestamps=self.timestamps,
+            window=self.window,
+            aggregation=self.aggregation,
+            metrics=dict(self.columns)
+        )
+
+
+def query_statistics(query_metrics, resource_type, ids, metrics=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE, window=None,
+                     aggregation=None):
+    """
+    Query the metrics of objects with one request per chunk of ids
+    :param query_metrics: utility.query_metrics of the PowerFlex connection
+    :param resource_type: Metrics resource type of the objects
+    :param ids: Ids of the objects
+    :param metrics: Names of the metrics, the defaults of the gateway if empty
+    :param chunk_size: Maximum number of ids per request
+    :param window: Length of the time window in seconds
+    :param aggregation: Name of the function applied to the samples
+    :return: Metrics of the objects in columnar form
+    :rtype: StatisticsTable
+    """
+    table = StatisticsTable(ids, metrics, window, aggregation)
+    for chunk in iter_chunks(table.ids, chunk_size):
+        table.add_response(query_metrics(resource_type, chunk,
+                                         list(metrics or [])) or {})
+    return table
@@ -0,0 +1,154 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Polling of PowerFlex objects until a long running operation completes"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import random
+import time
+
+DEFAULT_POLL_INTERVAL = 2
+DEFAULT_MAX_POLL_INTERVAL = 30
+DEFAULT_WAIT_TIMEOUT = 3600
+BACKOFF_FACTOR = 2
+JITTER = 0.1
+
+
+class WaitTimeout(Exception):
+
+    """
+    Raised when the awaited state is not reached in time.
+    """
+
+    def __init__(self, msg, state=None):
+        """
+        Initialize the timeout
+        :param msg: Error message
+        :param state: Last polled state
+        """
+        super().__init__(msg)
+        self.msg = msg
+        self.state = state
+
+
+def wait_for(get_state, is_done, timeout, interval=DEFAULT_POLL_INTERVAL,
+             max_interval=DEFAULT_MAX_POLL_INTERVAL, on_state=None,
+             jitter=JITTER, sleep=None, clock=None):
+    """
+    Poll a state until it is done.
+
+    The delay between two polls starts at interval and is multiplied by
+    BACKOFF_FACTOR up to max_interval while the state stays the same. It
+    is reset to interval whenever the state changes, so transitions are
+    followed closely and idle waits cost few requests. Every delay is
+    randomly shortened or lengthened by up to jitter times itself, so the
+    polls of operations started together spread out.
+    :param get_state: Callable returning the current state
+    :param is_done: Callable telling whether a state is the awaited one
+    :param timeout: Maximum number of seconds to wait
+    :param interval: Initial delay between two polls, in seconds
+    :param max_interval: Maximum delay between two polls, in seconds
+    :param on_state: Callable called with every polled state
+    :param jitter: Maximum fraction of a delay it is randomly changed by
+    :param sleep: Callable sleeping for a number of seconds, time.sleep
+                  if not given
+    :param clock: Callable returning a monotonic time in seconds,
+                  time.monotonic if not given
+    :return: The awaited state
+    :raises WaitTimeout: If the state is not done within timeout seconds
+    """
+    sleep = sleep or time.sleep
+    clock = clock or time.monotonic
+    deadline = clock() + timeout
+    delay = interval
+    previous = None
+    polls = 0
+    while True:
+        state = get_state()
+        polls += 1
+        if on_state is not None:
+            on_state(state)
+        if is_done(state):
+            return state
+        remaining = deadline - clock()
+        if remaining <= 0:
+            raise WaitTimeout(
+                "Timed out after {0} seconds and {1} polls waiting for the"
+                " operation to complete".format(timeout, polls), state)
+        if polls > 1 and state != previous:
+            delay = interval
+        previous = state
+        sleep(min(delay * (1 + jitter * (2 * random.random() - 1)), remaining))
+        delay = min(delay * BACKOFF_FACTOR, max_interval)
+
+
+def wait_for_completion(module, get_progress, is_done, operation):
+    """
+    Wait for a long running operation of a module to complete, as requested
+    by its wait and wait_timeout parameters. The polls reuse the session
+    of the module connection.
+    :param module: Ansible module object
+    :param get_progress: Callable returning the current progress of the
+                         operation, compared between polls
+    :param is_done: Callable telling whether a progress is the final one
+    :param operation: Description of the operation used in messages, e.g.
+                      "removal of device 1f2e3d4c00000000"
+    :return: Number of seconds and polls waited, and the history of the
+             progress, one entry per change; None if waiting was not
+             requested or in check mode
+    :rtype: dict
+    """
+    if not module.params.get('wait') or module.check_mode:
+        return None
+    start = time.monotonic()
+    details = dict(seconds=0.0, polls=0, history=[])
+
+    def on_state(progress):
+        elapsed = round(time.monotonic() - start, 3)
+        details['seconds'] = elapsed
+        details['polls'] += 1
+        history = details['history']
+        if not history or history[-1]['progress'] != progress:
+            history.append(dict(elapsed=elapsed, progress=progress))
+
+    try:
+        wait_for(get_progress, is_done, module.params['wait_timeout'],
+                 on_state=on_state)
+    except WaitTimeout as e:
+        errormsg = "Failed waiting for the {0}: {1}".format(operation, e.msg)
+        module.fail_json(msg=errormsg, wait_details=details)
+    except Exception as e:
+        errormsg = "Failed waiting for the {0} with error {1}".format(
+            operation, str(e))
+        module.fail_json(msg=errormsg, wait_details=details)
+    return details
+
+
+def get_removal_progress(get_func, entity_id, keys=()):
+    """
+    Get the progress of the removal of an object
+    :param get_func: Get method of the entity, e.g. the uncached_get of
+                     the device client of a PowerFlex connection, so no
+                     cached object is polled
+    :param entity_id: ID of the object
+    :param keys: Attributes of the object telling the removal progress
+    :return: The attributes of the object, None once it is removed
+    :rtype: dict
+    """
+    entities = get_func(filter_fields={'id': entity_id})
+    if not entities:
+        return None
+    return dict((key, entities[0].get(key)) for key in keys)
+
+
+def is_removed(progress):
+    """
+    Tell whether the removal of an object is complete
+    :param progress: Progress returned by get_removal_progress
+    :rtype: bool
+    """
+    return progress is None
@@ -0,0 +1,348 @@
+# Copyright: (c) 2026, Dell Technologies
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Persistent session cache for PowerFlex gateway connections"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    from PyPowerFlex import PowerFlexClient
+    from PyPowerFlex.utils import is_version_3
+    HAS_POWERFLEX_SDK = True
+except ImportError:
+    PowerFlexClient = object
+    HAS_POWERFLEX_SDK = False
+
+DEFAULT_SESSION_CACHE_DIR = '~/.ansible/tmp/powerflex_sessions'
+DEFAULT_SESSION_CACHE_TTL = 240
+HTTP_UNAUTHORIZED = 401
+
+
+class PowerFlexSessionCache:
+
+    """
+    On-disk cache of a PowerFlex gateway token keyed by
+    (hostname, port, username).
+
+    Entries are only valid for the password they were created with and
+    expire after ``ttl`` seconds. Reads and logins are serialized with an
+    exclusive file lock so concurrent tasks perform a single login. With
+    ``persist`` disabled the token is only shared in memory by the
+    entities of one client.
+    """
+
+    def __init__(self, hostname, port, username, password,
+                 ttl=DEFAULT_SESSION_CACHE_TTL, cache_dir=None, persist=True):
+        """
+        Initialize the session cache
+        :param hostname: PowerFlex gateway hostname
+        :param port: PowerFlex gateway port
+        :param username: PowerFlex username
+        :param password: PowerFlex password
+        :param ttl: Number of seconds a cached token stays valid
+        :param cache_dir: Directory holding the cache files
+        :param persist: Whether the token is stored on disk
+        """
+        self.ttl = ttl
+        self.persist = persist
+        self.cache_dir = os.path.expanduser(
+            cache_dir or DEFAULT_SESSION_CACHE_DIR)
+        key = hashlib.sha256(
+            "{0}:{1}:{2}".format(hostname, port, username).encode()).hexdigest()
+        self.path = os.path.join(self.cache_dir, key + '.json')
+        self.lock_path = self.path + '.lock'
+        self._fingerprint = hashlib.sha256(
+            "{0}:{1}".format(key, password).encode()).hexdigest()
+        self._entry = None
+        self._logout_func = None
+        self._lock = threading.RLock()
+        self.shares = 0
+
+    def _is_valid(self, entry):
+        return bool(entry) and entry.get('fingerprint') == self._fingerprint \
+            and entry.get('expires_at', 0) > time.time() \
+            and entry.get('token')
+
+    def _ensure_dir(self):
+        try:
+            os.makedirs(self.cache_dir, mode=0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        os.chmod(self.cache_dir, 0o700)
+
+    @contextmanager
+    def _file_lock(self):
+        self._ensure_dir()
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as cache_file:
+                return json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _write(self, entry):
+        tmp_path = "{0}.{1}.tmp".format(self.path, os.getpid())
+        fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as cache_file:
+            json.dump(entry, cache_file)
+        os.replace(tmp_path, self.path)
+
+    def login(self, entity, login_func, logout_func=None):
+        """
+        Set a valid token on the entity, logging in only on a cache miss
+        :param entity: PyPowerFlex request object whose token is shared
+        :param login_func: Original login callable of the entity
+        :param logout_func: Original logout callable of the entity, used by
+                            logout for a session logged in by this call
+        :return: PowerFlex API version
+        :rtype: str
+        """
+        with self._lock:
+            if not self._is_valid(self._entry):
+                if self.persist:
+                    with self._file_lock():
+                        entry = self._read()
+                        if not self._is_valid(entry):
+                            entry = self._new_entry(entity, login_func)
+                            self._write(entry)
+                else:
+                    entry = self._new_entry(entity, login_func)
+                    self._logout_func = logout_func
+                self._entry = entry
+            entity.token.set(self._entry['token'])
+            return self._entry['version']
+
+    def _new_entry(self, entity, login_func):
+        version = login_func()
+        return {
+            'token': entity.token.get(),
+            'version': version,
+            'fingerprint': self._fingerprint,
+            'expires_at': time.time() + self.ttl
+        }
+
+    def logout(self):
+        """
+        Log out the in-memory session, if any. Sessions stored on disk are
+        kept for the following tasks and left untouched.
+        """
+        with self._lock:
+            entry, logout_func = self._entry, self._logout_func
+            self._entry = None
+            self._logout_func = None
+            if self.persist or entry is None or logout_func is None:
+                return
+            logout_func(entry['token'], entry['version'])
+
+    def invalidate(self):
+        """Drop the cached token, e.g. after the gateway rejected it"""
+        with self._lock:
+            self._entry = None
+            if not self.persist:
+                return
+            with self._file_lock():
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+
+
+def bind_session_cache(entity, session_cache):
+    """
+    Route login, logout and requests of a PyPowerFlex entity through the
+    session cache. Requests rejected with HTTP 401 are retried once with
+    a fresh login.
+    :param entity: PyPowerFlex request object
+    :param session_cache: PowerFlexSessionCache instance
+    """
+    if getattr(entity, '_session_cache', None) is session_cache:
+        return
+    login_func = entity.login
+    logout_func = entity.logout
+    send_request_func = entity.send_request
+
+    def fresh_login():
+        # Querying the version already performs the basic-auth login, so
+        # only appliance (4.x and later) gateways need a second one.
+        version = entity.get_api_version()
+        if not is_version_3(version):
+            entity._appliance_login()
+        return version
+
+    def session_logout(token, version):
+        entity.token.set(token)
+        logout_func(version)
+
+    def login():
+        return session_cache.login(entity, fresh_login, session_logout)
+
+    def logout(version):
+        # Keep the session alive for the following tasks.
+        pass
+
+    def send_request(method, url, params=None, use_base_url=True, **url_params):
+        response = send_request_func(method, url, params, use_base_url, **url_params)
+        if response.status_code == HTTP_UNAUTHORIZED:
+            session_cache.invalidate()
+            response = send_request_func(method, url, params, use_base_url, **url_params)
+        return response
+
+    entity.login = login
+    entity.logout = logout
+    entity.send_request = send_request
+    entity._session_cache = session_cache
+    entity._unbound_requests = (login_func, logout_func, send_request_func)
+
+
+def unbind_session_cache(entity):
+    """
+    Restore the login, logout and requests of an entity bound by
+    bind_session_cache
+    :param entity: PyPowerFlex request object
+    """
+    entity.login, entity.logout, entity.send_request = entity._unbound_requests
+    del entity._unbound_requests
+    del entity._session_cache
+
+
+def get_client_entities(conn):
+    """
+    Get the storage entities created on a client
+    :param conn: PyPowerFlex client
+    :return: PyPowerFlex request objects
+    :rtype: list
+    """
+    entities = []
+    for attr_name in PowerFlexClient.__slots__:
+        try:
+            entity = getattr(conn, attr_name)
+        except Exception:
+            continue
+        if hasattr(entity, 'send_request'):
+            entities.append(entity)
+    return entities
+
+
+def bind_client_entities(conn, session_cache):
+    """
+    Bind every storage entity created on a client to the session cache
+    :param conn: PyPowerFlex client
+    :param session_cache: PowerFlexSessionCache instance
+    """
+    for entity in get_client_entities(conn):
+        bind_session_cache(entity, session_cache)
+
+
+def share_session(conn):
+    """
+    Make an initialized client safe for concurrent requests. The SDK logs
+    in and out around every request on a token shared by all entities,
+    so parallel requests would invalidate each other's token. Binding the
+    entities to one in-memory session avoids that. Clients already using
+    a session cache are left untouched. Every call must be paired with a
+    call to release_session.
+    :param conn: Initialized PyPowerFlex client
+    :return: The same client
+    """
+    if not HAS_POWERFLEX_SDK or not isinstance(conn, PowerFlexClient) \
+            or isinstance(conn, PowerFlexSessionClient):
+        return conn
+    session_cache = get_shared_session(conn)
+    if session_cache is None:
+        conf = conn.configuration
+        session_cache = PowerFlexSessionCache(
+            conf.gateway_address, conf.gateway_port, conf.username,
+            conf.password, persist=False)
+        bind_client_entities(conn, session_cache)
+    session_cache.shares += 1
+    return conn
+
+
+def get_shared_session(conn):
+    """
+    Get the in-memory session a client was switched to by share_session
+    :param conn: PyPowerFlex client
+    :return: PowerFlexSessionCache instance, None if the session is not shared
+    """
+    for entity in get_client_entities(conn):
+        session_cache = getattr(entity, '_session_cache', None)
+        if session_cache is not None and not session_cache.persist:
+            return session_cache
+    return None
+
+
+def release_session(conn):
+    """
+    Undo share_session. Once released by all its users, the shared session
+    is logged out and the client logs in and out around every request
+    again, so no session is left open on the gateway.
+    :param conn: PyPowerFlex client passed to share_session
+    """
+    if not HAS_POWERFLEX_SDK or not isinstance(conn, PowerFlexClient) \
+            or isinstance(conn, PowerFlexSessionClient):
+        return
+    session_cache = get_shared_session(conn)
+    if session_cache is None:
+        return
+    session_cache.shares -= 1
+    if session_cache.shares > 0:
+        return
+    for entity in get_client_entities(conn):
+        if getattr(entity, '_session_cache', None) is session_cache:
+            unbind_session_cache(entity)
+    try:
+        session_cache.logout()
+    except Exception:
+        # The session expires on the gateway anyway.
+        pass
+
+
+class PowerFlexSessionClient(PowerFlexClient):
+
+    """
+    PowerFlex client whose storage entities share a cached session
+    instead of logging in and out around every request.
+    """
+
+    def __init__(self, session_cache, **kwargs):
+        """
+        Initialize the client
+        :param session_cache: PowerFlexSessionCache instance
+        :param kwargs: Arguments of PowerFlexClient
+        """
+        super().__init__(**kwargs)
+        self.session_cache = session_cache
+
+    def _bind_entities(self):
+        bind_client_entities(self, self.session_cache)
+
+    def add_objects_common(self):
+        super().add_objects_common()
+        self._bind_entities()
+
+    def add_objects_gen1(self):
+        super().add_objects_gen1()
+        self._bind_entities()
+
+    def add_objects_gen2(self):
+        super().add_objects_gen2()
+        self._bind_entities()
@@ -12,6 +12,12 @@ from datetime import datetime
 from decimal import Decimal
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.logging_handler \
     import CustomRotatingFileHandler
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.session_cache \
+    import PowerFlexSessionCache, PowerFlexSessionClient, DEFAULT_SESSION_CACHE_TTL
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.object_cache \
+    import DEFAULT_OBJECT_CACHE_TTL, DEFAULT_OBJECT_CACHE_MAX_ENTRIES
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import DEFAULT_WAIT_TIMEOUT
 import traceback
 from ansible.module_utils.basic import missing_required_lib
 import random
@@ -46,7 +52,31 @@ def get_powerflex_gateway_host_parameters():
         password=dict(type='str', required=True, no_log=True),
         validate_certs=dict(type='bool', aliases=['verifycert'], required=False, default=True),
         port=dict(type='int', required=False, default=443),
-        timeout=dict(type='int', required=False, default=120)
+        timeout=dict(type='int', required=False, default=120),
+        session_cache=dict(type='bool', required=False, default=False),
+        session_cache_ttl=dict(type='int', required=False,
+                               default=DEFAULT_SESSION_CACHE_TTL),
+        session_cache_dir=dict(type='path', required=False),
+        lookup_cache=dict(type='bool', required=False, default=False),
+        object_cache=dict(type='bool', required=False, default=False),
+        object_cache_ttl=dict(type='int', required=False,
+                              default=DEFAULT_OBJECT_CACHE_TTL),
+        object_cache_max_entries=dict(type='int', required=False,
+                                      default=DEFAULT_OBJECT_CACHE_MAX_ENTRIES),
+        object_cache_dir=dict(type='path', required=False),
+        timings=dict(type='bool', required=False, default=False),
+        trace_file=dict(type='path', required=False)
+    )
+
+
+def get_powerflex_wait_parameters():
+    """Provides the parameters of the ansible modules waiting for long
+    running operations on PowerFlex Storage System to complete"""
+
+    return dict(
+        wait=dict(type='bool', required=False, default=False),
+        wait_timeout=dict(type='int', required=False,
+                          default=DEFAULT_WAIT_TIMEOUT)
     )
 
 
@@ -54,13 +84,24 @@ def get_powerflex_gateway_host_connection(module_params):
     """Establishes connection with PowerFlex storage system"""
 
     if HAS_POWERFLEX_SDK:
-        conn = PowerFlexClient(
+        conn_params = dict(
             gateway_address=module_params['hostname'],
             gateway_port=module_params['port'],
             verify_certificate=module_params['validate_certs'],
             username=module_params['username'],
             password=module_params['password'],
             timeout=module_params['timeout'])
+        if module_params.get('session_cache'):
+            session_cache = PowerFlexSessionCache(
+                hostname=module_params['hostname'],
+                port=module_params['port'],
+                username=module_params['username'],
+                password=module_params['password'],
+                ttl=module_params.get('session_cache_ttl') or DEFAULT_SESSION_CACHE_TTL,
+                cache_dir=module_params.get('session_cache_dir'))
+            conn = PowerFlexSessionClient(session_cache, **conn_params)
+        else:
+            conn = PowerFlexClient(**conn_params)
         conn.initialize()
         return conn
 
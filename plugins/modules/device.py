@@ -20,6 +20,7 @@ author:
 - Rajshree Khare (@khareRajshree) <ansible.team@dell.com>
 extends_documentation_fragment:
   - dellemc.powerflex.powerflex
+  - dellemc.powerflex.powerflex.wait
 options:
   current_pathname:
     description:
@@ -445,6 +446,31 @@ device_details:
         "vendorName": null,
         "writeCacheActive": false
     }
+wait_details:
+    description: Seconds and polls waited for the removal of the device to
+      complete, and the history of its progress.
+    returned: When I(wait) is C(true) and the device was removed
+    type: dict
+    contains:
+        seconds:
+            description: Number of seconds waited.
+            type: float
+        polls:
+            description: Number of polls.
+            type: int
+        history:
+            description: Progress each time it changed, with the number of
+              seconds since the wait started. The progress is null once
+              the object is removed.
+            type: list
+    sample: {
+        "seconds": 46.208,
+        "polls": 6,
+        "history": [
+            {"elapsed": 0.093, "progress": {"deviceState": "RemovePending", "errorState": "Okay"}},
+            {"elapsed": 46.208, "progress": null}
+        ]
+    }
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -454,6 +480,10 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import powerflex_compatibility
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import uncached_get
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import get_removal_progress, is_removed, wait_for_completion
 
 LOG = utils.get_logger('device')
 
@@ -486,6 +516,7 @@ class PowerFlexDevice(PowerFlexBase):
 
         super().__init__(AnsibleModule, module_params)
         super().check_module_compatibility()
+        self.wait_details = None
 
     def get_device_details(self, current_pathname=None, sds_id=None,
                            device_name=None, device_id=None):
@@ -758,12 +789,18 @@ class PowerFlexDevice(PowerFlexBase):
         try:
             LOG.info("Device to be removed: %s", device_id)
             self.powerflex_conn.device.delete(device_id=device_id)
-            return True
         except Exception as e:
             error_msg = "Remove device '%s' operation failed with " \
                         "error '%s'" % (device_id, str(e))
             LOG.error(error_msg)
             self.module.fail_json(msg=error_msg)
+        self.wait_details = wait_for_completion(
+            self.module,
+            lambda: get_removal_progress(
+                uncached_get(self.powerflex_conn.device), device_id,
+                ('deviceState', 'errorState')),
+            is_removed, "removal of device %s" % device_id)
+        return True
 
     def validate_input_parameters(self, device_name=None, device_id=None,
                                   current_pathname=None, sds_name=None,
@@ -949,6 +986,8 @@ class PowerFlexDevice(PowerFlexBase):
         remove_changed = False
         if state == 'absent' and device_details:
             remove_changed = self.remove_device(device_id)
+            if self.wait_details is not None:
+                result['wait_details'] = self.wait_details
 
         # Returning the updated device details
         result['changed'] = add_changed or remove_changed
@@ -1147,7 +1186,8 @@ def get_powerflex_device_parameters():
             choices=['Invalid', 'None', 'Read', 'Write', 'ReadAndWrite']),
         media_type=dict(choices=['HDD', 'SSD', 'NVDIMM']),
         state=dict(required=True, type='str', choices=['present', 'absent']),
-        force=dict(type='bool', default=False)
+        force=dict(type='bool', default=False),
+        **utils.get_powerflex_wait_parameters()
     )
 
 
@@ -150,6 +150,151 @@ options:
     type: bool
     default: false
     version_added: 2.3.0
+  max_workers:
+    description:
+    - Maximum number of I(gather_subset) entries fetched in parallel.
+    - C(1) fetches the subsets one after another and stops at the first failure.
+    - With a larger value the subsets are fetched concurrently over one shared
+      gateway session, and the failures of all subsets are reported together.
+    type: int
+    default: 1
+    version_added: 3.1.0
+  fields:
+    description:
+    - Keys to return for each entity of a subset, keyed by subset name.
+    - C(id) and C(name) are always returned.
+    - Subsets that are not listed return all keys.
+    - Related entities that are joined into a subset, such as C(SDS) of
+      C(fault_set), C(localVolumeName) and C(replicationConsistencyGroupName)
+      of C(replication_pair) and C(nvme_hosts) of C(sdt), are only looked up
+      when their key is requested.
+    - Statistics are only queried when C(statistics) is one of the keys.
+    type: dict
+    suboptions:
+      vol:
+        description:
+        - Keys returned for each entry of the C(vol) subset.
+        type: list
+        elements: str
+      storage_pool:
+        description:
+        - Keys returned for each entry of the C(storage_pool) subset.
+        type: list
+        elements: str
+      protection_domain:
+        description:
+        - Keys returned for each entry of the C(protection_domain) subset.
+        type: list
+        elements: str
+      sdc:
+        description:
+        - Keys returned for each entry of the C(sdc) subset.
+        type: list
+        elements: str
+      sds:
+        description:
+        - Keys returned for each entry of the C(sds) subset.
+        type: list
+        elements: str
+      snapshot_policy:
+        description:
+        - Keys returned for each entry of the C(snapshot_policy) subset.
+        type: list
+        elements: str
+      device:
+        description:
+        - Keys returned for each entry of the C(device) subset.
+        type: list
+        elements: str
+      rcg:
+        description:
+        - Keys returned for each entry of the C(rcg) subset.
+        type: list
+        elements: str
+      replication_pair:
+        description:
+        - Keys returned for each entry of the C(replication_pair) subset.
+        type: list
+        elements: str
+      fault_set:
+        description:
+        - Keys returned for each entry of the C(fault_set) subset.
+        type: list
+        elements: str
+      nvme_host:
+        description:
+        - Keys returned for each entry of the C(nvme_host) subset.
+        type: list
+        elements: str
+      sdt:
+        description:
+        - Keys returned for each entry of the C(sdt) subset.
+        type: list
+        elements: str
+    version_added: 3.1.0
+  statistics:
+    description:
+    - Amount of statistics returned with C(vol), C(storage_pool),
+      C(snapshot_policy), C(rcg) and C(replication_pair).
+    - C(none) does not query statistics at all and omits the C(statistics) key.
+    - C(summary) queries a small set of capacity and performance properties.
+    - C(full) queries the default statistics of each entity.
+    type: str
+    choices: ['none', 'summary', 'full']
+    default: full
+    version_added: 3.1.0
+  output_file:
+    description:
+    - Path of a gzip compressed NDJSON file the C(vol), C(device) and C(sdc)
+      subsets are written to instead of the module result.
+    - Each line holds one entity with an additional C(subset) key naming its
+      subset. The module result only returns the path and the number of
+      entities written per subset.
+    - The file is written on the host running the module and replaced once
+      the export completed.
+    type: path
+    version_added: 3.1.0
+  output_format:
+    description:
+    - Format of the export to I(output_file).
+    - C(ndjson) writes all exported subsets to one gzip compressed NDJSON file.
+    - C(csv), C(parquet) and C(feather) treat I(output_file) as a directory
+      and write one file per subset to it, named after the subset, for
+      example C(vol.parquet). The C(storage_pool) subset is exported as well.
+    - With a columnar format the nested keys of every entity, its statistics
+      included, are flattened into one typed column each, named after the
+      path of the key joined with dots. Lists are JSON encoded.
+    - C(parquet) and C(feather) require the pyarrow library on the host
+      running the module.
+    type: str
+    choices: ['ndjson', 'csv', 'parquet', 'feather']
+    default: ndjson
+    version_added: 3.1.0
+  page_size:
+    description:
+    - Number of entities processed and written at a time with I(output_file).
+    - Statistics of C(vol) are queried for one page at a time.
+    type: int
+    default: 1000
+    version_added: 3.1.0
+  delta_state_file:
+    description:
+    - Path of a state file holding a fingerprint of every entity returned by
+      the previous run.
+    - When specified only the entities added or modified since the previous
+      run are returned, and the statistics and related entities are only
+      looked up for them. The ids of added, modified and removed entities
+      are returned in I(Delta).
+    - Statistics are not part of the fingerprint.
+    - Changing the filters of a subset starts a new state for it, so all of
+      its entities are returned again.
+    - The file is written on the host running the module once all subsets
+      were gathered. It is not written in check mode, so the next run
+      returns the changes relative to the last run outside of check mode.
+    - Not applicable to C(managed_device), C(deployment), C(service_template)
+      and C(firmware_repository).
+    type: path
+    version_added: 3.1.0
 notes:
   - The I(check_mode) is supported.
   - The supported filter keys for the I(gather_subset) can be referred from PowerFlex Manager API documentation in U(https://developer.dell.com).
@@ -295,6 +440,59 @@ EXAMPLES = r'''
     validate_certs: "{{ validate_certs }}"
     gather_subset:
       - sdt
+
+- name: Get volume names, sizes and summary statistics
+  dellemc.powerflex.info:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - storage_pool
+    fields:
+      vol:
+        - sizeInKb
+        - storagePoolId
+        - statistics
+    statistics: summary
+
+- name: Write all volumes and SDCs to a compressed NDJSON file
+  dellemc.powerflex.info:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - sdc
+    output_file: "/tmp/powerflex_inventory.ndjson.gz"
+    page_size: 500
+
+- name: Write volumes, storage pools and devices to CSV files
+  dellemc.powerflex.info:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - storage_pool
+      - device
+    statistics: summary
+    output_file: "/tmp/powerflex_capacity"
+    output_format: csv
+
+- name: Get the volumes and SDCs changed since the previous run
+  dellemc.powerflex.info:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - sdc
+    delta_state_file: "/var/tmp/powerflex_info_delta.json"
 '''
 
 RETURN = r'''
@@ -303,6 +501,38 @@ changed:
     returned: always
     type: bool
     sample: 'false'
+Output_File:
+    description: Path of the file the C(vol), C(device) and C(sdc) subsets were written to.
+    returned: When I(output_file) is specified.
+    type: str
+    sample: "/tmp/powerflex_inventory.ndjson.gz"
+Delta:
+    description: Ids of the entities added, modified and removed since the previous run, per subset.
+    returned: When I(delta_state_file) is specified.
+    type: dict
+    sample: {
+        "vol": {
+            "added": ["456ad22e00000003"],
+            "modified": ["456ad22e00000001"],
+            "removed": []
+        }
+    }
+Exported_Counts:
+    description: Number of entities written to I(output_file) per subset.
+    returned: When I(output_file) is specified.
+    type: dict
+    sample: {
+        "vol": 100000,
+        "sdc": 2048
+    }
+Exported_Files:
+    description: Path of the file each subset was written to.
+    returned: When I(output_file) is specified with a columnar I(output_format).
+    type: dict
+    sample: {
+        "vol": "/tmp/powerflex_capacity/vol.csv",
+        "storage_pool": "/tmp/powerflex_capacity/storage_pool.csv"
+    }
 Array_Details:
     description: System entities of PowerFlex storage array.
     returned: always
@@ -2240,7 +2470,7 @@ sdt:
     }]
 '''
 
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
     import utils
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
@@ -2249,14 +2479,37 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import PowerFlexBase
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.configuration \
     import Configuration
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.export \
+    import ColumnarExport, NdjsonExport, iter_pages, ARROW_FORMATS, HAS_PYARROW
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.delta \
+    import DeltaState
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.replication \
+    import enrich_replication_pairs
 import re
 
 LOG = utils.get_logger('info')
 
 UNSUPPORTED_SUBSET_FOR_VERSION = 'One or more specified subset is not supported for the PowerFlex version.'
 POWERFLEX_MANAGER_GATHER_SUBSET = {'managed_device', 'deployment', 'service_template'}
+EXPORTED_SUBSETS = ('vol', 'device', 'sdc')
+COLUMNAR_EXPORTED_SUBSETS = ('vol', 'storage_pool', 'device', 'sdc')
 MIN_SUPPORTED_POWERFLEX_MANAGER_VERSION = 4.0
 ERROR_CODES = r'PARSE002|FILTER002|FILTER003'
+STATISTICS_SUMMARY_PROPERTIES = {
+    'vol': ['numOfMappedSdcs', 'userDataReadBwc', 'userDataWriteBwc',
+            'userDataSdcReadLatency', 'userDataSdcWriteLatency'],
+    'storage_pool': ['maxCapacityInKb', 'capacityInUseInKb',
+                     'capacityAvailableForVolumeAllocationInKb',
+                     'thinCapacityAllocatedInKb', 'numOfVolumes',
+                     'numOfDevices', 'userDataReadBwc', 'userDataWriteBwc'],
+    'snapshot_policy': ['numOfAutoSnapshots', 'numOfExpiredButLockedSnapshots',
+                        'numOfSrcVols'],
+    'rcg': ['numOfRplPairs', 'initialCopyProgress', 'lagPersistentInMillis',
+            'rplCgRpoCompliance', 'rplTransmitBwc'],
+    'replication_pair': ['initialCopyProgress', 'remainingCapacityToCopyInKb']
+}
 
 
 @powerflex_compatibility(min_ver='3.6', max_ver='5.0', successor='info_v2')
@@ -2270,13 +2523,15 @@ class PowerFlexInfo(PowerFlexBase):
         argument_spec = get_powerflex_info_parameters()
         module_params = {
             'argument_spec': argument_spec,
-            'supports_check_mode': False,
+            'supports_check_mode': True,
         }
         self.filter_keys = sorted(
             [k for k in argument_spec['filters']['options'].keys()
              if 'filter' in k])
         super().__init__(AnsibleModule, module_params)
         super().check_module_compatibility()
+        self.system_details = None
+        self.delta_state = None
 
     def get_api_details(self):
         """ Get api details of the array """
@@ -2291,6 +2546,12 @@ class PowerFlexInfo(PowerFlexBase):
             LOG.error(msg)
             self.module.fail_json(msg=msg)
 
+    def get_system_details(self):
+        """ Get the system list, fetched once per module run """
+        if self.system_details is None:
+            self.system_details = self.powerflex_conn.system.get()
+        return self.system_details
+
     def get_array_details(self):
         """ Get system details of a powerflex array """
 
@@ -2309,7 +2570,7 @@ class PowerFlexInfo(PowerFlexBase):
                            'mdmSecurityPolicy', 'showGuid', 'swid',
                            'systemVersionName', 'tlsVersion', 'upgradeState']
 
-            sys_list = self.powerflex_conn.system.get()
+            sys_list = self.get_system_details()
             sys_details_list = []
             for sys in sys_list:
                 sys_details = {}
@@ -2327,6 +2588,48 @@ class PowerFlexInfo(PowerFlexBase):
             LOG.error(msg)
             self.module.fail_json(msg=msg)
 
+    def get_subset_fields(self, subset):
+        """ Get the keys requested for a subset, None when not restricted """
+        fields = self.module.params.get('fields') or {}
+        return fields.get(subset)
+
+    def is_field_requested(self, subset, key):
+        """ Check whether a key is returned for the entities of a subset """
+        fields = self.get_subset_fields(subset)
+        return fields is None or key in fields
+
+    def get_statistics_mode(self, subset):
+        """ Get the statistics mode of a subset """
+        if not self.is_field_requested(subset, 'statistics'):
+            return 'none'
+        return self.module.params.get('statistics') or 'full'
+
+    def get_statistics_params(self, subset, entities=None):
+        """ Get the arguments of the statistics query of a subset. In delta
+            mode only the statistics of the given entities are queried """
+        params = {}
+        if self.get_statistics_mode(subset) == 'summary':
+            params['properties'] = STATISTICS_SUMMARY_PROPERTIES[subset]
+        if self.delta_state is not None and entities is not None:
+            params['ids'] = [entity['id'] for entity in entities]
+        return params
+
+    def select_changed(self, subset, entities, filter_dict=None):
+        """ In delta mode keep the entities added or modified since the
+            previous run, otherwise keep all entities """
+        if self.delta_state is None:
+            return entities
+        return self.delta_state.select_changed(subset, entities, filter_dict)
+
+    def project_fields(self, subset, entities):
+        """ Reduce the entities of a subset to the requested keys """
+        fields = self.get_subset_fields(subset)
+        if fields is None or not entities:
+            return entities
+        keys = ['id', 'name'] + [key for key in fields if key not in ('id', 'name')]
+        return [dict((key, entity[key]) for key in keys if key in entity)
+                for entity in entities]
+
     def get_sdc_list(self, filter_dict=None):
         """ Get the list of sdcs on a given PowerFlex storage system """
 
@@ -2338,7 +2641,8 @@ class PowerFlexInfo(PowerFlexBase):
                 sdc = self.powerflex_conn.sdc.get()
             # filter out NVMe host entities
             sdc = [obj for obj in sdc if obj.get('hostType') != 'NVMeHost']
-            return result_list(sdc)
+            sdc = self.select_changed('sdc', sdc, filter_dict)
+            return result_list(self.project_fields('sdc', sdc))
 
         except Exception as e:
             msg = 'Get SDC list from powerflex array failed with' \
@@ -2351,16 +2655,26 @@ class PowerFlexInfo(PowerFlexBase):
 
         try:
             LOG.info('Getting NVMe hosts list ')
-            sdc = self.powerflex_conn.sdc.get()
-            # filter out NVMe host entities
-            hosts = [obj for obj in sdc if obj.get('hostType') == 'NVMeHost']
+            query_filter = {}
+            response_filter = {}
+            for key, value in (filter_dict or {}).items():
+                # Names of unnamed hosts are only generated below and the
+                # host type is fixed by the query, so these filters are
+                # applied to the response
+                if key in ('name', 'hostType'):
+                    response_filter[key] = value
+                else:
+                    query_filter[key] = value
+            query_filter['hostType'] = 'NVMeHost'
+            hosts = self.powerflex_conn.sdc.get(filter_fields=query_filter)
             # Add name to NVMe hosts without giving name
             for host in hosts:
                 if host.get("name") is None:
                     host["name"] = f"NVMeHost:{host['id']}"
-            if filter_dict:
-                hosts = utils.filter_response(hosts, filter_dict)
-            return result_list(hosts)
+            if response_filter:
+                hosts = utils.filter_response(hosts, response_filter)
+            hosts = self.select_changed('nvme_host', hosts, filter_dict)
+            return result_list(self.project_fields('nvme_host', hosts))
 
         except Exception as e:
             msg = 'Get NVMe host list from powerflex array failed with' \
@@ -2377,7 +2691,8 @@ class PowerFlexInfo(PowerFlexBase):
                 sds = self.powerflex_conn.sds.get(filter_fields=filter_dict)
             else:
                 sds = self.powerflex_conn.sds.get()
-            return result_list(sds)
+            sds = self.select_changed('sds', sds, filter_dict)
+            return result_list(self.project_fields('sds', sds))
 
         except Exception as e:
             msg = 'Get SDS list from powerflex array failed with' \
@@ -2396,7 +2711,8 @@ class PowerFlexInfo(PowerFlexBase):
                 pd = self.powerflex_conn.protection_domain.get(filter_fields=filter_dict)
             else:
                 pd = self.powerflex_conn.protection_domain.get()
-            return result_list(pd)
+            pd = self.select_changed('protection_domain', pd, filter_dict)
+            return result_list(self.project_fields('protection_domain', pd))
 
         except Exception as e:
             msg = 'Get protection domain list from powerflex array failed ' \
@@ -2414,13 +2730,15 @@ class PowerFlexInfo(PowerFlexBase):
                 pool = self.powerflex_conn.storage_pool.get(filter_fields=filter_dict)
             else:
                 pool = self.powerflex_conn.storage_pool.get()
+            pool = self.select_changed('storage_pool', pool, filter_dict)
 
-            if pool:
-                statistics_map = self.powerflex_conn.utility.get_statistics_for_all_storagepools()
+            if pool and self.get_statistics_mode('storage_pool') != 'none':
+                statistics_map = self.powerflex_conn.utility.get_statistics_for_all_storagepools(
+                    **self.get_statistics_params('storage_pool', pool))
                 list_of_pool_ids_in_statistics = statistics_map.keys()
                 for item in pool:
                     item['statistics'] = statistics_map[item['id']] if item['id'] in list_of_pool_ids_in_statistics else {}
-            return result_list(pool)
+            return result_list(self.project_fields('storage_pool', pool))
 
         except Exception as e:
             msg = 'Get storage pool list from powerflex array failed with' \
@@ -2438,16 +2756,25 @@ class PowerFlexInfo(PowerFlexBase):
                 rcgs = self.powerflex_conn.replication_consistency_group.get(filter_fields=filter_dict)
             else:
                 rcgs = self.powerflex_conn.replication_consistency_group.get()
+            rcgs = self.select_changed('rcg', rcgs, filter_dict)
             if rcgs:
-                api_version = self.powerflex_conn.system.get()[0]['mdmCluster']['master']['versionInfo']
-                statistics_map = \
-                    self.powerflex_conn.replication_consistency_group.get_all_statistics(
-                        utils.is_version_less(utils.parse_version(api_version), '3.6'))
+                statistics_mode = self.get_statistics_mode('rcg')
+                statistics_map = {}
+                if statistics_mode == 'summary':
+                    statistics_map = \
+                        self.powerflex_conn.replication_consistency_group.query_selected_statistics(
+                            STATISTICS_SUMMARY_PROPERTIES['rcg'])
+                elif statistics_mode == 'full':
+                    api_version = self.get_system_details()[0]['mdmCluster']['master']['versionInfo']
+                    statistics_map = \
+                        self.powerflex_conn.replication_consistency_group.get_all_statistics(
+                            utils.is_version_less(utils.parse_version(api_version), '3.6'))
                 list_of_rcg_ids_in_statistics = statistics_map.keys()
                 for rcg in rcgs:
                     rcg.pop('links', None)
-                    rcg['statistics'] = statistics_map[rcg['id']] if rcg['id'] in list_of_rcg_ids_in_statistics else {}
-                return result_list(rcgs)
+                    if statistics_mode != 'none':
+                        rcg['statistics'] = statistics_map[rcg['id']] if rcg['id'] in list_of_rcg_ids_in_statistics else {}
+                return result_list(self.project_fields('rcg', rcgs))
 
         except Exception as e:
             msg = 'Get replication consistency group list from powerflex array failed with' \
@@ -2465,16 +2792,23 @@ class PowerFlexInfo(PowerFlexBase):
                 pairs = self.powerflex_conn.replication_pair.get(filter_fields=filter_dict)
             else:
                 pairs = self.powerflex_conn.replication_pair.get()
+            pairs = self.select_changed('replication_pair', pairs, filter_dict)
             if pairs:
-                for pair in pairs:
-                    pair.pop('links', None)
-                    local_volume = self.powerflex_conn.volume.get(filter_fields={'id': pair['localVolumeId']})
-                    if local_volume:
-                        pair['localVolumeName'] = local_volume[0]['name']
-                    pair['replicationConsistencyGroupName'] = \
-                        self.powerflex_conn.replication_consistency_group.get(filter_fields={'id': pair['replicationConsistencyGroupId']})[0]['name']
-                    pair['statistics'] = self.powerflex_conn.replication_pair.get_statistics(pair['id'])
-                return pairs
+                enrich_replication_pairs(
+                    self.powerflex_conn, pairs,
+                    volume_names=self.is_field_requested('replication_pair', 'localVolumeName'),
+                    rcg_names=self.is_field_requested('replication_pair', 'replicationConsistencyGroupName'))
+                statistics_mode = self.get_statistics_mode('replication_pair')
+                if statistics_mode == 'summary':
+                    statistics_map = self.powerflex_conn.replication_pair.query_selected_statistics(
+                        STATISTICS_SUMMARY_PROPERTIES['replication_pair'],
+                        ids=[pair['id'] for pair in pairs]) or {}
+                    for pair in pairs:
+                        pair['statistics'] = statistics_map.get(pair['id'], {})
+                elif statistics_mode == 'full':
+                    for pair in pairs:
+                        pair['statistics'] = self.powerflex_conn.replication_pair.get_statistics(pair['id'])
+                return self.project_fields('replication_pair', pairs)
 
         except Exception as e:
             msg = 'Get replication pair list from powerflex array failed with' \
@@ -2492,13 +2826,42 @@ class PowerFlexInfo(PowerFlexBase):
                 volumes = self.powerflex_conn.volume.get(filter_fields=filter_dict)
             else:
                 volumes = self.powerflex_conn.volume.get()
+            volumes = self.select_changed('vol', volumes, filter_dict)
 
-            if volumes:
-                statistics_map = self.powerflex_conn.utility.get_statistics_for_all_volumes()
+            if volumes and self.get_statistics_mode('vol') != 'none':
+                statistics_map = self.powerflex_conn.utility.get_statistics_for_all_volumes(
+                    **self.get_statistics_params('vol', volumes))
                 list_of_vol_ids_in_statistics = statistics_map.keys()
                 for item in volumes:
                     item['statistics'] = statistics_map[item['id']] if item['id'] in list_of_vol_ids_in_statistics else {}
-            return result_list(volumes)
+            return result_list(self.project_fields('vol', volumes))
+
+        except Exception as e:
+            msg = 'Get volumes list from powerflex array failed with' \
+                  ' error %s' % (str(e))
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+
+    def get_volumes_pages(self, filter_dict=None):
+        """ Get the volumes on a given PowerFlex storage system page by
+            page, querying the statistics of one page at a time """
+
+        try:
+            LOG.info('Getting volumes list in pages ')
+            if filter_dict:
+                volumes = self.powerflex_conn.volume.get(filter_fields=filter_dict)
+            else:
+                volumes = self.powerflex_conn.volume.get()
+            volumes = self.select_changed('vol', volumes, filter_dict)
+
+            statistics_mode = self.get_statistics_mode('vol')
+            for page in iter_pages(volumes, self.module.params.get('page_size')):
+                if statistics_mode != 'none':
+                    statistics_map = self.powerflex_conn.utility.get_statistics_for_all_volumes(
+                        ids=[item['id'] for item in page], **self.get_statistics_params('vol'))
+                    for item in page:
+                        item['statistics'] = statistics_map.get(item['id'], {})
+                yield result_list(self.project_fields('vol', page))
 
         except Exception as e:
             msg = 'Get volumes list from powerflex array failed with' \
@@ -2519,13 +2882,15 @@ class PowerFlexInfo(PowerFlexBase):
             else:
                 snapshot_policies = \
                     self.powerflex_conn.snapshot_policy.get()
+            snapshot_policies = self.select_changed('snapshot_policy', snapshot_policies, filter_dict)
 
-            if snapshot_policies:
-                statistics_map = self.powerflex_conn.utility.get_statistics_for_all_snapshot_policies()
+            if snapshot_policies and self.get_statistics_mode('snapshot_policy') != 'none':
+                statistics_map = self.powerflex_conn.utility.get_statistics_for_all_snapshot_policies(
+                    **self.get_statistics_params('snapshot_policy', snapshot_policies))
                 list_of_snap_pol_ids_in_statistics = statistics_map.keys()
                 for item in snapshot_policies:
                     item['statistics'] = statistics_map[item['id']] if item['id'] in list_of_snap_pol_ids_in_statistics else {}
-            return result_list(snapshot_policies)
+            return result_list(self.project_fields('snapshot_policy', snapshot_policies))
 
         except Exception as e:
             msg = 'Get snapshot policies list from powerflex array failed ' \
@@ -2543,8 +2908,9 @@ class PowerFlexInfo(PowerFlexBase):
                 devices = self.powerflex_conn.device.get(filter_fields=filter_dict)
             else:
                 devices = self.powerflex_conn.device.get()
+            devices = self.select_changed('device', devices, filter_dict)
 
-            return result_list(devices)
+            return result_list(self.project_fields('device', devices))
 
         except Exception as e:
             msg = 'Get device list from powerflex array failed ' \
@@ -2558,8 +2924,10 @@ class PowerFlexInfo(PowerFlexBase):
 
         try:
             LOG.info('Getting fault set list ')
+            subset_filter = filter_dict
             filter_pd = []
             if filter_dict:
+                filter_dict = dict(filter_dict)
                 if 'protectionDomainName' in filter_dict.keys():
                     filter_pd = filter_dict['protectionDomainName']
                     del filter_dict['protectionDomainName']
@@ -2567,21 +2935,33 @@ class PowerFlexInfo(PowerFlexBase):
             else:
                 fault_sets = self.powerflex_conn.fault_set.get()
 
-            fault_set_final = []
-            if fault_sets:
-                for fault_set in fault_sets:
-                    fault_set['protectionDomainName'] = Configuration(self.powerflex_conn, self.module).get_protection_domain(
-                        protection_domain_id=fault_set["protectionDomainId"])["name"]
-                    fault_set["SDS"] = Configuration(self.powerflex_conn, self.module).get_associated_sds(
-                        fault_set_id=fault_set['id'])
-                    fault_set_final.append(fault_set)
-            fault_sets = []
-            for fault_set in fault_set_final:
-                if fault_set['protectionDomainName'] in filter_pd:
-                    fault_sets.append(fault_set)
-            if len(filter_pd) != 0:
+            if not fault_sets:
+                self.select_changed('fault_set', fault_sets, subset_filter)
                 return result_list(fault_sets)
-            return result_list(fault_set_final)
+
+            fault_set_final = fault_sets
+            if len(filter_pd) != 0 or self.is_field_requested('fault_set', 'protectionDomainName'):
+                pd_map = {pd['id']: pd for pd in self.powerflex_conn.protection_domain.get()}
+                fault_set_final = []
+                for fault_set in fault_sets:
+                    pd_details = pd_map.get(fault_set['protectionDomainId'])
+                    if pd_details is None:
+                        error_msg = "Unable to find the protection domain with '%s'." \
+                            % fault_set['protectionDomainId']
+                        LOG.error(error_msg)
+                        self.module.fail_json(msg=error_msg)
+                    fault_set['protectionDomainName'] = pd_details['name']
+                    if len(filter_pd) == 0 or fault_set['protectionDomainName'] in filter_pd:
+                        fault_set_final.append(fault_set)
+            fault_set_final = self.select_changed('fault_set', fault_set_final, subset_filter)
+
+            if fault_set_final and self.is_field_requested('fault_set', 'SDS'):
+                sds_map = {}
+                for sds in self.powerflex_conn.sds.get():
+                    sds_map.setdefault(sds.get('faultSetId'), []).append(sds)
+                for fault_set in fault_set_final:
+                    fault_set['SDS'] = sds_map.get(fault_set['id'], [])
+            return result_list(self.project_fields('fault_set', fault_set_final))
 
         except Exception as e:
             msg = 'Get fault set list from powerflex array failed ' \
@@ -2622,25 +3002,18 @@ class PowerFlexInfo(PowerFlexBase):
         """ Get the list of sdt on a given PowerFlex Manager system """
         try:
             LOG.info('Getting sdt list ')
-            # Get the list of nvme hosts
-            associated_hosts = []
-            nvme_hosts = self.powerflex_conn.sdc.get(filter_fields={'hostType': "NVMeHost"})
-            for nvme_host in nvme_hosts:
-                controller = self.powerflex_conn.host.get_related(entity_id=nvme_host.get('id'), related='NvmeController')
-                associated_hosts.extend(controller)
-            associated_hosts_map = {controller.get('sdtId'): controller for controller in associated_hosts if controller.get('sdtId') is not None}
             if filter_dict:
                 sdts = self.powerflex_conn.sdt.get(filter_fields=filter_dict)
             else:
                 sdts = self.powerflex_conn.sdt.get()
+            sdts = self.select_changed('sdt', sdts, filter_dict)
 
-            for sdt in sdts:
-                sdt['nvme_hosts'] = []
-                for host in associated_hosts_map.values():
-                    if host.get('sdtId') == sdt.get('id'):
-                        sdt['nvme_hosts'].append(host)
+            if sdts and self.is_field_requested('sdt', 'nvme_hosts'):
+                controllers_map = Configuration(self.powerflex_conn, self.module).get_nvme_controllers_by_sdt()
+                for sdt in sdts:
+                    sdt['nvme_hosts'] = controllers_map.get(sdt.get('id'), [])
 
-            return result_list(sdts)
+            return result_list(self.project_fields('sdt', sdts))
 
         except Exception as e:
             msg = f'Get sdt from PowerFlex Manager failed with error {str(e)}'
@@ -2760,6 +3133,76 @@ class PowerFlexInfo(PowerFlexBase):
         if float(api_version) < MIN_SUPPORTED_POWERFLEX_MANAGER_VERSION and subset and set(subset).issubset(POWERFLEX_MANAGER_GATHER_SUBSET):
             self.module.exit_json(msg=UNSUPPORTED_SUBSET_FOR_VERSION, skipped=True)
 
+    def gather_subsets(self, subset, subset_dict_with_filter, subset_wo_param, filter_dict):
+        """ Run the getters of the requested subsets. With max_workers
+            greater than 1 they run concurrently and all failures are
+            reported together """
+
+        def fetch(key):
+            if key in subset_dict_with_filter:
+                return subset_dict_with_filter[key](filter_dict=filter_dict)
+            return subset_wo_param[key]()
+
+        keys = [key for key in subset
+                if key in subset_dict_with_filter or key in subset_wo_param]
+        max_workers = self.module.params.get('max_workers') or 1
+        if max_workers <= 1:
+            return {key: fetch(key) for key in keys}
+
+        task_results = run_tasks(self.module, self.powerflex_conn, fetch,
+                                 keys, max_workers)
+        subset_errors = {task.item: task.error for task in task_results if task.failed}
+        if subset_errors:
+            msg = 'Gathering the subsets failed with errors: %s' % '; '.join(
+                '%s: %s' % (key, error) for key, error in subset_errors.items())
+            LOG.error(msg)
+            self.module.fail_json(msg=msg, subset_errors=subset_errors)
+        return {task.item: task.result for task in task_results}
+
+    def get_exported_subsets(self):
+        """ Get the subsets written to the output file """
+        if self.module.params.get('output_format', 'ndjson') == 'ndjson':
+            return EXPORTED_SUBSETS
+        return COLUMNAR_EXPORTED_SUBSETS
+
+    def open_export(self):
+        """ Open the export of the output format to the output file """
+        output_format = self.module.params.get('output_format') or 'ndjson'
+        if output_format == 'ndjson':
+            return NdjsonExport(self.module.params['output_file'])
+        if output_format in ARROW_FORMATS and not HAS_PYARROW:
+            msg = missing_required_lib('pyarrow')
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+        return ColumnarExport(self.module.params['output_file'], output_format)
+
+    def export_subsets(self, subset, subset_dict_with_filter, filter_dict):
+        """ Write the exported subsets to the output file page by page
+            instead of returning them """
+
+        page_getters = {"vol": self.get_volumes_pages}
+        page_size = self.module.params.get('page_size')
+        output_file = self.module.params['output_file']
+        result = {}
+        try:
+            with self.open_export() as export:
+                for key in subset:
+                    if key in page_getters:
+                        pages = page_getters[key](filter_dict=filter_dict)
+                    else:
+                        pages = iter_pages(subset_dict_with_filter[key](filter_dict=filter_dict), page_size)
+                    for page in pages:
+                        export.write(key, page)
+            result['Output_File'] = export.path
+            result['Exported_Counts'] = export.counts
+            if isinstance(export, ColumnarExport):
+                result['Exported_Files'] = export.files
+            return result
+        except (IOError, OSError) as e:
+            msg = 'Writing the subsets to %s failed with error %s' % (output_file, str(e))
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+
     def perform_module_operation(self):
         """ Perform different actions on info based on user input
             in the playbook """
@@ -2770,6 +3213,10 @@ class PowerFlexInfo(PowerFlexBase):
             filter_dict = self.get_filters(filters)
             LOG.info('filters: %s', filter_dict)
 
+        if self.module.params.get('delta_state_file'):
+            self.delta_state = DeltaState(self.module.params['delta_state_file'],
+                                          self.module.params['hostname'])
+
         api_version = self.get_api_details()
         array_details = self.get_array_details()
         subset = self.module.params['gather_subset']
@@ -2798,11 +3245,31 @@ class PowerFlexInfo(PowerFlexBase):
             "deployment": self.get_deployments_list,
             "firmware_repository": self.get_firmware_repository_list
         }
+        additional_result = {}
+        if subset and self.module.params.get('output_file'):
+            exported_subsets = self.get_exported_subsets()
+            exported_subset = [key for key in subset if key in exported_subsets]
+            subset = [key for key in subset if key not in exported_subsets]
+            additional_result.update(
+                self.export_subsets(exported_subset, subset_dict_with_filter, filter_dict))
         if subset:
-            subset_result_filter = {key: subset_dict_with_filter[key](
-                filter_dict=filter_dict) for key in subset if key in subset_dict_with_filter}
-            subset_result_wo_param = {key: subset_wo_param[key](
-            ) for key in subset if key in subset_wo_param}
+            subset_result = self.gather_subsets(
+                subset, subset_dict_with_filter, subset_wo_param, filter_dict)
+            subset_result_filter = {key: value for key, value in subset_result.items()
+                                    if key in subset_dict_with_filter}
+            subset_result_wo_param = {key: value for key, value in subset_result.items()
+                                      if key in subset_wo_param}
+
+        if self.delta_state is not None:
+            additional_result['Delta'] = self.delta_state.delta
+            try:
+                if not self.module.check_mode:
+                    self.delta_state.save()
+            except (IOError, OSError) as e:
+                msg = 'Writing the delta state file %s failed with error %s' \
+                    % (self.delta_state.path, str(e))
+                LOG.error(msg)
+                self.module.fail_json(msg=msg)
 
         self.module.exit_json(
             Array_Details=array_details,
@@ -2825,7 +3292,8 @@ class PowerFlexInfo(PowerFlexBase):
             Deployments=subset_result_wo_param.get("deployment", []),
             FirmwareRepository=subset_result_wo_param.get(
                 "firmware_repository", []),
-            NVMeHosts=subset_result_filter.get("nvme_host", [])
+            NVMeHosts=subset_result_filter.get("nvme_host", []),
+            **additional_result
         )
 
 
@@ -2870,6 +3338,26 @@ def get_powerflex_info_parameters():
         include_related=dict(type='bool', default=False),
         include_bundles=dict(type='bool', default=False),
         include_components=dict(type='bool', default=False),
+        max_workers=dict(type='int', default=1),
+        fields=dict(type='dict',
+                    options=dict(
+                        vol=dict(type='list', elements='str'),
+                        storage_pool=dict(type='list', elements='str'),
+                        protection_domain=dict(type='list', elements='str'),
+                        sdc=dict(type='list', elements='str'),
+                        sds=dict(type='list', elements='str'),
+                        snapshot_policy=dict(type='list', elements='str'),
+                        device=dict(type='list', elements='str'),
+                        rcg=dict(type='list', elements='str'),
+                        replication_pair=dict(type='list', elements='str'),
+                        fault_set=dict(type='list', elements='str'),
+                        nvme_host=dict(type='list', elements='str'),
+                        sdt=dict(type='list', elements='str'))),
+        statistics=dict(type='str', choices=['none', 'summary', 'full'], default='full'),
+        output_file=dict(type='path'),
+        output_format=dict(type='str', choices=['ndjson', 'csv', 'parquet', 'feather'], default='ndjson'),
+        page_size=dict(type='int', default=1000),
+        delta_state_file=dict(type='path'),
     )
 
 
@@ -128,6 +128,145 @@ options:
     - Applicable when I(gather_subset) is C(firmware_repository).
     type: bool
     default: false
+  max_workers:
+    description:
+    - Maximum number of I(gather_subset) entries fetched in parallel.
+    - C(1) fetches the subsets one after another and stops at the first failure.
+    - With a larger value the subsets are fetched concurrently over one shared
+      gateway session, and the failures of all subsets are reported together.
+    type: int
+    default: 1
+    version_added: 3.1.0
+  fields:
+    description:
+    - Keys to return for each entity of a subset, keyed by subset name.
+    - C(id) and C(name) are always returned.
+    - Subsets that are not listed return all keys.
+    - The C(nvme_hosts) of C(sdt) are only looked up when the key is requested.
+    - Statistics are only queried when C(statistics) is one of the keys.
+    type: dict
+    suboptions:
+      vol:
+        description:
+        - Keys returned for each entry of the C(vol) subset.
+        type: list
+        elements: str
+      storage_pool:
+        description:
+        - Keys returned for each entry of the C(storage_pool) subset.
+        type: list
+        elements: str
+      protection_domain:
+        description:
+        - Keys returned for each entry of the C(protection_domain) subset.
+        type: list
+        elements: str
+      sdc:
+        description:
+        - Keys returned for each entry of the C(sdc) subset.
+        type: list
+        elements: str
+      snapshot_policy:
+        description:
+        - Keys returned for each entry of the C(snapshot_policy) subset.
+        type: list
+        elements: str
+      device:
+        description:
+        - Keys returned for each entry of the C(device) subset.
+        type: list
+        elements: str
+      nvme_host:
+        description:
+        - Keys returned for each entry of the C(nvme_host) subset.
+        type: list
+        elements: str
+      sdt:
+        description:
+        - Keys returned for each entry of the C(sdt) subset.
+        type: list
+        elements: str
+    version_added: 3.1.0
+  statistics:
+    description:
+    - Amount of metrics returned with C(vol) and C(storage_pool).
+    - C(none) does not query metrics at all and omits the C(statistics) key.
+    - C(summary) queries the host I/O, bandwidth and latency metrics only.
+    - C(full) queries all default metrics of each entity.
+    type: str
+    choices: ['none', 'summary', 'full']
+    default: full
+    version_added: 3.1.0
+  statistics_query:
+    description:
+    - Query the statistics of C(vol) and C(storage_pool) for the listed
+      entities only, in chunks of ids, and return them in columnar form.
+    - The statistics are returned in C(Statistics) instead of a
+      C(statistics) key of every entity. With I(output_file), every
+      exported volume gets a C(statistics) key mapping each metric to its
+      value.
+    - Ignored for a subset whose statistics are not queried, see
+      I(statistics) and I(fields).
+    type: dict
+    suboptions:
+      metrics:
+        description:
+        - Names of the metrics to query.
+        - Defaults to the metrics selected by I(statistics).
+        type: list
+        elements: str
+      chunk_size:
+        description:
+        - Maximum number of entity ids sent in one metrics query.
+        type: int
+        default: 500
+      window:
+        description:
+        - Length in seconds of the time window of samples kept, ending at
+          the newest sample.
+        - All returned samples are kept if not specified.
+        type: int
+      aggregation:
+        description:
+        - Function reducing the samples of the window to one value.
+        - The series of samples is returned if not specified.
+        type: str
+        choices: ['last', 'avg', 'min', 'max', 'sum']
+    version_added: 3.1.0
+  output_file:
+    description:
+    - Path of a gzip compressed NDJSON file the C(vol), C(device) and C(sdc)
+      subsets are written to instead of the module result.
+    - Each line holds one entity with an additional C(subset) key naming its
+      subset. The module result only returns the path and the number of
+      entities written per subset.
+    - The file is written on the host running the module and replaced once
+      the export completed.
+    type: path
+    version_added: 3.1.0
+  output_format:
+    description:
+    - Format of the export to I(output_file).
+    - C(ndjson) writes all exported subsets to one gzip compressed NDJSON file.
+    - C(csv), C(parquet) and C(feather) treat I(output_file) as a directory
+      and write one file per subset to it, named after the subset, for
+      example C(vol.parquet). The C(storage_pool) subset is exported as well.
+    - With a columnar format the nested keys of every entity, its statistics
+      included, are flattened into one typed column each, named after the
+      path of the key joined with dots. Lists are JSON encoded.
+    - C(parquet) and C(feather) require the pyarrow library on the host
+      running the module.
+    type: str
+    choices: ['ndjson', 'csv', 'parquet', 'feather']
+    default: ndjson
+    version_added: 3.1.0
+  page_size:
+    description:
+    - Number of entities processed and written at a time with I(output_file).
+    - Statistics of C(vol) are queried for one page at a time.
+    type: int
+    default: 1000
+    version_added: 3.1.0
 notes:
   - The supported filter keys for the I(gather_subset) can be referred from PowerFlex Manager API documentation in U(https://developer.dell.com).
   - The I(filter), I(sort), I(limit) and I(offset) options will be ignored when more than one I(gather_subset) is specified along with
@@ -255,6 +394,72 @@ EXAMPLES = r'''
   ansible.builtin.debug:
     msg: "{{ result_repository_out.FirmwareRepository |
         selectattr('id', 'equalto', '8aaa80788b7') | map(attribute='softwareBundles') | flatten }}"
+
+- name: Get volume names, sizes and summary statistics
+  dellemc.powerflex.info_v2:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - storage_pool
+    fields:
+      vol:
+        - sizeInKb
+        - storagePoolId
+        - statistics
+    statistics: summary
+
+- name: Get the average I/O of the volumes of a storage pool over 5 minutes
+  dellemc.powerflex.info_v2:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+    filters:
+      - filter_key: "storagePoolId"
+        filter_operator: "equal"
+        filter_value: "76f2b2fd00000000"
+    statistics_query:
+      metrics:
+        - host_read_iops
+        - host_write_iops
+      window: 300
+      aggregation: avg
+
+- name: Write all volumes and SDCs to a compressed NDJSON file
+  dellemc.powerflex.info_v2:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - sdc
+    output_file: "/tmp/powerflex_inventory.ndjson.gz"
+    page_size: 500
+
+- name: Write volumes, storage pools and their statistics to Parquet files
+  dellemc.powerflex.info_v2:
+    hostname: "{{ hostname }}"
+    username: "{{ username }}"
+    password: "{{ password }}"
+    validate_certs: "{{ validate_certs }}"
+    gather_subset:
+      - vol
+      - storage_pool
+      - device
+    fields:
+      vol:
+        - sizeInKb
+        - storagePoolId
+        - statistics
+    statistics: summary
+    output_file: "/tmp/powerflex_capacity"
+    output_format: parquet
 '''
 
 RETURN = r'''
@@ -263,6 +468,65 @@ changed:
     returned: always
     type: bool
     sample: 'false'
+Output_File:
+    description: Path of the file the C(vol), C(device) and C(sdc) subsets were written to.
+    returned: When I(output_file) is specified.
+    type: str
+    sample: "/tmp/powerflex_inventory.ndjson.gz"
+Exported_Counts:
+    description: Number of entities written to I(output_file) per subset.
+    returned: When I(output_file) is specified.
+    type: dict
+    sample: {
+        "vol": 100000,
+        "sdc": 2048
+    }
+Exported_Files:
+    description: Path of the file each subset was written to.
+    returned: When I(output_file) is specified with a columnar I(output_format).
+    type: dict
+    sample: {
+        "vol": "/tmp/powerflex_capacity/vol.parquet",
+        "storage_pool": "/tmp/powerflex_capacity/storage_pool.parquet"
+    }
+Statistics:
+    description:
+    - Statistics of the C(vol) and C(storage_pool) entities per subset,
+      in columnar form.
+    - Every metric maps to a list holding one value per entity, in the
+      order of C(ids).
+    returned: When I(statistics_query) is specified.
+    type: dict
+    contains:
+        ids:
+            description: IDs of the entities.
+            type: list
+        timestamps:
+            description: Timestamps of the samples within the window.
+            type: list
+        window:
+            description: Length of the time window in seconds.
+            type: int
+        aggregation:
+            description: Function applied to the samples of the window.
+            type: str
+        metrics:
+            description:
+            - Values per metric. A value is the series of samples, or
+              their aggregate with I(aggregation).
+            type: dict
+    sample: {
+        "vol": {
+            "ids": ["456ad22e00000003", "456ad22e00000004"],
+            "timestamps": ["2025-09-08T06:40:31Z", "2025-09-08T06:45:31Z"],
+            "window": 300,
+            "aggregation": "avg",
+            "metrics": {
+                "host_read_iops": [12.5, 0],
+                "host_write_iops": [40.0, null]
+            }
+        }
+    }
 Array_Details:
     description: System entities of PowerFlex storage array.
     returned: always
@@ -3975,21 +4239,39 @@ sdt:
 '''
 
 
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
     import utils
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import powerflex_compatibility
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.configuration \
+    import Configuration
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.export \
+    import ColumnarExport, NdjsonExport, iter_pages, ARROW_FORMATS, HAS_PYARROW
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.statistics \
+    import query_statistics
 import re
 
 LOG = utils.get_logger('info_v2')
 
 UNSUPPORTED_SUBSET_FOR_VERSION = 'One or more specified subset is not supported for the PowerFlex version.'
 POWERFLEX_MANAGER_GATHER_SUBSET = {'managed_device', 'deployment', 'service_template'}
+EXPORTED_SUBSETS = ('vol', 'device', 'sdc')
+COLUMNAR_EXPORTED_SUBSETS = ('vol', 'storage_pool', 'device', 'sdc')
 MIN_SUPPORTED_POWERFLEX_MANAGER_VERSION = 5.0
 ERROR_CODES = r'PARSE002|FILTER002|FILTER003'
+STATISTICS_SUMMARY_METRICS = {
+    'vol': ['host_read_iops', 'host_write_iops', 'host_read_bandwidth',
+            'host_write_bandwidth', 'avg_host_read_latency',
+            'avg_host_write_latency', 'logical_used', 'logical_provisioned'],
+    'storage_pool': ['host_read_iops', 'host_write_iops', 'host_read_bandwidth',
+                     'host_write_bandwidth', 'avg_host_read_latency',
+                     'avg_host_write_latency']
+}
 
 
 @powerflex_compatibility(min_ver='5.0', predecessor='info')
@@ -4010,6 +4292,8 @@ class PowerFlexInfo(PowerFlexBase):
              if 'filter' in k])
         super().__init__(AnsibleModule, module_params)
         super().check_module_compatibility()
+        self.system_details = None
+        self.statistics = {}
 
     def get_api_details(self):
         """ Get api details of the array """
@@ -4023,6 +4307,12 @@ class PowerFlexInfo(PowerFlexBase):
             LOG.error(msg)
             self.module.fail_json(msg=msg)
 
+    def get_system_details(self):
+        """ Get the system list, fetched once per module run """
+        if self.system_details is None:
+            self.system_details = self.powerflex_conn.system.get()
+        return self.system_details
+
     def get_array_details(self):
         """ Get system details of a powerflex array """
 
@@ -4041,7 +4331,7 @@ class PowerFlexInfo(PowerFlexBase):
                            'mdmSecurityPolicy', 'showGuid', 'swid',
                            'systemVersionName', 'tlsVersion', 'upgradeState']
 
-            sys_list = self.powerflex_conn.system.get()
+            sys_list = self.get_system_details()
             sys_details_list = []
             for sys in sys_list:
                 sys_details = {}
@@ -4058,6 +4348,63 @@ class PowerFlexInfo(PowerFlexBase):
             LOG.error(msg)
             self.module.fail_json(msg=msg)
 
+    def get_subset_fields(self, subset):
+        """ Get the keys requested for a subset, None when not restricted """
+        fields = self.module.params.get('fields') or {}
+        return fields.get(subset)
+
+    def is_field_requested(self, subset, key):
+        """ Check whether a key is returned for the entities of a subset """
+        fields = self.get_subset_fields(subset)
+        return fields is None or key in fields
+
+    def get_statistics_mode(self, subset):
+        """ Get the statistics mode of a subset """
+        if not self.is_field_requested(subset, 'statistics'):
+            return 'none'
+        return self.module.params.get('statistics') or 'full'
+
+    def get_statistics_metrics(self, subset):
+        """ Get the metrics queried for a subset, empty for the defaults """
+        if self.get_statistics_mode(subset) == 'summary':
+            return STATISTICS_SUMMARY_METRICS[subset]
+        return []
+
+    def add_statistics(self, subset, resource_type, entities, ids=None):
+        """ Query the metrics of the entities of a subset. With
+            statistics_query they are queried for the entities only and
+            kept in columnar form, otherwise every entity gets its own
+            statistics key """
+        if not entities or self.get_statistics_mode(subset) == 'none':
+            return None
+        query = self.module.params.get('statistics_query')
+        if query:
+            return query_statistics(
+                self.powerflex_conn.utility.query_metrics, resource_type,
+                [item['id'] for item in entities],
+                query.get('metrics') or self.get_statistics_metrics(subset),
+                query.get('chunk_size'), query.get('window'),
+                query.get('aggregation'))
+
+        resources = self.powerflex_conn.utility.query_metrics(
+            resource_type, ids or [], self.get_statistics_metrics(subset)).get("resources", [])
+        resource_map = {res["id"]: res["metrics"] for res in resources}
+        for item in entities:
+            metrics = resource_map.get(item['id'], {})
+            if isinstance(metrics, list):
+                metrics = [{'name': m['name'], 'stat_values': m.pop('values')} if 'values' in m else m for m in metrics]
+            item['statistics'] = metrics
+        return None
+
+    def project_fields(self, subset, entities):
+        """ Reduce the entities of a subset to the requested keys """
+        fields = self.get_subset_fields(subset)
+        if fields is None or not entities:
+            return entities
+        keys = ['id', 'name'] + [key for key in fields if key not in ('id', 'name')]
+        return [dict((key, entity[key]) for key in keys if key in entity)
+                for entity in entities]
+
     def get_sdc_list(self, filter_dict=None):
         """ Get the list of sdcs on a given PowerFlex storage system """
 
@@ -4069,7 +4416,7 @@ class PowerFlexInfo(PowerFlexBase):
                 sdc = self.powerflex_conn.sdc.get()
             # filter out NVMe host entities
             sdc = [obj for obj in sdc if obj.get('hostType') != 'NVMeHost']
-            return result_list(sdc)
+            return result_list(self.project_fields('sdc', sdc))
 
         except Exception as e:
             msg = f'Get SDC list from powerflex array failed with error {str(e)}'
@@ -4081,16 +4428,25 @@ class PowerFlexInfo(PowerFlexBase):
 
         try:
             LOG.info('Getting NVMe hosts list ')
-            sdc = self.powerflex_conn.sdc.get()
-            # filter out NVMe host entities
-            hosts = [obj for obj in sdc if obj.get('hostType') == 'NVMeHost']
+            query_filter = {}
+            response_filter = {}
+            for key, value in (filter_dict or {}).items():
+                # Names of unnamed hosts are only generated below and the
+                # host type is fixed by the query, so these filters are
+                # applied to the response
+                if key in ('name', 'hostType'):
+                    response_filter[key] = value
+                else:
+                    query_filter[key] = value
+            query_filter['hostType'] = 'NVMeHost'
+            hosts = self.powerflex_conn.sdc.get(filter_fields=query_filter)
             # Add name to NVMe hosts without giving name
             for host in hosts:
                 if host.get("name") is None:
                     host["name"] = f"NVMeHost:{host['id']}"
-            if filter_dict:
-                hosts = utils.filter_response(hosts, filter_dict)
-            return result_list(hosts)
+            if response_filter:
+                hosts = utils.filter_response(hosts, response_filter)
+            return result_list(self.project_fields('nvme_host', hosts))
 
         except Exception as e:
             msg = f'Get NVMe host list from powerflex array failed with error {str(e)}'
@@ -4108,7 +4464,7 @@ class PowerFlexInfo(PowerFlexBase):
                 pd = self.powerflex_conn.protection_domain.get(filter_fields=filter_dict)
             else:
                 pd = self.powerflex_conn.protection_domain.get()
-            return result_list(pd)
+            return result_list(self.project_fields('protection_domain', pd))
 
         except Exception as e:
             msg = f'Get protection domain list from powerflex array failed with error {str(e)}'
@@ -4126,15 +4482,10 @@ class PowerFlexInfo(PowerFlexBase):
             else:
                 pool = self.powerflex_conn.storage_pool.get()
 
-            if pool:
-                resources = self.powerflex_conn.utility.query_metrics('storage_pool', [], []).get("resources", [])
-                resource_map = {res["id"]: res["metrics"] for res in resources}
-                for item in pool:
-                    metrics = resource_map.get(item['id'], {})
-                    if isinstance(metrics, list):
-                        metrics = [{'name': m['name'], 'stat_values': m.pop('values')} if 'values' in m else m for m in metrics]
-                    item['statistics'] = metrics
-            return result_list(pool)
+            table = self.add_statistics('storage_pool', 'storage_pool', pool)
+            if table:
+                self.statistics['storage_pool'] = table.to_dict()
+            return result_list(self.project_fields('storage_pool', pool))
 
         except Exception as e:
             msg = f'Get storage pool list from powerflex array failed with error {str(e)}'
@@ -4152,15 +4503,36 @@ class PowerFlexInfo(PowerFlexBase):
             else:
                 volumes = self.powerflex_conn.volume.get()
 
-            if volumes:
-                resources = self.powerflex_conn.utility.query_metrics('volume', [], []).get("resources", [])
-                resource_map = {res["id"]: res["metrics"] for res in resources}
-                for item in volumes:
-                    metrics = resource_map.get(item['id'], {})
-                    if isinstance(metrics, list):
-                        metrics = [{'name': m['name'], 'stat_values': m.pop('values')} if 'values' in m else m for m in metrics]
-                    item['statistics'] = metrics
-            return result_list(volumes)
+            table = self.add_statistics('vol', 'volume', volumes)
+            if table:
+                self.statistics['vol'] = table.to_dict()
+            return result_list(self.project_fields('vol', volumes))
+
+        except Exception as e:
+            msg = f'Get volumes list from powerflex array failed with error {str(e)}'
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+
+    def get_volumes_pages(self, filter_dict=None):
+        """ Get the volumes on a given PowerFlex storage system page by
+            page, querying the metrics of one page at a time """
+
+        try:
+            LOG.info('Getting volumes list in pages ')
+            if filter_dict:
+                volumes = self.powerflex_conn.volume.get(filter_fields=filter_dict)
+            else:
+                volumes = self.powerflex_conn.volume.get()
+
+            for page in iter_pages(volumes, self.module.params.get('page_size')):
+                table = self.add_statistics('vol', 'volume', page,
+                                            [item['id'] for item in page])
+                if table:
+                    for index, item in enumerate(page):
+                        item['statistics'] = dict(
+                            (metric, column[index])
+                            for metric, column in table.columns.items())
+                yield result_list(self.project_fields('vol', page))
 
         except Exception as e:
             msg = f'Get volumes list from powerflex array failed with error {str(e)}'
@@ -4180,7 +4552,7 @@ class PowerFlexInfo(PowerFlexBase):
             else:
                 snapshot_policies = \
                     self.powerflex_conn.snapshot_policy.get()
-            return result_list(snapshot_policies)
+            return result_list(self.project_fields('snapshot_policy', snapshot_policies))
 
         except Exception as e:
             msg = f'Get snapshot policies list from powerflex array failed with error {str(e)}'
@@ -4198,7 +4570,7 @@ class PowerFlexInfo(PowerFlexBase):
             else:
                 devices = self.powerflex_conn.device.get()
 
-            return result_list(devices)
+            return result_list(self.project_fields('device', devices))
 
         except Exception as e:
             msg = f'Get device list from powerflex array failed with error {str(e)}'
@@ -4238,25 +4610,17 @@ class PowerFlexInfo(PowerFlexBase):
         """ Get the list of sdt on a given PowerFlex Manager system """
         try:
             LOG.info('Getting sdt list ')
-            # Get the list of nvme hosts
-            associated_hosts = []
-            nvme_hosts = self.powerflex_conn.sdc.get(filter_fields={'hostType': "NVMeHost"})
-            for nvme_host in nvme_hosts:
-                controller = self.powerflex_conn.host.get_related(entity_id=nvme_host.get('id'), related='NvmeController')
-                associated_hosts.extend(controller)
-            associated_hosts_map = {controller.get('sdtId'): controller for controller in associated_hosts if controller.get('sdtId') is not None}
             if filter_dict:
                 sdts = self.powerflex_conn.sdt.get(filter_fields=filter_dict)
             else:
                 sdts = self.powerflex_conn.sdt.get()
 
-            for sdt in sdts:
-                sdt['nvme_hosts'] = []
-                for host in associated_hosts_map.values():
-                    if host.get('sdtId') == sdt.get('id'):
-                        sdt['nvme_hosts'].append(host)
+            if sdts and self.is_field_requested('sdt', 'nvme_hosts'):
+                controllers_map = Configuration(self.powerflex_conn, self.module).get_nvme_controllers_by_sdt()
+                for sdt in sdts:
+                    sdt['nvme_hosts'] = controllers_map.get(sdt.get('id'), [])
 
-            return result_list(sdts)
+            return result_list(self.project_fields('sdt', sdts))
 
         except Exception as e:
             msg = f'Get sdt from PowerFlex Manager failed with error {str(e)}'
@@ -4374,6 +4738,85 @@ class PowerFlexInfo(PowerFlexBase):
         if float(api_version) < MIN_SUPPORTED_POWERFLEX_MANAGER_VERSION and subset and set(subset).issubset(POWERFLEX_MANAGER_GATHER_SUBSET):
             self.module.exit_json(msg=UNSUPPORTED_SUBSET_FOR_VERSION, skipped=True)
 
+    def gather_subsets(self, subset, subset_dict_with_filter, subset_wo_param, filter_dict):
+        """ Run the getters of the requested subsets. With max_workers
+            greater than 1 they run concurrently and all failures are
+            reported together """
+
+        def fetch(key):
+            if key in subset_dict_with_filter:
+                return subset_dict_with_filter[key](filter_dict=filter_dict)
+            return subset_wo_param[key]()
+
+        keys = [key for key in subset
+                if key in subset_dict_with_filter or key in subset_wo_param]
+        max_workers = self.module.params.get('max_workers') or 1
+        if max_workers <= 1:
+            return {key: fetch(key) for key in keys}
+
+        task_results = run_tasks(self.module, self.powerflex_conn, fetch,
+                                 keys, max_workers)
+        subset_errors = {task.item: task.error for task in task_results if task.failed}
+        if subset_errors:
+            msg = 'Gathering the subsets failed with errors: %s' % '; '.join(
+                '%s: %s' % (key, error) for key, error in subset_errors.items())
+            LOG.error(msg)
+            self.module.fail_json(msg=msg, subset_errors=subset_errors)
+        return {task.item: task.result for task in task_results}
+
+    def get_exported_subsets(self):
+        """ Get the subsets written to the output file """
+        if self.module.params.get('output_format', 'ndjson') == 'ndjson':
+            return EXPORTED_SUBSETS
+        return COLUMNAR_EXPORTED_SUBSETS
+
+    def open_export(self):
+        """ Open the export of the output format to the output file """
+        output_format = self.module.params.get('output_format') or 'ndjson'
+        if output_format == 'ndjson':
+            return NdjsonExport(self.module.params['output_file'])
+        if output_format in ARROW_FORMATS and not HAS_PYARROW:
+            msg = missing_required_lib('pyarrow')
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+        return ColumnarExport(self.module.params['output_file'], output_format)
+
+    def get_exported_pages(self, key, subset_dict_with_filter, filter_dict):
+        """ Get the pages of entities of an exported subset """
+        if key == 'vol':
+            return self.get_volumes_pages(filter_dict=filter_dict)
+        entities = subset_dict_with_filter[key](filter_dict=filter_dict) or []
+        statistics = self.statistics.pop(key, None)
+        if statistics:
+            positions = dict((obj_id, index) for index, obj_id in enumerate(statistics['ids']))
+            for entity in entities:
+                index = positions.get(entity['id'])
+                entity['statistics'] = dict(
+                    (metric, None if index is None else column[index])
+                    for metric, column in statistics['metrics'].items())
+        return iter_pages(entities, self.module.params.get('page_size'))
+
+    def export_subsets(self, subset, subset_dict_with_filter, filter_dict):
+        """ Write the exported subsets to the output file page by page
+            instead of returning them """
+
+        output_file = self.module.params['output_file']
+        result = {}
+        try:
+            with self.open_export() as export:
+                for key in subset:
+                    for page in self.get_exported_pages(key, subset_dict_with_filter, filter_dict):
+                        export.write(key, page)
+            result['Output_File'] = export.path
+            result['Exported_Counts'] = export.counts
+            if isinstance(export, ColumnarExport):
+                result['Exported_Files'] = export.files
+            return result
+        except (IOError, OSError) as e:
+            msg = f'Writing the subsets to {output_file} failed with error {str(e)}'
+            LOG.error(msg)
+            self.module.fail_json(msg=msg)
+
     def perform_module_operation(self):
         """ Perform different actions on info_v2 based on user input
             in the playbook """
@@ -4408,11 +4851,22 @@ class PowerFlexInfo(PowerFlexBase):
             "deployment": self.get_deployments_list,
             "firmware_repository": self.get_firmware_repository_list
         }
+        export_result = {}
+        if subset and self.module.params.get('output_file'):
+            exported_subsets = self.get_exported_subsets()
+            exported_subset = [key for key in subset if key in exported_subsets]
+            subset = [key for key in subset if key not in exported_subsets]
+            export_result.update(
+                self.export_subsets(exported_subset, subset_dict_with_filter, filter_dict))
         if subset:
-            subset_result_filter = {key: subset_dict_with_filter[key](
-                filter_dict=filter_dict) for key in subset if key in subset_dict_with_filter}
-            subset_result_wo_param = {key: subset_wo_param[key](
-            ) for key in subset if key in subset_wo_param}
+            subset_result = self.gather_subsets(
+                subset, subset_dict_with_filter, subset_wo_param, filter_dict)
+            subset_result_filter = {key: value for key, value in subset_result.items()
+                                    if key in subset_dict_with_filter}
+            subset_result_wo_param = {key: value for key, value in subset_result.items()
+                                      if key in subset_wo_param}
+        if self.module.params.get('statistics_query'):
+            export_result['Statistics'] = self.statistics
 
         self.module.exit_json(
             Array_Details=array_details,
@@ -4431,7 +4885,8 @@ class PowerFlexInfo(PowerFlexBase):
             Deployments=subset_result_wo_param.get("deployment", []),
             FirmwareRepository=subset_result_wo_param.get(
                 "firmware_repository", []),
-            NVMeHosts=subset_result_filter.get("nvme_host", [])
+            NVMeHosts=subset_result_filter.get("nvme_host", []),
+            **export_result
         )
 
 
@@ -4473,6 +4928,27 @@ def get_powerflex_info_parameters():
         full=dict(type='bool', default=False),
         include_attachments=dict(type='bool', default=True),
         include_bundles=dict(type='bool', default=False),
+        max_workers=dict(type='int', default=1),
+        fields=dict(type='dict',
+                    options=dict(
+                        vol=dict(type='list', elements='str'),
+                        storage_pool=dict(type='list', elements='str'),
+                        protection_domain=dict(type='list', elements='str'),
+                        sdc=dict(type='list', elements='str'),
+                        snapshot_policy=dict(type='list', elements='str'),
+                        device=dict(type='list', elements='str'),
+                        nvme_host=dict(type='list', elements='str'),
+                        sdt=dict(type='list', elements='str'))),
+        statistics=dict(type='str', choices=['none', 'summary', 'full'], default='full'),
+        statistics_query=dict(type='dict',
+                              options=dict(
+                                  metrics=dict(type='list', elements='str'),
+                                  chunk_size=dict(type='int', default=500),
+                                  window=dict(type='int'),
+                                  aggregation=dict(type='str', choices=['last', 'avg', 'min', 'max', 'sum']))),
+        output_file=dict(type='path'),
+        output_format=dict(type='str', choices=['ndjson', 'csv', 'parquet', 'feather'], default='ndjson'),
+        page_size=dict(type='int', default=1000),
     )
 
 
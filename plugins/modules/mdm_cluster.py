@@ -528,6 +528,10 @@ mdm_cluster_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import get_lookup_cache
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.instrumentation \
+    import instrument_module
 import copy
 
 LOG = utils.get_logger('mdm_cluster')
@@ -554,12 +558,14 @@ class PowerFlexMdmCluster(object):
             required_together=required_together_args)
 
         utils.ensure_required_libs(self.module)
+        instrument_module(self.module)
 
         self.not_exist_msg = "MDM {0} does not exists in MDM cluster."
         self.exist_msg = "MDM already exists in the MDM cluster"
         try:
             self.powerflex_conn = utils.get_powerflex_gateway_host_connection(
                 self.module.params)
+            get_lookup_cache(self.powerflex_conn, self.module.params)
             LOG.info("Got the PowerFlex system connection object instance")
             LOG.info('Check Mode Flag %s', self.module.check_mode)
         except Exception as e:
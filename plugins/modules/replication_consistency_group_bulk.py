@@ -0,0 +1,556 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Dell Technologies
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible module for running an action on many replication consistency groups on Dell Technologies (Dell) PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: replication_consistency_group_bulk
+version_added: '3.1.0'
+short_description: Run a disaster recovery action on many replication consistency groups on Dell PowerFlex
+description:
+- Running a failover, switchover, reverse, restore, sync, pause, resume,
+  freeze or unfreeze action on a set of replication consistency groups
+  (RCGs) of PowerFlex storage system in a single task.
+- The RCGs are selected by name, by ID or by protection domain, and are
+  resolved with a single query.
+- The action is sent to a bounded number of RCGs in parallel. The state of
+  every RCG is then polled with an adaptive backoff until the action
+  completed, and a timeline of every RCG is returned.
+author:
+- Dell Technologies (@dellemc) <ansible.team@dell.com>
+extends_documentation_fragment:
+  - dellemc.powerflex.powerflex
+options:
+  rcg_names:
+    description:
+    - Names of the RCGs.
+    type: list
+    elements: str
+  rcg_ids:
+    description:
+    - IDs of the RCGs.
+    type: list
+    elements: str
+  protection_domain_name:
+    description:
+    - Name of a protection domain, all of its RCGs are selected.
+    - Mutually exclusive with I(protection_domain_id).
+    type: str
+  protection_domain_id:
+    description:
+    - ID of a protection domain, all of its RCGs are selected.
+    - Mutually exclusive with I(protection_domain_name).
+    type: str
+  action:
+    description:
+    - Action to run on the RCGs.
+    - RCGs already in the state the action leads to are left unchanged.
+    choices: ['failover', 'reverse', 'restore',
+              'switchover', 'sync', 'pause',
+              'resume', 'freeze', 'unfreeze']
+    type: str
+    required: true
+  force:
+    description:
+    - Force switchover the RCGs.
+    type: bool
+    default: false
+  pause_mode:
+    description:
+    - Pause mode.
+    - It is required if I(action) is C(pause).
+    choices: ['StopDataTransfer', 'OnlyTrackChanges']
+    type: str
+  max_workers:
+    description:
+    - Maximum number of RCGs the action is run on in parallel.
+    type: int
+    default: 4
+  wait:
+    description:
+    - Whether to wait for the action to complete on every RCG.
+    type: bool
+    default: true
+  wait_timeout:
+    description:
+    - Maximum number of seconds to wait for the action to complete on an
+      RCG.
+    type: int
+    default: 600
+attributes:
+  check_mode:
+    description: Runs task to validate without performing action on the target machine.
+    support: full
+  diff_mode:
+    description: Runs the task to report the changes made or to be made.
+    support: none
+notes:
+  - The RCGs selected by name, by ID and by protection domain are merged,
+    every RCG is acted on once.
+  - The RCGs are acted on independently. A failing or timed out RCG does
+    not stop the others, and the task fails after all RCGs were processed.
+  - The polling delay of an RCG starts at 2 seconds and doubles up to 30
+    seconds while its state does not change.
+'''
+
+EXAMPLES = r'''
+- name: Failover all the RCGs of a protection domain
+  dellemc.powerflex.replication_consistency_group_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    protection_domain_name: "domain1"
+    action: "failover"
+    max_workers: 16
+    wait_timeout: 1200
+
+- name: Switchover RCGs by name
+  dellemc.powerflex.replication_consistency_group_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    rcg_names:
+      - "rcg_app1"
+      - "rcg_app2"
+    action: "switchover"
+    force: true
+
+- name: Pause RCGs without waiting
+  dellemc.powerflex.replication_consistency_group_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    rcg_ids:
+      - "aadc17d500000000"
+      - "aadc17d600000001"
+    action: "pause"
+    pause_mode: "StopDataTransfer"
+    wait: false
+'''
+
+RETURN = r'''
+changed:
+    description: Whether or not the resource has changed.
+    returned: always
+    type: bool
+    sample: 'false'
+replication_consistency_groups:
+    description: Outcome of the action on every selected RCG.
+    returned: always
+    type: list
+    contains:
+        name:
+            description: Name of the RCG, or the name or ID it was selected by.
+            type: str
+        id:
+            description: ID of the RCG, if it exists.
+            type: str
+        changed:
+            description: Whether the action was or would be sent.
+            type: bool
+        state:
+            description: Last known failover type, failover state, pause mode,
+              freeze state, consistency mode and replication direction of the RCG.
+            type: dict
+        timeline:
+            description:
+            - Events of the RCG, with the number of seconds since the start
+              of the task.
+            - C(selected) carries the state before the action, C(sent) is
+              logged once the action was accepted, C(polled) every time the
+              polled state changed, and C(done) or C(timeout) ends the wait.
+            type: list
+        seconds:
+            description: Number of seconds from the start of the task until
+              the RCG completed or failed.
+            type: float
+        error:
+            description: Error message if the action failed or timed out.
+            type: str
+    sample: [
+        {
+            "name": "rcg_app1",
+            "id": "aadc17d500000000",
+            "changed": true,
+            "state": {
+                "failoverType": "Failover",
+                "failoverState": "Done",
+                "pauseMode": "None",
+                "freezeState": "Unfrozen",
+                "currConsistMode": "Consistent",
+                "replicationDirection": "LocalToRemote"
+            },
+            "timeline": [
+                {"event": "selected", "elapsed": 0.412,
+                 "state": {"failoverType": "None", "failoverState": "None"}},
+                {"event": "sent", "elapsed": 0.603},
+                {"event": "polled", "elapsed": 2.71,
+                 "state": {"failoverType": "Failover", "failoverState": "Done"}},
+                {"event": "done", "elapsed": 2.71}
+            ],
+            "seconds": 2.71,
+            "error": null
+        }
+    ]
+summary:
+    description: Number of RCGs per outcome, and the duration of the task.
+    returned: always
+    type: dict
+    contains:
+        total:
+            description: Number of selected RCGs.
+            type: int
+        changed:
+            description: Number of RCGs the action was or would be sent to.
+            type: int
+        unchanged:
+            description: Number of RCGs already in the requested state.
+            type: int
+        failed:
+            description: Number of RCGs that failed or timed out.
+            type: int
+        seconds:
+            description: Number of seconds until the slowest RCG completed.
+            type: float
+    sample: {
+        "total": 2,
+        "changed": 1,
+        "unchanged": 1,
+        "failed": 0,
+        "seconds": 2.71
+    }
+'''
+
+import time
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell\
+    import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
+    import powerflex_compatibility
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
+    import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.bulk \
+    import index_entities
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import WaitTimeout, wait_for
+
+LOG = utils.get_logger('replication_consistency_group_bulk')
+
+STATE_KEYS = ('failoverType', 'failoverState', 'pauseMode', 'freezeState',
+              'currConsistMode', 'replicationDirection')
+
+
+# State of an RCG on which the action completed
+TARGET_STATES = {
+    'failover': ('failoverType', 'Failover'),
+    'switchover': ('failoverType', 'Switchover'),
+    'reverse': ('failoverType', 'None'),
+    'restore': ('failoverType', 'None'),
+    'sync': ('currConsistMode', 'Consistent'),
+    'resume': ('pauseMode', 'None'),
+    'freeze': ('freezeState', 'Frozen'),
+    'unfreeze': ('freezeState', 'Unfrozen')
+}
+
+
+def is_action_done(action, state):
+    """Tell whether an action completed on an RCG
+        :param action: Name of the action
+        :param state: State of the RCG
+        :return: True if the RCG is in the state the action leads to
+    """
+    if action == 'pause':
+        return state.get('pauseMode') not in (None, 'None')
+    key, value = TARGET_STATES[action]
+    return str(state.get(key)).lower() == value.lower()
+
+
+def needs_action(action, state):
+    """Tell whether an action is to be sent to an RCG
+        :param action: Name of the action
+        :param state: State of the RCG
+        :return: False if the RCG is already in the state the action leads
+                 to, sync being always sent
+    """
+    return action == 'sync' or not is_action_done(action, state)
+
+
+def get_state(rcg):
+    """Get the part of the RCG details the actions change
+        :param rcg: Details of the RCG
+        :return: State of the RCG
+    """
+    return dict((key, rcg.get(key)) for key in STATE_KEYS)
+
+
+@powerflex_compatibility(min_ver='3.6', max_ver='5.0')
+class PowerFlexReplicationConsistencyGroupBulk(PowerFlexBase):
+    """Class with bulk replication consistency group operations"""
+
+    def __init__(self):
+        argument_spec = get_powerflex_rcg_bulk_parameters()
+        mut_ex_args = [['protection_domain_name', 'protection_domain_id']]
+        required_one_of_args = [['rcg_names', 'rcg_ids',
+                                 'protection_domain_name',
+                                 'protection_domain_id']]
+        required_if_args = [['action', 'pause', ['pause_mode']]]
+
+        module_params = {
+            'argument_spec': argument_spec,
+            'supports_check_mode': True,
+            'mutually_exclusive': mut_ex_args,
+            'required_one_of': required_one_of_args,
+            'required_if': required_if_args
+        }
+
+        super().__init__(AnsibleModule, module_params)
+        super().check_module_compatibility()
+        self.start = time.time()
+
+    def get_elapsed(self):
+        """Get the number of seconds since the start of the task"""
+        return round(time.time() - self.start, 3)
+
+    def list_rcgs(self):
+        """Get all RCGs with a single query
+            :return: List of RCGs
+        """
+        try:
+            return self.powerflex_conn.replication_consistency_group.get()
+        except Exception as e:
+            errormsg = "Failed to get the list of replication consistency" \
+                       " groups with error {0}".format(str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+
+    def get_protection_domain_id(self, protection_domain_name=None,
+                                 protection_domain_id=None):
+        """Get the ID of the protection domain the RCGs are selected by
+            :param protection_domain_name: Name of the protection domain
+            :param protection_domain_id: ID of the protection domain
+            :return: ID of the protection domain
+        """
+        if protection_domain_id:
+            return protection_domain_id
+        try:
+            pd_details = self.powerflex_conn.protection_domain.get(
+                filter_fields={'name': protection_domain_name})
+        except Exception as e:
+            error_msg = "Failed to get the protection domain '%s' with " \
+                        "error '%s'" % (protection_domain_name, str(e))
+            LOG.error(error_msg)
+            self.module.fail_json(msg=error_msg)
+        if not pd_details:
+            self.module.fail_json(
+                msg="Unable to find the protection domain with "
+                    "'%s'." % protection_domain_name)
+        return pd_details[0]['id']
+
+    def select_rcgs(self, params):
+        """Select the RCGs by name, by ID and by protection domain
+            :param params: Module parameters
+            :return: List of dictionaries with the name, id and details of
+                     every selected RCG, the details being None for the
+                     names and IDs that match no RCG
+        """
+        rcgs = self.list_rcgs()
+        by_id, by_key = index_entities(rcgs)
+        selected = []
+        selected_ids = set()
+
+        def select(name, rcg):
+            if rcg is not None and rcg['id'] in selected_ids:
+                return
+            if rcg is not None:
+                selected_ids.add(rcg['id'])
+                name = rcg['name']
+            selected.append(dict(name=name, id=rcg['id'] if rcg else None,
+                                 rcg=rcg))
+
+        for rcg_name in params['rcg_names'] or []:
+            matches = by_key['name'].get(rcg_name, [])
+            select(rcg_name, matches[0] if matches else None)
+        for rcg_id in params['rcg_ids'] or []:
+            select(rcg_id, by_id.get(rcg_id))
+        if params['protection_domain_name'] or params['protection_domain_id']:
+            pd_id = self.get_protection_domain_id(
+                params['protection_domain_name'], params['protection_domain_id'])
+            for rcg in rcgs:
+                if rcg.get('protectionDomainId') == pd_id:
+                    select(rcg['name'], rcg)
+        return selected
+
+    def send_action(self, rcg_id, action):
+        """Send an action to an RCG
+            :param rcg_id: ID of the RCG
+            :param action: Name of the action
+        """
+        params = self.module.params
+        rcg_api = self.powerflex_conn.replication_consistency_group
+        if action == 'switchover':
+            rcg_api.switchover(rcg_id, params['force'])
+        elif action == 'pause':
+            rcg_api.pause(rcg_id, params['pause_mode'])
+        else:
+            getattr(rcg_api, action)(rcg_id)
+
+    def poll_state(self, rcg_id):
+        """Get the current state of an RCG
+            :param rcg_id: ID of the RCG
+            :return: State of the RCG
+        """
+        return get_state(
+            self.powerflex_conn.replication_consistency_group.get(entity_id=rcg_id))
+
+    def run_action(self, item):
+        """Run the action on an RCG and record the number of seconds from
+           the start of the task until it completed or failed
+            :param item: Dictionary with the name, id and details of the RCG
+            :return: The item, with its outcome, timeline and seconds
+        """
+        try:
+            return self.apply_action(item)
+        finally:
+            item['seconds'] = self.get_elapsed()
+
+    def apply_action(self, item):
+        """Apply the action to an RCG and wait for it to complete
+            :param item: Dictionary with the name, id and details of the RCG
+            :return: The item, with its outcome and timeline
+        """
+        params = self.module.params
+        action = params['action']
+        timeline = item['timeline']
+        state = item['state'] = get_state(item['rcg'])
+        timeline.append(dict(event='selected', elapsed=self.get_elapsed(),
+                             state=state))
+        if not needs_action(action, state):
+            return item
+        item['changed'] = True
+        if self.module.check_mode:
+            return item
+        try:
+            self.send_action(item['id'], action)
+        except Exception as e:
+            errormsg = "{0} of replication consistency group {1} failed" \
+                       " with error {2}".format(action.capitalize(),
+                                                item['name'], str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+        timeline.append(dict(event='sent', elapsed=self.get_elapsed()))
+        if not params['wait']:
+            return item
+
+        def on_state(polled):
+            if polled != item['state']:
+                timeline.append(dict(event='polled',
+                                     elapsed=self.get_elapsed(),
+                                     state=polled))
+            item['state'] = polled
+
+        try:
+            wait_for(lambda: self.poll_state(item['id']),
+                     lambda polled: is_action_done(action, polled),
+                     params['wait_timeout'], on_state=on_state)
+        except WaitTimeout as e:
+            timeline.append(dict(event='timeout', elapsed=self.get_elapsed()))
+            errormsg = "{0} of replication consistency group {1}:" \
+                       " {2}".format(action.capitalize(), item['name'], e.msg)
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+        timeline.append(dict(event='done', elapsed=self.get_elapsed()))
+        return item
+
+    def perform_module_operation(self):
+        """
+        Run the action on the selected RCGs based on the parameters passed
+        in the playbook
+        """
+        params = self.module.params
+        selected = self.select_rcgs(params)
+        to_run = []
+        for item in selected:
+            item.update(changed=False, state=None, timeline=[], seconds=None,
+                        error=None)
+            if item['rcg'] is None:
+                item['error'] = "Replication consistency group {0} does" \
+                                " not exist".format(item['name'])
+            else:
+                to_run.append(item)
+        LOG.info("Running %s on the RCGs %s", params['action'],
+                 [item['name'] for item in to_run])
+
+        for task in run_tasks(self.module, self.powerflex_conn,
+                              self.run_action, to_run,
+                              params['max_workers']):
+            if task.failed:
+                task.item['error'] = task.error
+
+        rcgs = [dict((key, item[key]) for key in
+                     ('name', 'id', 'changed', 'state', 'timeline',
+                      'seconds', 'error')) for item in selected]
+        failed = [item for item in rcgs if item['error']]
+        result = dict(
+            changed=any(item['changed'] for item in rcgs),
+            replication_consistency_groups=rcgs,
+            summary=dict(
+                total=len(rcgs),
+                changed=sum(1 for item in rcgs
+                            if item['changed'] and not item['error']),
+                unchanged=sum(1 for item in rcgs
+                              if not item['changed'] and not item['error']),
+                failed=len(failed),
+                seconds=self.get_elapsed())
+        )
+        if failed:
+            errormsg = "Failed to {0} {1} of {2} replication consistency" \
+                       " groups: {3}".format(params['action'], len(failed),
+                                             len(rcgs), "; ".join(
+                                                 item['error'] for item in failed))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg, **result)
+        self.module.exit_json(**result)
+
+
+def get_powerflex_rcg_bulk_parameters():
+    """This method provide parameter required for the bulk replication
+    consistency group module on PowerFlex"""
+    return dict(
+        rcg_names=dict(type='list', elements='str'),
+        rcg_ids=dict(type='list', elements='str'),
+        protection_domain_name=dict(), protection_domain_id=dict(),
+        action=dict(required=True,
+                    choices=['failover', 'reverse', 'restore', 'switchover',
+                             'sync', 'pause', 'resume', 'freeze', 'unfreeze']),
+        force=dict(type='bool', default=False),
+        pause_mode=dict(choices=['StopDataTransfer', 'OnlyTrackChanges']),
+        max_workers=dict(type='int', default=4),
+        wait=dict(type='bool', default=True),
+        wait_timeout=dict(type='int', default=600)
+    )
+
+
+def main():
+    """ Create PowerFlex bulk replication consistency group object and
+        perform actions on it based on user input from playbook"""
+    obj = PowerFlexReplicationConsistencyGroupBulk()
+    obj.perform_module_operation()
+
+
+if __name__ == '__main__':
+    main()
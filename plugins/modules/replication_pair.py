@@ -82,6 +82,12 @@ options:
         description:
         - Name of replication pair.
         type: str
+  max_workers:
+    description:
+    - Maximum number of replication pair add requests sent in parallel.
+    type: int
+    default: 1
+    version_added: '3.1.0'
   remote_peer:
     description:
     - Remote peer system.
@@ -181,6 +187,29 @@ EXAMPLES = r'''
       validate_certs: "{{validate_certs}}"
       port: "{{port}}"
 
+- name: Create replication pairs sending four add requests in parallel
+  dellemc.powerflex.replication_pair:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    rcg_name: "test_rcg"
+    max_workers: 4
+    pairs:
+      - source_volume_name: "src_vol_1"
+        target_volume_name: "dest_vol_1"
+        copy_type: "OnlineCopy"
+      - source_volume_name: "src_vol_2"
+        target_volume_name: "dest_vol_2"
+        copy_type: "OnlineCopy"
+    remote_peer:
+      hostname: "{{remote_hostname}}"
+      username: "{{remote_username}}"
+      password: "{{remote_password}}"
+      validate_certs: "{{validate_certs}}"
+      port: "{{port}}"
+
 - name: Pause replication pair
   dellemc.powerflex.replication_pair:
     hostname: "{{hostname}}"
@@ -377,6 +406,12 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import powerflex_compatibility
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.bulk \
+    import index_entities
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.replication \
+    import enrich_replication_pairs
 
 LOG = utils.get_logger('replication_pair')
 
@@ -397,6 +432,16 @@ class PowerFlexReplicationPair(PowerFlexBase):
         }
         super().__init__(AnsibleModule, ansible_module_params)
         super().check_module_compatibility()
+        self.remote_powerflex_conn = None
+
+    def get_remote_connection(self):
+        """Get the connection to the remote peer, created on first use
+            :return: PowerFlex connection to the remote peer gateway
+        """
+        if self.remote_powerflex_conn is None:
+            self.remote_powerflex_conn = utils.get_powerflex_gateway_host_connection(
+                self.module.params['remote_peer'])
+        return self.remote_powerflex_conn
 
     def get_replication_pair(self, pair_name=None, pair_id=None):
         """Get replication pair details
@@ -441,9 +486,7 @@ class PowerFlexReplicationPair(PowerFlexBase):
             if filter_by_name:
                 filter_field = {'name': vol_name_or_id}
             if is_remote:
-                self.remote_powerflex_conn = utils.get_powerflex_gateway_host_connection(
-                    self.module.params['remote_peer'])
-                volume_details = self.remote_powerflex_conn.volume.get(
+                volume_details = self.get_remote_connection().volume.get(
                     filter_fields=filter_field)
             else:
                 volume_details = self.powerflex_conn.volume.get(
@@ -458,6 +501,67 @@ class PowerFlexReplicationPair(PowerFlexBase):
             LOG.error(errormsg)
             self.module.fail_json(msg=errormsg)
 
+    def get_volume_ids(self, vol_names, is_remote=False):
+        """Get the IDs of volumes, listed with a single query
+            :param vol_names: Names of the volumes
+            :param is_remote: Specifies if source or target volumes
+            :return: Volume IDs by name
+        """
+        vol_type = 'Target' if is_remote else 'Source'
+        try:
+            conn = self.get_remote_connection() if is_remote else self.powerflex_conn
+            volume_details = conn.volume.get(fields=['id', 'name'])
+        except Exception as e:
+            errormsg = "Failed to retrieve volume {0}".format(str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+            return {}
+        by_name = index_entities(volume_details)[1]['name']
+        missing = [name for name in vol_names if name not in by_name]
+        if missing:
+            self.module.fail_json(msg="%s volume %s does not exist" % (vol_type, ', '.join(missing)))
+        return dict((name, by_name[name][0]['id']) for name in vol_names if name in by_name)
+
+    def resolve_volume_names(self, input_pairs):
+        """Set the source and target volume IDs of the pairs given by
+           volume name, with one volume query per side
+            :param input_pairs: Replication pairs to create
+        """
+        for side, is_remote in (('source', False), ('target', True)):
+            name_key = side + '_volume_name'
+            vol_names = list(dict.fromkeys(
+                pair[name_key] for pair in input_pairs if pair[name_key] is not None))
+            if not vol_names:
+                continue
+            vol_ids = self.get_volume_ids(vol_names, is_remote)
+            for pair in input_pairs:
+                if pair[name_key] is not None:
+                    pair[side + '_volume_id'] = vol_ids.get(pair[name_key])
+
+    def add_pairs(self, rcg_id, pairs):
+        """Add replication pairs to a RCG, sending at most max_workers
+           requests in parallel. With a single worker the first failure
+           stops the remaining pairs.
+            :param rcg_id: ID of the rcg
+            :param pairs: Replication pairs to add
+            :return: Error of the first pair that failed, if any
+            :rtype: str
+        """
+        def add(pair):
+            return self.powerflex_conn.replication_pair.add(
+                source_vol_id=pair['source_volume_id'],
+                dest_vol_id=pair['target_volume_id'],
+                rcg_id=rcg_id,
+                copy_type=pair['copy_type'],
+                name=pair['name'])
+
+        for task in run_tasks(self.module, self.powerflex_conn, add, pairs,
+                              self.module.params['max_workers'],
+                              fail_fast=True):
+            if task.failed:
+                return task.error
+        return None
+
     def get_rcg(self, rcg_name=None, rcg_id=None):
         """Get rcg details
             :param rcg_name: Name of the rcg
@@ -492,11 +596,10 @@ class PowerFlexReplicationPair(PowerFlexBase):
         """
         try:
             rcg_pairs = self.powerflex_conn.replication_consistency_group.get_replication_pairs(rcg_id)
-            for rcg_pair in rcg_pairs:
-                rcg_pair.pop('links', None)
-                rcg_pair['localVolumeName'] = self.get_volume(rcg_pair['localVolumeId'], filter_by_name=False)[0]['name']
-                rcg_pair['replicationConsistencyGroupName'] = self.get_rcg(rcg_id=rcg_pair['replicationConsistencyGroupId'])['name']
-            return rcg_pairs
+            if not rcg_pairs:
+                return []
+            return enrich_replication_pairs(self.powerflex_conn, rcg_pairs,
+                                            rcg=self.get_rcg(rcg_id=rcg_id))
         except Exception as e:
             errormsg = "Failed to get the replication pairs for replication consistency group {0} with" \
                        " error {1}".format(rcg_id, str(e))
@@ -506,22 +609,16 @@ class PowerFlexReplicationPair(PowerFlexBase):
     def create_replication_pairs(self, rcg_id, rcg_pairs, input_pairs):
         """Create replication pairs"""
         try:
-            for pair in input_pairs:
-                if pair['source_volume_name'] is not None:
-                    pair['source_volume_id'] = self.get_volume(pair['source_volume_name'])[0]['id']
-                if pair['target_volume_name'] is not None:
-                    pair['target_volume_id'] = self.get_volume(pair['target_volume_name'], is_remote=True)[0]['id']
+            self.resolve_volume_names(input_pairs)
             pairs = find_non_existing_pairs(rcg_pairs, input_pairs)
             if not pairs:
                 return False
             if not self.module.check_mode:
-                for pair in pairs:
-                    self.powerflex_conn.replication_pair.add(
-                        source_vol_id=pair['source_volume_id'],
-                        dest_vol_id=pair['target_volume_id'],
-                        rcg_id=rcg_id,
-                        copy_type=pair['copy_type'],
-                        name=pair['name'])
+                error = self.add_pairs(rcg_id, pairs)
+                if error is not None:
+                    errormsg = "Create replication pairs failed with error {0}".format(error)
+                    LOG.error(errormsg)
+                    self.module.fail_json(msg=errormsg)
             return True
         except Exception as e:
             errormsg = "Create replication pairs failed with error {0}".format(str(e))
@@ -647,11 +744,9 @@ class PowerFlexReplicationPair(PowerFlexBase):
 
 
 def find_non_existing_pairs(rcg_pairs, input_pairs):
-    for pair in rcg_pairs:
-        for input_pair in list(input_pairs):
-            if input_pair['source_volume_id'] == pair['localVolumeId'] and \
-                    input_pair['target_volume_id'] == pair['remoteVolumeId']:
-                input_pairs.remove(input_pair)
+    existing_pairs = set((pair['localVolumeId'], pair['remoteVolumeId']) for pair in rcg_pairs)
+    input_pairs[:] = [input_pair for input_pair in input_pairs
+                      if (input_pair['source_volume_id'], input_pair['target_volume_id']) not in existing_pairs]
     return input_pairs
 
 
@@ -659,6 +754,7 @@ def get_powerflex_replication_pair_parameters():
     """This method provide parameter required for the replication_consistency_group
     module on PowerFlex"""
     return dict(pair_id=dict(), pair_name=dict(), pause=dict(type='bool'),
+                max_workers=dict(type='int', default=1),
                 state=dict(choices=['absent', 'present'], default='present'), rcg_id=dict(), rcg_name=dict(),
                 remote_peer=dict(type='dict',
                                  options=dict(hostname=dict(type='str', aliases=['gateway_host'], required=True),
@@ -20,6 +20,7 @@ author:
 - Trisha Datta (@trisha-dell) <ansible.team@dell.com>
 extends_documentation_fragment:
   - dellemc.powerflex.powerflex
+  - dellemc.powerflex.powerflex.wait
 options:
   resource_group_name:
     description:
@@ -239,6 +240,33 @@ resource_group_details:
           "templateValid": true,
           "configurationChange": false
       }
+wait_details:
+    description: Seconds and polls waited for the deployment job of the
+      resource group to complete, and the history of its status.
+    returned: When I(wait) is C(true) and a deployment job was started
+    type: dict
+    contains:
+        seconds:
+            description: Number of seconds waited.
+            type: float
+        polls:
+            description: Number of polls.
+            type: int
+        history:
+            description: Status and health of the deployment each time they
+              changed, with the number of seconds since the wait started.
+              The progress is null once a deleted deployment is removed.
+            type: list
+    sample: {
+        "seconds": 1830.412,
+        "polls": 68,
+        "history": [
+            {"elapsed": 0.171, "progress": {"status": "in_progress",
+             "deploymentHealthStatusType": "unknown"}},
+            {"elapsed": 1830.412, "progress": {"status": "complete",
+             "deploymentHealthStatusType": "green"}}
+        ]
+    }
 '''
 
 
@@ -249,11 +277,16 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import powerflex_compatibility
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import wait_for_completion
 import json
-import copy
 
 LOG = utils.get_logger('resource_group')
 
+DEPLOYMENT_RUNNING_STATUSES = ('pending', 'in_progress')
+SERVER_RESOURCE_PARAMS = ("razor_image", "scaleio_enabled", "scaleio_role",
+                          "compression_enabled", "replication_enabled")
+
 
 @powerflex_compatibility(min_ver='3.6', max_ver='5.0')
 class PowerFlexResourceGroup(PowerFlexBase):
@@ -274,6 +307,7 @@ class PowerFlexResourceGroup(PowerFlexBase):
         }
         super().__init__(AnsibleModule, ansible_module_params)
         super().check_module_compatibility()
+        self.wait_details = None
 
     def get_service_template(self, template_id=None, template_name=None, for_deployment=True):
         """
@@ -349,53 +383,62 @@ class PowerFlexResourceGroup(PowerFlexBase):
         return modify_dict
 
     def clone_component(self, deploy_data):
-        new_component = None
-        count_server = 0
-        server_name = []
-        for component in range(len(deploy_data["serviceTemplate"]["components"])):
-            if deploy_data["serviceTemplate"]["components"][component]["type"] == "SERVER":
-                count_server = count_server + 1
-                server_name.append(deploy_data["serviceTemplate"]["components"][component]["name"])
-        for component in range(len(deploy_data["serviceTemplate"]["components"])):
-            if self.module.params["clone_node"] is None:
-                if count_server == 1 and deploy_data["serviceTemplate"]["components"][component]["name"] == server_name[0]:
-                    new_component = deploy_data["serviceTemplate"]["components"][component]
-                elif count_server != 1:
-                    self.module.fail_json(msg="More than 1 server components exist. Provide the clone_node.")
-            else:
-                if deploy_data["serviceTemplate"]["components"][component]["name"] == self.module.params["clone_node"]:
-                    new_component = deploy_data["serviceTemplate"]["components"][component]
-
-        return new_component
-
-    def prepare_add_node_payload(self, deploy_data):
-
-        new_component = self.clone_component(deploy_data=deploy_data)
-        if new_component is not None:
-            uuid = utils.random_uuid_generation()
-            new_component.update({
-                "identifier": None,
-                "asmGUID": None,
-                "puppetCertName": None,
-                "osPuppetCertName": None,
-                "managementIpAddress": None,
-                "brownfield": False,
-                "id": uuid,
-                "name": uuid})
-            resource_params = ["razor_image", "scaleio_enabled", "scaleio_role",
-                               "compression_enabled", "replication_enabled"]
-
-            for resource in range(len(new_component["resources"])):
-                if new_component["resources"][resource]["id"] == "asm::server":
-                    for param in range(len(new_component["resources"][resource]["parameters"])):
-                        if new_component["resources"][resource]["parameters"][param]["id"] \
-                                not in resource_params:
-                            new_component["resources"][resource]["parameters"][param]["guid"] = None
-                            new_component["resources"][resource]["parameters"][param]["value"] = None
-        return new_component
+        components = deploy_data["serviceTemplate"]["components"]
+        if self.module.params["clone_node"] is not None:
+            return next((component for component in reversed(components)
+                         if component["name"] == self.module.params["clone_node"]), None)
+        servers = [component for component in components if component["type"] == "SERVER"]
+        if components and len(servers) != 1:
+            self.module.fail_json(msg="More than 1 server components exist. Provide the clone_node.")
+        return servers[0] if servers else None
+
+    def get_clone_template(self, deploy_data):
+        """
+        Derives the component the nodes added by a scale up are cloned from, once for all of them.
 
-    def modify_resource_group_details(self, deployment_data):
-        new_deployment_data = copy.deepcopy(deployment_data)
+        Only the attributes reset for the new nodes are copied, the rest of the template is shared
+        with the deployment, which is left unchanged.
+
+        :param deploy_data: The details of the deployment.
+        :return: The component to clone, without its identity and server parameter values.
+        """
+        component = self.clone_component(deploy_data=deploy_data)
+        if component is None:
+            return None
+        clone_template = dict(component, identifier=None, asmGUID=None, puppetCertName=None,
+                              osPuppetCertName=None, managementIpAddress=None, brownfield=False)
+        clone_template["resources"] = [
+            dict(resource, parameters=[
+                param if param["id"] in SERVER_RESOURCE_PARAMS else dict(param, guid=None, value=None)
+                for param in resource["parameters"]])
+            if resource["id"] == "asm::server" else resource
+            for resource in component["resources"]]
+        return clone_template
+
+    def prepare_add_node_payload(self, deploy_data, clone_template=None):
+        """
+        Prepares the component of a node added by a scale up.
+
+        :param deploy_data: The details of the deployment.
+        :param clone_template: The template returned by get_clone_template, derived from
+                               deploy_data if not given.
+        :return: The component of the new node, None if there is no component to clone.
+        """
+        if clone_template is None:
+            clone_template = self.get_clone_template(deploy_data=deploy_data)
+        if clone_template is None:
+            return None
+        uuid = utils.random_uuid_generation()
+        return dict(clone_template, id=uuid, name=uuid)
+
+    def prepare_modify_payload(self, deployment_data):
+        """
+        Prepares the payload of the modification of a resource group deployment.
+
+        :param deployment_data: The details of the deployment.
+        :return: The modified deployment data.
+        """
+        new_deployment_data = dict(deployment_data)
 
         # edit resource group
 
@@ -409,18 +452,24 @@ class PowerFlexResourceGroup(PowerFlexBase):
         if self.module.params["scaleup"]:
             new_deployment_data["scaleup"] = True
             new_deployment_data["retry"] = True
-            node = 0
-            while node < self.module.params["node_count"]:
-                new_deployment_data1 = copy.deepcopy(deployment_data)
-                new_component = self.prepare_add_node_payload(deploy_data=new_deployment_data1)
-                if new_component:
-                    new_deployment_data["serviceTemplate"]["components"].append(new_component)
-                node = node + 1
+            components = list(deployment_data["serviceTemplate"]["components"])
+            if self.module.params["node_count"] > 0:
+                clone_template = self.get_clone_template(deploy_data=deployment_data)
+                if clone_template is not None:
+                    components.extend(
+                        self.prepare_add_node_payload(deploy_data=deployment_data, clone_template=clone_template)
+                        for _ in range(self.module.params["node_count"]))
+            new_deployment_data["serviceTemplate"] = dict(deployment_data["serviceTemplate"],
+                                                          components=components)
+
+        return new_deployment_data
 
+    def modify_resource_group_details(self, deployment_data):
+        rg_data = self.prepare_modify_payload(deployment_data=deployment_data)
         try:
             if not self.module.check_mode:
                 self.powerflex_conn.deployment.edit(deployment_id=deployment_data["id"],
-                                                    rg_data=new_deployment_data)
+                                                    rg_data=rg_data)
 
         except Exception as e:
             errmsg = f'Modifying a resource group deployment failed with error {utils.get_display_message(str(e))}'
@@ -487,6 +536,37 @@ class PowerFlexResourceGroup(PowerFlexBase):
             else:
                 self.module.fail_json(msg=utils.get_display_message(str(e)))
 
+    def get_deployment_progress(self, deployment_id):
+        """
+        Get the progress of the deployment job of a resource group.
+
+        :param deployment_id: The ID of the deployment.
+        :return: The status and health of the deployment, None if it does not exist.
+        """
+        deployment = self.get_deployment_details(deployment_id=deployment_id)
+        if not deployment:
+            return None
+        return {"status": deployment.get("status"),
+                "deploymentHealthStatusType": deployment.get("deploymentHealthStatusType")}
+
+    def wait_for_deployment(self, deployment_id, operation):
+        """
+        Wait for the deployment job of a resource group to complete when wait is set.
+
+        :param deployment_id: The ID of the deployment.
+        :param operation: Description of the operation used in messages.
+        """
+        self.wait_details = wait_for_completion(
+            self.module, lambda: self.get_deployment_progress(deployment_id),
+            lambda progress: progress is None or progress["status"] not in DEPLOYMENT_RUNNING_STATUSES,
+            f"{operation} of resource group {deployment_id}")
+        if self.wait_details and self.wait_details["history"]:
+            progress = self.wait_details["history"][-1]["progress"]
+            if progress and progress["status"] == "error":
+                errmsg = f"The {operation} of resource group {deployment_id} completed with status error"
+                LOG.error(errmsg)
+                self.module.fail_json(msg=errmsg, wait_details=self.wait_details)
+
     def get_operation_mapping(self):
         """
         Get the operation mapping based on the deployment details and module parameters.
@@ -537,6 +617,8 @@ class PowerFlexResourceGroup(PowerFlexBase):
             changed, resource_group_details = resource_group_operation.execute(self)
             result['resource_group_details'] = resource_group_details
             result['changed'] = changed
+            if self.wait_details is not None:
+                result['wait_details'] = self.wait_details
 
         self.module.exit_json(**result)
 
@@ -546,10 +628,13 @@ class Deploy:
         try:
             rg_data = self.get_deployment_data()
             response = self.powerflex_conn.deployment.create(rg_data)
-            return True, response
         except Exception as e:
             errmsg = f'Deploying a resource group failed with error {utils.get_display_message(str(e))}'
             self.module.fail_json(msg=errmsg)
+        if self.module.params['wait']:
+            self.wait_for_deployment(response['id'], "deployment")
+            response = self.get_deployment_details(deployment_id=response['id'])
+        return True, response
 
 
 class ValidateDeploy:
@@ -571,28 +656,35 @@ class ModifyResourceGroup:
             if self.is_modify_needed(deployment_data=rg_data):
                 self.modify_resource_group_details(deployment_data=rg_data)
                 changed = True
-
-            response = self.get_deployment_details(deployment_id=rg_data['id'])
-            return changed, response
         except Exception as e:
             errmsg = f'Editing a resource group failed with error {utils.get_display_message(str(e))}'
             self.module.fail_json(msg=errmsg)
+        if changed:
+            self.wait_for_deployment(rg_data['id'], "modification")
+        response = self.get_deployment_details(deployment_id=rg_data['id'])
+        return changed, response
 
 
 class DeleteDeploy:
     def execute(self):
         try:
             changed = False
+            deployment_id = None
             if self.deployment_details:
+                deployment_id = self.deployment_details['id']
                 if not self.module.check_mode:
-                    self.powerflex_conn.deployment.delete(self.deployment_details['id'])
+                    self.powerflex_conn.deployment.delete(deployment_id)
                     self.deployment_details = \
                         self.get_deployment_details(deployment_name=self.deployment_details['deploymentName'])
                 changed = True
-            return changed, self.deployment_details
         except Exception as e:
             errmsg = f'Deleting a resource group deployment failed with error {utils.get_display_message(str(e))}'
             self.module.fail_json(msg=errmsg)
+        if changed and self.deployment_details:
+            self.wait_for_deployment(deployment_id, "deletion")
+            if self.wait_details is not None:
+                self.deployment_details = self.get_deployment_details(deployment_id=deployment_id)
+        return changed, self.deployment_details
 
 
 def main():
@@ -619,7 +711,8 @@ def get_powerflex_resource_group_parameters():
         node_count=dict(type='int', default=1),
         validate=dict(type='bool', default=False),
         schedule_date=dict(),
-        state=dict(choices=['present', 'absent'], default='present')
+        state=dict(choices=['present', 'absent'], default='present'),
+        **utils.get_powerflex_wait_parameters()
     )
 
 
@@ -192,6 +192,10 @@ sdc_details:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell\
     import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import get_lookup_cache
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.instrumentation \
+    import instrument_module
 
 LOG = utils.get_logger('sdc')
 
@@ -216,10 +220,12 @@ class PowerFlexSdc(object):
             required_one_of=required_one_of)
 
         utils.ensure_required_libs(self.module)
+        instrument_module(self.module)
 
         try:
             self.powerflex_conn = utils.get_powerflex_gateway_host_connection(
                 self.module.params)
+            get_lookup_cache(self.powerflex_conn, self.module.params)
             LOG.info("Got the PowerFlex system connection object instance")
         except Exception as e:
             LOG.error(str(e))
@@ -22,6 +22,7 @@ author:
 - Trisha Datta (@trisha-dell) <ansible.team@dell.com>
 extends_documentation_fragment:
   - dellemc.powerflex.powerflex
+  - dellemc.powerflex.powerflex.wait
 options:
   sds_name:
     description:
@@ -107,6 +108,16 @@ options:
     - Unique identifier of the fault set.
     - Mutually exclusive with I(fault_set_name).
     type: str
+  max_workers:
+    description:
+    - Maximum number of IP add, IP remove and IP role update requests sent
+      in parallel.
+    - Role updates that give an IP the SDS role are always sent one by one,
+      in the order of I(sds_ip_list).
+    - Requests sent one by one stop at the first failed IP.
+    type: int
+    default: 1
+    version_added: '3.1.0'
   state:
     description:
     - State of the SDS.
@@ -486,6 +497,32 @@ sds_details:
         "sdsState": "Normal",
         "softwareVersionInfo": "R3_6.0.0"
     }
+wait_details:
+    description: Seconds and polls waited for the removal of the SDS to
+      complete, and the history of its progress.
+    returned: When I(wait) is C(true) and the SDS was removed
+    type: dict
+    contains:
+        seconds:
+            description: Number of seconds waited.
+            type: float
+        polls:
+            description: Number of polls.
+            type: int
+        history:
+            description: Progress each time it changed, with the number of
+              seconds since the wait started. The progress is null once
+              the object is removed.
+            type: list
+    sample: {
+        "seconds": 122.517,
+        "polls": 9,
+        "history": [
+            {"elapsed": 0.081, "progress": {"sdsState": "RemovalInProgress",
+             "membershipState": "Joined", "mdmConnectionState": "Connected"}},
+            {"elapsed": 122.517, "progress": null}
+        ]
+    }
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -497,10 +534,18 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import PowerFlexBase
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.configuration \
     import Configuration
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import uncached_get
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import get_removal_progress, is_removed, wait_for_completion
 import copy
 
 LOG = utils.get_logger('sds')
 
+SDS_ROLES = ('all', 'sdsOnly')
+
 
 @powerflex_compatibility(min_ver='3.6', max_ver='5.0')
 class PowerFlexSDS(PowerFlexBase):
@@ -882,6 +927,29 @@ class PowerFlexSDS(PowerFlexBase):
                 LOG.info("IP(s) do not exists.")
                 return []
 
+    def apply_to_ips(self, func, sds_ip_list, max_workers=None):
+        """Call func for every IP, sending at most max_workers requests in
+           parallel. With a single worker the first failure stops the
+           remaining IPs.
+            :param func: Callable taking one IP and its role
+            :type func: callable
+            :param sds_ip_list: List of one or more IP addresses and
+                                their roles
+            :type sds_ip_list: list[dict]
+            :param max_workers: Maximum number of parallel requests,
+                                I(max_workers) if not given
+            :type max_workers: int
+            :return: Error of the first IP that failed, if any
+            :rtype: str
+        """
+        if max_workers is None:
+            max_workers = self.module.params['max_workers']
+        for task in run_tasks(self.module, self.powerflex_conn, func,
+                              sds_ip_list, max_workers, fail_fast=True):
+            if task.failed:
+                return task.error
+        return None
+
     def add_ip(self, sds_id, sds_ip_list):
         """Add IP to SDS
             :param sds_id: SDS ID
@@ -891,18 +959,19 @@ class PowerFlexSDS(PowerFlexBase):
             :type sds_ip_list: list[dict]
             :return: Boolean indicating if add IP operation is successful
         """
-        try:
-            if not self.module.check_mode:
-                for ip in sds_ip_list:
-                    LOG.info("IP to add: %s", ip)
-                    self.powerflex_conn.sds.add_ip(sds_id=sds_id, sds_ip=ip)
-                    LOG.info("IP added successfully.")
-            return True
-        except Exception as e:
-            error_msg = "Add IP to SDS '%s' operation failed with " \
-                        "error '%s'" % (sds_id, str(e))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg)
+        def add(ip):
+            LOG.info("IP to add: %s", ip)
+            self.powerflex_conn.sds.add_ip(sds_id=sds_id, sds_ip=ip)
+            LOG.info("IP added successfully.")
+
+        if not self.module.check_mode:
+            error = self.apply_to_ips(add, sds_ip_list)
+            if error:
+                error_msg = "Add IP to SDS '%s' operation failed with " \
+                            "error '%s'" % (sds_id, error)
+                LOG.error(error_msg)
+                self.module.fail_json(msg=error_msg)
+        return True
 
     def update_role(self, sds_id, sds_ip_list):
         """Update IP's role for an SDS
@@ -913,23 +982,28 @@ class PowerFlexSDS(PowerFlexBase):
             :type sds_ip_list: list[dict]
             :return: Boolean indicating if add IP operation is successful
         """
-        try:
-            if not self.module.check_mode:
-                LOG.info("Role updates for: %s", sds_ip_list)
-                if len(sds_ip_list) != 0:
-                    for ip in sds_ip_list:
-                        LOG.info("ip-role: %s", ip)
-                        self.powerflex_conn.sds.set_ip_role(sds_id, ip['ip'],
-                                                            ip['role'])
-                        msg = "The role '%s' for IP '%s' is updated " \
-                              "successfully." % (ip['role'], ip['ip'])
-                        LOG.info(msg)
-            return True
-        except Exception as e:
-            error_msg = "Update role of IP for SDS '%s' operation failed " \
-                        "with error '%s'" % (sds_id, str(e))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg)
+        def set_role(ip):
+            LOG.info("ip-role: %s", ip)
+            self.powerflex_conn.sds.set_ip_role(sds_id, ip['ip'],
+                                                ip['role'])
+            msg = "The role '%s' for IP '%s' is updated " \
+                  "successfully." % (ip['role'], ip['ip'])
+            LOG.info(msg)
+
+        if not self.module.check_mode:
+            LOG.info("Role updates for: %s", sds_ip_list)
+            # Only one IP can have the SDS role, so the array validates
+            # such updates against each other and they keep their order.
+            max_workers = None
+            if any(ip['role'] in SDS_ROLES for ip in sds_ip_list):
+                max_workers = 1
+            error = self.apply_to_ips(set_role, sds_ip_list, max_workers)
+            if error:
+                error_msg = "Update role of IP for SDS '%s' operation " \
+                            "failed with error '%s'" % (sds_id, error)
+                LOG.error(error_msg)
+                self.module.fail_json(msg=error_msg)
+        return True
 
     def remove_ip(self, sds_id, sds_ip_list):
         """Remove IP from SDS
@@ -940,18 +1014,19 @@ class PowerFlexSDS(PowerFlexBase):
             :type sds_ip_list: list[dict]
             :return: Boolean indicating if remove IP operation is successful
         """
-        try:
-            if not self.module.check_mode:
-                for ip in sds_ip_list:
-                    LOG.info("IP to remove: %s", ip)
-                    self.powerflex_conn.sds.remove_ip(sds_id=sds_id, ip=ip['ip'])
-                    LOG.info("IP removed successfully.")
-            return True
-        except Exception as e:
-            error_msg = "Remove IP from SDS '%s' operation failed with " \
-                        "error '%s'" % (sds_id, str(e))
-            LOG.error(error_msg)
-            self.module.fail_json(msg=error_msg)
+        def remove(ip):
+            LOG.info("IP to remove: %s", ip)
+            self.powerflex_conn.sds.remove_ip(sds_id=sds_id, ip=ip['ip'])
+            LOG.info("IP removed successfully.")
+
+        if not self.module.check_mode:
+            error = self.apply_to_ips(remove, sds_ip_list)
+            if error:
+                error_msg = "Remove IP from SDS '%s' operation failed with " \
+                            "error '%s'" % (sds_id, error)
+                LOG.error(error_msg)
+                self.module.fail_json(msg=error_msg)
+        return True
 
     def delete_sds(self, sds_id):
         """Delete SDS
@@ -1049,7 +1124,9 @@ def get_powerflex_sds_parameters():
         performance_profile=dict(choices=['Compact', 'HighPerformance']),
         fault_set_name=dict(),
         fault_set_id=dict(),
-        state=dict(required=True, type='str', choices=['present', 'absent'])
+        max_workers=dict(type='int', default=1),
+        state=dict(required=True, type='str', choices=['present', 'absent']),
+        **utils.get_powerflex_wait_parameters()
     )
 
 
@@ -1065,8 +1142,17 @@ class SDSExitHandler():
 class SDSDeleteHandler():
     def handle(self, sds_obj, sds_params, sds_details):
         if sds_params['state'] == 'absent' and sds_details:
-            sds_details = sds_obj.delete_sds(sds_details['id'])
+            sds_id = sds_details['id']
+            sds_details = sds_obj.delete_sds(sds_id)
             sds_obj.result['changed'] = True
+            wait_details = wait_for_completion(
+                sds_obj.module,
+                lambda: get_removal_progress(
+                    uncached_get(sds_obj.powerflex_conn.sds), sds_id,
+                    ('sdsState', 'membershipState', 'mdmConnectionState')),
+                is_removed, "removal of SDS %s" % sds_id)
+            if wait_details is not None:
+                sds_obj.result['wait_details'] = wait_details
 
         SDSExitHandler().handle(sds_obj, sds_details)
 
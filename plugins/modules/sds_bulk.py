@@ -0,0 +1,643 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Dell Technologies
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible module for managing SDSs in bulk on Dell Technologies (Dell) PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: sds_bulk
+version_added: '3.1.0'
+short_description: Manage a list of SDSs on Dell PowerFlex
+description:
+- Managing SDSs in bulk on PowerFlex storage system includes creating,
+  modifying, adding or removing IPs of and deleting every SDS of a list of
+  SDS specs in a single task.
+- The existing SDSs and the protection domains and fault sets referenced
+  by the specs are fetched once, and the changes of every SDS are computed
+  from them before any change is applied.
+- The changes are applied by a bounded number of parallel workers and
+  reported per SDS together with a summary.
+author:
+- Dell Technologies (@dellemc) <ansible.team@dell.com>
+extends_documentation_fragment:
+  - dellemc.powerflex.powerflex
+options:
+  sds:
+    description:
+    - List of SDS specs.
+    - Every SDS may only be listed once.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      sds_name:
+        description:
+        - The name of the SDS.
+        type: str
+        required: true
+      protection_domain_name:
+        description:
+        - The name of the protection domain.
+        - Either name or the id of the protection domain is required for
+          creating an SDS.
+        - Mutually exclusive with I(protection_domain_id).
+        type: str
+      protection_domain_id:
+        description:
+        - The ID of the protection domain.
+        - Mutually exclusive with I(protection_domain_name).
+        type: str
+      fault_set_name:
+        description:
+        - Name of the fault set of the SDS.
+        - Mutually exclusive with I(fault_set_id).
+        type: str
+      fault_set_id:
+        description:
+        - Unique identifier of the fault set of the SDS.
+        - Mutually exclusive with I(fault_set_name).
+        type: str
+      sds_ip_list:
+        description:
+        - Dictionary of IPs and their roles for the SDS.
+        - At least one IP-role is mandatory while creating a SDS.
+        type: list
+        elements: dict
+        suboptions:
+          ip:
+            description:
+            - IP address of the SDS.
+            type: str
+            required: true
+          role:
+            description:
+            - Role assigned to the SDS IP address.
+            choices: ['sdsOnly', 'sdcOnly', 'all']
+            type: str
+            required: true
+      sds_ip_state:
+        description:
+        - State of IP with respect to the SDS.
+        - C(present-in-sds) adds the IPs missing from the SDS and updates
+          the roles of the others.
+        - C(absent-in-sds) removes the IPs of the list from the SDS.
+        choices: ['present-in-sds', 'absent-in-sds']
+        type: str
+        default: 'present-in-sds'
+      rfcache_enabled:
+        description:
+        - Whether Flash cache should be enabled.
+        type: bool
+      rmcache_enabled:
+        description:
+        - Whether RAM cache should be enabled.
+        type: bool
+      rmcache_size:
+        description:
+        - Read RAM cache size (in MB).
+        - Can only be set when I(rmcache_enabled) is C(true).
+        type: int
+      performance_profile:
+        description:
+        - Performance profile to apply to the SDS.
+        choices: ['Compact', 'HighPerformance']
+        type: str
+      state:
+        description:
+        - State of the SDS.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+  max_workers:
+    description:
+    - Maximum number of SDSs changed in parallel.
+    type: int
+    default: 4
+attributes:
+  check_mode:
+    description: Runs task to validate without performing action on the target machine.
+    support: full
+  diff_mode:
+    description: Runs the task to report the changes made or to be made.
+    support: none
+notes:
+  - An SDS is not moved to another protection domain or fault set. A spec
+    that names a different one than the SDS has is reported as an error.
+  - The changes of one SDS are applied in order, IPs being added before the
+    roles of the existing IPs are updated.
+  - The specs are validated and applied independently. A failing spec does
+    not stop the others, and the task fails after all specs were processed.
+'''
+
+EXAMPLES = r'''
+- name: Create or update the SDS of every storage node
+  dellemc.powerflex.sds_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    max_workers: 16
+    sds:
+      - sds_name: "node0"
+        protection_domain_name: "domain1"
+        fault_set_name: "fs1"
+        sds_ip_list:
+          - ip: "198.10.xxx.xxx"
+            role: "all"
+        rmcache_enabled: true
+        rmcache_size: 128
+      - sds_name: "node1"
+        protection_domain_name: "domain1"
+        fault_set_name: "fs2"
+        sds_ip_list:
+          - ip: "198.10.xxx.xxx"
+            role: "sdsOnly"
+          - ip: "198.20.xxx.xxx"
+            role: "sdcOnly"
+        performance_profile: "HighPerformance"
+
+- name: Create the SDSs of an inventory group
+  dellemc.powerflex.sds_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    sds: "{{ groups['sds'] | map('extract', hostvars, 'sds_spec') | list }}"
+  run_once: true
+
+- name: Remove IPs and delete SDSs
+  dellemc.powerflex.sds_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    sds:
+      - sds_name: "node0"
+        sds_ip_list:
+          - ip: "198.20.xxx.xxx"
+            role: "sdcOnly"
+        sds_ip_state: "absent-in-sds"
+      - sds_name: "node1"
+        state: "absent"
+'''
+
+RETURN = r'''
+changed:
+    description: Whether or not the resource has changed.
+    returned: always
+    type: bool
+    sample: 'false'
+sds:
+    description: Outcome of every SDS spec, in the order of the specs.
+    returned: always
+    type: list
+    contains:
+        sds_name:
+            description: Name of the SDS in the spec.
+            type: str
+        id:
+            description: ID of the SDS, if it exists or was created.
+            type: str
+        changed:
+            description: Whether the SDS was or would be changed.
+            type: bool
+        actions:
+            description: Changes applied, or to be applied in check mode.
+            type: list
+        error:
+            description: Error message if the spec could not be applied.
+            type: str
+    sample: [
+        {
+            "sds_name": "node0",
+            "id": "8f3bb0cc00000002",
+            "changed": true,
+            "actions": ["create", "performance_profile"],
+            "error": null
+        },
+        {
+            "sds_name": "node1",
+            "id": "8f3bb0cd00000003",
+            "changed": false,
+            "actions": [],
+            "error": null
+        }
+    ]
+summary:
+    description: Number of SDS specs per outcome.
+    returned: always
+    type: dict
+    contains:
+        total:
+            description: Number of SDS specs.
+            type: int
+        created:
+            description: Number of SDSs created.
+            type: int
+        modified:
+            description: Number of existing SDSs modified.
+            type: int
+        deleted:
+            description: Number of SDSs deleted.
+            type: int
+        unchanged:
+            description: Number of SDSs already in the requested state.
+            type: int
+        failed:
+            description: Number of SDS specs that failed.
+            type: int
+    sample: {
+        "total": 2,
+        "created": 1,
+        "modified": 0,
+        "deleted": 0,
+        "unchanged": 1,
+        "failed": 0
+    }
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell\
+    import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
+    import powerflex_compatibility
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
+    import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.bulk \
+    import index_entities, prepare_output, get_summary
+
+LOG = utils.get_logger('sds_bulk')
+
+ACTIONS = ('create', 'rfcache', 'rmcache', 'rmcache_size',
+           'performance_profile', 'add_ip', 'ip_role', 'remove_ip', 'delete')
+
+
+@powerflex_compatibility(min_ver='3.6', max_ver='5.0')
+class PowerFlexSDSBulk(PowerFlexBase):
+    """Class with bulk SDS operations"""
+
+    def __init__(self):
+        argument_spec = get_powerflex_sds_bulk_parameters()
+
+        module_params = {
+            'argument_spec': argument_spec,
+            'supports_check_mode': True
+        }
+
+        super().__init__(AnsibleModule, module_params)
+        super().check_module_compatibility()
+        self.references = {}
+        self.sds = {}
+
+    def list_entities(self, entity, label):
+        """Get all entities of a kind with a single query
+            :param entity: Name of the entity on the PowerFlex connection
+            :param label: Name of the entities used in messages
+            :return: List of entities
+        """
+        try:
+            return getattr(self.powerflex_conn, entity).get()
+        except Exception as e:
+            errormsg = "Failed to get the list of {0} with error " \
+                       "{1}".format(label, str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+
+    def resolve_references(self, specs):
+        """Index the existing SDSs and the protection domains and fault
+        sets referenced by any of the specs
+            :param specs: List of SDS specs
+        """
+        def is_referenced(*keys):
+            return any(spec.get(key) for spec in specs for key in keys)
+
+        if is_referenced('protection_domain_name', 'protection_domain_id'):
+            self.references['protection_domain'] = index_entities(
+                self.list_entities('protection_domain', 'protection domains'))
+        if is_referenced('fault_set_name', 'fault_set_id'):
+            self.references['fault_set'] = index_entities(
+                self.list_entities('fault_set', 'fault sets'))
+        self.sds = dict((sds['name'], sds)
+                        for sds in self.list_entities('sds', 'SDSs'))
+
+    def find_reference(self, entity, label, entity_id=None, entity_name=None):
+        """Find resolved entities by id or name
+            :param entity: Kind of the entity
+            :param label: Name of the entity used in messages
+            :param entity_id: ID of the entity
+            :param entity_name: Name of the entity
+            :return: List of matching entities
+        """
+        by_id, by_name = self.references[entity]
+        if entity_id:
+            matches = [by_id[entity_id]] if entity_id in by_id else []
+        else:
+            matches = by_name['name'].get(entity_name, [])
+        if not matches:
+            err_msg = "Unable to find the {0} with {1}. Please enter a valid" \
+                      " {0} name/id.".format(label, entity_id or entity_name)
+            self.module.fail_json(msg=err_msg)
+        return matches
+
+    def get_protection_domain_id(self, spec):
+        """Get the ID of the protection domain of a spec
+            :param spec: SDS spec
+            :return: ID of the protection domain
+        """
+        if not (spec['protection_domain_id'] or spec['protection_domain_name']):
+            return None
+        return self.find_reference(
+            'protection_domain', 'protection domain',
+            spec['protection_domain_id'], spec['protection_domain_name'])[0]['id']
+
+    def get_fault_set_id(self, spec, pd_id):
+        """Get the ID of the fault set of a spec
+            :param spec: SDS spec
+            :param pd_id: ID of the protection domain of the SDS
+            :return: ID of the fault set
+        """
+        if not (spec['fault_set_id'] or spec['fault_set_name']):
+            return None
+        fault_sets = self.find_reference(
+            'fault_set', 'fault set', spec['fault_set_id'],
+            spec['fault_set_name'])
+        if pd_id:
+            fault_sets = [fault_set for fault_set in fault_sets
+                          if fault_set['protectionDomainId'] == pd_id]
+        if not fault_sets:
+            self.module.fail_json(msg="The specified Fault set is not in the"
+                                      " specified Protection Domain.")
+        if len(fault_sets) > 1:
+            err_msg = "More than one fault set found with {0}, Please" \
+                      " provide protection domain Name/Id to fetch the" \
+                      " unique fault set".format(spec['fault_set_name'])
+            self.module.fail_json(msg=err_msg)
+        return fault_sets[0]['id']
+
+    def validate_spec(self, spec):
+        """Validate an SDS spec
+            :param spec: SDS spec
+        """
+        if len(spec['sds_name'].strip()) == 0:
+            self.module.fail_json(msg="Provide valid value for name for the"
+                                      " creation/modification of the SDS.")
+        for pair in (('protection_domain_name', 'protection_domain_id'),
+                     ('fault_set_name', 'fault_set_id')):
+            if spec[pair[0]] and spec[pair[1]]:
+                self.module.fail_json(
+                    msg="parameters are mutually exclusive: "
+                        "{0}|{1}".format(*pair))
+        if spec['rmcache_size'] is not None and \
+                spec['rmcache_enabled'] is False:
+            self.module.fail_json(
+                msg="RM cache size can be set only when RM cache is enabled,"
+                    " please enable it along with RM cache size.")
+
+    def plan_sds(self, spec):
+        """Compare an SDS spec with the existing SDS
+            :param spec: SDS spec
+            :return: Dictionary with the SDS and the changes to apply
+        """
+        self.validate_spec(spec)
+        sds_name = spec['sds_name']
+        plan = dict(sds_name=sds_name, id=None, changes={})
+        changes = plan['changes']
+
+        sds = self.sds.get(sds_name)
+        if spec['state'] == 'absent':
+            if sds:
+                plan['id'] = sds['id']
+                changes['delete'] = True
+            return plan
+
+        pd_id = self.get_protection_domain_id(spec)
+        fault_set_id = self.get_fault_set_id(spec, pd_id)
+        ip_list = spec['sds_ip_list'] or []
+        remove_ips = spec['sds_ip_state'] == 'absent-in-sds'
+
+        if sds is None:
+            if pd_id is None or not ip_list or remove_ips:
+                self.module.fail_json(
+                    msg="Protection domain name/id and the IPs to add are"
+                        " mandatory for creating the SDS {0}.".format(sds_name))
+            rmcache_size = spec['rmcache_size']
+            changes['create'] = dict(
+                protection_domain_id=pd_id,
+                sds_ips=[{'SdsIp': ip} for ip in ip_list], name=sds_name,
+                rmcache_enabled=spec['rmcache_enabled'],
+                rmcache_size_in_kb=rmcache_size * 1024
+                if rmcache_size is not None else None,
+                fault_set_id=fault_set_id)
+            if spec['rfcache_enabled'] is not None:
+                changes['rfcache'] = spec['rfcache_enabled']
+            if spec['performance_profile']:
+                changes['performance_profile'] = spec['performance_profile']
+            return plan
+
+        plan['id'] = sds['id']
+        if pd_id and pd_id != sds['protectionDomainId']:
+            self.module.fail_json(
+                msg="SDS {0} belongs to the protection domain {1}, it can not"
+                    " be moved.".format(sds_name, sds['protectionDomainId']))
+        if fault_set_id and fault_set_id != sds.get('faultSetId'):
+            self.module.fail_json(
+                msg="SDS {0} belongs to the fault set {1}, it can not be"
+                    " moved.".format(sds_name, sds.get('faultSetId')))
+        self.update_modify_changes(spec, sds, changes)
+        self.update_ip_changes(ip_list, remove_ips, sds, changes)
+        return plan
+
+    def update_modify_changes(self, spec, sds, changes):
+        """Add the attribute changes of an existing SDS
+            :param spec: SDS spec
+            :param sds: Details of the SDS
+            :param changes: Dictionary of the changes to apply
+        """
+        if spec['rfcache_enabled'] is not None and \
+                sds['rfcacheEnabled'] != spec['rfcache_enabled']:
+            changes['rfcache'] = spec['rfcache_enabled']
+        if spec['rmcache_enabled'] is not None and \
+                sds['rmcacheEnabled'] != spec['rmcache_enabled']:
+            changes['rmcache'] = spec['rmcache_enabled']
+        if spec['performance_profile'] and \
+                sds.get('perfProfile') != spec['performance_profile']:
+            changes['performance_profile'] = spec['performance_profile']
+
+        rmcache_size = spec['rmcache_size']
+        if rmcache_size is not None and \
+                rmcache_size != sds['rmcacheSizeInKb'] / 1024:
+            if not changes.get('rmcache', sds['rmcacheEnabled']):
+                self.module.fail_json(
+                    msg="Failed to update RM cache size for the SDS '{0}' as"
+                        " RM cache is disabled previously, please enable it"
+                        " before setting the size.".format(sds['name']))
+            changes['rmcache_size'] = rmcache_size
+
+    def update_ip_changes(self, ip_list, remove_ips, sds, changes):
+        """Add the IPs to add or remove and the roles to update
+            :param ip_list: IPs and roles of the spec
+            :param remove_ips: Whether the IPs are to be removed
+            :param sds: Details of the SDS
+            :param changes: Dictionary of the changes to apply
+        """
+        existing_ips = sds.get('ipList') or []
+        if remove_ips:
+            to_remove = [ip for ip in existing_ips if ip in ip_list]
+            if to_remove:
+                changes['remove_ip'] = to_remove
+            return
+
+        existing_roles = dict((ip['ip'], ip['role']) for ip in existing_ips)
+        for ip in ip_list:
+            if ip['ip'] not in existing_roles:
+                changes.setdefault('add_ip', []).append(ip)
+            elif existing_roles[ip['ip']] != ip['role']:
+                changes.setdefault('ip_role', []).append(ip)
+
+    def apply_plan(self, plan):
+        """Apply the changes of an SDS
+            :param plan: Dictionary with the SDS and the changes to apply
+            :return: ID of the SDS
+        """
+        changes = plan['changes']
+        sds_api = self.powerflex_conn.sds
+        try:
+            if 'create' in changes:
+                plan['id'] = sds_api.create(**changes['create'])['id']
+                LOG.info("Created SDS %s with id %s", plan['sds_name'],
+                         plan['id'])
+            sds_id = plan['id']
+            if 'delete' in changes:
+                sds_api.delete(sds_id)
+            if 'rfcache' in changes:
+                sds_api.set_rfcache_enabled(sds_id, changes['rfcache'])
+            if 'rmcache' in changes:
+                sds_api.set_rmcache_enabled(sds_id, changes['rmcache'])
+            if 'rmcache_size' in changes:
+                sds_api.set_rmcache_size(sds_id, changes['rmcache_size'])
+            if 'performance_profile' in changes:
+                sds_api.set_performance_parameters(
+                    sds_id, changes['performance_profile'])
+            for ip in changes.get('add_ip', []):
+                sds_api.add_ip(sds_id=sds_id, sds_ip=ip)
+            for ip in changes.get('ip_role', []):
+                sds_api.set_ip_role(sds_id, ip['ip'], ip['role'])
+            for ip in changes.get('remove_ip', []):
+                sds_api.remove_ip(sds_id=sds_id, ip=ip['ip'])
+            return sds_id
+        except Exception as e:
+            errormsg = "Updating SDS {0} failed with error " \
+                       "{1}".format(plan['sds_name'], str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+
+    def validate_unique_names(self, specs):
+        """Fail if an SDS is listed more than once
+            :param specs: List of SDS specs
+        """
+        names = set()
+        for spec in specs:
+            if spec['sds_name'] in names:
+                self.module.fail_json(
+                    msg="SDS {0} is listed more than once in"
+                        " sds.".format(spec['sds_name']))
+            names.add(spec['sds_name'])
+
+    def perform_module_operation(self):
+        """
+        Perform the bulk SDS operations based on the parameters passed in
+        the playbook
+        """
+        specs = self.module.params['sds']
+        max_workers = self.module.params['max_workers']
+
+        self.validate_unique_names(specs)
+        self.resolve_references(specs)
+
+        plans = run_tasks(self.module, self.powerflex_conn, self.plan_sds,
+                          specs)
+        results = []
+        to_apply = []
+        for spec, task in zip(specs, plans):
+            if task.failed:
+                results.append(dict(sds_name=spec['sds_name'], id=None,
+                                    changes={}, error=task.error))
+                continue
+            plan = dict(task.result, error=None)
+            results.append(plan)
+            if plan['changes']:
+                to_apply.append(plan)
+        LOG.info("SDSs to change: %s",
+                 [plan['sds_name'] for plan in to_apply])
+
+        if to_apply and not self.module.check_mode:
+            for task in run_tasks(self.module, self.powerflex_conn,
+                                  self.apply_plan, to_apply, max_workers):
+                if task.failed:
+                    task.item['error'] = task.error
+
+        sds = [prepare_output(plan, 'sds_name', ACTIONS) for plan in results]
+        result = dict(
+            changed=any(item['changed'] for item in sds),
+            sds=sds,
+            summary=get_summary(results)
+        )
+        failed = [item for item in sds if item['error']]
+        if failed:
+            errormsg = "Failed to apply {0} of {1} SDS specs: {2}".format(
+                len(failed), len(sds),
+                "; ".join(item['error'] for item in failed))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg, **result)
+        self.module.exit_json(**result)
+
+
+def get_powerflex_sds_bulk_parameters():
+    """This method provide parameter required for the bulk SDS module on
+    PowerFlex"""
+    return dict(
+        sds=dict(
+            type='list', elements='dict', required=True, options=dict(
+                sds_name=dict(required=True),
+                protection_domain_name=dict(), protection_domain_id=dict(),
+                fault_set_name=dict(), fault_set_id=dict(),
+                sds_ip_list=dict(
+                    type='list', elements='dict', options=dict(
+                        ip=dict(required=True),
+                        role=dict(required=True, choices=['all', 'sdsOnly',
+                                                          'sdcOnly'])
+                    )
+                ),
+                sds_ip_state=dict(default='present-in-sds',
+                                  choices=['present-in-sds', 'absent-in-sds']),
+                rfcache_enabled=dict(type='bool'),
+                rmcache_enabled=dict(type='bool'),
+                rmcache_size=dict(type='int'),
+                performance_profile=dict(choices=['Compact',
+                                                  'HighPerformance']),
+                state=dict(default='present', choices=['present', 'absent'])
+            )
+        ),
+        max_workers=dict(type='int', default=4)
+    )
+
+
+def main():
+    """ Create PowerFlex bulk SDS object and perform actions on it
+        based on user input from playbook"""
+    obj = PowerFlexSDSBulk()
+    obj.perform_module_operation()
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,8 @@ description:
 - Managing snapshots on PowerFlex Storage System includes
   creating, getting details, mapping/unmapping to/from SDC,
   modifying the attributes and deleting snapshot.
+- It also includes creating snapshots of many volumes at once, with a
+  single consistent point in time.
 
 author:
 - Akash Shendge (@shenda1) <ansible.team@dell.com>
@@ -30,6 +32,9 @@ options:
     - The name of the snapshot.
     - Mandatory for create operation.
     - Specify either I(snapshot_name) or I(snapshot_id) (but not both) for any operation.
+    - With I(volumes) or I(vol_name_pattern), the suffix appended to the
+      volume name to name the snapshots that have no I(snapshot_name)
+      of their own.
     type: str
   snapshot_id:
     description:
@@ -131,6 +136,57 @@ options:
     - It defaults to C(ONLY_ME), if not specified.
     choices: ['ONLY_ME', 'INCLUDING_DESCENDANTS']
     type: str
+  volumes:
+    description:
+    - List of volumes to snapshot in one operation.
+    - Mutually exclusive with I(snapshot_id), I(vol_name) and I(vol_id).
+    - Snapshots that already exist for their volume are left unchanged.
+    type: list
+    elements: dict
+    version_added: '3.1.0'
+    suboptions:
+      vol_name:
+        description:
+        - The name of the volume.
+        - Mutually exclusive with I(vol_id).
+        type: str
+      vol_id:
+        description:
+        - The ID of the volume.
+        - Mutually exclusive with I(vol_name).
+        type: str
+      snapshot_name:
+        description:
+        - The name of the snapshot of the volume.
+        - It defaults to the volume name followed by the module
+          I(snapshot_name).
+        type: str
+  vol_name_pattern:
+    description:
+    - Regular expression matching the whole name of the volumes to
+      snapshot in one operation.
+    - The snapshots are named after the volume followed by I(snapshot_name).
+    - Can be combined with I(volumes).
+    type: str
+    version_added: '3.1.0'
+  consistent:
+    description:
+    - Whether the snapshots of I(volumes) and I(vol_name_pattern) share
+      one point in time.
+    - If C(true), all snapshots are created by a single request as one
+      snapshot group.
+    - If C(false), every volume is snapshotted by its own request, so a
+      failing volume does not prevent the others from being snapshotted.
+    type: bool
+    default: true
+    version_added: '3.1.0'
+  max_workers:
+    description:
+    - Maximum number of snapshot requests sent in parallel when
+      I(consistent) is C(false).
+    type: int
+    default: 1
+    version_added: '3.1.0'
   state:
     description:
     - State of the snapshot.
@@ -139,6 +195,8 @@ options:
     type: str
 notes:
   - The I(check_mode) is not supported.
+  - I(volumes) and I(vol_name_pattern) only support creating snapshots with
+    I(read_only) and I(desired_retention), and require I(state) C(present).
 '''
 
 EXAMPLES = r'''
@@ -154,6 +212,34 @@ EXAMPLES = r'''
     desired_retention: 2
     state: "present"
 
+- name: Create consistent snapshots of all database volumes
+  dellemc.powerflex.snapshot:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    vol_name_pattern: "db_.*"
+    snapshot_name: "_nightly"
+    read_only: true
+    desired_retention: 7
+    retention_unit: "days"
+    state: "present"
+
+- name: Create snapshots of a list of volumes
+  dellemc.powerflex.snapshot:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    volumes:
+      - vol_name: "ansible_volume_1"
+        snapshot_name: "ansible_volume_1_snap"
+      - vol_id: "cdd883cf00000002"
+        snapshot_name: "ansible_volume_2_snap"
+    consistent: false
+    max_workers: 4
+    state: "present"
+
 - name: Get snapshot details using snapshot id
   dellemc.powerflex.snapshot:
     hostname: "{{hostname}}"
@@ -364,6 +450,21 @@ snapshot_details:
         "volumeType": "Snapshot",
         "vtreeId": "6e86255c00000001"
     }
+snapshots_details:
+    description:
+    - Details of the snapshots of I(volumes) and I(vol_name_pattern), with
+      the same keys as I(snapshot_details).
+    returned: When I(volumes) or I(vol_name_pattern) is given
+    type: list
+    elements: dict
+    version_added: '3.1.0'
+snapshot_group_ids:
+    description: IDs of the snapshot groups created.
+    returned: When I(volumes) or I(vol_name_pattern) is given
+    type: list
+    elements: str
+    sample: ["22f1e80c00000001"]
+    version_added: '3.1.0'
 '''
 
 from ansible.module_utils.basic import AnsibleModule
@@ -373,9 +474,12 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import powerflex_compatibility
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
 from datetime import datetime, timedelta
 import time
 import copy
+import re
 
 LOG = utils.get_logger('snapshot')
 
@@ -391,18 +495,26 @@ class PowerFlexSnapshot(PowerFlexBase):
         mutually_exclusive = [['snapshot_name', 'snapshot_id'],
                               ['vol_name', 'vol_id'],
                               ['snapshot_id', 'vol_name'],
-                              ['snapshot_id', 'vol_id']]
+                              ['snapshot_id', 'vol_id'],
+                              ['volumes', 'snapshot_id'],
+                              ['volumes', 'vol_name'],
+                              ['volumes', 'vol_id'],
+                              ['vol_name_pattern', 'vol_name'],
+                              ['vol_name_pattern', 'vol_id']]
 
         required_together = [['sdc', 'sdc_state']]
 
-        required_one_of = [['snapshot_name', 'snapshot_id']]
+        required_one_of = [['snapshot_name', 'snapshot_id', 'volumes']]
+
+        required_by = {'vol_name_pattern': 'snapshot_name'}
 
         module_params = {
             'argument_spec': argument_spec,
             'supports_check_mode': False,
             'mutually_exclusive': mutually_exclusive,
             'required_one_of': required_one_of,
-            'required_together': required_together
+            'required_together': required_together,
+            'required_by': required_by
         }
 
         super().__init__(AnsibleModule, module_params)
@@ -638,6 +750,194 @@ class PowerFlexSnapshot(PowerFlexBase):
             LOG.error(errormsg)
             self.module.fail_json(msg=errormsg)
 
+    def list_volumes(self):
+        """Get all volumes and snapshots
+            :return: Volumes and snapshots by name and by id
+        """
+
+        try:
+            volumes = self.powerflex_conn.volume.get()
+        except Exception as e:
+            errormsg = "Failed to get the list of volumes with error " \
+                       "%s" % str(e)
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+        return (dict((volume['name'], volume) for volume in volumes),
+                dict((volume['id'], volume) for volume in volumes))
+
+    def get_bulk_sources(self, volumes_by_name, volumes_by_id):
+        """Get the volumes to snapshot and the names of their snapshots
+            :param volumes_by_name: Volumes and snapshots by name
+            :param volumes_by_id: Volumes and snapshots by id
+            :return: List of source volume and snapshot name pairs
+        """
+
+        suffix = self.module.params['snapshot_name']
+        sources = []
+        for entry in self.module.params['volumes'] or []:
+            if bool(entry['vol_name']) == bool(entry['vol_id']):
+                self.module.fail_json(msg="Specify either vol_name or vol_id"
+                                          " for every entry of volumes.")
+            name_or_id = entry['vol_id'] or entry['vol_name']
+            volume = volumes_by_id.get(entry['vol_id']) if entry['vol_id'] \
+                else volumes_by_name.get(entry['vol_name'])
+            if volume is None:
+                self.module.fail_json(msg="Unable to find the volume %s."
+                                          % name_or_id)
+            if not (entry['snapshot_name'] or suffix):
+                self.module.fail_json(msg="Please provide the snapshot_name"
+                                          " of volume %s." % name_or_id)
+            sources.append(
+                (volume, entry['snapshot_name'] or volume['name'] + suffix))
+
+        pattern = self.module.params['vol_name_pattern']
+        if pattern:
+            try:
+                regex = re.compile(pattern)
+            except re.error as e:
+                self.module.fail_json(msg="Invalid vol_name_pattern %s with"
+                                          " error %s" % (pattern, str(e)))
+            sources.extend(
+                (volume, volume['name'] + suffix)
+                for volume in sorted(volumes_by_name.values(),
+                                     key=lambda volume: volume['name'])
+                if volume.get('volumeType') != 'Snapshot'
+                and regex.fullmatch(volume['name']))
+
+        unique_sources = []
+        source_ids = {}
+        for volume, snapshot_name in sources:
+            if snapshot_name not in source_ids:
+                source_ids[snapshot_name] = volume['id']
+                unique_sources.append((volume, snapshot_name))
+            elif source_ids[snapshot_name] != volume['id']:
+                self.module.fail_json(msg="Snapshot name %s is used for more"
+                                          " than one volume." % snapshot_name)
+        return unique_sources
+
+    def create_snapshots(self, system_id, snapshot_defs, access_mode,
+                         retention):
+        """Create the snapshots of many volumes
+            :param system_id: The system id
+            :param snapshot_defs: Snapshot definitions of the volumes
+            :param access_mode: Access mode for the snapshots
+            :param retention: The retention for the snapshots
+            :return: Responses of the successful requests and error messages
+        """
+
+        def snapshot_volumes(defs):
+            return self.powerflex_conn.system.snapshot_volumes(
+                system_id=system_id,
+                snapshot_defs=defs,
+                access_mode=access_mode,
+                retention_period=retention
+            )
+
+        if self.module.params['consistent']:
+            batches, max_workers = [snapshot_defs], 1
+        else:
+            batches = [[snapshot_def] for snapshot_def in snapshot_defs]
+            max_workers = self.module.params['max_workers']
+        LOG.info("Creating %s snapshots with %s requests",
+                 len(snapshot_defs), len(batches))
+
+        responses = []
+        errors = []
+        for task in run_tasks(self.module, self.powerflex_conn,
+                              snapshot_volumes, batches, max_workers):
+            if task.failed:
+                errors.append(
+                    "Create snapshots %s operation failed with error %s" % (
+                        ", ".join(snapshot_def['snapshotName']
+                                  for snapshot_def in task.item), task.error))
+            else:
+                responses.append(task.result)
+        return responses, errors
+
+    def get_snapshots_details(self, snapshot_ids, volumes_by_id, refresh):
+        """Get the details of snapshots
+            :param snapshot_ids: IDs of the snapshots
+            :param volumes_by_id: Volumes and snapshots by id
+            :param refresh: Whether to query the snapshots again
+            :return: List of snapshot details
+        """
+
+        snapshots = volumes_by_id
+        if refresh:
+            snapshots = self.list_volumes()[1]
+        snapshots_details = []
+        for snapshot_id in snapshot_ids:
+            if snapshot_id not in snapshots:
+                continue
+            snapshot_details = [snapshots[snapshot_id]]
+            ancestor = volumes_by_id.get(
+                snapshot_details[0].get('ancestorVolumeId'))
+            if ancestor:
+                snapshot_details[0]['ancestorVolumeName'] = ancestor['name']
+            self.add_size_in_kb(snapshot_details)
+            self.add_storage_pool_name(snapshot_details)
+            self.add_retention_in_hours(snapshot_details)
+            snapshots_details.append(snapshot_details[0])
+        return snapshots_details
+
+    def perform_bulk_operation(self, desired_retention, retention_unit):
+        """Create the snapshots of the volumes and of the volumes matching
+        the pattern
+            :param desired_retention: Desired retention of the snapshots
+            :param retention_unit: Retention unit for the snapshots
+        """
+
+        for param in ['sdc', 'size', 'snapshot_new_name', 'remove_mode']:
+            if self.module.params[param]:
+                self.module.fail_json(msg="%s is not supported with volumes"
+                                          " or vol_name_pattern" % param)
+        if self.module.params['state'] != 'present':
+            self.module.fail_json(msg="volumes and vol_name_pattern are only"
+                                      " supported with state present")
+
+        volumes_by_name, volumes_by_id = self.list_volumes()
+        sources = self.get_bulk_sources(volumes_by_name, volumes_by_id)
+
+        snapshot_ids = []
+        snapshot_defs = []
+        for volume, snapshot_name in sources:
+            snapshot = volumes_by_name.get(snapshot_name)
+            if snapshot is None:
+                snapshot_defs.append(
+                    utils.SnapshotDef(volume['id'], snapshot_name))
+            elif snapshot.get('ancestorVolumeId') != volume['id']:
+                self.module.fail_json(
+                    msg="A volume named %s already exists and is not a"
+                        " snapshot of volume %s." % (snapshot_name,
+                                                     volume['name']))
+            else:
+                snapshot_ids.append(snapshot['id'])
+
+        result = dict(changed=False, snapshots_details=[],
+                      snapshot_group_ids=[])
+        errors = []
+        if snapshot_defs:
+            retention = 0
+            if desired_retention:
+                retention = calculate_retention(desired_retention,
+                                                retention_unit)
+            responses, errors = self.create_snapshots(
+                self.get_system_id(), snapshot_defs,
+                self.get_mode(self.module.params['read_only']), retention)
+            for response in responses:
+                result['snapshot_group_ids'].append(
+                    response.get('snapshotGroupId'))
+                snapshot_ids.extend(response.get('volumeIdList') or [])
+            result['changed'] = bool(responses)
+
+        result['snapshots_details'] = self.get_snapshots_details(
+            snapshot_ids, volumes_by_id, refresh=result['changed'])
+        if errors:
+            errormsg = "; ".join(errors)
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg, **result)
+        self.module.exit_json(**result)
+
     def modify_retention(self, snapshot_id, new_retention):
         """Modify snapshot retention
             :param snapshot_id: The snapshot id
@@ -986,6 +1286,11 @@ class PowerFlexSnapshot(PowerFlexBase):
 
         self.validate_desired_retention(desired_retention, retention_unit)
 
+        if self.module.params['volumes'] or \
+                self.module.params['vol_name_pattern']:
+            self.perform_bulk_operation(desired_retention, retention_unit)
+            return
+
         snapshot_details = self.get_snapshot(snapshot_name, snapshot_id)
 
         if snapshot_details:
@@ -1382,6 +1687,14 @@ def get_powerflex_snapshot_parameters():
         retention_unit=dict(choices=['hours', 'days']),
         remove_mode=dict(choices=['ONLY_ME', 'INCLUDING_DESCENDANTS']),
         sdc_state=dict(choices=['mapped', 'unmapped']),
+        volumes=dict(
+            type='list', elements='dict', options=dict(
+                vol_name=dict(), vol_id=dict(), snapshot_name=dict()
+            )
+        ),
+        vol_name_pattern=dict(),
+        consistent=dict(type='bool', default=True),
+        max_workers=dict(type='int', default=1),
         state=dict(required=True, type='str', choices=['present', 'absent'])
     )
 
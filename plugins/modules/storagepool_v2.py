@@ -21,6 +21,7 @@ description:
 
 extends_documentation_fragment:
   - dellemc.powerflex.powerflex_v2
+  - dellemc.powerflex.powerflex.wait
 
 author:
 - Luis Liu (@vangork) <ansible.team@dell.com>
@@ -459,6 +460,31 @@ storage_pool_details:
         "wrcDeviceGroupId": "39a898be00000000",
         "zeroPaddingEnabled": true
     }
+wait_details:
+    description: Seconds and polls waited for the removal of the storage
+      pool to complete, and the history of its progress.
+    returned: When I(wait) is C(true) and the storage pool was removed
+    type: dict
+    contains:
+        seconds:
+            description: Number of seconds waited.
+            type: float
+        polls:
+            description: Number of polls.
+            type: int
+        history:
+            description: Progress each time it changed, with the number of
+              seconds since the wait started. The progress is null once
+              the object is removed.
+            type: list
+    sample: {
+        "seconds": 8.307,
+        "polls": 3,
+        "history": [
+            {"elapsed": 0.064, "progress": {}},
+            {"elapsed": 8.307, "progress": null}
+        ]
+    }
 '''
 
 import copy
@@ -467,6 +493,10 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils. \
     storage.dell.libraries.configuration import Configuration
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase, powerflex_compatibility
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import uncached_get
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import get_removal_progress, is_removed, wait_for_completion
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
     import utils
 
@@ -499,6 +529,7 @@ class PowerFlexStoragePoolV2(PowerFlexBase):
                 'TwoPlusTwo', 'EightPlusTwo']),
             state=dict(required=True, type='str',
                        choices=['present', 'absent']),
+            **utils.get_powerflex_wait_parameters()
         )
 
         mutually_exclusive = [['storage_pool_name', 'storage_pool_id'],
@@ -735,6 +766,15 @@ class PowerFlexStoragePoolV2(PowerFlexBase):
                 result["diff"] = dict(before=sp_details, after={})
                 if not self.module.check_mode:
                     self.delete(sp_details)
+                wait_details = wait_for_completion(
+                    self.module,
+                    lambda: get_removal_progress(
+                        uncached_get(self.powerflex_conn.storage_pool),
+                        sp_details['id']),
+                    is_removed,
+                    "removal of storage pool %s" % sp_details['id'])
+                if wait_details is not None:
+                    result['wait_details'] = wait_details
             self.module.exit_json(**result)
 
         storage_pool = {
@@ -173,6 +173,16 @@ options:
     - Mapping state of the SDC.
     choices: ['mapped', 'unmapped']
     type: str
+  max_workers:
+    description:
+    - Maximum number of SDC mappings added, modified or removed in parallel.
+    - All SDCs are resolved with a single query regardless of this value.
+    - With a single worker the first failed SDC operation stops the
+      remaining ones. With more workers all the operations are sent and
+      the errors of the failed ones are reported together.
+    type: int
+    default: 1
+    version_added: 3.1.0
   delete_snapshots:
     description:
     - If C(true), the volume and all its dependent snapshots will be deleted.
@@ -549,6 +559,8 @@ from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.lib
     import powerflex_compatibility
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
     import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
 import copy
 
 LOG = utils.get_logger('volume')
@@ -584,6 +596,7 @@ class PowerFlexVolume(PowerFlexBase):
 
         super().__init__(AnsibleModule, module_params)
         super().check_module_compatibility()
+        self.sdc_index = None
 
     def get_protection_domain(self, protection_domain_name=None,
                               protection_domain_id=None):
@@ -772,6 +785,17 @@ class PowerFlexVolume(PowerFlexBase):
             id_ip_name = sdc_id
 
         try:
+            sdc_index = self.get_sdc_index()
+            if sdc_name:
+                resolved_id = sdc_index['name'].get(sdc_name)
+            elif sdc_ip:
+                resolved_id = sdc_index['ip'].get(sdc_ip)
+            else:
+                resolved_id = sdc_index['id'].get(sdc_id)
+            if resolved_id:
+                return resolved_id
+
+            # Query the SDC in case it was added after the index was read
             if sdc_name:
                 sdc_details = self.powerflex_conn.sdc.get(
                     filter_fields={'name': sdc_name})
@@ -793,6 +817,45 @@ class PowerFlexVolume(PowerFlexBase):
             LOG.error(errormsg)
             self.module.fail_json(msg=errormsg)
 
+    def get_sdc_index(self):
+        """Get the SDCs indexed by name, IP and ID. The SDCs are read
+            with a single query and the index is reused for every SDC
+            of the task.
+            :return: Dict with the 'name', 'ip' and 'id' indexes
+        """
+
+        if self.sdc_index is None:
+            sdc_index = {'name': {}, 'ip': {}, 'id': {}}
+            for sdc in self.powerflex_conn.sdc.get():
+                sdc_index['id'][sdc['id']] = sdc['id']
+                if sdc.get('name'):
+                    sdc_index['name'].setdefault(sdc['name'], sdc['id'])
+                if sdc.get('sdcIp'):
+                    sdc_index['ip'].setdefault(sdc['sdcIp'], sdc['id'])
+            self.sdc_index = sdc_index
+        return self.sdc_index
+
+    def run_sdc_operations(self, operation, items, get_error):
+        """Run an SDC operation for every item, at most max_workers at a
+            time, and fail with the errors of all failed items. With a
+            single worker the first failure stops the remaining items.
+            :param operation: Callable taking one item
+            :param items: Items to run the operation for
+            :param get_error: Callable building the error message of a
+             failed TaskResult
+            :return: List of TaskResult in the order of items
+        """
+
+        task_results = run_tasks(self.module, self.powerflex_conn, operation,
+                                 items, self.module.params.get('max_workers'),
+                                 fail_fast=True)
+        errors = [get_error(task) for task in task_results if task.failed]
+        if errors:
+            errormsg = "; ".join(errors)
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+        return task_results
+
     def create_volume(self, vol_name, pool_id, size, vol_type=None,
                       use_rmcache=None, comp_type=None):
         """Create volume
@@ -846,20 +909,18 @@ class PowerFlexVolume(PowerFlexBase):
              mode is successful
         """
 
-        try:
-            changed = False
-            for temp in access_mode_list:
-                if temp['accessMode']:
-                    self.powerflex_conn.volume.set_access_mode_for_sdc(
-                        volume_id=vol_id, sdc_id=temp['sdc_id'],
-                        access_mode=temp['accessMode'])
-                    changed = True
-            return changed
-        except Exception as e:
-            errormsg = "Modify access mode of SDC operation failed " \
-                       "with error {0}".format(str(e))
-            LOG.error(errormsg)
-            self.module.fail_json(msg=errormsg)
+        def set_access_mode(temp):
+            self.powerflex_conn.volume.set_access_mode_for_sdc(
+                volume_id=vol_id, sdc_id=temp['sdc_id'],
+                access_mode=temp['accessMode'])
+
+        access_mode_list = [temp for temp in access_mode_list
+                            if temp['accessMode']]
+        self.run_sdc_operations(
+            set_access_mode, access_mode_list,
+            lambda task: "Modify access mode of SDC operation failed "
+                         "with error {0}".format(task.error))
+        return len(access_mode_list) > 0
 
     def modify_limits(self, payload):
         """Modify IOPS and bandwidth limits of SDC's mapped to volume
@@ -904,22 +965,12 @@ class PowerFlexVolume(PowerFlexBase):
             :return: Boolean indicating if unmap operation is successful
         """
 
-        current_sdcs = volume['mappedSdcInfo']
-        current_sdc_ids = []
+        current_sdc_ids = set(self.get_current_sdcs(volume['mappedSdcInfo']))
         sdc_id_list = []
-        sdc_id = None
-        if current_sdcs:
-            for temp in current_sdcs:
-                current_sdc_ids.append(temp['sdcId'])
 
         for temp in sdc:
-            if 'sdc_name' in temp and temp['sdc_name']:
-                sdc_id = self.get_sdc_id(sdc_name=temp['sdc_name'])
-            elif 'sdc_ip' in temp and temp['sdc_ip']:
-                sdc_id = self.get_sdc_id(sdc_ip=temp['sdc_ip'])
-            else:
-                sdc_id = self.get_sdc_id(sdc_id=temp['sdc_id'])
-            if sdc_id in current_sdc_ids:
+            sdc_id = self.get_sdc_id_from_input(temp)
+            if sdc_id in current_sdc_ids and sdc_id not in sdc_id_list:
                 sdc_id_list.append(sdc_id)
 
         LOG.info("SDC IDs to remove %s", sdc_id_list)
@@ -927,16 +978,13 @@ class PowerFlexVolume(PowerFlexBase):
         if len(sdc_id_list) == 0:
             return False
 
-        try:
-            for sdc_id in sdc_id_list:
-                self.powerflex_conn.volume.remove_mapped_sdc(
-                    volume['id'], sdc_id)
-            return True
-        except Exception as e:
-            errormsg = "Unmap SDC {0} from volume {1} failed with error " \
-                       "{2}".format(sdc_id, volume['id'], str(e))
-            LOG.error(errormsg)
-            self.module.fail_json(msg=errormsg)
+        self.run_sdc_operations(
+            lambda sdc_id: self.powerflex_conn.volume.remove_mapped_sdc(
+                volume['id'], sdc_id),
+            sdc_id_list,
+            lambda task: "Unmap SDC {0} from volume {1} failed with error "
+                         "{2}".format(task.item, volume['id'], task.error))
+        return True
 
     def map_volume_to_sdc(self, volume, sdc):
         """Map SDC's to volume
@@ -951,7 +999,7 @@ class PowerFlexVolume(PowerFlexBase):
         sdc_modify_list1 = []
         sdc_modify_list2 = []
 
-        current_sdc_ids = self.get_current_sdcs(current_sdcs)
+        current_sdc_ids = set(self.get_current_sdcs(current_sdcs))
 
         for temp in sdc:
             sdc_id = self.get_sdc_id_from_input(temp)
@@ -970,35 +1018,33 @@ class PowerFlexVolume(PowerFlexBase):
         if not sdc_map_list:
             return False, sdc_modify_list1, sdc_modify_list2
 
-        try:
-            changed = False
-            for sdc in sdc_map_list:
+        def add_mapping(sdc):
+            payload = {
+                "volume_id": volume['id'],
+                "sdc_id": sdc['sdc_id'],
+                "access_mode": sdc['access_mode'],
+                "allow_multiple_mappings":
+                    self.module.params['allow_multiple_mappings']
+            }
+            self.powerflex_conn.volume.add_mapped_sdc(**payload)
+
+            if sdc['bandwidth_limit'] or sdc['iops_limit']:
                 payload = {
                     "volume_id": volume['id'],
                     "sdc_id": sdc['sdc_id'],
-                    "access_mode": sdc['access_mode'],
-                    "allow_multiple_mappings":
-                        self.module.params['allow_multiple_mappings']
+                    "bandwidth_limit": sdc['bandwidth_limit'],
+                    "iops_limit": sdc['iops_limit']
                 }
-                self.powerflex_conn.volume.add_mapped_sdc(**payload)
-
-                if sdc['bandwidth_limit'] or sdc['iops_limit']:
-                    payload = {
-                        "volume_id": volume['id'],
-                        "sdc_id": sdc['sdc_id'],
-                        "bandwidth_limit": sdc['bandwidth_limit'],
-                        "iops_limit": sdc['iops_limit']
-                    }
 
-                    self.powerflex_conn.volume.set_mapped_sdc_limits(**payload)
-                changed = True
-            return changed, sdc_modify_list1, sdc_modify_list2
-        except Exception as e:
-            errormsg = "Mapping volume {0} to SDC {1} " \
-                       "failed with error {2}".format(volume['name'],
-                                                      sdc['sdc_id'], str(e))
-            LOG.error(errormsg)
-            self.module.fail_json(msg=errormsg)
+                self.powerflex_conn.volume.set_mapped_sdc_limits(**payload)
+
+        self.run_sdc_operations(
+            add_mapping, sdc_map_list,
+            lambda task: "Mapping volume {0} to SDC {1} "
+                         "failed with error {2}".format(volume['name'],
+                                                        task.item['sdc_id'],
+                                                        task.error))
+        return True, sdc_modify_list1, sdc_modify_list2
 
     def update_sdc_lists(self, sdc_modify_list1, sdc_modify_list2,
                          access_mode_dict, limits_dict):
@@ -1473,14 +1519,15 @@ class PowerFlexVolume(PowerFlexBase):
             mode_changed = self.modify_access_mode(vol_id,
                                                    access_mode_list)
         if len(limits_list) > 0:
-            for temp in limits_list:
-                payload = {
-                    "volume_id": volume_details['id'],
-                    "sdc_id": temp['sdc_id'],
-                    "bandwidth_limit": temp['bandwidth_limit'],
-                    "iops_limit": temp['iops_limit']
-                }
-                limits_changed = self.modify_limits(payload)
+            payloads = [{
+                "volume_id": volume_details['id'],
+                "sdc_id": temp['sdc_id'],
+                "bandwidth_limit": temp['bandwidth_limit'],
+                "iops_limit": temp['iops_limit']
+            } for temp in limits_list]
+            task_results = self.run_sdc_operations(
+                self.modify_limits, payloads, lambda task: task.error)
+            limits_changed = any(task.result for task in task_results)
         return mode_changed, limits_changed, map_changed
 
     def delete_operation(self, vol_id, delete_snapshots):
@@ -1668,6 +1715,7 @@ def get_powerflex_volume_parameters():
             )
         ),
         sdc_state=dict(choices=['mapped', 'unmapped']),
+        max_workers=dict(type='int', default=1),
         state=dict(required=True, type='str', choices=['present', 'absent'])
     )
 
@@ -0,0 +1,827 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Dell Technologies
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+""" Ansible module for managing volumes in bulk on Dell Technologies (Dell) PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+module: volume_bulk
+version_added: '3.1.0'
+short_description: Manage a list of volumes on Dell PowerFlex
+description:
+- Managing volumes in bulk on PowerFlex storage system includes creating,
+  renaming, extending, mapping and deleting every volume of a list of
+  volume specs in a single task.
+- The protection domains, storage pools, snapshot policies and SDCs
+  referenced by the specs are resolved once, and the specs are compared
+  against a single query of the existing volumes.
+- The changes are applied by a bounded number of parallel workers and
+  reported per volume together with a summary.
+author:
+- Dell Technologies (@dellemc) <ansible.team@dell.com>
+extends_documentation_fragment:
+  - dellemc.powerflex.powerflex
+options:
+  volumes:
+    description:
+    - List of volume specs.
+    - Every volume may only be listed once.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      vol_name:
+        description:
+        - The name of the volume.
+        type: str
+        required: true
+      vol_new_name:
+        description:
+        - New name of the volume. Used to rename the volume.
+        - A volume already renamed to I(vol_new_name) is left unchanged.
+        type: str
+      storage_pool_name:
+        description:
+        - The name of the storage pool.
+        - Either name or the id of the storage pool is required for creating
+          a volume.
+        - Mutually exclusive with I(storage_pool_id).
+        type: str
+      storage_pool_id:
+        description:
+        - The ID of the storage pool.
+        - Mutually exclusive with I(storage_pool_name).
+        type: str
+      protection_domain_name:
+        description:
+        - The name of the protection domain.
+        - Used to pick the storage pool when several pools share a name.
+        - Mutually exclusive with I(protection_domain_id).
+        type: str
+      protection_domain_id:
+        description:
+        - The ID of the protection domain.
+        - Mutually exclusive with I(protection_domain_name).
+        type: str
+      size:
+        description:
+        - The size of the volume.
+        - Size of the volume will be assigned as higher multiple of 8 GB.
+        - Mandatory for create operation.
+        type: int
+      cap_unit:
+        description:
+        - The unit of the volume size. It defaults to C(GB).
+        type: str
+        choices: ['GB', 'TB']
+      vol_type:
+        description:
+        - Type of volume provisioning.
+        type: str
+        choices: ['THICK_PROVISIONED', 'THIN_PROVISIONED']
+      compression_type:
+        description:
+        - Type of the compression method.
+        type: str
+        choices: ['NORMAL', 'NONE']
+      use_rmcache:
+        description:
+        - Whether to use RM Cache or not.
+        type: bool
+      snapshot_policy_name:
+        description:
+        - Name of the snapshot policy to attach to the volume.
+        - Mutually exclusive with I(snapshot_policy_id).
+        type: str
+      snapshot_policy_id:
+        description:
+        - ID of the snapshot policy to attach to the volume.
+        - Mutually exclusive with I(snapshot_policy_name).
+        type: str
+      sdc:
+        description:
+        - SDCs the volume is mapped to.
+        - SDCs already mapped to the volume and not listed are left mapped.
+        type: list
+        elements: dict
+        suboptions:
+          sdc_id:
+            description:
+            - ID of the SDC.
+            - Specify either I(sdc_name), I(sdc_ip) or I(sdc_id).
+            - Mutually exclusive with I(sdc_ip) and I(sdc_name).
+            type: str
+          sdc_ip:
+            description:
+            - IP of the SDC.
+            - Mutually exclusive with I(sdc_id) and I(sdc_name).
+            type: str
+          sdc_name:
+            description:
+            - Name of the SDC.
+            - Mutually exclusive with I(sdc_id) and I(sdc_ip).
+            type: str
+          access_mode:
+            description:
+            - Define the access mode for all mappings of the volume.
+            - New mappings default to C(READ_WRITE).
+            type: str
+            choices: ['READ_WRITE', 'READ_ONLY', 'NO_ACCESS']
+      state:
+        description:
+        - State of the volume.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+  allow_multiple_mappings:
+    description:
+    - Specifies whether to allow or not allow multiple mappings.
+    type: bool
+  delete_snapshots:
+    description:
+    - If C(true), the volumes and all their dependent snapshots will be
+      deleted.
+    - If C(false), only the volumes will be deleted.
+    type: bool
+  max_workers:
+    description:
+    - Maximum number of volumes changed in parallel.
+    type: int
+    default: 4
+attributes:
+  check_mode:
+    description: Runs task to validate without performing action on the target machine.
+    support: full
+  diff_mode:
+    description: Runs the task to report the changes made or to be made.
+    support: none
+notes:
+  - Volumes are only extended. A I(size) smaller than the current size of a
+    volume is reported as an error for that volume.
+  - A volume with a different snapshot policy attached is reported as an
+    error. Use M(dellemc.powerflex.volume) to remove or detach the policy.
+  - The specs are validated and applied independently. A failing spec does
+    not stop the others, and the task fails after all specs were processed.
+  - Supported only for PowerFlex versions 3.6 and later, earlier than 5.0.
+    On PowerFlex 5.0 and later the task is skipped with a warning, use
+    M(dellemc.powerflex.volume_v2) for each volume instead.
+'''
+
+EXAMPLES = r'''
+- name: Create and map volumes
+  dellemc.powerflex.volume_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    allow_multiple_mappings: true
+    max_workers: 8
+    volumes:
+      - vol_name: "sample_volume_1"
+        storage_pool_name: "pool_1"
+        protection_domain_name: "pd_1"
+        size: 16
+        sdc:
+          - sdc_name: "sdc_1"
+          - sdc_ip: "10.x.x.x"
+            access_mode: "READ_ONLY"
+      - vol_name: "sample_volume_2"
+        storage_pool_name: "pool_1"
+        protection_domain_name: "pd_1"
+        vol_type: "THIN_PROVISIONED"
+        size: 1
+        cap_unit: "TB"
+        snapshot_policy_name: "sample_snap_policy"
+
+- name: Rename and extend volumes
+  dellemc.powerflex.volume_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    volumes:
+      - vol_name: "sample_volume_1"
+        vol_new_name: "new_sample_volume_1"
+      - vol_name: "sample_volume_2"
+        size: 2
+        cap_unit: "TB"
+
+- name: Delete volumes
+  dellemc.powerflex.volume_bulk:
+    hostname: "{{hostname}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    validate_certs: "{{validate_certs}}"
+    port: "{{port}}"
+    delete_snapshots: true
+    volumes:
+      - vol_name: "new_sample_volume_1"
+        state: "absent"
+      - vol_name: "sample_volume_2"
+        state: "absent"
+'''
+
+RETURN = r'''
+changed:
+    description: Whether or not the resource has changed.
+    returned: always
+    type: bool
+    sample: 'false'
+volumes:
+    description: Outcome of every volume spec, in the order of the specs.
+    returned: always
+    type: list
+    contains:
+        vol_name:
+            description: Name of the volume in the spec.
+            type: str
+        id:
+            description: ID of the volume, if it exists or was created.
+            type: str
+        changed:
+            description: Whether the volume was or would be changed.
+            type: bool
+        actions:
+            description: Changes applied, or to be applied in check mode.
+            type: list
+        error:
+            description: Error message if the spec could not be applied.
+            type: str
+    sample: [
+        {
+            "vol_name": "sample_volume_1",
+            "id": "456ad22e00000003",
+            "changed": true,
+            "actions": ["create", "map"],
+            "error": null
+        },
+        {
+            "vol_name": "sample_volume_2",
+            "id": "456ad22e00000004",
+            "changed": false,
+            "actions": [],
+            "error": null
+        }
+    ]
+summary:
+    description: Number of volume specs per outcome.
+    returned: always
+    type: dict
+    contains:
+        total:
+            description: Number of volume specs.
+            type: int
+        created:
+            description: Number of volumes created.
+            type: int
+        modified:
+            description: Number of existing volumes modified.
+            type: int
+        deleted:
+            description: Number of volumes deleted.
+            type: int
+        unchanged:
+            description: Number of volumes already in the requested state.
+            type: int
+        failed:
+            description: Number of volume specs that failed.
+            type: int
+    sample: {
+        "total": 2,
+        "created": 1,
+        "modified": 0,
+        "deleted": 0,
+        "unchanged": 1,
+        "failed": 0
+    }
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell\
+    import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
+    import powerflex_compatibility
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.powerflex_base \
+    import PowerFlexBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.bulk \
+    import index_entities, prepare_output, get_summary
+
+LOG = utils.get_logger('volume_bulk')
+
+ACTIONS = ('create', 'rename', 'extend', 'use_rmcache', 'compression',
+           'snapshot_policy', 'map', 'access_mode', 'delete')
+
+
+@powerflex_compatibility(min_ver='3.6', max_ver='5.0')
+class PowerFlexVolumeBulk(PowerFlexBase):
+    """Class with bulk volume operations"""
+
+    def __init__(self):
+        argument_spec = get_powerflex_volume_bulk_parameters()
+
+        module_params = {
+            'argument_spec': argument_spec,
+            'supports_check_mode': True
+        }
+
+        super().__init__(AnsibleModule, module_params)
+        super().check_module_compatibility()
+        self.references = {}
+        self.volumes = {}
+
+    def list_entities(self, entity, label):
+        """Get all entities of a kind with a single query
+            :param entity: Name of the entity on the PowerFlex connection
+            :param label: Name of the entities used in messages
+            :return: List of entities
+        """
+        try:
+            return getattr(self.powerflex_conn, entity).get()
+        except Exception as e:
+            errormsg = "Failed to get the list of {0} with error " \
+                       "{1}".format(label, str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+
+    def resolve_references(self, specs):
+        """Index the protection domains, storage pools, snapshot policies
+        and SDCs referenced by any of the specs
+            :param specs: List of volume specs
+        """
+        def is_referenced(*keys):
+            return any(spec.get(key) for spec in specs for key in keys)
+
+        if is_referenced('protection_domain_name', 'protection_domain_id'):
+            self.references['protection_domain'] = index_entities(
+                self.list_entities('protection_domain', 'protection domains'))
+        if is_referenced('storage_pool_name', 'storage_pool_id',
+                         'compression_type'):
+            self.references['storage_pool'] = index_entities(
+                self.list_entities('storage_pool', 'storage pools'))
+        if is_referenced('snapshot_policy_name', 'snapshot_policy_id'):
+            self.references['snapshot_policy'] = index_entities(
+                self.list_entities('snapshot_policy', 'snapshot policies'))
+        if is_referenced('sdc'):
+            self.references['sdc'] = index_entities(
+                self.list_entities('sdc', 'SDCs'), ('name', 'sdcIp'))
+
+    def get_volume_snapshot(self, specs):
+        """Get the existing volumes named by the specs with a single query
+            :param specs: List of volume specs
+            :return: Dictionary of volume details by name
+        """
+        names = set()
+        for spec in specs:
+            names.add(spec['vol_name'])
+            if spec['vol_new_name']:
+                names.add(spec['vol_new_name'])
+        volumes = self.list_entities('volume', 'volumes')
+        return dict((volume['name'], volume) for volume in volumes
+                    if volume.get('name') in names)
+
+    def find_reference(self, entity, label, entity_id=None, entity_name=None):
+        """Find resolved entities by id or name
+            :param entity: Kind of the entity
+            :param label: Name of the entity used in messages
+            :param entity_id: ID of the entity
+            :param entity_name: Name of the entity
+            :return: List of matching entities
+        """
+        by_id, by_name = self.references[entity]
+        if entity_id:
+            matches = [by_id[entity_id]] if entity_id in by_id else []
+        else:
+            matches = by_name['name'].get(entity_name, [])
+        if not matches:
+            err_msg = "Unable to find the {0} with {1}. Please enter a valid" \
+                      " {0} name/id.".format(label, entity_id or entity_name)
+            self.module.fail_json(msg=err_msg)
+        return matches
+
+    def get_protection_domain_id(self, spec):
+        """Get the ID of the protection domain of a spec
+            :param spec: Volume spec
+            :return: ID of the protection domain
+        """
+        if not (spec['protection_domain_id'] or spec['protection_domain_name']):
+            return None
+        return self.find_reference(
+            'protection_domain', 'protection domain',
+            spec['protection_domain_id'], spec['protection_domain_name'])[0]['id']
+
+    def get_storage_pool(self, spec):
+        """Get the storage pool of a spec
+            :param spec: Volume spec
+            :return: Storage pool details
+        """
+        sp_id = spec['storage_pool_id']
+        sp_name = spec['storage_pool_name']
+        if not (sp_id or sp_name):
+            return None
+        pools = self.find_reference('storage_pool', 'storage pool',
+                                    sp_id, sp_name)
+        pd_id = self.get_protection_domain_id(spec)
+        if pd_id:
+            pools = [pool for pool in pools
+                     if pool['protectionDomainId'] == pd_id]
+        if len(pools) > 1:
+            err_msg = "More than one storage pool found with {0}," \
+                      " Please provide protection domain Name/Id" \
+                      " to fetch the unique pool".format(sp_name)
+            self.module.fail_json(msg=err_msg)
+        if not pools:
+            err_msg = "Unable to find the storage pool {0} in protection" \
+                      " domain {1}.".format(sp_id or sp_name, pd_id)
+            self.module.fail_json(msg=err_msg)
+        return pools[0]
+
+    def get_snapshot_policy_id(self, spec):
+        """Get the ID of the snapshot policy of a spec
+            :param spec: Volume spec
+            :return: ID of the snapshot policy
+        """
+        if not (spec['snapshot_policy_id'] or spec['snapshot_policy_name']):
+            return None
+        return self.find_reference(
+            'snapshot_policy', 'snapshot policy',
+            spec['snapshot_policy_id'], spec['snapshot_policy_name'])[0]['id']
+
+    def get_sdc_id(self, sdc):
+        """Get the ID of an SDC of a spec
+            :param sdc: SDC of the spec
+            :return: ID of the SDC
+        """
+        if sdc['sdc_id']:
+            return self.find_reference('sdc', 'SDC', entity_id=sdc['sdc_id'])[0]['id']
+        by_id, by_name = self.references['sdc']
+        if sdc['sdc_ip']:
+            matches = by_name['sdcIp'].get(sdc['sdc_ip'])
+        else:
+            matches = by_name['name'].get(sdc['sdc_name'])
+        if not matches:
+            err_msg = "Unable to find the SDC with {0}. Please enter a valid" \
+                      " SDC name/ip/id.".format(sdc['sdc_ip'] or sdc['sdc_name'])
+            self.module.fail_json(msg=err_msg)
+        return matches[0]['id']
+
+    def validate_spec(self, spec):
+        """Validate a volume spec
+            :param spec: Volume spec
+        """
+        if len(spec['vol_name'].strip()) == 0:
+            self.module.fail_json(msg="Please provide valid volume name.")
+        if spec['vol_new_name'] is not None and \
+                len(spec['vol_new_name'].strip()) == 0:
+            self.module.fail_json(msg="Please provide valid volume new name.")
+        for pair in (('storage_pool_name', 'storage_pool_id'),
+                     ('protection_domain_name', 'protection_domain_id'),
+                     ('snapshot_policy_name', 'snapshot_policy_id')):
+            if spec[pair[0]] and spec[pair[1]]:
+                self.module.fail_json(
+                    msg="parameters are mutually exclusive: "
+                        "{0}|{1}".format(*pair))
+        for sdc in spec['sdc'] or []:
+            if len([key for key in ('sdc_id', 'sdc_ip', 'sdc_name')
+                    if sdc[key]]) != 1:
+                self.module.fail_json(
+                    msg="Please provide exactly one of sdc_id, sdc_ip or"
+                        " sdc_name for every SDC.")
+
+    def plan_volume(self, spec):
+        """Compare a volume spec with the existing volume
+            :param spec: Volume spec
+            :return: Dictionary with the volume and the changes to apply
+        """
+        self.validate_spec(spec)
+        vol_name = spec['vol_name']
+        new_name = spec['vol_new_name']
+        plan = dict(vol_name=vol_name, id=None, changes={})
+        changes = plan['changes']
+
+        volume = self.volumes.get(vol_name)
+        if spec['state'] == 'absent':
+            if volume:
+                plan['id'] = volume['id']
+                changes['delete'] = get_remove_mode(
+                    self.module.params['delete_snapshots'])
+            return plan
+
+        if volume is None and new_name:
+            volume = self.volumes.get(new_name)
+        elif volume is not None and new_name and new_name != vol_name \
+                and new_name in self.volumes:
+            self.module.fail_json(
+                msg="Unable to rename volume {0} to {1} as a volume with that"
+                    " name already exists.".format(vol_name, new_name))
+
+        size = get_size_data(spec['size'], spec['cap_unit'])
+        comp_type = spec['compression_type'].capitalize() \
+            if spec['compression_type'] else None
+        pool = self.get_storage_pool(spec)
+        snap_pol_id = self.get_snapshot_policy_id(spec)
+
+        if volume is None:
+            if new_name:
+                self.module.fail_json(
+                    msg="vol_new_name parameter is not supported during "
+                        "creation of a volume. Try renaming the volume after"
+                        " the creation.")
+            if pool is None or not size:
+                self.module.fail_json(
+                    msg="Storage pool name/id and size are mandatory for"
+                        " creating the volume {0}.".format(vol_name))
+            if comp_type:
+                validate_data_layout(self.module, pool)
+            changes['create'] = dict(
+                storage_pool_id=pool['id'], size_in_gb=size, name=vol_name,
+                volume_type=get_vol_type(spec['vol_type']),
+                use_rmcache=spec['use_rmcache'], compression_method=comp_type)
+            if snap_pol_id:
+                changes['snapshot_policy'] = snap_pol_id
+            mapped_sdcs = {}
+        else:
+            plan['id'] = volume['id']
+            if pool and pool['id'] != volume['storagePoolId']:
+                self.module.fail_json(
+                    msg="Entered storage pool does not match with the"
+                        " volume's storage pool {0}.".format(
+                            volume['storagePoolId']))
+            self.update_modify_changes(spec, volume, size, comp_type,
+                                       snap_pol_id, changes)
+            mapped_sdcs = dict((mapping['sdcId'], mapping['accessMode'])
+                               for mapping in volume.get('mappedSdcInfo') or [])
+
+        self.update_mapping_changes(spec, mapped_sdcs, changes)
+        return plan
+
+    def update_modify_changes(self, spec, volume, size, comp_type,
+                              snap_pol_id, changes):
+        """Add the attribute changes of an existing volume
+            :param spec: Volume spec
+            :param volume: Details of the volume
+            :param size: Size of the volume in GB
+            :param comp_type: Compression method of the volume
+            :param snap_pol_id: ID of the snapshot policy
+            :param changes: Dictionary of the changes to apply
+        """
+        if spec['vol_new_name'] and spec['vol_new_name'] != volume['name']:
+            changes['rename'] = spec['vol_new_name']
+
+        vol_size_in_gb = utils.get_size_in_gb(volume['sizeInKb'], 'KB')
+        if size is not None and size <= vol_size_in_gb - 8:
+            self.module.fail_json(
+                msg="Reducing the size of volume {0} from {1} GB to {2} GB"
+                    " is not supported.".format(volume['name'],
+                                                vol_size_in_gb, size))
+        if size is not None and size > vol_size_in_gb:
+            changes['extend'] = size
+
+        if spec['use_rmcache'] is not None and \
+                volume['useRmcache'] != spec['use_rmcache']:
+            changes['use_rmcache'] = spec['use_rmcache']
+
+        if comp_type and comp_type != volume['compressionMethod']:
+            pools_by_id = self.references['storage_pool'][0]
+            validate_data_layout(self.module,
+                                 pools_by_id[volume['storagePoolId']])
+            changes['compression'] = comp_type
+
+        attached_pol_id = volume.get('snplIdOfSourceVolume')
+        if snap_pol_id and attached_pol_id and attached_pol_id != snap_pol_id:
+            self.module.fail_json(
+                msg="Volume {0} already has the snapshot policy {1}"
+                    " attached.".format(volume['name'], attached_pol_id))
+        if snap_pol_id and not attached_pol_id:
+            changes['snapshot_policy'] = snap_pol_id
+
+    def update_mapping_changes(self, spec, mapped_sdcs, changes):
+        """Add the SDC mappings and access modes to change
+            :param spec: Volume spec
+            :param mapped_sdcs: Access mode of the mapped SDCs by id
+            :param changes: Dictionary of the changes to apply
+        """
+        for sdc in spec['sdc'] or []:
+            sdc_id = self.get_sdc_id(sdc)
+            access_mode = get_access_mode(sdc['access_mode'])
+            if sdc_id not in mapped_sdcs:
+                changes.setdefault('map', []).append(
+                    (sdc_id, access_mode or 'ReadWrite'))
+                mapped_sdcs[sdc_id] = access_mode or 'ReadWrite'
+            elif access_mode and mapped_sdcs[sdc_id] != access_mode:
+                changes.setdefault('access_mode', []).append(
+                    (sdc_id, access_mode))
+
+    def apply_plan(self, plan):
+        """Apply the changes of a volume
+            :param plan: Dictionary with the volume and the changes to apply
+            :return: ID of the volume
+        """
+        changes = plan['changes']
+        volume_api = self.powerflex_conn.volume
+        try:
+            if 'create' in changes:
+                plan['id'] = volume_api.create(**changes['create'])['id']
+                LOG.info("Created volume %s with id %s", plan['vol_name'],
+                         plan['id'])
+            vol_id = plan['id']
+            if 'delete' in changes:
+                volume_api.delete(vol_id, changes['delete'])
+            if 'rename' in changes:
+                volume_api.rename(vol_id, changes['rename'])
+            if 'extend' in changes:
+                volume_api.extend(vol_id, changes['extend'])
+            if 'use_rmcache' in changes:
+                volume_api.set_use_rmcache(vol_id, changes['use_rmcache'])
+            if 'compression' in changes:
+                volume_api.set_compression_method(vol_id, changes['compression'])
+            if 'snapshot_policy' in changes:
+                self.powerflex_conn.snapshot_policy.add_source_volume(
+                    changes['snapshot_policy'], vol_id)
+            for sdc_id, access_mode in changes.get('map', []):
+                volume_api.add_mapped_sdc(
+                    volume_id=vol_id, sdc_id=sdc_id, access_mode=access_mode,
+                    allow_multiple_mappings=self.module.params[
+                        'allow_multiple_mappings'])
+            for sdc_id, access_mode in changes.get('access_mode', []):
+                volume_api.set_access_mode_for_sdc(
+                    volume_id=vol_id, sdc_id=sdc_id, access_mode=access_mode)
+            return vol_id
+        except Exception as e:
+            errormsg = "Updating volume {0} failed with error " \
+                       "{1}".format(plan['vol_name'], str(e))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg)
+
+    def validate_unique_names(self, specs):
+        """Fail if a volume is listed more than once
+            :param specs: List of volume specs
+        """
+        names = set()
+        for spec in specs:
+            if spec['vol_name'] in names:
+                self.module.fail_json(
+                    msg="Volume {0} is listed more than once in"
+                        " volumes.".format(spec['vol_name']))
+            names.add(spec['vol_name'])
+
+    def perform_module_operation(self):
+        """
+        Perform the bulk volume operations based on the parameters passed
+        in the playbook
+        """
+        specs = self.module.params['volumes']
+        max_workers = self.module.params['max_workers']
+
+        self.validate_unique_names(specs)
+        self.resolve_references(specs)
+        self.volumes = self.get_volume_snapshot(specs)
+
+        plans = run_tasks(self.module, self.powerflex_conn, self.plan_volume,
+                          specs)
+        results = []
+        to_apply = []
+        for spec, task in zip(specs, plans):
+            if task.failed:
+                results.append(dict(vol_name=spec['vol_name'], id=None,
+                                    changes={}, error=task.error))
+                continue
+            plan = dict(task.result, error=None)
+            results.append(plan)
+            if plan['changes']:
+                to_apply.append(plan)
+        LOG.info("Volumes to change: %s",
+                 [plan['vol_name'] for plan in to_apply])
+
+        if to_apply and not self.module.check_mode:
+            for task in run_tasks(self.module, self.powerflex_conn,
+                                  self.apply_plan, to_apply, max_workers):
+                if task.failed:
+                    task.item['error'] = task.error
+
+        volumes = [prepare_output(plan, 'vol_name', ACTIONS)
+                   for plan in results]
+        result = dict(
+            changed=any(volume['changed'] for volume in volumes),
+            volumes=volumes,
+            summary=get_summary(results)
+        )
+        failed = [volume for volume in volumes if volume['error']]
+        if failed:
+            errormsg = "Failed to apply {0} of {1} volume specs: {2}".format(
+                len(failed), len(volumes),
+                "; ".join(volume['error'] for volume in failed))
+            LOG.error(errormsg)
+            self.module.fail_json(msg=errormsg, **result)
+        self.module.exit_json(**result)
+
+
+def validate_data_layout(module, pool):
+    """
+    :param module: Ansible module object
+    :param pool: Details of the storage pool
+    """
+    if pool.get('dataLayout') != "FineGranularity":
+        err_msg = "compression_type for volume can only be " \
+                  "mentioned when storage pools have Fine " \
+                  "Granularity layout. Storage Pool found" \
+                  " with {0}".format(pool.get('dataLayout'))
+        module.fail_json(msg=err_msg)
+
+
+def get_size_data(size, cap_unit):
+    """
+    :param size: Size of the volume
+    :param cap_unit: Unit of the size
+    :return: Size of the volume in GB
+    """
+    if size and cap_unit == 'TB':
+        size = size * 1024
+    return size
+
+
+def get_remove_mode(delete_snapshots):
+    """
+    :param delete_snapshots: Whether to delete the dependent snapshots
+    :return: The removal mode of the volume
+    """
+    return 'INCLUDING_DESCENDANTS' if delete_snapshots else 'ONLY_ME'
+
+
+def get_access_mode(access_mode):
+    """
+    :param access_mode: Access mode of the SDC
+    :return: The enum for the access mode
+    """
+
+    access_mode_dict = {
+        "READ_WRITE": "ReadWrite",
+        "READ_ONLY": "ReadOnly",
+        "NO_ACCESS": "NoAccess"
+    }
+    return access_mode_dict.get(access_mode)
+
+
+def get_vol_type(vol_type):
+    """
+    :param vol_type: Type of the volume
+    :return: Corresponding value for the entered vol_type
+    """
+    vol_type_dict = {
+        "THICK_PROVISIONED": "ThickProvisioned",
+        "THIN_PROVISIONED": "ThinProvisioned",
+    }
+    if vol_type:
+        vol_type = vol_type_dict.get(vol_type)
+    return vol_type
+
+
+def get_powerflex_volume_bulk_parameters():
+    """This method provide parameter required for the bulk volume
+    module on PowerFlex"""
+    return dict(
+        volumes=dict(
+            type='list', elements='dict', required=True, options=dict(
+                vol_name=dict(required=True), vol_new_name=dict(),
+                storage_pool_name=dict(), storage_pool_id=dict(),
+                protection_domain_name=dict(), protection_domain_id=dict(),
+                size=dict(type='int'),
+                cap_unit=dict(choices=['GB', 'TB']),
+                vol_type=dict(choices=['THICK_PROVISIONED',
+                                       'THIN_PROVISIONED']),
+                compression_type=dict(choices=['NORMAL', 'NONE']),
+                use_rmcache=dict(type='bool'),
+                snapshot_policy_name=dict(), snapshot_policy_id=dict(),
+                sdc=dict(
+                    type='list', elements='dict', options=dict(
+                        sdc_id=dict(), sdc_ip=dict(), sdc_name=dict(),
+                        access_mode=dict(choices=['READ_WRITE', 'READ_ONLY',
+                                                  'NO_ACCESS'])
+                    )
+                ),
+                state=dict(default='present', choices=['present', 'absent'])
+            )
+        ),
+        allow_multiple_mappings=dict(type='bool'),
+        delete_snapshots=dict(type='bool'),
+        max_workers=dict(type='int', default=4)
+    )
+
+
+def main():
+    """ Create PowerFlex bulk volume object and perform actions on it
+        based on user input from playbook"""
+    obj = PowerFlexVolumeBulk()
+    obj.perform_module_operation()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex inventory plugin"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+import pytest
+from mock.mock import MagicMock
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_inventory_api \
+    import MockInventoryApi
+from ansible_collections.dellemc.powerflex.plugins.inventory.powerflex import InventoryModule
+
+
+class TestPowerflexInventory():
+
+    @pytest.fixture
+    def inventory_plugin(self):
+        plugin = InventoryModule()
+        plugin.inventory = InventoryData()
+        plugin.options = copy.deepcopy(MockInventoryApi.INVENTORY_OPTIONS)
+        plugin.get_option = lambda option: plugin.options[option]
+        plugin.conn = MagicMock()
+        plugin.conn.protection_domain.get = MagicMock(
+            return_value=MockInventoryApi.PROTECTION_DOMAINS)
+        plugin.conn.fault_set.get = MagicMock(
+            return_value=MockInventoryApi.FAULT_SETS)
+        plugin.conn.sds.get = MagicMock(return_value=MockInventoryApi.SDS_LIST)
+        plugin.conn.sdc.get = MagicMock(return_value=MockInventoryApi.SDC_LIST)
+        plugin.conn.system.get_mdm_cluster_details = MagicMock(
+            return_value=MockInventoryApi.MDM_CLUSTER)
+        plugin.get_connection = MagicMock(return_value=plugin.conn)
+        return plugin
+
+    def test_verify_file(self, inventory_plugin, tmp_path):
+        for name in ('powerflex.yml', 'hosts.yml'):
+            (tmp_path / name).write_text(u'plugin: dellemc.powerflex.powerflex\n')
+        assert inventory_plugin.verify_file(str(tmp_path / 'powerflex.yml'))
+        assert not inventory_plugin.verify_file(str(tmp_path / 'hosts.yml'))
+
+    def test_populate_topology(self, inventory_plugin):
+        inventory_plugin.populate(inventory_plugin.get_topology())
+        inventory = inventory_plugin.inventory
+        assert sorted(inventory.hosts) == ['10.0.0.3', '10.0.0.9', 'node1', 'node2']
+        node1 = inventory.get_host('node1').get_vars()
+        assert node1['powerflex_roles'] == ['sds', 'sdc', 'mdm']
+        assert node1['ansible_host'] == '10.0.0.1'
+        assert node1['powerflex_ips'] == ['10.0.0.1', '10.1.0.1']
+        assert node1['powerflex_protection_domain_name'] == 'domain 1'
+        assert node1['powerflex_fault_set_name'] == 'fs1'
+        assert node1['powerflex_sdc_id'] == 'sdc_id_1'
+        assert node1['powerflex_mdm_role'] == 'primary'
+        groups = inventory.groups
+        assert sorted(host.name for host in groups['powerflex_sds'].get_hosts()) == ['node1', 'node2']
+        assert sorted(host.name for host in groups['powerflex_sdc'].get_hosts()) == ['10.0.0.9', 'node1']
+        assert [host.name for host in groups['powerflex_mdm_tiebreaker'].get_hosts()] == ['10.0.0.3']
+        assert [host.name for host in groups['powerflex_pd_domain_1_fs_fs1'].hosts] == ['node1']
+        assert [group.name for group in groups['powerflex_pd_domain_1'].child_groups] == \
+            ['powerflex_pd_domain_1_fs_fs1']
+        inventory_plugin.conn.sdt.get.assert_not_called()
+
+    def test_populate_hostnames_ip(self, inventory_plugin):
+        inventory_plugin.options.update(hostnames='ip', entities=['sds'])
+        inventory_plugin.populate(inventory_plugin.get_topology())
+        assert sorted(inventory_plugin.inventory.hosts) == ['10.0.0.1', '10.0.0.2']
+        inventory_plugin.conn.sdc.get.assert_not_called()
+        inventory_plugin.conn.system.get_mdm_cluster_details.assert_not_called()
+
+    def test_get_topology_exception(self, inventory_plugin):
+        inventory_plugin.conn.sds.get = MagicMock(side_effect=Exception('unauthorized'))
+        with pytest.raises(AnsibleError, match='unauthorized'):
+            inventory_plugin.get_topology()
+
+    def test_parse_cache(self, inventory_plugin, mocker):
+        mocker.patch.object(InventoryModule, '_read_config_data')
+        inventory_plugin.options.update(cache=True)
+        inventory_plugin._cache = {}
+        inventory_plugin.parse(InventoryData(), MagicMock(), 'powerflex.yml', cache=False)
+        inventory_plugin.parse(InventoryData(), MagicMock(), 'powerflex.yml', cache=True)
+        assert inventory_plugin.conn.sds.get.call_count == 1
+        assert 'node1' in inventory_plugin.inventory.hosts
@@ -15,3 +15,4 @@ utils.PowerFlexClient = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
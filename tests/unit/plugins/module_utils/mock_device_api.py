@@ -39,6 +39,8 @@ class MockDeviceApi:
         "protection_domain_id": None,
         "external_acceleration_type": None,
         "media_type": None,
+        "wait": False,
+        "wait_timeout": 3600,
         "state": None
     }
 
@@ -17,5 +17,5 @@ class FailJsonException(Exception):
             self.message = None
 
 
-def fail_json(msg):
+def fail_json(msg, **kwargs):
     raise FailJsonException(msg)
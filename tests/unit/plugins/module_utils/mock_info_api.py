@@ -238,8 +238,41 @@ class MockInfoApi:
     RCG_LIST = MockReplicationConsistencyGroupApi.get_rcg_details()
     PAIR_LIST = MockReplicationPairApi.get_pair_details()
 
+    @staticmethod
+    def get_scaled_pair_list(count):
+        pair = MockReplicationPairApi.get_pair_details()[0]
+        pairs = []
+        for index in range(count):
+            scaled_pair = dict(pair)
+            scaled_pair['id'] = 'pair_id_%s' % index
+            scaled_pair['localVolumeId'] = 'vol_id_%s' % index
+            scaled_pair['replicationConsistencyGroupId'] = 'rcg_id_%s' % (index % 10)
+            pairs.append(scaled_pair)
+        return pairs
+
+    @staticmethod
+    def get_scaled_volume_list(count):
+        return [{'id': 'vol_id_%s' % index, 'name': 'vol_%s' % index} for index in range(count)]
+
+    @staticmethod
+    def get_scaled_rcg_list(count):
+        return [{'id': 'rcg_id_%s' % index, 'name': 'rcg_%s' % index} for index in range(count)]
+
     INFO_GET_FAULT_SET_LIST = MockFaultSetApi.FAULT_SET_GET_LIST
 
+    INFO_FAULT_SET_MULTI_PD_LIST = [
+        {"id": "fault_set_id_1", "name": "fault_set_name_1", "protectionDomainId": "9300c1f900000000"},
+        {"id": "fault_set_id_2", "name": "fault_set_name_2", "protectionDomainId": "9300c1f900000000"},
+        {"id": "fault_set_id_3", "name": "fault_set_name_3", "protectionDomainId": "9300e90900000001"}
+    ]
+
+    INFO_FAULT_SET_SDS_LIST = [
+        {"id": "8f3bb0cc00000002", "name": "node0", "faultSetId": "fault_set_id_1"},
+        {"id": "8f3bb0ce00000000", "name": "node1", "faultSetId": "fault_set_id_1"},
+        {"id": "8f3bb15300000001", "name": "node22", "faultSetId": "fault_set_id_3"},
+        {"id": "8f3bb15300000004", "name": "node23"}
+    ]
+
     INFO_SDC_GET_LIST = [
         {
             "id": "07335d3d00000006",
@@ -333,6 +366,16 @@ class MockInfoApi:
             "id": "1040d69e00010001"
         }
     ]
+    INFO_GET_SDT_MULTI_LIST = [
+        {"id": "8bddf18c00000001", "name": "sdt-name"},
+        {"id": "8bddf18c00000002", "name": "sdt-name-2"}
+    ]
+    INFO_GET_ALL_NVME_CONTROLLER_LIST = [
+        {"id": "cc00010001000002", "sdtId": "8bddf18c00000001", "hostId": "1040d69e00010001"},
+        {"id": "cc00010001000003", "sdtId": "8bddf18c00000001", "hostId": "1040d69e00010002"},
+        {"id": "cc00010001000004", "sdtId": "8bddf18c00000002", "hostId": "1040d69e00010001"},
+        {"id": "cc00010001000005", "hostId": "1040d69e00010003"}
+    ]
     INFO_GET_SDT_NVME_CONTROLLER_LIST = [
         {
             "isConnected": True,
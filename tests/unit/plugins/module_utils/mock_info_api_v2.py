@@ -320,6 +320,16 @@ class MockInfoApi:
             "id": "1040d69e00010001"
         }
     ]
+    INFO_GET_SDT_MULTI_LIST = [
+        {"id": "8bddf18c00000001", "name": "sdt-name"},
+        {"id": "8bddf18c00000002", "name": "sdt-name-2"}
+    ]
+    INFO_GET_ALL_NVME_CONTROLLER_LIST = [
+        {"id": "cc00010001000002", "sdtId": "8bddf18c00000001", "hostId": "1040d69e00010001"},
+        {"id": "cc00010001000003", "sdtId": "8bddf18c00000001", "hostId": "1040d69e00010002"},
+        {"id": "cc00010001000004", "sdtId": "8bddf18c00000002", "hostId": "1040d69e00010001"},
+        {"id": "cc00010001000005", "hostId": "1040d69e00010003"}
+    ]
     INFO_GET_SDT_NVME_CONTROLLER_LIST = [
         {
             "isConnected": True,
@@ -0,0 +1,65 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Mock Api response for Unit tests of the inventory plugin on Dell Technologies (Dell) PowerFlex
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class MockInventoryApi:
+    INVENTORY_OPTIONS = {
+        "hostname": "**.***.**.***",
+        "username": "admin",
+        "password": "password",
+        "validate_certs": False,
+        "port": 443,
+        "timeout": 120,
+        "entities": ['sds', 'sdc', 'mdm'],
+        "hostnames": 'name',
+        "group_prefix": 'powerflex_',
+        "strict": False,
+        "compose": {},
+        "groups": {},
+        "keyed_groups": [],
+        "cache": False
+    }
+
+    PROTECTION_DOMAINS = [
+        {"id": "pd_id_1", "name": "domain 1"}
+    ]
+
+    FAULT_SETS = [
+        {"id": "fs_id_1", "name": "fs1", "protectionDomainId": "pd_id_1"}
+    ]
+
+    SDS_LIST = [
+        {"id": "sds_id_1", "name": "node1", "protectionDomainId": "pd_id_1",
+         "faultSetId": "fs_id_1", "sdsState": "Normal", "membershipState": "Joined",
+         "ipList": [{"ip": "10.0.0.1", "role": "all"}, {"ip": "10.1.0.1", "role": "sdcOnly"}]},
+        {"id": "sds_id_2", "name": "node2", "protectionDomainId": "pd_id_1",
+         "faultSetId": None, "sdsState": "Normal", "membershipState": "Joined",
+         "ipList": [{"ip": "10.0.0.2", "role": "all"}]}
+    ]
+
+    SDC_LIST = [
+        {"id": "sdc_id_1", "name": "node1", "sdcIp": "10.0.0.1", "sdcIps": None,
+         "sdcGuid": "F8ECB844-23B8-4629-92BB-B6E49A1744CB", "sdcApproved": True,
+         "osType": "Linux", "mdmConnectionState": "Connected"},
+        {"id": "sdc_id_2", "name": None, "sdcIp": "10.0.0.9", "sdcIps": ["10.0.0.9"],
+         "sdcGuid": "F8ECB844-23B8-4629-92BB-B6E49A1744CC", "sdcApproved": True,
+         "osType": "Linux", "mdmConnectionState": "Connected"}
+    ]
+
+    MDM_CLUSTER = {
+        "master": {"id": "mdm_id_1", "name": "node1", "status": "Normal",
+                   "managementIPs": ["10.0.0.1"], "ips": ["10.0.0.1"]},
+        "slaves": [{"id": "mdm_id_2", "name": "node2", "status": "Normal",
+                    "managementIPs": ["10.0.0.2"], "ips": ["10.0.0.2"]}],
+        "tieBreakers": [{"id": "mdm_id_3", "status": "Normal",
+                         "managementIPs": [], "ips": ["10.0.0.3"]}]
+    }
@@ -0,0 +1,67 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Mock Api response for Unit tests of replication consistency group bulk module on Dell Technologies (Dell) PowerFlex
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class MockReplicationConsistencyGroupBulkApi:
+    RCG_BULK_COMMON_ARGS = {
+        "hostname": "**.***.**.***",
+        "rcg_names": None,
+        "rcg_ids": None,
+        "protection_domain_name": None,
+        "protection_domain_id": None,
+        "action": None,
+        "force": False,
+        "pause_mode": None,
+        "max_workers": 1,
+        "wait": True,
+        "wait_timeout": 600
+    }
+
+    PROTECTION_DOMAINS = [
+        {"id": "pd_id_1", "name": "pd_1"},
+        {"id": "pd_id_2", "name": "pd_2"}
+    ]
+
+    @staticmethod
+    def get_rcg(index, **state):
+        rcg = {"id": "rcg_id_%s" % index,
+               "name": "rcg_%s" % index,
+               "protectionDomainId": "pd_id_%s" % (index % 2 + 1),
+               "failoverType": "None",
+               "failoverState": "None",
+               "pauseMode": "None",
+               "freezeState": "Unfrozen",
+               "currConsistMode": "Consistent",
+               "replicationDirection": "LocalToRemote",
+               "links": []}
+        rcg.update(state)
+        return rcg
+
+    @staticmethod
+    def get_rcg_list(count, **state):
+        return [MockReplicationConsistencyGroupBulkApi.get_rcg(index, **state)
+                for index in range(count)]
+
+    @staticmethod
+    def get_rcg_responses(rcgs, polled=None):
+        """Responses of the RCG get method: the list of RCGs, and for every
+        poll of an RCG the next of its polled states, its listed state
+        once they are used"""
+        polled = dict((rcg_id, list(states)) for rcg_id, states in (polled or {}).items())
+        by_id = dict((rcg['id'], rcg) for rcg in rcgs)
+
+        def get(entity_id=None, filter_fields=None, fields=None):
+            if entity_id is None:
+                return rcgs
+            states = polled.get(entity_id)
+            return dict(by_id[entity_id], **(states.pop(0) if states else {}))
+        return get
@@ -14,7 +14,7 @@ __metaclass__ = type
 class MockReplicationPairApi:
     REPLICATION_PAIR_COMMON_ARGS = {
         "hostname": "**.***.**.***",
-        "rcg_name": None, "rcg_id": None,
+        "rcg_name": None, "rcg_id": None, "max_workers": 1,
         "pair_id": None, "pair_name": None,
         "pairs": [{"source_volume_name": None, "source_volume_id": None, "target_volume_name": None,
                    "target_volume_id": None}], "pause": None,
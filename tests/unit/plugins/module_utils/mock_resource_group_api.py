@@ -8,6 +8,8 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import copy
+
 
 class MockResourceResourceGroupAPI:
 
@@ -24,7 +26,9 @@ class MockResourceResourceGroupAPI:
         "firmware_repository_id": None,
         "resource_group_name": None,
         "resource_group_id": None,
-        "schedule_date": None
+        "schedule_date": None,
+        "wait": False,
+        "wait_timeout": 3600
     }
 
     RG_RESPONSE = [{
@@ -148,6 +152,26 @@ class MockResourceResourceGroupAPI:
         "templateName": "update-template"
     }]
 
+    @staticmethod
+    def get_large_deployment(server_count=64, parameter_count=300):
+        """Deployment of server_count nodes, each with parameter_count server parameters"""
+        deployment = copy.deepcopy(MockResourceResourceGroupAPI.RG_RESPONSE[0])
+        component = deployment["serviceTemplate"]["components"][0]
+        components = []
+        for server in range(server_count):
+            parameters = [{"id": "razor_image", "guid": None, "value": "razor-image"}]
+            parameters.extend({"id": "param-%s" % index, "guid": "guid-%s-%s" % (server, index),
+                               "value": "value-%s-%s" % (server, index),
+                               "options": [{"name": "option-%s" % option, "value": option}
+                                           for option in range(5)]}
+                              for index in range(parameter_count))
+            components.append(dict(
+                copy.deepcopy(component), id="component-%s" % server, name="node-%s" % server,
+                resources=[{"id": "asm::server", "parameters": parameters},
+                           {"id": "asm::idrac", "parameters": copy.deepcopy(parameters)}]))
+        deployment["serviceTemplate"]["components"] = components
+        return deployment
+
     @staticmethod
     def resource_group_error(response_type):
         return {
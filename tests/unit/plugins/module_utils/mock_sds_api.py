@@ -28,6 +28,9 @@ class MockSDSApi:
         "fault_set_name": None,
         "fault_set_id": None,
         "fault_set_new_name": None,
+        "max_workers": 1,
+        "wait": False,
+        "wait_timeout": 3600,
         "state": None
     }
 
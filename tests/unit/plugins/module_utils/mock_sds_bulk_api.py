@@ -0,0 +1,82 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Mock Api response for Unit tests of SDS bulk module on Dell Technologies (Dell) PowerFlex
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class MockSDSBulkApi:
+    SDS_BULK_COMMON_ARGS = {
+        "hostname": "**.***.**.***",
+        "sds": [],
+        "max_workers": 1
+    }
+
+    SDS_SPEC = {
+        "sds_name": None,
+        "protection_domain_name": None,
+        "protection_domain_id": None,
+        "fault_set_name": None,
+        "fault_set_id": None,
+        "sds_ip_list": None,
+        "sds_ip_state": "present-in-sds",
+        "rfcache_enabled": None,
+        "rmcache_enabled": None,
+        "rmcache_size": None,
+        "performance_profile": None,
+        "state": "present"
+    }
+
+    PROTECTION_DOMAINS = [
+        {"id": "pd_id_1", "name": "pd_1"},
+        {"id": "pd_id_2", "name": "pd_2"}
+    ]
+
+    FAULT_SETS = [
+        {"id": "fs_id_1", "name": "fs_1", "protectionDomainId": "pd_id_1"},
+        {"id": "fs_id_2", "name": "fs_1", "protectionDomainId": "pd_id_2"}
+    ]
+
+    SDS_LIST = [
+        {"id": "sds_id_1", "name": "node_1", "protectionDomainId": "pd_id_1",
+         "faultSetId": "fs_id_1",
+         "ipList": [{"ip": "10.0.0.1", "role": "all"}],
+         "rfcacheEnabled": True, "rmcacheEnabled": False,
+         "rmcacheSizeInKb": 131072, "perfProfile": "HighPerformance"},
+        {"id": "sds_id_2", "name": "node_2", "protectionDomainId": "pd_id_1",
+         "faultSetId": None,
+         "ipList": [{"ip": "10.0.0.2", "role": "all"},
+                    {"ip": "10.0.1.2", "role": "sdcOnly"}],
+         "rfcacheEnabled": True, "rmcacheEnabled": False,
+         "rmcacheSizeInKb": 131072, "perfProfile": "HighPerformance"},
+        {"id": "sds_id_3", "name": "node_3", "protectionDomainId": "pd_id_1",
+         "faultSetId": None, "ipList": [],
+         "rfcacheEnabled": True, "rmcacheEnabled": False,
+         "rmcacheSizeInKb": 131072, "perfProfile": "HighPerformance"}
+    ]
+
+    @staticmethod
+    def create_sds(**kwargs):
+        return {"id": kwargs['name'] + "_id"}
+
+    @staticmethod
+    def get_failed_msgs(response_type):
+        error_msg = {
+            'duplicate': "SDS node_1 is listed more than once in sds",
+            'get_sds': "Failed to get the list of SDSs with error",
+            'create_params': "Protection domain name/id and the IPs to add"
+                             " are mandatory for creating the SDS node_1.",
+            'move': "SDS node_1 belongs to the protection domain pd_id_1, it"
+                    " can not be moved.",
+            'fault_set': "The specified Fault set is not in the specified"
+                         " Protection Domain.",
+            'rmcache_size': "Failed to update RM cache size for the SDS"
+                            " 'node_1' as RM cache is disabled previously"
+        }
+        return error_msg.get(response_type)
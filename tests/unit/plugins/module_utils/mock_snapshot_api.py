@@ -0,0 +1,73 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Mock Api response for Unit tests of snapshot module on Dell Technologies (Dell) PowerFlex
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class MockSnapshotApi:
+    SNAPSHOT_COMMON_ARGS = {
+        "hostname": "**.***.**.***",
+        "snapshot_name": None,
+        "snapshot_id": None,
+        "vol_name": None,
+        "vol_id": None,
+        "read_only": None,
+        "size": None,
+        "cap_unit": None,
+        "snapshot_new_name": None,
+        "allow_multiple_mappings": None,
+        "sdc": None,
+        "desired_retention": None,
+        "retention_unit": None,
+        "remove_mode": None,
+        "sdc_state": None,
+        "volumes": None,
+        "vol_name_pattern": None,
+        "consistent": True,
+        "max_workers": 1,
+        "state": "present"
+    }
+
+    SYSTEMS = [{"id": "system_id_1"}]
+
+    STORAGE_POOLS = [{"id": "sp_id_1", "name": "pool_1"}]
+
+    @staticmethod
+    def get_volume(name, vol_id, ancestor_id=None):
+        return {
+            "id": vol_id,
+            "name": name,
+            "sizeInKb": 16 * 1024 * 1024,
+            "storagePoolId": "sp_id_1",
+            "volumeType": "Snapshot" if ancestor_id else "ThinProvisioned",
+            "ancestorVolumeId": ancestor_id,
+            "creationTime": 1700000000,
+            "secureSnapshotExpTime": 0
+        }
+
+    @staticmethod
+    def get_volume_entry(vol_name=None, vol_id=None, snapshot_name=None):
+        return {"vol_name": vol_name, "vol_id": vol_id,
+                "snapshot_name": snapshot_name}
+
+    @staticmethod
+    def get_failed_msgs(response_type):
+        error_msg = {
+            'not_found': "Unable to find the volume vol_x.",
+            'conflict': "A volume named vol_1_snap already exists and is not"
+                        " a snapshot of volume vol_1.",
+            'duplicate': "Snapshot name snap_1 is used for more than one"
+                         " volume.",
+            'invalid_pattern': "Invalid vol_name_pattern",
+            'state_absent': "volumes and vol_name_pattern are only supported"
+                            " with state present",
+            'create': "Create snapshots vol_2_snap operation failed with error"
+        }
+        return error_msg.get(response_type)
@@ -30,6 +30,8 @@ class MockStoragePoolV2Api:
             "critical_threshold": 50
         },
         "over_provisioning_factor": 100,
+        "wait": False,
+        "wait_timeout": 3600,
         "state": None
     }
 
@@ -30,8 +30,10 @@ class MockVolumeApi:
         "size": None,
         "cap_unit": None,
         "vol_new_name": None,
+        "allow_multiple_mappings": None,
         "sdc": {},
         "sdc_state": None,
+        "max_workers": 1,
         "delete_snapshots": None,
         "state": None
     }
@@ -552,6 +554,11 @@ class MockVolumeApi:
 
     SDC_RESPONSE_EMPTY = []
 
+    @staticmethod
+    def get_sdc_list(count):
+        return [{"id": "sdc_id_%s" % index, "name": "sdc_%s" % index,
+                 "sdcIp": "10.0.0.%s" % index} for index in range(count)]
+
     GET_STORAGE_POOL = {
         'dataLayout': 'MediumGranularity'
     }
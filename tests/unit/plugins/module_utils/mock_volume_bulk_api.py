@@ -0,0 +1,91 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Mock Api response for Unit tests of volume bulk module on Dell Technologies (Dell) PowerFlex
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+
+class MockVolumeBulkApi:
+    VOLUME_BULK_COMMON_ARGS = {
+        "hostname": "**.***.**.***",
+        "volumes": [],
+        "allow_multiple_mappings": None,
+        "delete_snapshots": None,
+        "max_workers": 1
+    }
+
+    VOLUME_SPEC = {
+        "vol_name": None,
+        "vol_new_name": None,
+        "storage_pool_name": None,
+        "storage_pool_id": None,
+        "protection_domain_name": None,
+        "protection_domain_id": None,
+        "size": None,
+        "cap_unit": None,
+        "vol_type": None,
+        "compression_type": None,
+        "use_rmcache": None,
+        "snapshot_policy_name": None,
+        "snapshot_policy_id": None,
+        "sdc": None,
+        "state": "present"
+    }
+
+    PROTECTION_DOMAINS = [
+        {"id": "pd_id_1", "name": "pd_1"},
+        {"id": "pd_id_2", "name": "pd_2"}
+    ]
+
+    STORAGE_POOLS = [
+        {"id": "sp_id_1", "name": "pool_1", "protectionDomainId": "pd_id_1",
+         "dataLayout": "FineGranularity"},
+        {"id": "sp_id_2", "name": "pool_1", "protectionDomainId": "pd_id_2",
+         "dataLayout": "MediumGranularity"}
+    ]
+
+    SNAPSHOT_POLICIES = [
+        {"id": "snap_pol_id_1", "name": "snap_pol_1"}
+    ]
+
+    SDCS = [
+        {"id": "sdc_id_1", "name": "sdc_1", "sdcIp": "10.0.0.1"},
+        {"id": "sdc_id_2", "name": "sdc_2", "sdcIp": "10.0.0.2"}
+    ]
+
+    VOLUMES = [
+        {"id": "vol_id_1", "name": "vol_1", "sizeInKb": 16 * 1024 * 1024,
+         "storagePoolId": "sp_id_1", "useRmcache": False,
+         "compressionMethod": "Invalid", "snplIdOfSourceVolume": None,
+         "volumeType": "ThinProvisioned",
+         "mappedSdcInfo": [{"sdcId": "sdc_id_1", "accessMode": "ReadWrite"}]},
+        {"id": "vol_id_2", "name": "vol_2_renamed", "sizeInKb": 16 * 1024 * 1024,
+         "storagePoolId": "sp_id_1", "useRmcache": False,
+         "compressionMethod": "Invalid", "snplIdOfSourceVolume": None,
+         "volumeType": "ThinProvisioned", "mappedSdcInfo": []},
+        {"id": "vol_id_3", "name": "other", "sizeInKb": 16 * 1024 * 1024,
+         "storagePoolId": "sp_id_1", "useRmcache": False,
+         "compressionMethod": "Invalid", "snplIdOfSourceVolume": None,
+         "volumeType": "ThinProvisioned", "mappedSdcInfo": []}
+    ]
+
+    @staticmethod
+    def create_volume(**kwargs):
+        return {"id": kwargs['name'] + "_id"}
+
+    @staticmethod
+    def get_failed_msgs(response_type):
+        error_msg = {
+            'pool_not_found': "Unable to find the storage pool with pool_x",
+            'duplicate': "Volume vol_1 is listed more than once in volumes",
+            'shrink': "Reducing the size of volume vol_1 from 16 GB to 8 GB"
+                      " is not supported",
+            'get_volumes': "Failed to get the list of volumes with error"
+        }
+        return error_msg.get(response_type)
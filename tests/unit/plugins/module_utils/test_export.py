@@ -0,0 +1,75 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex columnar export"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import csv
+import os
+import pytest
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.export \
+    import ColumnarExport, ColumnarTable, flatten_entity
+
+VOLUMES = [
+    {'id': 'vol_1', 'name': 'vol_1', 'sizeInKb': 8388608, 'mappedSdcInfo': [{'sdcId': 'sdc_1'}],
+     'statistics': [{'name': 'host_read_iops', 'stat_values': [1.5]}],
+     'links': {'self': '/api/instances/Volume::vol_1'}},
+    {'id': 'vol_2', 'name': 'vol_2', 'sizeInKb': 16777216, 'useRmcache': True,
+     'statistics': {'host_read_iops': 2}}
+]
+
+
+def test_flatten_entity():
+    assert flatten_entity(VOLUMES[0]) == {
+        'id': 'vol_1', 'name': 'vol_1', 'sizeInKb': 8388608,
+        'mappedSdcInfo': '[{"sdcId": "sdc_1"}]',
+        'statistics.host_read_iops.stat_values': '[1.5]',
+        'links.self': '/api/instances/Volume::vol_1'}
+
+
+def test_columnar_table_types():
+    table = ColumnarTable()
+    for volume in VOLUMES:
+        table.append(volume)
+    table.append({'id': 'vol_3', 'sizeInKb': 1.5, 'useRmcache': 'yes'})
+    columns = dict((column, (column_type, values))
+                   for column, column_type, values in table.get_typed_columns())
+    assert table.num_rows == 3
+    assert columns['sizeInKb'] == (float, [8388608.0, 16777216.0, 1.5])
+    assert columns['useRmcache'] == (str, [None, 'true', 'yes'])
+    assert columns['statistics.host_read_iops'] == (int, [None, 2, None])
+
+
+def test_columnar_export_csv(tmp_path):
+    output_dir = str(tmp_path / 'capacity')
+    with ColumnarExport(output_dir, 'csv') as export:
+        export.write('vol', VOLUMES[:1])
+        export.write('vol', VOLUMES[1:])
+        export.write('device', [])
+    assert export.counts == {'vol': 2, 'device': 0}
+    assert sorted(os.listdir(output_dir)) == ['device.csv', 'vol.csv']
+    with open(export.files['vol']) as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert [row['id'] for row in rows] == ['vol_1', 'vol_2']
+    assert [row['useRmcache'] for row in rows] == ['', 'true']
+
+
+def test_columnar_export_failure(tmp_path):
+    output_dir = str(tmp_path / 'capacity')
+    with pytest.raises(ValueError):
+        with ColumnarExport(output_dir, 'csv') as export:
+            export.write('vol', VOLUMES)
+            raise ValueError('listing failed')
+    assert os.listdir(output_dir) == []
+
+
+def test_columnar_export_parquet(tmp_path):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    with ColumnarExport(str(tmp_path), 'parquet') as export:
+        export.write('vol', VOLUMES)
+    table = parquet.read_table(export.files['vol'])
+    assert table.column('sizeInKb').to_pylist() == [8388608, 16777216]
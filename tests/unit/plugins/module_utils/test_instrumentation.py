@@ -0,0 +1,103 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex request instrumentation"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from mock.mock import MagicMock
+from PyPowerFlex import PowerFlexClient, base_client
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.instrumentation \
+    import get_endpoint, instrument_module
+
+
+class StubResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.content = json.dumps(data).encode()
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+def stub_get(url, auth=None, **kwargs):
+    if url.endswith('/api/login'):
+        return StubResponse(200, 'token')
+    return StubResponse(200, '3.6')
+
+
+def stub_request(method, url, auth=None, **kwargs):
+    if url.endswith('/version'):
+        return StubResponse(200, '3.6')
+    if url.endswith('/types/StoragePool/instances'):
+        return StubResponse(200, [{'id': 'sp_id_1', 'name': 'pool_1'}])
+    return StubResponse(200, {})
+
+
+class TestInstrumentation:
+
+    @pytest.fixture
+    def module(self, mocker):
+        mocker.patch('requests.get', side_effect=stub_get)
+        mocker.patch('requests.request', side_effect=stub_request)
+        mocker.patch.object(base_client, 'requests', base_client.requests)
+        module = MagicMock()
+        module._name = 'dellemc.powerflex.storagepool'
+        module.params = {'timings': True, 'trace_file': None}
+        return module
+
+    def run_module(self, module):
+        module.exit_json = exit_json = MagicMock()
+        assert instrument_module(module) is not None
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        conn.storage_pool.get()
+        conn.storage_pool.rename('sp_id_1', 'pool_2')
+        module.exit_json(changed=True)
+        return exit_json.call_args[1]
+
+    def test_get_endpoint(self):
+        assert get_endpoint('https://gateway:443/api/instances/StoragePool::sp_id_1/action/setStoragePoolName') \
+            == '/api/instances/StoragePool::{id}/action/setStoragePoolName'
+        assert get_endpoint('https://gateway/rest/v1/volumes/4a54a8ba6df0690f') == '/rest/v1/volumes/{id}'
+
+    def test_timings_summary(self, module):
+        result = self.run_module(module)
+        timings = result['_timings']
+        assert result['changed'] is True
+        assert timings['phases']['read']['requests'] == 1
+        assert timings['phases']['write']['requests'] == 1
+        assert timings['phases']['login']['requests'] == timings['requests'] - 2
+        endpoints = dict(((item['method'], item['endpoint']), item) for item in timings['endpoints'])
+        assert endpoints[('GET', '/api/types/StoragePool/instances')]['bytes'] == \
+            len(json.dumps([{'id': 'sp_id_1', 'name': 'pool_1'}]))
+        assert endpoints[('POST', '/api/instances/StoragePool::{id}/action/setStoragePoolName')]['requests'] == 1
+
+    def test_trace_file(self, module, tmp_path):
+        trace_file = tmp_path / 'trace.jsonl'
+        module.params = {'timings': False, 'trace_file': str(trace_file)}
+        result = self.run_module(module)
+        self.run_module(module)
+        assert '_timings' not in result
+        lines = trace_file.read_text().splitlines()
+        assert len(lines) == 2
+        spans = json.loads(lines[0])['resourceSpans'][0]['scopeSpans'][0]['spans']
+        root = spans[0]
+        assert root['name'] == 'dellemc.powerflex.storagepool'
+        assert all(span['parentSpanId'] == root['spanId'] and span['traceId'] == root['traceId']
+                   for span in spans[1:])
+        assert 'GET /api/types/StoragePool/instances' in [span['name'] for span in spans]
+
+    def test_not_requested(self, module):
+        module.params = {}
+        assert instrument_module(module) is None
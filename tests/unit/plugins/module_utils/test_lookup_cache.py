@@ -0,0 +1,156 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex lookup cache"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from PyPowerFlex import PowerFlexClient
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import get_lookup_cache, memoize_lookups, uncached_get
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.object_cache \
+    import PowerFlexObjectCache
+
+
+class StubResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.content = b'{}'
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+class StubGateway:
+
+    '''Minimal PowerFlex 3.x gateway counting storage pool requests'''
+
+    POOLS = [
+        {'id': 'sp_id_1', 'name': 'pool_1', 'protectionDomainId': 'pd_id_1'},
+        {'id': 'sp_id_2', 'name': 'pool_2', 'protectionDomainId': 'pd_id_1'},
+        {'id': 'sp_id_3', 'name': 'pool_1', 'protectionDomainId': 'pd_id_2'}
+    ]
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, auth=None, **kwargs):
+        if url.endswith('/api/login'):
+            return StubResponse(200, 'token')
+        if url.endswith('/api/version'):
+            return StubResponse(200, '3.6')
+        return StubResponse(200, None)
+
+    def request(self, method, url, auth=None, **kwargs):
+        if url.endswith('/version'):
+            return StubResponse(200, '3.6')
+        self.requests.append((method, url.split('/api', 1)[1]))
+        if url.endswith('/types/StoragePool/instances'):
+            return StubResponse(200, self.POOLS)
+        if '/instances/StoragePool::' in url and method == 'get':
+            return StubResponse(200, self.POOLS[0])
+        return StubResponse(200, {})
+
+
+class TestLookupCache:
+
+    @pytest.fixture
+    def gateway(self, mocker):
+        stub = StubGateway()
+        mocker.patch('PyPowerFlex.base_client.requests.get', side_effect=stub.get)
+        mocker.patch('PyPowerFlex.base_client.requests.request', side_effect=stub.request)
+        return stub
+
+    @pytest.fixture
+    def conn(self, gateway):
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        memoize_lookups(conn)
+        del gateway.requests[:]
+        return conn
+
+    def test_lookups_served_from_one_list(self, gateway, conn):
+        assert [pool['id'] for pool in conn.storage_pool.get(
+            filter_fields={'name': 'pool_1'})] == ['sp_id_1', 'sp_id_3']
+        assert conn.storage_pool.get(
+            filter_fields={'name': 'pool_1', 'protectionDomainId': 'pd_id_2'}
+        )[0]['id'] == 'sp_id_3'
+        assert conn.storage_pool.get(filter_fields={'id': 'sp_id_2'})[0]['name'] == 'pool_2'
+        assert conn.storage_pool.get(entity_id='sp_id_1')['name'] == 'pool_1'
+        assert len(conn.storage_pool.get()) == 3
+        assert gateway.requests == [('get', '/types/StoragePool/instances')]
+
+    def test_lookup_by_id_before_list(self, gateway, conn):
+        conn.storage_pool.get(entity_id='sp_id_1')
+        conn.storage_pool.get(entity_id='sp_id_1')
+        assert gateway.requests == [('get', '/instances/StoragePool::sp_id_1')]
+
+    def test_results_are_copies(self, gateway, conn):
+        conn.storage_pool.get(filter_fields={'id': 'sp_id_1'})[0]['name'] = 'changed'
+        assert conn.storage_pool.get(filter_fields={'id': 'sp_id_1'})[0]['name'] == 'pool_1'
+
+    def test_write_invalidates_type(self, gateway, conn):
+        conn.storage_pool.get(filter_fields={'name': 'pool_1'})
+        conn.storage_pool.rename('sp_id_1', 'pool_renamed')
+        conn.storage_pool.get(filter_fields={'name': 'pool_1'})
+        assert gateway.requests[1][0] == 'post'
+        assert gateway.requests.count(('get', '/types/StoragePool/instances')) == 2
+
+    def test_uncached_types(self, gateway, conn):
+        conn.volume.get(filter_fields={'name': 'vol_1'})
+        conn.volume.get(filter_fields={'name': 'vol_1'})
+        assert len(gateway.requests) == 2
+
+    def test_get_uncached(self, gateway, conn):
+        conn.storage_pool.get(filter_fields={'id': 'sp_id_1'})
+        assert uncached_get(conn.storage_pool)(filter_fields={'id': 'sp_id_1'})[0]['name'] == 'pool_1'
+        conn.storage_pool.get(filter_fields={'id': 'sp_id_1'})
+        assert gateway.requests == [('get', '/types/StoragePool/instances')] * 2
+
+    def test_other_clients_untouched(self):
+        assert memoize_lookups(object()) is None
+
+    def test_lookup_cache_opt_in(self, gateway):
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        get_func = conn.storage_pool.get
+        assert get_lookup_cache(conn, {'lookup_cache': False, 'object_cache': False}) is None
+        assert conn.storage_pool.get == get_func
+        assert get_lookup_cache(conn, {'lookup_cache': True, 'object_cache': False}) is not None
+        assert conn.storage_pool._uncached_get == get_func
+
+    def get_cached_conn(self, gateway, cache_dir):
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        memoize_lookups(conn, PowerFlexObjectCache('gateway', 443, 'admin', cache_dir=cache_dir))
+        del gateway.requests[:]
+        return conn
+
+    def test_lists_shared_by_runs(self, gateway, tmp_path):
+        cache_dir = str(tmp_path)
+        self.get_cached_conn(gateway, cache_dir).storage_pool.get(
+            filter_fields={'name': 'pool_1'})
+        assert gateway.requests == [('get', '/types/StoragePool/instances')]
+        conn = self.get_cached_conn(gateway, cache_dir)
+        assert conn.storage_pool.get(entity_id='sp_id_2')['name'] == 'pool_2'
+        assert len(conn.storage_pool.get(filter_fields={'name': 'pool_1'})) == 2
+        assert gateway.requests == []
+
+    def test_write_invalidates_shared_lists(self, gateway, tmp_path):
+        cache_dir = str(tmp_path)
+        self.get_cached_conn(gateway, cache_dir).storage_pool.get()
+        self.get_cached_conn(gateway, cache_dir).storage_pool.rename('sp_id_1', 'pool_renamed')
+        conn = self.get_cached_conn(gateway, cache_dir)
+        conn.storage_pool.get()
+        assert gateway.requests == [('get', '/types/StoragePool/instances')]
@@ -0,0 +1,64 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex object cache"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.object_cache \
+    import PowerFlexObjectCache, get_object_cache
+
+POOLS = [{'id': 'sp_id_1', 'name': 'pool_1'}]
+
+
+def get_cache(tmp_path, hostname='gateway', **kwargs):
+    return PowerFlexObjectCache(hostname, 443, 'admin', cache_dir=str(tmp_path), **kwargs)
+
+
+def test_get_and_expire(tmp_path):
+    cache = get_cache(tmp_path)
+    assert cache.get('storage_pool') is None
+    cache.set('storage_pool', POOLS)
+    assert cache.get('storage_pool') == POOLS
+    assert get_cache(tmp_path, hostname='other').get('storage_pool') is None
+    assert get_cache(tmp_path, ttl=0).get('storage_pool') is None
+    assert cache.get('storage_pool') == POOLS
+
+
+def test_least_recently_used_evicted(tmp_path):
+    cache = get_cache(tmp_path, max_entries=2)
+    cache.set('storage_pool', POOLS)
+    cache.set('fault_set', [])
+    os.utime(cache._get_path('storage_pool'), (0, 0))
+    os.utime(cache._get_path('fault_set'), (1, 1))
+    assert cache.get('storage_pool') == POOLS
+    cache.set('sdc', [])
+    assert cache.get('fault_set') is None
+    assert cache.get('storage_pool') == POOLS
+    assert cache.get('sdc') == []
+
+
+def test_invalidate(tmp_path):
+    cache = get_cache(tmp_path)
+    other = get_cache(tmp_path, hostname='other')
+    for entity in ('storage_pool', 'fault_set'):
+        cache.set(entity, [])
+        other.set(entity, [])
+    cache.invalidate('fault_set')
+    assert cache.get('fault_set') is None and cache.get('storage_pool') == []
+    cache.invalidate()
+    assert cache.get('storage_pool') is None
+    assert other.get('storage_pool') == [] and other.get('fault_set') == []
+
+
+def test_get_object_cache():
+    params = {'hostname': 'gateway', 'port': 443, 'username': 'admin',
+              'object_cache': True, 'object_cache_ttl': 60,
+              'object_cache_max_entries': 8, 'object_cache_dir': '/tmp/objects'}
+    cache = get_object_cache(params)
+    assert (cache.ttl, cache.max_entries, cache.cache_dir) == (60, 8, '/tmp/objects')
+    assert get_object_cache(dict(params, object_cache=False)) is None
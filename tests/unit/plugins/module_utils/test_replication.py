@@ -0,0 +1,55 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the replication pair enrichment"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.replication \
+    import enrich_replication_pairs, get_name_map
+
+
+def get_pairs():
+    return [{'id': 'pair_id_%s' % index, 'localVolumeId': 'vol_id_%s' % index,
+             'replicationConsistencyGroupId': 'rcg_id_%s' % (index % 2), 'links': []}
+            for index in range(4)]
+
+
+def get_conn():
+    conn = MagicMock()
+    conn.volume.get = MagicMock(return_value=[
+        {'id': 'vol_id_%s' % index, 'name': 'vol_%s' % index} for index in range(3)])
+    conn.replication_consistency_group.get = MagicMock(return_value=[
+        {'id': 'rcg_id_0', 'name': 'rcg_0'}, {'id': 'rcg_id_1', 'name': 'rcg_1'}])
+    return conn
+
+
+class TestReplication:
+
+    def test_get_name_map(self):
+        conn = get_conn()
+        assert get_name_map(conn.volume, ['vol_id_1', 'vol_id_7']) == {'vol_id_1': 'vol_1'}
+        assert get_name_map(conn.volume, []) == {}
+        assert conn.volume.get.call_count == 1
+
+    def test_enrich_replication_pairs(self):
+        conn = get_conn()
+        pairs = enrich_replication_pairs(conn, get_pairs())
+        assert conn.volume.get.call_count == 1
+        assert conn.replication_consistency_group.get.call_count == 1
+        assert [pair.get('localVolumeName') for pair in pairs] == ['vol_0', 'vol_1', 'vol_2', None]
+        assert [pair['replicationConsistencyGroupName'] for pair in pairs] == ['rcg_0', 'rcg_1'] * 2
+        assert all('links' not in pair for pair in pairs)
+
+    def test_enrich_replication_pairs_of_rcg(self):
+        conn = get_conn()
+        pairs = enrich_replication_pairs(conn, get_pairs(), volume_names=False,
+                                         rcg={'id': 'rcg_id_0', 'name': 'rcg_0'})
+        conn.volume.get.assert_not_called()
+        conn.replication_consistency_group.get.assert_not_called()
+        assert set(pair['replicationConsistencyGroupName'] for pair in pairs) == {'rcg_0'}
+        assert all('localVolumeName' not in pair for pair in pairs)
@@ -0,0 +1,168 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex session cache"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from mock.mock import MagicMock
+from PyPowerFlex import PowerFlexClient
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
+    import session_cache
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.session_cache \
+    import PowerFlexSessionCache, PowerFlexSessionClient, release_session, share_session
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.concurrency \
+    import run_tasks
+
+
+class StubResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self.data = data
+        self.content = b'' if data is None else b'{}'
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+
+class StubGateway:
+
+    '''Minimal PowerFlex 3.x gateway counting logins'''
+
+    def __init__(self):
+        self.logins = 0
+        self.logouts = 0
+        self.token = None
+        self.reject_next = False
+
+    def get(self, url, auth=None, **kwargs):
+        if url.endswith('/api/login'):
+            self.logins += 1
+            self.token = 'token-%s' % self.logins
+            return StubResponse(200, self.token)
+        if url.endswith('/api/logout'):
+            self.logouts += 1
+            return StubResponse(200, None)
+        if url.endswith('/api/version'):
+            return StubResponse(200, '3.6')
+        return StubResponse(404, None)
+
+    def request(self, method, url, auth=None, **kwargs):
+        if self.reject_next or auth[1] != self.token:
+            self.reject_next = False
+            return StubResponse(401, {'message': 'Unauthorized'})
+        if url.endswith('/version'):
+            return StubResponse(200, '3.6')
+        return StubResponse(200, [{'id': 'system_id'}])
+
+
+class TestPowerFlexSessionCache:
+
+    @pytest.fixture
+    def gateway(self, mocker):
+        stub = StubGateway()
+        mocker.patch('PyPowerFlex.base_client.requests.get', side_effect=stub.get)
+        mocker.patch('PyPowerFlex.base_client.requests.request', side_effect=stub.request)
+        return stub
+
+    def run_task(self, cache_dir, ttl=240):
+        cache = PowerFlexSessionCache('gateway', 443, 'admin', 'password',
+                                      ttl=ttl, cache_dir=cache_dir)
+        conn = PowerFlexSessionClient(
+            cache, gateway_address='gateway', gateway_port=443,
+            username='admin', password='password')
+        conn.initialize()
+        conn.system.get()
+        conn.system.get()
+        return conn
+
+    def test_uncached_task_logs_in_per_request(self, gateway):
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        conn.system.get()
+        conn.system.get()
+        assert gateway.logins >= 3
+
+    def test_one_login_per_ttl_window(self, gateway, tmp_path):
+        for dummy in range(5):
+            self.run_task(str(tmp_path))
+        assert gateway.logins == 1
+
+    def test_login_after_ttl_expiry(self, gateway, tmp_path, mocker):
+        self.run_task(str(tmp_path))
+        now = session_cache.time.time()
+        mocker.patch.object(session_cache.time, 'time', return_value=now + 300)
+        self.run_task(str(tmp_path))
+        assert gateway.logins == 2
+
+    def test_relogin_on_unauthorized(self, gateway, tmp_path):
+        conn = self.run_task(str(tmp_path))
+        gateway.reject_next = True
+        conn.system.get()
+        assert gateway.logins == 2
+
+    def test_password_change_invalidates_entry(self, gateway, tmp_path):
+        self.run_task(str(tmp_path))
+        cache = PowerFlexSessionCache('gateway', 443, 'admin', 'other',
+                                      cache_dir=str(tmp_path))
+        assert not cache._is_valid(cache._read())
+
+    def test_cache_file_permissions(self, gateway, tmp_path):
+        cache_dir = os.path.join(str(tmp_path), 'sessions')
+        conn = self.run_task(cache_dir)
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(conn.session_cache.path).st_mode) == 0o600
+
+    def test_shared_session_for_concurrent_requests(self, gateway, tmp_path):
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        logins = gateway.logins
+        share_session(conn)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda dummy: conn.system.get(), range(8)))
+        assert results == [[{'id': 'system_id'}]] * 8
+        assert gateway.logins == logins + 1
+        assert not os.listdir(str(tmp_path))
+
+    def get_client(self):
+        conn = PowerFlexClient(gateway_address='gateway', gateway_port=443,
+                               username='admin', password='password')
+        conn.initialize()
+        return conn
+
+    def test_release_shared_session(self, gateway):
+        conn = self.get_client()
+        logins, logouts = gateway.logins, gateway.logouts
+        share_session(conn)
+        share_session(conn)
+        conn.system.get()
+        release_session(conn)
+        conn.system.get()
+        assert (gateway.logins, gateway.logouts) == (logins + 1, logouts)
+        release_session(conn)
+        assert gateway.logouts == logouts + 1
+        assert not hasattr(conn.system, '_session_cache')
+        conn.system.get()
+        assert gateway.logins > logins + 1
+        assert gateway.logouts == logouts + 2
+
+    def test_run_tasks_logs_out_shared_session(self, gateway):
+        conn = self.get_client()
+        logins, logouts = gateway.logins, gateway.logouts
+        results = run_tasks(MagicMock(), conn, lambda dummy: conn.system.get(), range(8), max_workers=4)
+        assert [task.result for task in results] == [[{'id': 'system_id'}]] * 8
+        assert (gateway.logins, gateway.logouts) == (logins + 1, logouts + 1)
+        assert not hasattr(conn.system, '_session_cache')
@@ -0,0 +1,63 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex statistics query"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.statistics \
+    import query_statistics
+
+TIMESTAMPS = ["2025-09-08T06:40:00Z", "2025-09-08T06:44:00Z",
+              "2025-09-08T06:45:00Z"]
+
+
+def get_response(resource_type, ids, metrics):
+    return {
+        "timestamps": TIMESTAMPS,
+        "resources": [
+            {"id": obj_id,
+             "metrics": [{"name": "host_read_iops", "values": [1, 2, 3]},
+                         {"name": "host_write_iops", "values": [4, None, 6]}]}
+            for obj_id in ids if obj_id != "id_3"
+        ]
+    }
+
+
+def test_query_statistics_chunks():
+    query_metrics = MagicMock(side_effect=get_response)
+    ids = ["id_%s" % index for index in range(5)]
+    table = query_statistics(query_metrics, 'volume', ids, ['host_read_iops'],
+                             chunk_size=2)
+    assert [call[0][1] for call in query_metrics.call_args_list] == \
+        [["id_0", "id_1"], ["id_2", "id_3"], ["id_4"]]
+    query_metrics.assert_called_with('volume', ["id_4"], ['host_read_iops'])
+    result = table.to_dict()
+    assert result['ids'] == ids
+    assert result['timestamps'] == TIMESTAMPS
+    assert list(result['metrics']) == ['host_read_iops']
+    assert result['metrics']['host_read_iops'][3] is None
+    assert result['metrics']['host_read_iops'][4] == [1, 2, 3]
+
+
+def test_query_statistics_window_aggregation():
+    query_metrics = MagicMock(side_effect=get_response)
+    table = query_statistics(query_metrics, 'volume', ["id_1", "id_3"],
+                             window=120, aggregation='avg')
+    query_metrics.assert_called_once_with('volume', ["id_1", "id_3"], [])
+    result = table.to_dict()
+    assert result['timestamps'] == TIMESTAMPS[1:]
+    assert result['metrics'] == {'host_read_iops': [2.5, None],
+                                 'host_write_iops': [6, None]}
+
+
+def test_query_statistics_no_ids():
+    query_metrics = MagicMock(side_effect=get_response)
+    table = query_statistics(query_metrics, 'volume', [], ['host_read_iops'],
+                             aggregation='last')
+    query_metrics.assert_not_called()
+    assert table.to_dict()['metrics'] == {'host_read_iops': []}
@@ -0,0 +1,116 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for the PowerFlex wait engine"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries import wait
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.wait \
+    import WaitTimeout, get_removal_progress, is_removed, wait_for, wait_for_completion
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def get_module(wait_timeout=60, **params):
+    module = MagicMock()
+    module.params = dict(wait=True, wait_timeout=wait_timeout, **params)
+    module.check_mode = False
+    return module
+
+
+class TestWait:
+
+    def test_backoff_reset_on_change(self):
+        clock = FakeClock()
+        states = iter(['a', 'a', 'a', 'b', 'b', 'b', 'b', 'b', 'b', 'done'])
+        polled = []
+        state = wait_for(lambda: next(states), lambda state: state == 'done', 600,
+                         interval=2, max_interval=10, on_state=polled.append,
+                         jitter=0, sleep=clock.sleep, clock=clock)
+        assert state == 'done'
+        assert len(polled) == 10
+        assert clock.sleeps == [2, 4, 8, 2, 4, 8, 10, 10, 10]
+
+    def test_timeout(self):
+        clock = FakeClock()
+        with pytest.raises(WaitTimeout) as error:
+            wait_for(lambda: 'running', lambda state: False, 15, interval=2,
+                     max_interval=30, jitter=0, sleep=clock.sleep, clock=clock)
+        assert error.value.state == 'running'
+        assert clock.sleeps == [2, 4, 8, 1]
+        assert 'Timed out after 15 seconds and 5 polls' in error.value.msg
+
+    def test_done_without_sleeping(self):
+        clock = FakeClock()
+        assert wait_for(lambda: 'done', lambda state: state == 'done', 0,
+                        sleep=clock.sleep, clock=clock) == 'done'
+        assert clock.sleeps == []
+
+    def test_jitter(self):
+        clock = FakeClock()
+        states = iter(['a'] * 20 + ['done'])
+        wait_for(lambda: next(states), lambda state: state == 'done', 600,
+                 interval=2, max_interval=10, jitter=0.5,
+                 sleep=clock.sleep, clock=clock)
+        assert 1 <= clock.sleeps[0] <= 3
+        assert all(5 <= delay <= 15 for delay in clock.sleeps[3:])
+        assert len(set(clock.sleeps[3:])) > 1
+
+    def test_wait_for_completion(self, mocker):
+        mocker.patch.object(wait.time, 'sleep')
+        progress = iter([{'state': 'a'}, {'state': 'a'}, {'state': 'b'}, None])
+        details = wait_for_completion(get_module(), lambda: next(progress),
+                                      is_removed, "removal of object 1")
+        assert details['polls'] == 4
+        assert [entry['progress'] for entry in details['history']] == [
+            {'state': 'a'}, {'state': 'b'}, None]
+
+    def test_wait_for_completion_not_requested(self):
+        get_progress = MagicMock()
+        module = get_module()
+        module.params['wait'] = False
+        assert wait_for_completion(module, get_progress, is_removed, "operation") is None
+        module = get_module()
+        module.check_mode = True
+        assert wait_for_completion(module, get_progress, is_removed, "operation") is None
+        get_progress.assert_not_called()
+
+    def test_wait_for_completion_timeout(self):
+        module = get_module(wait_timeout=0)
+        wait_for_completion(module, lambda: {'state': 'a'}, is_removed,
+                            "removal of object 1")
+        kwargs = module.fail_json.call_args[1]
+        assert kwargs['msg'].startswith(
+            "Failed waiting for the removal of object 1: Timed out after 0 seconds and 1 polls")
+        assert kwargs['wait_details']['history'][0]['progress'] == {'state': 'a'}
+
+    def test_wait_for_completion_exception(self):
+        module = get_module()
+        wait_for_completion(module, MagicMock(side_effect=Exception('Not reachable')),
+                            is_removed, "removal of object 1")
+        assert module.fail_json.call_args[1]['msg'] == \
+            "Failed waiting for the removal of object 1 with error Not reachable"
+
+    def test_get_removal_progress(self):
+        entity_client = MagicMock()
+        entity_client.get = MagicMock(side_effect=[[{'id': '1', 'state': 'a', 'name': 'n'}], []])
+        assert get_removal_progress(entity_client.get, '1', ('state',)) == {'state': 'a'}
+        assert get_removal_progress(entity_client.get, '1', ('state',)) is None
+        entity_client.get.assert_called_with(filter_fields={'id': '1'})
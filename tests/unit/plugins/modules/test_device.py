@@ -15,6 +15,8 @@ from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_
     import MockApiException
 from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell \
     import utils
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries \
+    import wait
 from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_fail_json \
     import FailJsonException, fail_json
 
@@ -24,6 +26,7 @@ utils.PowerFlexClient = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 from ansible_collections.dellemc.powerflex.plugins.modules.device import PowerFlexDevice
 
 
@@ -228,6 +231,7 @@ class TestPowerflexDevice():
             "state": "absent"
         })
         device_module_mock.module.params = self.get_module_args
+        device_module_mock.module.check_mode = False
         device_module_mock.powerflex_conn.sds.get = MagicMock(
             return_value=MockDeviceApi.SDS_DETAILS_1)
         device_module_mock.powerflex_conn.device.get = MagicMock(
@@ -235,6 +239,27 @@ class TestPowerflexDevice():
         device_module_mock.perform_module_operation()
         device_module_mock.powerflex_conn.device.delete.assert_called()
 
+    def test_delete_device_wait(self, device_module_mock, mocker):
+        sleep = mocker.patch.object(wait.time, 'sleep')
+        device_module_mock.module.params = dict(
+            self.get_module_args, current_pathname=MockDeviceApi.PATH_1,
+            sds_name=MockDeviceApi.SDS_NAME_1, state="absent", wait=True)
+        device_module_mock.module.check_mode = False
+        device_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockDeviceApi.SDS_DETAILS_1)
+        device_module_mock.powerflex_conn.device.get = MagicMock(
+            return_value=MockDeviceApi.DEVICE_GET_LIST)
+        device_module_mock.powerflex_conn.device.delete = MagicMock(
+            side_effect=lambda device_id: setattr(
+                device_module_mock.powerflex_conn.device.get, 'side_effect',
+                [MockDeviceApi.DEVICE_GET_LIST, []]))
+        device_module_mock.perform_module_operation()
+        wait_details = device_module_mock.module.exit_json.call_args[1]['wait_details']
+        assert wait_details['polls'] == 2
+        assert [entry['progress'] for entry in wait_details['history']] == [
+            {'deviceState': None, 'errorState': None}, None]
+        assert sleep.call_count == 1
+
     def test_delete_device_exception(self, device_module_mock):
         self.get_module_args.update({
             "current_pathname": MockDeviceApi.PATH_1,
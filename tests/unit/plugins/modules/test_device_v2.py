@@ -30,6 +30,7 @@ utils.get_logger = MagicMock()
 utils.get_powerflex_gateway_host_connection = MagicMock()
 utils.PowerFlexClient = MagicMock()
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 
 
 class TestPowerFlexDeviceV2():
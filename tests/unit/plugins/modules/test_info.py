@@ -8,6 +8,11 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import copy
+import csv
+import gzip
+import json
+import os
 import pytest
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
@@ -28,6 +33,8 @@ utils.filter_response = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
+from ansible_collections.dellemc.powerflex.plugins.modules import info
 from ansible_collections.dellemc.powerflex.plugins.modules.info import PowerFlexInfo, get_powerflex_info_parameters
 INVALID_SORT_MSG = 'messageCode=PARSE002 displayMessage=An invalid column name: invalid is entered in the sort list'
 
@@ -204,6 +211,76 @@ class TestPowerflexInfo():
         info_module_mock.perform_module_operation()
         info_module_mock.powerflex_conn.replication_pair.get.assert_called()
 
+    def test_get_replication_pair_details_scaled(self, info_module_mock):
+        pair_count = 10000
+        self.get_module_args.update({
+            "gather_subset": ['replication_pair'],
+            "filters": None,
+            "statistics": "summary"
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.replication_pair.get = MagicMock(
+            return_value=MockInfoApi.get_scaled_pair_list(pair_count))
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockInfoApi.get_scaled_volume_list(pair_count))
+        info_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            return_value=MockInfoApi.get_scaled_rcg_list(10))
+        info_module_mock.powerflex_conn.replication_pair.query_selected_statistics = MagicMock(
+            return_value={'pair_id_0': {'initialCopyProgress': 100}})
+        info_module_mock.perform_module_operation()
+        assert info_module_mock.powerflex_conn.volume.get.call_count == 1
+        assert info_module_mock.powerflex_conn.replication_consistency_group.get.call_count == 1
+        assert info_module_mock.powerflex_conn.replication_pair.query_selected_statistics.call_count == 1
+        info_module_mock.powerflex_conn.replication_pair.get_statistics.assert_not_called()
+        info_module_mock.powerflex_conn.replication_pair.get_all_statistics.assert_not_called()
+        pairs = info_module_mock.module.exit_json.call_args[1]['Replication_Pairs']
+        assert len(pairs) == pair_count
+        assert pairs[0]['localVolumeName'] == 'vol_0'
+        assert pairs[11]['replicationConsistencyGroupName'] == 'rcg_1'
+        assert pairs[0]['statistics'] == {'initialCopyProgress': 100}
+        assert pairs[1]['statistics'] == {}
+
+    def test_get_replication_pair_statistics(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['replication_pair'],
+            "filters": None
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.replication_pair.get = MagicMock(
+            return_value=MockInfoApi.get_scaled_pair_list(2))
+        statistics = {
+            'pair_id_0': {'initialCopyProgress': 100, 'remainingCapacityToCopyInKb': 0,
+                          'rplTransmitBwc': {'numOccured': 4, 'totalWeightInKb': 64, 'numSeconds': 5},
+                          'rplTotalJournalCap': 0, 'rplUsedJournalCap': 0},
+            'pair_id_1': {'initialCopyProgress': 42, 'remainingCapacityToCopyInKb': 4751360,
+                          'rplTransmitBwc': {'numOccured': 0, 'totalWeightInKb': 0, 'numSeconds': 5},
+                          'rplTotalJournalCap': 8192, 'rplUsedJournalCap': 512}}
+        info_module_mock.powerflex_conn.replication_pair.get_statistics = MagicMock(
+            side_effect=lambda pair_id: statistics[pair_id])
+        info_module_mock.perform_module_operation()
+        assert info_module_mock.powerflex_conn.replication_pair.get_statistics.call_count == 2
+        info_module_mock.powerflex_conn.replication_pair.query_selected_statistics.assert_not_called()
+        pairs = info_module_mock.module.exit_json.call_args[1]['Replication_Pairs']
+        assert [pair['statistics'] for pair in pairs] == [
+            statistics['pair_id_0'], statistics['pair_id_1']]
+
+    def test_get_replication_pair_statistics_summary(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['replication_pair'],
+            "filters": None,
+            "statistics": "summary"
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.replication_pair.get = MagicMock(
+            return_value=MockInfoApi.get_scaled_pair_list(2))
+        info_module_mock.powerflex_conn.replication_pair.query_selected_statistics = MagicMock(
+            return_value={'pair_id_1': {'initialCopyProgress': 42, 'remainingCapacityToCopyInKb': 4751360}})
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.replication_pair.query_selected_statistics.assert_called_once_with(
+            ['initialCopyProgress', 'remainingCapacityToCopyInKb'], ids=['pair_id_0', 'pair_id_1'])
+        pairs = info_module_mock.module.exit_json.call_args[1]['Replication_Pairs']
+        assert pairs[1]['statistics'] == {'initialCopyProgress': 42, 'remainingCapacityToCopyInKb': 4751360}
+
     def test_get_replication_pair_details_throws_exception(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['replication_pair']
@@ -460,6 +537,47 @@ class TestPowerflexInfo():
         info_module_mock.perform_module_operation()
         info_module_mock.powerflex_conn.fault_set.get.assert_called()
 
+    def test_get_fault_set_details_bulk_join(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['fault_set'],
+            "filters": None
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_MULTI_PD_LIST)
+        info_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_SDS_LIST)
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.protection_domain.get.assert_called_once_with()
+        info_module_mock.powerflex_conn.sds.get.assert_called_once_with()
+        info_module_mock.powerflex_conn.fault_set.get_sdss.assert_not_called()
+        fault_sets = info_module_mock.module.exit_json.call_args[1]['Fault_Sets']
+        assert [fs['protectionDomainName'] for fs in fault_sets] == ['domain1', 'domain1', 'domain2']
+        assert [len(fs['SDS']) for fs in fault_sets] == [2, 0, 1]
+
+    def test_get_fault_set_details_pd_filter(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['fault_set'],
+            "filters": [{
+                "filter_key": "protectionDomainName",
+                "filter_operator": "equal",
+                "filter_value": "domain2",
+            }]
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_MULTI_PD_LIST)
+        info_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_SDS_LIST)
+        info_module_mock.perform_module_operation()
+        fault_sets = info_module_mock.module.exit_json.call_args[1]['Fault_Sets']
+        assert [fs['id'] for fs in fault_sets] == ['fault_set_id_3']
+        assert fault_sets[0]['SDS'][0]['name'] == 'node22'
+
     def test_get_fault_set_details_exception(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['fault_set']
@@ -506,6 +624,266 @@ class TestPowerflexInfo():
         self.capture_fail_json_call(MockInfoApi.get_exception_response(
             'system_exception'), info_module_mock)
 
+    def test_get_subsets_concurrently(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['sds', 'device', 'rcg'],
+            "filters": None,
+            "max_workers": 4
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockInfoApi.INFO_SDS_GET_LIST)
+        info_module_mock.powerflex_conn.device.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_DEVICE_LIST)
+        info_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            return_value=MockInfoApi.RCG_LIST)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['SDSs'] == MockInfoApi.INFO_SDS_GET_LIST
+        assert result['Devices'] == MockInfoApi.INFO_GET_DEVICE_LIST
+        assert len(result['Replication_Consistency_Groups']) == len(MockInfoApi.RCG_LIST)
+        info_module_mock.powerflex_conn.system.get.assert_called_once()
+
+    def test_get_subsets_concurrently_collects_errors(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['sds', 'device', 'protection_domain'],
+            "filters": None,
+            "max_workers": 4
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.sds.get = MagicMock(
+            side_effect=MockApiException)
+        info_module_mock.powerflex_conn.device.get = MagicMock(
+            side_effect=MockApiException)
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        with pytest.raises(FailJsonException) as fail:
+            info_module_mock.perform_module_operation()
+        assert MockInfoApi.get_exception_response('sds_get_details') in fail.value.message
+        assert MockInfoApi.get_exception_response('device_get_details') in fail.value.message
+        info_module_mock.powerflex_conn.protection_domain.get.assert_called_once()
+
+    def test_get_volume_details_without_statistics(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "statistics": 'none'
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_GET_LIST)
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert all('statistics' not in vol for vol in result['Volumes'])
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes.assert_not_called()
+
+    def test_get_sp_details_summary_statistics(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['storage_pool'],
+            "statistics": 'summary'
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_GET_LIST)
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_storagepools = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_STATISTICS)
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_storagepools.assert_called_once_with(
+            properties=info.STATISTICS_SUMMARY_PROPERTIES['storage_pool'])
+
+    def test_get_volume_details_fields(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "fields": {'vol': ['sizeInKb']}
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_GET_LIST)
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Volumes'] == [
+            {'id': vol['id'], 'name': vol['name'], 'sizeInKb': vol['sizeInKb']}
+            for vol in MockInfoApi.INFO_VOLUME_GET_LIST]
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes.assert_not_called()
+
+    def test_get_fault_set_details_fields_skip_join(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['fault_set'],
+            "fields": {'fault_set': ['protectionDomainId']}
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_MULTI_PD_LIST)
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_SDS_LIST)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert all(sorted(fault_set) == ['id', 'name', 'protectionDomainId']
+                   for fault_set in result['Fault_Sets'])
+        info_module_mock.powerflex_conn.protection_domain.get.assert_not_called()
+        info_module_mock.powerflex_conn.sds.get.assert_not_called()
+
+    def test_get_subsets_output_file(self, info_module_mock, tmp_path):
+        output_file = str(tmp_path / 'export.ndjson.gz')
+        self.get_module_args.update({
+            "gather_subset": ['vol', 'device', 'protection_domain'],
+            "output_file": output_file,
+            "page_size": 1
+        })
+        info_module_mock.module.params = self.get_module_args
+        volumes = MockInfoApi.INFO_VOLUME_GET_LIST * 3
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=volumes)
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.powerflex_conn.device.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_DEVICE_LIST)
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Output_File'] == output_file
+        assert result['Exported_Counts'] == {
+            'vol': len(volumes), 'device': len(MockInfoApi.INFO_GET_DEVICE_LIST)}
+        assert result['Volumes'] == [] and result['Devices'] == []
+        assert len(result['Protection_Domains']) == len(MockInfoApi.INFO_GET_PD_LIST)
+        with gzip.open(output_file, 'rt') as export:
+            records = [json.loads(line) for line in export]
+        assert [record['subset'] for record in records] == \
+            ['vol'] * len(volumes) + ['device'] * len(MockInfoApi.INFO_GET_DEVICE_LIST)
+        assert info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes.call_count == len(volumes)
+
+    def test_get_subsets_output_file_exception(self, info_module_mock, tmp_path):
+        output_file = str(tmp_path / 'export.ndjson.gz')
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "output_file": output_file
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            side_effect=MockApiException)
+        self.capture_fail_json_call(MockInfoApi.get_exception_response(
+            'volume_get_details'), info_module_mock)
+        assert not os.listdir(str(tmp_path))
+
+    def test_get_subsets_output_format_csv(self, info_module_mock, tmp_path):
+        output_dir = str(tmp_path / 'capacity')
+        self.get_module_args.update({
+            "gather_subset": ['vol', 'storage_pool', 'protection_domain'],
+            "output_file": output_dir,
+            "output_format": 'csv',
+            "page_size": 1
+        })
+        info_module_mock.module.params = self.get_module_args
+        volumes = copy.deepcopy(MockInfoApi.INFO_VOLUME_GET_LIST * 2)
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=volumes)
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_GET_LIST)
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_storagepools = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_STATISTICS)
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.perform_module_operation()
+        self.get_module_args.update({"output_file": None, "output_format": 'ndjson'})
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Output_File'] == output_dir
+        assert result['Exported_Counts'] == {
+            'vol': len(volumes), 'storage_pool': len(MockInfoApi.INFO_STORAGE_POOL_GET_LIST)}
+        assert result['Exported_Files'] == {
+            'vol': os.path.join(output_dir, 'vol.csv'),
+            'storage_pool': os.path.join(output_dir, 'storage_pool.csv')}
+        assert result['Volumes'] == [] and result['Storage_Pools'] == []
+        assert len(result['Protection_Domains']) == len(MockInfoApi.INFO_GET_PD_LIST)
+        assert sorted(os.listdir(output_dir)) == ['storage_pool.csv', 'vol.csv']
+        with open(result['Exported_Files']['vol']) as export:
+            rows = list(csv.DictReader(export))
+        assert [row['id'] for row in rows] == [vol['id'] for vol in volumes]
+
+    def test_get_subsets_output_format_no_pyarrow(self, info_module_mock, tmp_path, mocker):
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "output_file": str(tmp_path / 'capacity'),
+            "output_format": 'parquet'
+        })
+        info_module_mock.module.params = self.get_module_args
+        mocker.patch.object(info, 'HAS_PYARROW', False)
+        self.capture_fail_json_call('pyarrow', info_module_mock)
+        self.get_module_args.update({"output_file": None, "output_format": 'ndjson'})
+        assert not os.listdir(str(tmp_path))
+
+    def test_get_volume_details_delta(self, info_module_mock, tmp_path):
+        state_file = str(tmp_path / 'delta.json')
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "delta_state_file": state_file
+        })
+        info_module_mock.module.params = self.get_module_args
+        volumes = [dict(MockInfoApi.INFO_VOLUME_GET_LIST[0], id='vol_id_%s' % index, name='vol_%s' % index)
+                   for index in range(3)]
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=copy.deepcopy(volumes))
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes = MagicMock(
+            return_value={})
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert [vol['id'] for vol in result['Volumes']] == ['vol_id_0', 'vol_id_1', 'vol_id_2']
+        assert result['Delta']['vol']['added'] == ['vol_id_0', 'vol_id_1', 'vol_id_2']
+
+        volumes[1]['sizeInKb'] = volumes[1]['sizeInKb'] * 2
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=copy.deepcopy(volumes[:2]))
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert [vol['id'] for vol in result['Volumes']] == ['vol_id_1']
+        assert result['Delta']['vol'] == {
+            'added': [], 'modified': ['vol_id_1'], 'removed': ['vol_id_2']}
+        info_module_mock.powerflex_conn.utility.get_statistics_for_all_volumes.assert_called_with(
+            ids=['vol_id_1'])
+
+    def test_get_volume_details_delta_check_mode(self, info_module_mock, tmp_path):
+        state_file = tmp_path / 'delta.json'
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "delta_state_file": str(state_file),
+            "statistics": "none"
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.module.check_mode = True
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            side_effect=lambda: copy.deepcopy(MockInfoApi.INFO_VOLUME_GET_LIST))
+        info_module_mock.perform_module_operation()
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Delta']['vol']['added'] == [MockInfoApi.INFO_VOLUME_GET_LIST[0]['id']]
+        assert not state_file.exists()
+
+    def test_get_fault_set_details_delta_unchanged(self, info_module_mock, tmp_path):
+        self.get_module_args.update({
+            "gather_subset": ['fault_set'],
+            "delta_state_file": str(tmp_path / 'delta.json')
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            side_effect=lambda: copy.deepcopy(MockInfoApi.INFO_FAULT_SET_MULTI_PD_LIST))
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockInfoApi.INFO_FAULT_SET_SDS_LIST)
+        info_module_mock.perform_module_operation()
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert not result['Fault_Sets']
+        assert result['Delta']['fault_set']['modified'] == []
+        info_module_mock.powerflex_conn.sds.get.assert_called_once()
+
     def test_get_managed_device_details(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['managed_device']
@@ -649,6 +1027,30 @@ class TestPowerflexInfo():
         info_module_mock.perform_module_operation()
         info_module_mock.powerflex_conn.sdc.get.assert_called()
 
+    def test_get_nvme_host_details_filter_pushed_down(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['nvme_host'],
+            "filters": [{
+                "filter_key": "protectionDomainId",
+                "filter_operator": "equal",
+                "filter_value": "fake_pd_id"
+            }, {
+                "filter_key": "name",
+                "filter_operator": "equal",
+                "filter_value": "fake_host_name_1"
+            }]
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockInfoApi.INFO_NVME_HOST_LIST
+        )
+        utils.filter_response = MagicMock(return_value=MockInfoApi.INFO_NVME_HOST_LIST[:1])
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.sdc.get.assert_called_once_with(
+            filter_fields={'protectionDomainId': 'fake_pd_id', 'hostType': 'NVMeHost'})
+        utils.filter_response.assert_called_once_with(
+            MockInfoApi.INFO_NVME_HOST_LIST, {'name': 'fake_host_name_1'})
+
     def test_get_nvme_host_details_exception(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['nvme_host']
@@ -679,6 +1081,24 @@ class TestPowerflexInfo():
         info_module_mock.powerflex_conn.sdc.get.assert_called()
         info_module_mock.powerflex_conn.host.get_related.assert_called()
 
+    def test_get_sdt_details_bulk_controllers(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['sdt'],
+            "filters": None
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.sdt.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_SDT_MULTI_LIST
+        )
+        info_module_mock.powerflex_conn.host.send_get_request = MagicMock(
+            return_value=(MagicMock(status_code=200), MockInfoApi.INFO_GET_ALL_NVME_CONTROLLER_LIST)
+        )
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.host.send_get_request.assert_called_once()
+        info_module_mock.powerflex_conn.host.get_related.assert_not_called()
+        sdts = info_module_mock.module.exit_json.call_args[1]['SDTs']
+        assert [len(sdt['nvme_hosts']) for sdt in sdts] == [2, 1]
+
     def test_get_sdt_details_filter(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['sdt'],
@@ -8,6 +8,10 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
+import csv
+import gzip
+import json
+import os
 import pytest
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
@@ -27,6 +31,8 @@ utils.filter_response = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
+from ansible_collections.dellemc.powerflex.plugins.modules import info_v2
 from ansible_collections.dellemc.powerflex.plugins.modules.info_v2 import PowerFlexInfo, get_powerflex_info_parameters
 INVALID_SORT_MSG = 'messageCode=PARSE002 displayMessage=An invalid column name: invalid is entered in the sort list'
 
@@ -287,6 +293,159 @@ class TestPowerflexInfo():
         self.capture_fail_json_call(MockInfoApi.get_exception_response(
             'device_get_details'), info_module_mock)
 
+    def test_get_volume_details_without_statistics(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "statistics": 'none'
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_GET_LIST)
+        info_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert all('statistics' not in vol for vol in result['Volumes'])
+        info_module_mock.powerflex_conn.utility.query_metrics.assert_not_called()
+
+    def test_get_sp_details_summary_statistics(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['storage_pool'],
+            "statistics": 'summary'
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_GET_LIST)
+        info_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_STATISTICS)
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.utility.query_metrics.assert_called_once_with(
+            'storage_pool', [], info_v2.STATISTICS_SUMMARY_METRICS['storage_pool'])
+
+    def test_get_volume_details_statistics_query(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['vol', 'storage_pool'],
+            "statistics": 'summary',
+            "statistics_query": {'metrics': None, 'chunk_size': 1,
+                                 'window': None, 'aggregation': 'last'}
+        })
+        info_module_mock.module.params = self.get_module_args
+        volumes = MockInfoApi.INFO_VOLUME_GET_LIST
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=volumes)
+        info_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_GET_LIST)
+        info_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockInfoApi.INFO_STORAGE_POOL_STATISTICS)
+        info_module_mock.perform_module_operation()
+        query_metrics = info_module_mock.powerflex_conn.utility.query_metrics
+        assert query_metrics.call_count == \
+            len(volumes) + len(MockInfoApi.INFO_STORAGE_POOL_GET_LIST)
+        query_metrics.assert_any_call(
+            'volume', [volumes[0]['id']], info_v2.STATISTICS_SUMMARY_METRICS['vol'])
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert all('statistics' not in vol for vol in result['Volumes'])
+        pools = result['Statistics']['storage_pool']
+        assert pools['ids'] == [pool['id'] for pool in MockInfoApi.INFO_STORAGE_POOL_GET_LIST]
+        assert pools['aggregation'] == 'last'
+        assert pools['metrics']['host_write_iops'] == [None] * len(pools['ids'])
+        assert result['Statistics']['vol']['ids'] == [vol['id'] for vol in volumes]
+        self.get_module_args.update({"statistics_query": None})
+
+    def test_get_volume_details_fields(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "fields": {'vol': ['sizeInKb']}
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_GET_LIST)
+        info_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Volumes'] == [
+            {'id': vol['id'], 'name': vol['name'], 'sizeInKb': vol['sizeInKb']}
+            for vol in MockInfoApi.INFO_VOLUME_GET_LIST]
+        info_module_mock.powerflex_conn.utility.query_metrics.assert_not_called()
+
+    def test_get_subsets_output_file(self, info_module_mock, tmp_path):
+        output_file = str(tmp_path / 'export.ndjson.gz')
+        self.get_module_args.update({
+            "gather_subset": ['vol', 'device', 'protection_domain'],
+            "output_file": output_file,
+            "page_size": 1
+        })
+        info_module_mock.module.params = self.get_module_args
+        volumes = MockInfoApi.INFO_VOLUME_GET_LIST * 3
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=volumes)
+        info_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockInfoApi.INFO_VOLUME_STATISTICS)
+        info_module_mock.powerflex_conn.device.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_DEVICE_LIST)
+        info_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_PD_LIST)
+        info_module_mock.perform_module_operation()
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Output_File'] == output_file
+        assert result['Exported_Counts'] == {
+            'vol': len(volumes), 'device': len(MockInfoApi.INFO_GET_DEVICE_LIST)}
+        assert result['Volumes'] == [] and result['Devices'] == []
+        assert len(result['Protection_Domains']) == len(MockInfoApi.INFO_GET_PD_LIST)
+        with gzip.open(output_file, 'rt') as export:
+            records = [json.loads(line) for line in export]
+        assert [record['subset'] for record in records] == \
+            ['vol'] * len(volumes) + ['device'] * len(MockInfoApi.INFO_GET_DEVICE_LIST)
+        assert info_module_mock.powerflex_conn.utility.query_metrics.call_count == len(volumes)
+
+    def test_get_subsets_output_file_exception(self, info_module_mock, tmp_path):
+        output_file = str(tmp_path / 'export.ndjson.gz')
+        self.get_module_args.update({
+            "gather_subset": ['vol'],
+            "output_file": output_file
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            side_effect=MockApiException)
+        self.capture_fail_json_call(MockInfoApi.get_exception_response(
+            'volume_get_details'), info_module_mock)
+        assert not os.listdir(str(tmp_path))
+
+    def test_get_subsets_output_format_csv(self, info_module_mock, tmp_path):
+        output_dir = str(tmp_path / 'capacity')
+        self.get_module_args.update({
+            "gather_subset": ['vol', 'storage_pool'],
+            "output_file": output_dir,
+            "output_format": 'csv',
+            "statistics_query": {'metrics': ['host_read_iops'], 'chunk_size': 500,
+                                 'window': None, 'aggregation': 'last'}
+        })
+        info_module_mock.module.params = self.get_module_args
+        volumes = MockInfoApi.INFO_VOLUME_GET_LIST
+        pools = MockInfoApi.INFO_STORAGE_POOL_GET_LIST
+        info_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=volumes)
+        info_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=pools)
+        info_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            side_effect=lambda resource_type, ids, metrics: {
+                'timestamps': ['2025-09-08T06:45:00Z'],
+                'resources': [{'id': obj_id, 'metrics': [{'name': 'host_read_iops', 'values': [10]}]}
+                              for obj_id in ids]})
+        info_module_mock.perform_module_operation()
+        self.get_module_args.update({"output_file": None, "output_format": 'ndjson',
+                                     "statistics_query": None})
+        result = info_module_mock.module.exit_json.call_args[1]
+        assert result['Exported_Counts'] == {'vol': len(volumes), 'storage_pool': len(pools)}
+        assert result['Volumes'] == [] and result['Storage_Pools'] == []
+        assert result['Statistics'] == {}
+        for subset, entities in (('vol', volumes), ('storage_pool', pools)):
+            with open(result['Exported_Files'][subset]) as export:
+                rows = list(csv.DictReader(export))
+            assert [row['id'] for row in rows] == [entity['id'] for entity in entities]
+            assert all(row['statistics.host_read_iops'] == '10' for row in rows)
+
     def test_get_managed_device_details(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['managed_device']
@@ -430,6 +589,30 @@ class TestPowerflexInfo():
         info_module_mock.perform_module_operation()
         info_module_mock.powerflex_conn.sdc.get.assert_called()
 
+    def test_get_nvme_host_details_filter_pushed_down(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['nvme_host'],
+            "filters": [{
+                "filter_key": "protectionDomainId",
+                "filter_operator": "equal",
+                "filter_value": "fake_pd_id"
+            }, {
+                "filter_key": "name",
+                "filter_operator": "equal",
+                "filter_value": "fake_host_name_1"
+            }]
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockInfoApi.INFO_NVME_HOST_LIST
+        )
+        utils.filter_response = MagicMock(return_value=MockInfoApi.INFO_NVME_HOST_LIST[:1])
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.sdc.get.assert_called_once_with(
+            filter_fields={'protectionDomainId': 'fake_pd_id', 'hostType': 'NVMeHost'})
+        utils.filter_response.assert_called_once_with(
+            MockInfoApi.INFO_NVME_HOST_LIST, {'name': 'fake_host_name_1'})
+
     def test_get_nvme_host_details_exception(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['nvme_host']
@@ -460,6 +643,24 @@ class TestPowerflexInfo():
         info_module_mock.powerflex_conn.sdc.get.assert_called()
         info_module_mock.powerflex_conn.host.get_related.assert_called()
 
+    def test_get_sdt_details_bulk_controllers(self, info_module_mock):
+        self.get_module_args.update({
+            "gather_subset": ['sdt'],
+            "filters": None
+        })
+        info_module_mock.module.params = self.get_module_args
+        info_module_mock.powerflex_conn.sdt.get = MagicMock(
+            return_value=MockInfoApi.INFO_GET_SDT_MULTI_LIST
+        )
+        info_module_mock.powerflex_conn.host.send_get_request = MagicMock(
+            return_value=(MagicMock(status_code=200), MockInfoApi.INFO_GET_ALL_NVME_CONTROLLER_LIST)
+        )
+        info_module_mock.perform_module_operation()
+        info_module_mock.powerflex_conn.host.send_get_request.assert_called_once()
+        info_module_mock.powerflex_conn.host.get_related.assert_not_called()
+        sdts = info_module_mock.module.exit_json.call_args[1]['SDTs']
+        assert [len(sdt['nvme_hosts']) for sdt in sdts] == [2, 1]
+
     def test_get_sdt_details_filter(self, info_module_mock):
         self.get_module_args.update({
             "gather_subset": ['sdt'],
@@ -23,6 +23,7 @@ utils.get_powerflex_gateway_host_connection = MagicMock()
 utils.PowerFlexClient = MagicMock()
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 from ansible_collections.dellemc.powerflex.plugins.modules.mdm_cluster import PowerFlexMdmCluster
 
 
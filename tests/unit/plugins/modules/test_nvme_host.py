@@ -28,6 +28,7 @@ utils.PowerFlexClient = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 
 
 class TestPowerflexNVMeHost(PowerFlexUnitBase):
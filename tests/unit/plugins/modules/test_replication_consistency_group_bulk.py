@@ -0,0 +1,192 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for replication consistency group bulk module on PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import time
+import pytest
+# pylint: disable=unused-import
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_replication_consistency_group_bulk_api \
+    import MockReplicationConsistencyGroupBulkApi
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.powerflex_unit_base \
+    import PowerFlexUnitBase
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries \
+    import wait
+from ansible_collections.dellemc.powerflex.plugins.modules.replication_consistency_group_bulk \
+    import PowerFlexReplicationConsistencyGroupBulk
+
+
+class TestPowerflexReplicationConsistencyGroupBulk(PowerFlexUnitBase):
+
+    get_module_args = MockReplicationConsistencyGroupBulkApi.RCG_BULK_COMMON_ARGS
+
+    @pytest.fixture
+    def module_object(self):
+        return PowerFlexReplicationConsistencyGroupBulk
+
+    def test_failover_protection_domain(self, powerflex_module_mock, mocker):
+        sleep = mocker.patch.object(wait.time, 'sleep')
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "protection_domain_name": "pd_1",
+                "action": "failover",
+                "max_workers": 4
+            })
+        rcgs = MockReplicationConsistencyGroupBulkApi.get_rcg_list(6)
+        rcgs[2]['failoverType'] = 'Failover'
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockReplicationConsistencyGroupBulkApi.PROTECTION_DOMAINS[:1])
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(rcgs, polled={
+                'rcg_id_0': [{}, {'failoverType': 'Failover'}],
+                'rcg_id_4': [{'failoverType': 'Failover'}]}))
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.failover = MagicMock()
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get_statistics = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        assert sorted(call[0][0] for call in
+                      powerflex_module_mock.powerflex_conn.replication_consistency_group.failover.call_args_list) == \
+            ['rcg_id_0', 'rcg_id_4']
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get_statistics.assert_not_called()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert [item['name'] for item in result['replication_consistency_groups']] == \
+            ['rcg_0', 'rcg_2', 'rcg_4']
+        assert result['summary']['changed'] == 2
+        assert result['summary']['unchanged'] == 1
+        rcg_0 = result['replication_consistency_groups'][0]
+        assert [event['event'] for event in rcg_0['timeline']] == \
+            ['selected', 'sent', 'polled', 'done']
+        assert rcg_0['state']['failoverType'] == 'Failover'
+        assert sleep.call_count == 1
+        assert result['replication_consistency_groups'][1]['timeline'][-1]['event'] == 'selected'
+
+    def test_seconds_per_rcg(self, powerflex_module_mock, mocker):
+        now = [0.0]
+        mocker.patch.object(wait.time, 'sleep',
+                            side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds))
+        mocker.patch.object(time, 'time', side_effect=lambda: now[0])
+        powerflex_module_mock.start = 0.0
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "rcg_ids": ["rcg_id_0", "rcg_id_1", "rcg_id_2"],
+                "action": "failover"
+            })
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(MockReplicationConsistencyGroupBulkApi.get_rcg_list(3), polled={
+                'rcg_id_0': [{'failoverType': 'Failover'}],
+                'rcg_id_1': [{}, {}, {'failoverType': 'Failover'}],
+                'rcg_id_2': [{}, {'failoverType': 'Failover'}]}))
+        powerflex_module_mock.perform_module_operation()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        seconds = [item['seconds'] for item in result['replication_consistency_groups']]
+        assert seconds[0] == 0.0
+        assert seconds[0] < seconds[1] < seconds[2]
+        assert seconds[2] - seconds[1] < seconds[1]
+        assert result['summary']['seconds'] == seconds[2]
+
+    def test_select_names_and_ids(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "rcg_names": ["rcg_1", "rcg_9"],
+                "rcg_ids": ["rcg_id_1"],
+                "action": "resume"
+            })
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(
+                MockReplicationConsistencyGroupBulkApi.get_rcg_list(3, pauseMode='StopDataTransfer'),
+                polled={'rcg_id_1': [{'pauseMode': 'None'}]}))
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.resume = MagicMock()
+        self.capture_fail_json_call("Replication consistency group rcg_9 does not exist",
+                                    powerflex_module_mock, invoke_perform_module=True)
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.resume.assert_called_once_with('rcg_id_1')
+        assert powerflex_module_mock.powerflex_conn.replication_consistency_group.get.call_count == 2
+
+    def test_action_timeout(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "rcg_ids": ["rcg_id_0", "rcg_id_1"],
+                "action": "freeze",
+                "wait_timeout": 0
+            })
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(MockReplicationConsistencyGroupBulkApi.get_rcg_list(2)))
+        powerflex_module_mock.module.fail_json = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        call = powerflex_module_mock.module.fail_json.call_args[1]
+        assert "Failed to freeze 2 of 2" in call['msg']
+        assert "Timed out after 0 seconds" in call['msg']
+        assert call['replication_consistency_groups'][0]['timeline'][-1]['event'] == 'timeout'
+        assert call['summary']['failed'] == 2
+
+    def test_action_exception(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "rcg_ids": ["rcg_id_0", "rcg_id_1"],
+                "action": "switchover",
+                "force": True
+            })
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(MockReplicationConsistencyGroupBulkApi.get_rcg_list(2), polled={
+                'rcg_id_1': [{'failoverType': 'Switchover'}]}))
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.switchover = MagicMock(
+            side_effect=[MockApiException, None])
+        self.capture_fail_json_call("Switchover of replication consistency group rcg_0 failed",
+                                    powerflex_module_mock, invoke_perform_module=True)
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.switchover.assert_called_with('rcg_id_1', True)
+
+    def test_pause_no_wait(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "rcg_names": ["rcg_0", "rcg_1"],
+                "action": "pause",
+                "pause_mode": "OnlyTrackChanges",
+                "wait": False
+            })
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(MockReplicationConsistencyGroupBulkApi.get_rcg_list(2)))
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.pause = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        assert powerflex_module_mock.powerflex_conn.replication_consistency_group.pause.call_count == 2
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.pause.assert_called_with('rcg_id_1', 'OnlyTrackChanges')
+        assert powerflex_module_mock.powerflex_conn.replication_consistency_group.get.call_count == 1
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['summary']['changed'] == 2
+
+    def test_check_mode(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "rcg_names": ["rcg_0"],
+                "action": "restore"
+            })
+        powerflex_module_mock.module.check_mode = True
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.get = MagicMock(
+            side_effect=MockReplicationConsistencyGroupBulkApi.get_rcg_responses(MockReplicationConsistencyGroupBulkApi.get_rcg_list(2, failoverType='Failover')))
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.restore = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.replication_consistency_group.restore.assert_not_called()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert result['replication_consistency_groups'][0]['changed'] is True
@@ -24,6 +24,7 @@ utils.PowerFlexClient = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 from ansible_collections.dellemc.powerflex.plugins.modules.replication_pair import PowerFlexReplicationPair
 
 
@@ -130,6 +131,67 @@ class TestPowerflexReplicationPair:
         assert "Create replication pairs failed with error" \
             in replication_pair_module_mock.module.fail_json.call_args[1]['msg']
 
+    def test_create_pairs_serial_fail_fast(self, replication_pair_module_mock):
+        self.get_module_args.update({
+            "rcg_name": "test_rcg",
+            "pairs": [{"source_volume_id": "src_id_%s" % index, "target_volume_id": "dest_id_%s" % index,
+                       "source_volume_name": None, "target_volume_name": None, "copy_type": "OnlineCopy",
+                       "name": None} for index in range(3)],
+            "max_workers": 1,
+            "state": "present"
+        })
+        replication_pair_module_mock.module.params = self.get_module_args
+        replication_pair_module_mock.get_rcg_replication_pairs = MagicMock(return_value=[])
+        replication_pair_module_mock.powerflex_conn.replication_pair.add = MagicMock(
+            side_effect=[None, MockApiException, None]
+        )
+        replication_pair_module_mock.perform_module_operation()
+        assert "Create replication pairs failed with error" \
+            in replication_pair_module_mock.module.fail_json.call_args[1]['msg']
+        assert replication_pair_module_mock.powerflex_conn.replication_pair.add.call_count == 2
+
+    def test_create_pairs_bulk_resolve(self, replication_pair_module_mock):
+        self.get_module_args.update({
+            "rcg_name": "test_rcg",
+            "pairs": [{"source_volume_name": "src_vol_%s" % index, "target_volume_name": "dest_vol_%s" % index,
+                       "source_volume_id": None, "target_volume_id": None, "copy_type": "OnlineCopy",
+                       "name": None} for index in range(6)],
+            "max_workers": 4,
+            "state": "present"
+        })
+        replication_pair_module_mock.module.params = self.get_module_args
+        replication_pair_module_mock.get_rcg_replication_pairs = MagicMock(
+            return_value=[{"localVolumeId": "src_id_0", "remoteVolumeId": "dest_id_0"}])
+        replication_pair_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=[{"id": "src_id_%s" % index, "name": "src_vol_%s" % index} for index in range(6)])
+        remote_conn = MagicMock()
+        remote_conn.volume.get = MagicMock(
+            return_value=[{"id": "dest_id_%s" % index, "name": "dest_vol_%s" % index} for index in range(6)])
+        utils.get_powerflex_gateway_host_connection = MagicMock(return_value=remote_conn)
+        replication_pair_module_mock.perform_module_operation()
+        self.get_module_args.update({"max_workers": 1})
+        assert utils.get_powerflex_gateway_host_connection.call_count == 1
+        assert replication_pair_module_mock.powerflex_conn.volume.get.call_count == 1
+        assert remote_conn.volume.get.call_count == 1
+        added = sorted((call[1]['source_vol_id'], call[1]['dest_vol_id']) for call in
+                       replication_pair_module_mock.powerflex_conn.replication_pair.add.call_args_list)
+        assert added == [("src_id_%s" % index, "dest_id_%s" % index) for index in range(1, 6)]
+
+    def test_create_pairs_missing_volume(self, replication_pair_mock):
+        self.get_module_args.update({
+            "rcg_name": "test_rcg",
+            "pairs": [{"source_volume_name": "src_vol", "target_volume_name": None, "source_volume_id": None,
+                       "target_volume_id": "345", "copy_type": "OnlineCopy", "name": "test_pair"}],
+            "state": "present"
+        })
+        replication_pair_mock.module.params = self.get_module_args
+        replication_pair_mock.get_rcg = MagicMock(return_value={"id": 123})
+        replication_pair_mock.get_rcg_replication_pairs = MagicMock(return_value=[])
+        replication_pair_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockReplicationPairApi.get_volume_details())
+        self.capture_fail_json_call("Source volume src_vol does not exist", replication_pair_mock)
+        replication_pair_mock.powerflex_conn.replication_pair.add.assert_not_called()
+
     def test_pause_replication_pair(self, replication_pair_module_mock):
         self.get_module_args.update({"pair_name": "test_pair", "pause": True, "state": "present"})
         replication_pair_module_mock.module.params = self.get_module_args
@@ -271,6 +333,21 @@ class TestPowerflexReplicationPair:
         replication_pair_module_mock.perform_module_operation()
         replication_pair_module_mock.powerflex_conn.replication_pair.add.assert_called()
 
+    def test_get_rcg_replication_pairs_enrichment(self, replication_pair_module_mock):
+        rcg_pairs = [dict(MockReplicationPairApi.get_pair_details()[0], id="pair_id_%s" % index,
+                          localVolumeId="vol_id_%s" % index) for index in range(5)]
+        replication_pair_module_mock.powerflex_conn.replication_consistency_group.get_replication_pairs = MagicMock(
+            return_value=rcg_pairs)
+        replication_pair_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=[{"id": "vol_id_%s" % index, "name": "vol_%s" % index} for index in range(10)])
+        replication_pair_module_mock.get_rcg = MagicMock(return_value={"id": 123, "name": "test_rcg"})
+        pairs = replication_pair_module_mock.get_rcg_replication_pairs(123)
+        assert replication_pair_module_mock.get_rcg.call_count == 1
+        assert replication_pair_module_mock.powerflex_conn.volume.get.call_count == 1
+        assert [pair['localVolumeName'] for pair in pairs] == ["vol_%s" % index for index in range(5)]
+        assert set(pair['replicationConsistencyGroupName'] for pair in pairs) == {"test_rcg"}
+        assert all('links' not in pair for pair in pairs)
+
     def test_get_rcg_name(self, replication_pair_mock):
         self.get_module_args.update({
             "rcg_name": "test_rcg",
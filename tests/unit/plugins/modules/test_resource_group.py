@@ -7,6 +7,9 @@
 from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
+import copy
+import json
+import time
 import pytest
 # pylint: disable=unused-import
 from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
@@ -19,6 +22,8 @@ from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libra
     import PowerFlexUnitBase
 from ansible_collections.dellemc.powerflex.plugins.modules.resource_group \
     import PowerFlexResourceGroup
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries \
+    import wait
 
 
 class TestResourceGroup(PowerFlexUnitBase):
@@ -125,6 +130,56 @@ class TestResourceGroup(PowerFlexUnitBase):
         powerflex_module_mock.perform_module_operation()
         assert powerflex_module_mock.module.exit_json.call_args[1]['changed'] is True
 
+    def deploy_with_wait(self, powerflex_module_mock, mocker, statuses):
+        mocker.patch.object(wait.time, 'sleep')
+        arguments = {"resource_group_name": "ans_rg", "description": "ans_rg",
+                     "template_id": "template_id", "template_name": None,
+                     "firmware_repository_id": None, "firmware_repository_name": None,
+                     "state": "present", "wait": True}
+        self.set_module_params(powerflex_module_mock, self.get_module_args, arguments)
+        deployment = MockResourceResourceGroupAPI.RG_RESPONSE[0]
+        powerflex_module_mock.powerflex_conn.deployment.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.deployment.get_by_id = MagicMock(
+            side_effect=[dict(deployment, status=status) for status in statuses])
+        powerflex_module_mock.powerflex_conn.service_template.get_by_id = MagicMock(
+            return_value=MockResourceResourceGroupAPI.RG_TEMPLATE_RESPONSE)
+        powerflex_module_mock.powerflex_conn.deployment.create = MagicMock(
+            return_value=deployment)
+
+    def test_create_deploy_wait(self, powerflex_module_mock, mocker):
+        self.deploy_with_wait(powerflex_module_mock, mocker,
+                              ["pending", "in_progress", "complete", "complete"])
+        powerflex_module_mock.perform_module_operation()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['resource_group_details']['status'] == "complete"
+        assert result['wait_details']['polls'] == 3
+        assert [entry['progress']['status'] for entry in result['wait_details']['history']] == \
+            ["pending", "in_progress", "complete"]
+
+    def test_create_deploy_wait_error(self, powerflex_module_mock, mocker):
+        self.deploy_with_wait(powerflex_module_mock, mocker, ["in_progress", "error"])
+        self.capture_fail_json_call(
+            "The deployment of resource group 8aaa03a88de961fa018de96a88d80008 "
+            "completed with status error", powerflex_module_mock, invoke_perform_module=True)
+
+    def test_delete_deploy_wait(self, powerflex_module_mock, mocker):
+        mocker.patch.object(wait.time, 'sleep')
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"resource_group_name": "ans_rg", "state": "absent", "wait": True})
+        deployment = MockResourceResourceGroupAPI.RG_RESPONSE[0]
+        not_found = MockApiException()
+        not_found.status = "404"
+        powerflex_module_mock.powerflex_conn.deployment.get = MagicMock(
+            return_value=MockResourceResourceGroupAPI.RG_RESPONSE)
+        powerflex_module_mock.powerflex_conn.deployment.get_by_id = MagicMock(
+            side_effect=[deployment, dict(deployment, status="in_progress"),
+                         dict(deployment, status="in_progress"), not_found, not_found])
+        powerflex_module_mock.powerflex_conn.deployment.delete = MagicMock(return_value=None)
+        powerflex_module_mock.perform_module_operation()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['resource_group_details'] is None
+        assert result['wait_details']['history'][-1]['progress'] is None
+
     def test_create_deploy_exception(self, powerflex_module_mock):
         arguments = {"resource_group_name": "ans_rg", "description": "ans_rg",
                      "template_id": None, "template_name": "update-template",
@@ -205,6 +260,70 @@ class TestResourceGroup(PowerFlexUnitBase):
         powerflex_module_mock.perform_module_operation()
         assert powerflex_module_mock.module.exit_json.call_args[1]['changed'] is True
 
+    def test_resource_group_edit_payload(self, powerflex_module_mock):
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"resource_group_name": "ans_rg", "state": "present",
+                                "scaleup": True, "node_count": 2, "clone_node": None,
+                                "new_resource_group_name": "ans_rg1", "description": "ans_rg"})
+        deployment = copy.deepcopy(MockResourceResourceGroupAPI.RG_RESPONSE[0])
+        powerflex_module_mock.powerflex_conn.deployment.get = MagicMock(
+            return_value=[deployment])
+        powerflex_module_mock.powerflex_conn.deployment.get_by_id = MagicMock(
+            return_value=deployment)
+        powerflex_module_mock.powerflex_conn.deployment.edit = MagicMock(
+            return_value=None)
+        powerflex_module_mock.perform_module_operation()
+        rg_data = powerflex_module_mock.powerflex_conn.deployment.edit.call_args[1]['rg_data']
+        assert isinstance(rg_data, dict)
+        assert rg_data["id"] == deployment["id"]
+        assert rg_data["deploymentName"] == "ans_rg1"
+        assert rg_data["deploymentDescription"] == "ans_rg"
+        assert rg_data["scaleup"] is True and rg_data["retry"] is True
+        components = rg_data["serviceTemplate"]["components"]
+        assert components[:1] == deployment["serviceTemplate"]["components"]
+        assert len(components) == 3
+        assert all(component["name"] == component["id"] for component in components[1:])
+        assert deployment["deploymentName"] == "ans_rg"
+        assert len(deployment["serviceTemplate"]["components"]) == 1
+
+    def test_scaleup_payload(self, powerflex_module_mock):
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"scaleup": True, "node_count": 64, "clone_node": "node-3",
+                                "new_resource_group_name": None, "description": None})
+        deployment = MockResourceResourceGroupAPI.get_large_deployment(server_count=16, parameter_count=100)
+        before = json.dumps(deployment)
+        payload = powerflex_module_mock.prepare_modify_payload(deployment_data=deployment)
+        assert json.dumps(deployment) == before
+        assert payload["scaleup"] is True and payload["retry"] is True
+        components = payload["serviceTemplate"]["components"]
+        assert components[:16] == deployment["serviceTemplate"]["components"]
+        new_components = components[16:]
+        assert len(new_components) == 64
+        assert len(set(component["id"] for component in new_components)) == 64
+        for component in new_components:
+            assert component["name"] == component["id"]
+            assert component["asmGUID"] is None and component["brownfield"] is False
+            server, idrac = component["resources"]
+            assert server["parameters"][0] == {"id": "razor_image", "guid": None, "value": "razor-image"}
+            assert all(param["guid"] is None and param["value"] is None for param in server["parameters"][1:])
+            assert idrac == deployment["serviceTemplate"]["components"][3]["resources"][1]
+
+    def test_scaleup_payload_benchmark(self, powerflex_module_mock, record_property):
+        # Report only, the timings depend on the host running the tests
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"scaleup": True, "node_count": 64, "clone_node": "node-3",
+                                "new_resource_group_name": None, "description": None})
+        deployment = MockResourceResourceGroupAPI.get_large_deployment(server_count=16, parameter_count=100)
+        start = time.perf_counter()
+        payload = powerflex_module_mock.prepare_modify_payload(deployment_data=deployment)
+        record_property("builder_seconds", time.perf_counter() - start)
+        # The previous builder deep copied the whole deployment once per added node
+        start = time.perf_counter()
+        for node in range(8):
+            copy.deepcopy(deployment)
+        record_property("deep_copy_seconds", time.perf_counter() - start)
+        assert len(payload["serviceTemplate"]["components"]) == 80
+
     def test_modify_resource_group_exception(self, powerflex_module_mock):
         arguments = {"resource_group_name": "ans_rg", "description": "ans_rg",
                      "template_id": None, "template_name": "update-template",
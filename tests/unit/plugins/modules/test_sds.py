@@ -23,6 +23,8 @@ from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libra
     import PowerFlexUnitBase
 
 from ansible_collections.dellemc.powerflex.plugins.modules.sds import PowerFlexSDS
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries \
+    import wait
 
 
 class TestPowerflexSDS(PowerFlexUnitBase):
@@ -513,6 +515,58 @@ class TestPowerflexSDS(PowerFlexUnitBase):
             powerflex_module_mock, powerflex_module_mock.module.params)
         powerflex_module_mock.powerflex_conn.sds.add_ip.assert_called()
 
+    def test_add_ip_parallel_response(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds_ip_list":
+                [
+                    {
+                        "ip": "10.xx.xx.%s" % index,
+                        "role": "sdcOnly"
+                    } for index in range(6)
+                ],
+                "sds_ip_state": "present-in-sds",
+                "max_workers": 4,
+                "state": "present"
+            })
+        powerflex_module_mock.get_sds_details = MagicMock(
+            return_value=MockSDSApi.SDS_GET_LIST[0])
+        powerflex_module_mock.powerflex_conn.sds.add_ip = MagicMock()
+        SDSHandler().handle(
+            powerflex_module_mock, powerflex_module_mock.module.params)
+        assert powerflex_module_mock.powerflex_conn.sds.add_ip.call_count == 6
+
+    def test_update_sds_role_in_order(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds_ip_list":
+                [
+                    {
+                        "ip": self.ip1,
+                        "role": "sdcOnly"
+                    },
+                    {
+                        "ip": self.ip2,
+                        "role": "all"
+                    }
+                ],
+                "sds_ip_state": "present-in-sds",
+                "max_workers": 4,
+                "state": "present"
+            })
+        powerflex_module_mock.get_sds_details = MagicMock(
+            return_value=MockSDSApi.SDS_GET_LIST[0])
+        powerflex_module_mock.powerflex_conn.sds.set_ip_role = MagicMock()
+        SDSHandler().handle(
+            powerflex_module_mock, powerflex_module_mock.module.params)
+        assert [call[0][1:] for call in
+                powerflex_module_mock.powerflex_conn.sds.set_ip_role.call_args_list] == \
+            [(self.ip1, "sdcOnly"), (self.ip2, "all")]
+
     def test_add_ip_exception(self, powerflex_module_mock):
         self.set_module_params(
             powerflex_module_mock,
@@ -536,6 +590,31 @@ class TestPowerflexSDS(PowerFlexUnitBase):
             MockSDSApi.get_sds_exception_response(
                 'add_ip_exception'), powerflex_module_mock, SDSHandler)
 
+    def test_add_ip_serial_fail_fast(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds_ip_list":
+                [
+                    {
+                        "ip": "10.xx.xx.%s" % index,
+                        "role": "sdcOnly"
+                    } for index in range(3)
+                ],
+                "sds_ip_state": "present-in-sds",
+                "max_workers": 1,
+                "state": "present"
+            })
+        powerflex_module_mock.get_sds_details = MagicMock(
+            return_value=MockSDSApi.SDS_GET_LIST[0])
+        powerflex_module_mock.powerflex_conn.sds.add_ip = MagicMock(
+            side_effect=[None, MockApiException, None])
+        self.capture_fail_json_call(
+            MockSDSApi.get_sds_exception_response(
+                'add_ip_exception'), powerflex_module_mock, SDSHandler)
+        assert powerflex_module_mock.powerflex_conn.sds.add_ip.call_count == 2
+
     def test_remove_ip_response(self, powerflex_module_mock):
         self.set_module_params(
             powerflex_module_mock,
@@ -614,6 +693,31 @@ class TestPowerflexSDS(PowerFlexUnitBase):
             powerflex_module_mock, powerflex_module_mock.module.params)
         powerflex_module_mock.powerflex_conn.sds.delete.assert_called()
 
+    def test_delete_sds_wait(self, powerflex_module_mock, mocker):
+        sleep = mocker.patch.object(wait.time, 'sleep')
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                'state': 'absent',
+                'wait': True
+            })
+        powerflex_module_mock.get_sds_details = MagicMock(
+            return_value=MockSDSApi.SDS_GET_LIST[0])
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(
+            side_effect=[MockSDSApi.SDS_GET_LIST, MockSDSApi.SDS_GET_LIST, []])
+        powerflex_module_mock.powerflex_conn.sds.delete = MagicMock(return_value=None)
+        SDSHandler().handle(
+            powerflex_module_mock, powerflex_module_mock.module.params)
+        wait_details = powerflex_module_mock.module.exit_json.call_args[1]['wait_details']
+        assert wait_details['polls'] == 3
+        assert len(wait_details['history']) == 2
+        assert wait_details['history'][0]['progress'] == {
+            'sdsState': 'Normal', 'membershipState': 'Joined',
+            'mdmConnectionState': 'Connected'}
+        assert wait_details['history'][-1]['progress'] is None
+        assert sleep.call_count == 2
+
     def test_delete_fault_set_exception(self, powerflex_module_mock):
         self.set_module_params(
             powerflex_module_mock,
@@ -0,0 +1,287 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for SDS bulk module on PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+# pylint: disable=unused-import
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_sds_bulk_api \
+    import MockSDSBulkApi
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.powerflex_unit_base \
+    import PowerFlexUnitBase
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.fail_json \
+    import FailJsonException, fail_json
+from ansible_collections.dellemc.powerflex.plugins.modules.sds_bulk \
+    import PowerFlexSDSBulk
+
+
+class TestPowerflexSDSBulk(PowerFlexUnitBase):
+
+    get_module_args = MockSDSBulkApi.SDS_BULK_COMMON_ARGS
+
+    @pytest.fixture
+    def module_object(self):
+        return PowerFlexSDSBulk
+
+    def test_create_sds(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1",
+                         protection_domain_name="pd_2", fault_set_name="fs_1",
+                         rmcache_enabled=True, rmcache_size=256,
+                         performance_profile="Compact",
+                         sds_ip_list=[{"ip": "10.0.0.1", "role": "all"}])
+                ]
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockSDSBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockSDSBulkApi.FAULT_SETS)
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.sds.create = MagicMock(
+            side_effect=MockSDSBulkApi.create_sds)
+        powerflex_module_mock.powerflex_conn.sds.set_performance_parameters = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.sds.create.assert_called_once_with(
+            protection_domain_id="pd_id_2",
+            sds_ips=[{"SdsIp": {"ip": "10.0.0.1", "role": "all"}}],
+            name="node_1", rmcache_enabled=True, rmcache_size_in_kb=256 * 1024,
+            fault_set_id="fs_id_2")
+        powerflex_module_mock.powerflex_conn.sds.set_performance_parameters.assert_called_once_with(
+            "node_1_id", "Compact")
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['sds'][0]['actions'] == ['create', 'performance_profile']
+        assert result['summary']['created'] == 1
+
+    def test_create_sds_check_mode(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1",
+                         protection_domain_id="pd_id_1",
+                         sds_ip_list=[{"ip": "10.0.0.1", "role": "all"}])
+                ]
+            })
+        powerflex_module_mock.module.check_mode = True
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockSDSBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.sds.create = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.sds.create.assert_not_called()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+
+    def test_sds_idempotent(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1",
+                         protection_domain_name="pd_1", fault_set_id="fs_id_1",
+                         rfcache_enabled=True, performance_profile="HighPerformance",
+                         sds_ip_list=[{"ip": "10.0.0.1", "role": "all"}]),
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_2", state="absent")
+                ]
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockSDSBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockSDSBulkApi.FAULT_SETS)
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockSDSBulkApi.SDS_LIST[:1])
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.sds.get.assert_called_once_with()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is False
+        assert result['summary']['unchanged'] == 2
+
+    def test_modify_sds(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1",
+                         rfcache_enabled=False, rmcache_enabled=True,
+                         rmcache_size=256,
+                         sds_ip_list=[{"ip": "10.0.0.1", "role": "sdsOnly"},
+                                      {"ip": "10.0.1.1", "role": "sdcOnly"}]),
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_2",
+                         sds_ip_state="absent-in-sds",
+                         sds_ip_list=[{"ip": "10.0.1.2", "role": "sdcOnly"}]),
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_3", state="absent")
+                ],
+                "max_workers": 3
+            })
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockSDSBulkApi.SDS_LIST)
+        powerflex_module_mock.powerflex_conn.sds.set_rfcache_enabled = MagicMock()
+        powerflex_module_mock.powerflex_conn.sds.set_rmcache_enabled = MagicMock()
+        powerflex_module_mock.powerflex_conn.sds.set_rmcache_size = MagicMock()
+        powerflex_module_mock.powerflex_conn.sds.add_ip = MagicMock()
+        powerflex_module_mock.powerflex_conn.sds.set_ip_role = MagicMock()
+        powerflex_module_mock.powerflex_conn.sds.remove_ip = MagicMock()
+        powerflex_module_mock.powerflex_conn.sds.delete = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.sds.set_rfcache_enabled.assert_called_once_with("sds_id_1", False)
+        powerflex_module_mock.powerflex_conn.sds.set_rmcache_enabled.assert_called_once_with("sds_id_1", True)
+        powerflex_module_mock.powerflex_conn.sds.set_rmcache_size.assert_called_once_with("sds_id_1", 256)
+        powerflex_module_mock.powerflex_conn.sds.add_ip.assert_called_once_with(
+            sds_id="sds_id_1", sds_ip={"ip": "10.0.1.1", "role": "sdcOnly"})
+        powerflex_module_mock.powerflex_conn.sds.set_ip_role.assert_called_once_with(
+            "sds_id_1", "10.0.0.1", "sdsOnly")
+        powerflex_module_mock.powerflex_conn.sds.remove_ip.assert_called_once_with(
+            sds_id="sds_id_2", ip="10.0.1.2")
+        powerflex_module_mock.powerflex_conn.sds.delete.assert_called_once_with("sds_id_3")
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['sds'][0]['actions'] == [
+            'rfcache', 'rmcache', 'rmcache_size', 'add_ip', 'ip_role']
+        assert result['summary'] == dict(total=3, created=0, modified=2,
+                                         deleted=1, unchanged=0, failed=0)
+
+    def test_sds_fleet_fetched_once(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_%s" % index,
+                         protection_domain_name="pd_1", fault_set_name="fs_1",
+                         sds_ip_list=[{"ip": "10.0.0.%s" % index, "role": "all"}])
+                    for index in range(100)
+                ],
+                "max_workers": 8
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockSDSBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockSDSBulkApi.FAULT_SETS)
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.sds.create = MagicMock(
+            side_effect=MockSDSBulkApi.create_sds)
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.protection_domain.get.assert_called_once_with()
+        powerflex_module_mock.powerflex_conn.fault_set.get.assert_called_once_with()
+        powerflex_module_mock.powerflex_conn.sds.get.assert_called_once_with()
+        assert powerflex_module_mock.powerflex_conn.sds.create.call_count == 100
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['summary']['created'] == 100
+
+    def test_sds_spec_errors(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1",
+                         protection_domain_name="pd_2"),
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_2",
+                         protection_domain_id="pd_id_1",
+                         sds_ip_list=[{"ip": "10.0.0.2", "role": "all"}]),
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_3",
+                         protection_domain_id="pd_id_1",
+                         sds_ip_list=[{"ip": "10.0.0.3", "role": "all"}])
+                ],
+                "max_workers": 2
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockSDSBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockSDSBulkApi.SDS_LIST[:1])
+
+        def create(**kwargs):
+            if kwargs['name'] == "node_3":
+                raise MockApiException()
+            return MockSDSBulkApi.create_sds(**kwargs)
+
+        powerflex_module_mock.powerflex_conn.sds.create = MagicMock(side_effect=create)
+        powerflex_module_mock.module.fail_json = MagicMock(
+            side_effect=fail_json)
+        with pytest.raises(FailJsonException):
+            powerflex_module_mock.perform_module_operation()
+        result = powerflex_module_mock.module.fail_json.call_args[1]
+        assert MockSDSBulkApi.get_failed_msgs('move') in \
+            result['sds'][0]['error']
+        assert [item['changed'] for item in result['sds']] == \
+            [False, True, False]
+        assert result['summary']['failed'] == 2
+        assert "Failed to apply 2 of 3 SDS specs" in result['msg']
+
+    @pytest.mark.parametrize("spec, response_type", [
+        ({"sds_name": "node_1", "protection_domain_name": "pd_1"},
+         'create_params'),
+        ({"sds_name": "node_1", "protection_domain_name": "pd_2",
+          "fault_set_id": "fs_id_1"}, 'fault_set'),
+    ])
+    def test_sds_spec_error_messages(self, powerflex_module_mock, spec,
+                                     response_type):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [dict(MockSDSBulkApi.SDS_SPEC, **spec)]
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockSDSBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.fault_set.get = MagicMock(
+            return_value=MockSDSBulkApi.FAULT_SETS)
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(return_value=[])
+        self.capture_fail_json_call(
+            MockSDSBulkApi.get_failed_msgs(response_type),
+            powerflex_module_mock, invoke_perform_module=True)
+
+    def test_rmcache_size_disabled(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1",
+                             rmcache_size=256)]
+            })
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(
+            return_value=MockSDSBulkApi.SDS_LIST[:1])
+        self.capture_fail_json_call(
+            MockSDSBulkApi.get_failed_msgs('rmcache_size'),
+            powerflex_module_mock, invoke_perform_module=True)
+
+    def test_duplicate_sds_specs(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1"),
+                    dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1")
+                ]
+            })
+        self.capture_fail_json_call(
+            MockSDSBulkApi.get_failed_msgs('duplicate'),
+            powerflex_module_mock, invoke_perform_module=True)
+
+    def test_get_sds_exception(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "sds": [dict(MockSDSBulkApi.SDS_SPEC, sds_name="node_1")]
+            })
+        powerflex_module_mock.powerflex_conn.sds.get = MagicMock(side_effect=MockApiException)
+        self.capture_fail_json_call(
+            MockSDSBulkApi.get_failed_msgs('get_sds'),
+            powerflex_module_mock, invoke_perform_module=True)
@@ -0,0 +1,171 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for snapshot module on PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+# pylint: disable=unused-import
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_snapshot_api \
+    import MockSnapshotApi
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.powerflex_unit_base \
+    import PowerFlexUnitBase
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.fail_json \
+    import FailJsonException
+from ansible_collections.dellemc.powerflex.plugins.modules.snapshot \
+    import PowerFlexSnapshot
+
+
+class TestPowerflexSnapshot(PowerFlexUnitBase):
+
+    get_module_args = MockSnapshotApi.SNAPSHOT_COMMON_ARGS
+
+    VOLUMES = [
+        MockSnapshotApi.get_volume("vol_1", "vol_id_1"),
+        MockSnapshotApi.get_volume("vol_2", "vol_id_2"),
+        MockSnapshotApi.get_volume("db_vol_1", "vol_id_3")
+    ]
+
+    @pytest.fixture
+    def module_object(self):
+        return PowerFlexSnapshot
+
+    def mock_gateway(self, powerflex_module_mock, volumes):
+        conn = powerflex_module_mock.powerflex_conn = MagicMock()
+        created = []
+
+        def snapshot_volumes(system_id, snapshot_defs, **kwargs):
+            for snapshot_def in snapshot_defs:
+                created.append(MockSnapshotApi.get_volume(
+                    snapshot_def['snapshotName'],
+                    snapshot_def['snapshotName'] + "_id",
+                    snapshot_def['volumeId']))
+            return {"snapshotGroupId": "group_%s" % len(created),
+                    "volumeIdList": [snapshot_def['snapshotName'] + "_id"
+                                     for snapshot_def in snapshot_defs]}
+
+        conn.system.get = MagicMock(return_value=MockSnapshotApi.SYSTEMS)
+        conn.storage_pool.get = MagicMock(
+            return_value=MockSnapshotApi.STORAGE_POOLS)
+        conn.volume.get = MagicMock(
+            side_effect=lambda **kwargs: volumes + created)
+        conn.system.snapshot_volumes = MagicMock(side_effect=snapshot_volumes)
+        return conn
+
+    def test_create_consistent_snapshots(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock, self.get_module_args,
+            {"snapshot_name": "_snap", "read_only": True,
+             "desired_retention": 2, "retention_unit": "days",
+             "volumes": [
+                 MockSnapshotApi.get_volume_entry(vol_name="vol_1"),
+                 MockSnapshotApi.get_volume_entry(vol_id="vol_id_2",
+                                                  snapshot_name="snap_2")]})
+        conn = self.mock_gateway(powerflex_module_mock, list(self.VOLUMES))
+        powerflex_module_mock.perform_module_operation()
+        conn.system.snapshot_volumes.assert_called_once_with(
+            system_id="system_id_1",
+            snapshot_defs=[{"volumeId": "vol_id_1", "snapshotName": "vol_1_snap"},
+                           {"volumeId": "vol_id_2", "snapshotName": "snap_2"}],
+            access_mode="ReadOnly", retention_period=2 * 24 * 60)
+        assert conn.volume.get.call_count == 2
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert result['snapshot_group_ids'] == ["group_2"]
+        assert [snapshot['id'] for snapshot in result['snapshots_details']] == \
+            ["vol_1_snap_id", "snap_2_id"]
+        assert result['snapshots_details'][1]['ancestorVolumeName'] == "vol_2"
+        assert result['snapshots_details'][1]['storagePoolName'] == "pool_1"
+
+    def test_create_snapshots_by_pattern(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock, self.get_module_args,
+            {"snapshot_name": "_snap", "vol_name_pattern": "vol_[0-9]+"})
+        volumes = list(self.VOLUMES) + [
+            MockSnapshotApi.get_volume("vol_9", "snap_id_9", "vol_id_1")]
+        conn = self.mock_gateway(powerflex_module_mock, volumes)
+        powerflex_module_mock.perform_module_operation()
+        snapshot_defs = conn.system.snapshot_volumes.call_args[1]['snapshot_defs']
+        assert [snapshot_def['volumeId'] for snapshot_def in snapshot_defs] == \
+            ["vol_id_1", "vol_id_2"]
+        assert conn.system.snapshot_volumes.call_args[1]['retention_period'] == 0
+
+    def test_create_snapshots_idempotent(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock, self.get_module_args,
+            {"snapshot_name": "_snap", "vol_name_pattern": "vol_.*"})
+        volumes = list(self.VOLUMES) + [
+            MockSnapshotApi.get_volume("vol_1_snap", "snap_id_1", "vol_id_1"),
+            MockSnapshotApi.get_volume("vol_2_snap", "snap_id_2", "vol_id_2")]
+        conn = self.mock_gateway(powerflex_module_mock, volumes)
+        powerflex_module_mock.perform_module_operation()
+        conn.system.snapshot_volumes.assert_not_called()
+        conn.volume.get.assert_called_once_with()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is False
+        assert [snapshot['id'] for snapshot in result['snapshots_details']] == \
+            ["snap_id_1", "snap_id_2"]
+
+    def test_create_snapshots_not_consistent(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock, self.get_module_args,
+            {"snapshot_name": "_snap", "consistent": False, "max_workers": 2,
+             "volumes": [MockSnapshotApi.get_volume_entry(vol_name=name)
+                         for name in ("vol_1", "vol_2", "db_vol_1")]})
+        conn = self.mock_gateway(powerflex_module_mock, list(self.VOLUMES))
+        snapshot_volumes = conn.system.snapshot_volumes.side_effect
+
+        def fail_vol_2(system_id, snapshot_defs, **kwargs):
+            if snapshot_defs[0]['volumeId'] == "vol_id_2":
+                raise MockApiException()
+            return snapshot_volumes(system_id, snapshot_defs, **kwargs)
+
+        def raise_failure(msg, **kwargs):
+            raise FailJsonException(msg)
+
+        conn.system.snapshot_volumes = MagicMock(side_effect=fail_vol_2)
+        powerflex_module_mock.module.fail_json = MagicMock(
+            side_effect=raise_failure)
+        with pytest.raises(FailJsonException):
+            powerflex_module_mock.perform_module_operation()
+        assert conn.system.snapshot_volumes.call_count == 3
+        result = powerflex_module_mock.module.fail_json.call_args[1]
+        assert MockSnapshotApi.get_failed_msgs('create') in result['msg']
+        assert result['changed'] is True
+        assert len(result['snapshot_group_ids']) == 2
+        assert sorted(snapshot['name'] for snapshot in
+                      result['snapshots_details']) == \
+            ["db_vol_1_snap", "vol_1_snap"]
+
+    @pytest.mark.parametrize("params, response_type", [
+        ({"snapshot_name": "_snap", "volumes": [
+            MockSnapshotApi.get_volume_entry(vol_name="vol_x")]}, 'not_found'),
+        ({"volumes": [
+            MockSnapshotApi.get_volume_entry(vol_name="vol_1",
+                                             snapshot_name="snap_1"),
+            MockSnapshotApi.get_volume_entry(vol_name="vol_2",
+                                             snapshot_name="snap_1")]},
+         'duplicate'),
+        ({"snapshot_name": "_snap", "vol_name_pattern": "vol_("},
+         'invalid_pattern'),
+        ({"snapshot_name": "_snap", "vol_name_pattern": "vol_1",
+          "state": "absent"}, 'state_absent'),
+        ({"snapshot_name": "_snap", "vol_name_pattern": "vol_1"}, 'conflict')
+    ])
+    def test_create_snapshots_errors(self, powerflex_module_mock, params,
+                                     response_type):
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               params)
+        self.mock_gateway(powerflex_module_mock, list(self.VOLUMES) + [
+            MockSnapshotApi.get_volume("vol_1_snap", "vol_id_4")])
+        self.capture_fail_json_call(
+            MockSnapshotApi.get_failed_msgs(response_type),
+            powerflex_module_mock, invoke_perform_module=True)
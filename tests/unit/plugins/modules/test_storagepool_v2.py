@@ -17,6 +17,10 @@ from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libra
     import PowerFlexUnitBase
 from ansible_collections.dellemc.powerflex.plugins.modules.storagepool_v2 \
     import PowerFlexStoragePoolV2
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries \
+    import wait
+from ansible_collections.dellemc.powerflex.plugins.module_utils.storage.dell.libraries.lookup_cache \
+    import LookupCache, bind_lookup_cache
 from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_storagepool_api_v2 import \
     MockStoragePoolV2Api
 
@@ -583,6 +587,68 @@ class TestPowerflexStoragePoolV2(PowerFlexUnitBase):
                 module_mock=powerflex_module_mock,
                 invoke_perform_module=True)
 
+    def test_delete_storagepool_wait(self, powerflex_module_mock, mocker):
+        sleep = mocker.patch.object(wait.time, 'sleep')
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "storage_pool_name": "test_pool",
+                "state": "absent",
+                "wait": True
+            })
+        powerflex_module_mock.powerflex_conn.storage_pool.get_by_name = MagicMock(
+            return_value=MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL)
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockStoragePoolV2Api.PROTECTION_DOMAIN['protection_domain'])
+        powerflex_module_mock.powerflex_conn.device_group.get = MagicMock(
+            return_value=MockStoragePoolV2Api.DEVICE_GROUP['device_group'])
+        powerflex_module_mock.powerflex_conn.storage_pool.update = MagicMock(
+            return_value=(False, MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL))
+        powerflex_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockStoragePoolV2Api.STORAGE_POOL_STATISTICS)
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            side_effect=[[MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL], []])
+        powerflex_module_mock.powerflex_conn.storage_pool.delete = MagicMock(return_value=None)
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.storage_pool.delete.assert_called()
+        wait_details = powerflex_module_mock.module.exit_json.call_args_list[0][1]['wait_details']
+        assert wait_details['polls'] == 2
+        assert [entry['progress'] for entry in wait_details['history']] == [{}, None]
+        assert sleep.call_count == 1
+
+    def test_delete_storagepool_wait_lookup_cache(self, powerflex_module_mock, mocker):
+        mocker.patch.object(wait.time, 'sleep')
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "storage_pool_name": "test_pool",
+                "state": "absent",
+                "wait": True
+            })
+        storage_pool = MagicMock()
+        storage_pool.get_by_name = MagicMock(
+            return_value=MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL)
+        storage_pool.get = MagicMock(
+            side_effect=[[MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL],
+                         [MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL], []])
+        storage_pool.delete = MagicMock(return_value=None)
+        storage_pool.update = MagicMock(
+            return_value=(False, MockStoragePoolV2Api.STORAGE_POOL_GET_DETAIL))
+        bind_lookup_cache('storage_pool', storage_pool, LookupCache())
+        powerflex_module_mock.powerflex_conn.storage_pool = storage_pool
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockStoragePoolV2Api.PROTECTION_DOMAIN['protection_domain'])
+        powerflex_module_mock.powerflex_conn.device_group.get = MagicMock(
+            return_value=MockStoragePoolV2Api.DEVICE_GROUP['device_group'])
+        powerflex_module_mock.powerflex_conn.utility.query_metrics = MagicMock(
+            return_value=MockStoragePoolV2Api.STORAGE_POOL_STATISTICS)
+        powerflex_module_mock.perform_module_operation()
+        wait_details = powerflex_module_mock.module.exit_json.call_args_list[0][1]['wait_details']
+        assert wait_details['polls'] == 3
+        assert storage_pool._uncached_get.call_count == 3
+
     def test_delete_storagepool(self, powerflex_module_mock):
         self.set_module_params(
             powerflex_module_mock,
@@ -38,6 +38,7 @@ utils.PowerFlexClient = MagicMock()
 from ansible.module_utils import basic
 
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 from ansible_collections.dellemc.powerflex.plugins.modules.thin_clone import (
     PowerFlexThinClone,
 )
@@ -28,6 +28,7 @@ utils.PowerFlexClient = MagicMock()
 
 from ansible.module_utils import basic
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 from ansible_collections.dellemc.powerflex.plugins.modules.volume import PowerFlexVolume
 
 
@@ -269,6 +270,15 @@ class TestPowerflexVolume(PowerFlexUnitBase):
             sdc_id
         )
 
+    def test_get_sdc_id_single_query(self, powerflex_module_mock):
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeApi.get_sdc_list(3)
+        )
+        assert powerflex_module_mock.get_sdc_id(sdc_name="sdc_1") == "sdc_id_1"
+        assert powerflex_module_mock.get_sdc_id(sdc_ip="10.0.0.2") == "sdc_id_2"
+        assert powerflex_module_mock.get_sdc_id(sdc_id="sdc_id_0") == "sdc_id_0"
+        powerflex_module_mock.powerflex_conn.sdc.get.assert_called_once_with()
+
     def test_create_volume_error_vol_name(self, powerflex_module_mock):
         self.capture_fail_json_call(
             MockVolumeApi.get_exception_response(
@@ -332,6 +342,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert ret is True
 
     def test_modify_access_mode_true(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         access_mode_list = [{"accessMode": "READ_ONLY", "sdc_id": "sdc_id"}]
         powerflex_module_mock.powerflex_conn.volume.set_access_mode_for_sdc = MagicMock(
             return_value=None
@@ -341,6 +352,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert ret is True
 
     def test_modify_access_mode_false(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         access_mode_list = [{"accessMode": None, "sdc_id": "sdc_id"}]
         powerflex_module_mock.powerflex_conn.volume.set_access_mode_for_sdc = MagicMock(
             return_value=None
@@ -350,6 +362,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert ret is False
 
     def test_modify_access_mode_exception(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         access_mode_list = [{"accessMode": "READ_ONLY", "sdc_id": "sdc_id"}]
         powerflex_module_mock.powerflex_conn.volume.set_access_mode_for_sdc = MagicMock(
             side_effect=MockApiException
@@ -419,6 +432,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         )
 
     def test_unmap_volume_from_sdc_true(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         volume = {"mappedSdcInfo": [{"sdcId": "sdc_id"}], "id": "vol_id"}
         sdc = [{"sdc_name": "sdc_name"}]
         powerflex_module_mock.get_sdc_id = MagicMock(
@@ -443,6 +457,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert ret is False
 
     def test_unmap_volume_from_sdc_exception(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         volume = {"mappedSdcInfo": [{"sdcId": "sdc_id"}], "id": "vol_id"}
         sdc = [{"sdc_id": "sdc_id"}]
         powerflex_module_mock.get_sdc_id = MagicMock(
@@ -480,6 +495,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert sdc_modify_list2[0]["sdc_id"] == "sdc_id"
 
     def test_map_volume_to_sdc_ip(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         volume = {
             "mappedSdcInfo": [
                 {"sdcId": "sdc_id", "accessMode": "READ_WRITE",
@@ -504,6 +520,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert sdc_modify_list2 == []
 
     def test_map_volume_to_sdc_id(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         volume = {
             "mappedSdcInfo": [
                 {"sdcId": "sdc_id", "accessMode": "READ_WRITE",
@@ -527,6 +544,7 @@ class TestPowerflexVolume(PowerFlexUnitBase):
         assert sdc_modify_list2 == []
 
     def test_map_volume_to_sdc_exception(self, powerflex_module_mock):
+        powerflex_module_mock.module.params = self.get_module_args
         volume = {
             "mappedSdcInfo": [
                 {"sdcId": "sdc_id", "accessMode": "READ_WRITE",
@@ -555,6 +573,70 @@ class TestPowerflexVolume(PowerFlexUnitBase):
             sdc
         )
 
+    def test_map_volume_to_sdc_bulk(self, powerflex_module_mock):
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"max_workers": 8})
+        sdc_list = MockVolumeApi.get_sdc_list(64)
+        volume = {
+            "mappedSdcInfo": [
+                {"sdcId": "sdc_id_0", "accessMode": "ReadWrite",
+                 "limitIops": 0, "limitBwInMbps": 0}],
+            "id": "vol_id",
+            "name": "name"
+        }
+        sdc = [{"sdc_name": item["name"], "access_mode": "READ_WRITE",
+                "iops_limit": 0, "bandwidth_limit": 0} for item in sdc_list]
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=sdc_list
+        )
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc = MagicMock(
+            return_value=None
+        )
+        ret, sdc_modify_list1, sdc_modify_list2 = powerflex_module_mock.map_volume_to_sdc(
+            volume, sdc)
+        assert ret is True
+        assert sdc_modify_list1 == [] and sdc_modify_list2 == []
+        powerflex_module_mock.powerflex_conn.sdc.get.assert_called_once_with()
+        mapped_ids = sorted(call[1]["sdc_id"] for call in
+                            powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.call_args_list)
+        assert mapped_ids == sorted(item["id"] for item in sdc_list[1:])
+
+    def test_map_volume_to_sdc_bulk_errors(self, powerflex_module_mock):
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"max_workers": 4})
+        volume = {"mappedSdcInfo": [], "id": "vol_id", "name": "name"}
+        sdc = [{"sdc_id": "sdc_id_%s" % index, "access_mode": "READ_WRITE"}
+               for index in range(3)]
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeApi.get_sdc_list(3)
+        )
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc = MagicMock(
+            side_effect=[None, MockApiException, MockApiException]
+        )
+        powerflex_module_mock.module.fail_json = fail_json
+        with pytest.raises(FailJsonException) as fail:
+            powerflex_module_mock.map_volume_to_sdc(volume, sdc)
+        assert fail.value.message.count("Mapping volume name to SDC") == 2
+        assert powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.call_count == 3
+
+    def test_map_volume_to_sdc_serial_fail_fast(self, powerflex_module_mock):
+        self.set_module_params(powerflex_module_mock, self.get_module_args,
+                               {"max_workers": 1})
+        volume = {"mappedSdcInfo": [], "id": "vol_id", "name": "name"}
+        sdc = [{"sdc_id": "sdc_id_%s" % index, "access_mode": "READ_WRITE"}
+               for index in range(3)]
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeApi.get_sdc_list(3)
+        )
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc = MagicMock(
+            side_effect=[None, MockApiException, None]
+        )
+        powerflex_module_mock.module.fail_json = fail_json
+        with pytest.raises(FailJsonException) as fail:
+            powerflex_module_mock.map_volume_to_sdc(volume, sdc)
+        assert fail.value.message.count("Mapping volume name to SDC") == 1
+        assert powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.call_count == 2
+
     @pytest.mark.parametrize('params', [
         {"sdc": [{"sdc_id": "sdc_id", "sdc_name": "sdc_name", "sdc_ip": "sdc_ip"}],
          "assert_msg": "val_params_err1"},
@@ -0,0 +1,306 @@
+# Copyright: (c) 2026, Dell Technologies
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Unit Tests for volume bulk module on PowerFlex"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+# pylint: disable=unused-import
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries import initial_mock
+from mock.mock import MagicMock
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_volume_bulk_api \
+    import MockVolumeBulkApi
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.mock_api_exception \
+    import MockApiException
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.powerflex_unit_base \
+    import PowerFlexUnitBase
+from ansible_collections.dellemc.powerflex.tests.unit.plugins.module_utils.libraries.fail_json \
+    import FailJsonException, fail_json
+from ansible_collections.dellemc.powerflex.plugins.modules.volume_bulk \
+    import PowerFlexVolumeBulk
+
+
+class TestPowerflexVolumeBulk(PowerFlexUnitBase):
+
+    get_module_args = MockVolumeBulkApi.VOLUME_BULK_COMMON_ARGS
+
+    @pytest.fixture
+    def module_object(self):
+        return PowerFlexVolumeBulk
+
+    def test_create_and_map_volumes(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1",
+                         storage_pool_name="pool_1", protection_domain_name="pd_1",
+                         size=16, snapshot_policy_name="snap_pol_1",
+                         sdc=[{"sdc_name": "sdc_1", "sdc_ip": None, "sdc_id": None,
+                               "access_mode": None},
+                              {"sdc_name": None, "sdc_ip": "10.0.0.2", "sdc_id": None,
+                               "access_mode": "READ_ONLY"}]),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_2",
+                         storage_pool_id="sp_id_2", size=1, cap_unit="TB",
+                         vol_type="THIN_PROVISIONED")
+                ]
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockVolumeBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockVolumeBulkApi.STORAGE_POOLS)
+        powerflex_module_mock.powerflex_conn.snapshot_policy.get = MagicMock(
+            return_value=MockVolumeBulkApi.SNAPSHOT_POLICIES)
+        powerflex_module_mock.powerflex_conn.snapshot_policy.add_source_volume = MagicMock()
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeBulkApi.SDCS)
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.volume.create = MagicMock(
+            side_effect=MockVolumeBulkApi.create_volume)
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.volume.create.assert_any_call(
+            storage_pool_id="sp_id_1", size_in_gb=16, name="vol_1",
+            volume_type=None, use_rmcache=None, compression_method=None)
+        powerflex_module_mock.powerflex_conn.volume.create.assert_any_call(
+            storage_pool_id="sp_id_2", size_in_gb=1024, name="vol_2",
+            volume_type="ThinProvisioned", use_rmcache=None,
+            compression_method=None)
+        powerflex_module_mock.powerflex_conn.snapshot_policy.add_source_volume.assert_called_once_with(
+            "snap_pol_id_1", "vol_1_id")
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.assert_any_call(
+            volume_id="vol_1_id", sdc_id="sdc_id_2", access_mode="ReadOnly",
+            allow_multiple_mappings=None)
+        assert powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.call_count == 2
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert result['volumes'][0]['actions'] == ['create', 'snapshot_policy', 'map']
+        assert result['summary']['created'] == 2
+
+    def test_create_volumes_check_mode(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1",
+                         storage_pool_id="sp_id_1", size=16)
+                ]
+            })
+        powerflex_module_mock.module.check_mode = True
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockVolumeBulkApi.STORAGE_POOLS)
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.volume.create = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.volume.create.assert_not_called()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is True
+        assert result['volumes'][0]['actions'] == ['create']
+
+    def test_volumes_idempotent(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1",
+                         storage_pool_name="pool_1", protection_domain_id="pd_id_1",
+                         size=16,
+                         sdc=[{"sdc_name": "sdc_1", "sdc_ip": None, "sdc_id": None,
+                               "access_mode": "READ_WRITE"}]),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_2",
+                         vol_new_name="vol_2_renamed")
+                ]
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockVolumeBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockVolumeBulkApi.STORAGE_POOLS)
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeBulkApi.SDCS)
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockVolumeBulkApi.VOLUMES)
+        powerflex_module_mock.powerflex_conn.volume.create = MagicMock()
+        powerflex_module_mock.powerflex_conn.volume.rename = MagicMock()
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.volume.get.assert_called_once_with()
+        powerflex_module_mock.powerflex_conn.volume.create.assert_not_called()
+        powerflex_module_mock.powerflex_conn.volume.rename.assert_not_called()
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.assert_not_called()
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['changed'] is False
+        assert result['volumes'][1]['id'] == "vol_id_2"
+        assert result['summary']['unchanged'] == 2
+
+    def test_modify_volumes(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1",
+                         vol_new_name="vol_1_renamed", size=32, use_rmcache=True,
+                         compression_type="NORMAL",
+                         sdc=[{"sdc_name": None, "sdc_ip": None, "sdc_id": "sdc_id_1",
+                               "access_mode": "NO_ACCESS"}])
+                ]
+            })
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockVolumeBulkApi.STORAGE_POOLS)
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeBulkApi.SDCS)
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockVolumeBulkApi.VOLUMES[:1])
+        powerflex_module_mock.powerflex_conn.volume.rename = MagicMock()
+        powerflex_module_mock.powerflex_conn.volume.extend = MagicMock()
+        powerflex_module_mock.powerflex_conn.volume.set_use_rmcache = MagicMock()
+        powerflex_module_mock.powerflex_conn.volume.set_compression_method = MagicMock()
+        powerflex_module_mock.powerflex_conn.volume.set_access_mode_for_sdc = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.volume.rename.assert_called_once_with(
+            "vol_id_1", "vol_1_renamed")
+        powerflex_module_mock.powerflex_conn.volume.extend.assert_called_once_with("vol_id_1", 32)
+        powerflex_module_mock.powerflex_conn.volume.set_use_rmcache.assert_called_once_with(
+            "vol_id_1", True)
+        powerflex_module_mock.powerflex_conn.volume.set_compression_method.assert_called_once_with(
+            "vol_id_1", "Normal")
+        powerflex_module_mock.powerflex_conn.volume.set_access_mode_for_sdc.assert_called_once_with(
+            volume_id="vol_id_1", sdc_id="sdc_id_1", access_mode="NoAccess")
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['volumes'][0]['actions'] == [
+            'rename', 'extend', 'use_rmcache', 'compression', 'access_mode']
+        assert result['summary']['modified'] == 1
+
+    def test_delete_volumes(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1", state="absent"),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_2", state="absent")
+                ],
+                "delete_snapshots": True
+            })
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockVolumeBulkApi.VOLUMES[:1])
+        powerflex_module_mock.powerflex_conn.volume.delete = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.volume.delete.assert_called_once_with(
+            "vol_id_1", "INCLUDING_DESCENDANTS")
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['summary'] == dict(total=2, created=0, modified=0,
+                                         deleted=1, unchanged=1, failed=0)
+
+    def test_bulk_volumes_resolved_once(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_%s" % index,
+                         storage_pool_name="pool_1", protection_domain_name="pd_2",
+                         size=8,
+                         sdc=[{"sdc_name": "sdc_%s" % (index % 2 + 1), "sdc_ip": None,
+                               "sdc_id": None, "access_mode": None}])
+                    for index in range(64)
+                ],
+                "max_workers": 8
+            })
+        powerflex_module_mock.powerflex_conn.protection_domain.get = MagicMock(
+            return_value=MockVolumeBulkApi.PROTECTION_DOMAINS)
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockVolumeBulkApi.STORAGE_POOLS)
+        powerflex_module_mock.powerflex_conn.sdc.get = MagicMock(
+            return_value=MockVolumeBulkApi.SDCS)
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(return_value=[])
+        powerflex_module_mock.powerflex_conn.volume.create = MagicMock(
+            side_effect=MockVolumeBulkApi.create_volume)
+        powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc = MagicMock()
+        powerflex_module_mock.perform_module_operation()
+        powerflex_module_mock.powerflex_conn.protection_domain.get.assert_called_once_with()
+        powerflex_module_mock.powerflex_conn.storage_pool.get.assert_called_once_with()
+        powerflex_module_mock.powerflex_conn.sdc.get.assert_called_once_with()
+        powerflex_module_mock.powerflex_conn.volume.get.assert_called_once_with()
+        assert powerflex_module_mock.powerflex_conn.volume.create.call_count == 64
+        assert powerflex_module_mock.powerflex_conn.volume.add_mapped_sdc.call_count == 64
+        result = powerflex_module_mock.module.exit_json.call_args[1]
+        assert result['summary']['created'] == 64
+
+    def test_volume_spec_errors(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1", size=8),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_2",
+                         storage_pool_name="pool_x", size=8),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_3",
+                         storage_pool_id="sp_id_1", size=8),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_4",
+                         storage_pool_id="sp_id_1", size=8)
+                ],
+                "max_workers": 2
+            })
+        powerflex_module_mock.powerflex_conn.storage_pool.get = MagicMock(
+            return_value=MockVolumeBulkApi.STORAGE_POOLS)
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(
+            return_value=MockVolumeBulkApi.VOLUMES[:1])
+
+        def create(**kwargs):
+            if kwargs['name'] == "vol_4":
+                raise MockApiException()
+            return MockVolumeBulkApi.create_volume(**kwargs)
+
+        powerflex_module_mock.powerflex_conn.volume.create = MagicMock(
+            side_effect=create)
+        powerflex_module_mock.module.fail_json = MagicMock(
+            side_effect=fail_json)
+        with pytest.raises(FailJsonException):
+            powerflex_module_mock.perform_module_operation()
+        result = powerflex_module_mock.module.fail_json.call_args[1]
+        assert MockVolumeBulkApi.get_failed_msgs('shrink') in \
+            result['volumes'][0]['error']
+        assert MockVolumeBulkApi.get_failed_msgs('pool_not_found') in \
+            result['volumes'][1]['error']
+        assert [volume['changed'] for volume in result['volumes']] == \
+            [False, False, True, False]
+        assert result['summary']['failed'] == 3
+        assert result['summary']['created'] == 1
+        assert result['changed'] is True
+        assert "Failed to apply 3 of 4 volume specs" in result['msg']
+
+    def test_duplicate_volume_specs(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1"),
+                    dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1")
+                ]
+            })
+        self.capture_fail_json_call(
+            MockVolumeBulkApi.get_failed_msgs('duplicate'),
+            powerflex_module_mock, invoke_perform_module=True)
+
+    def test_get_volumes_exception(self, powerflex_module_mock):
+        self.set_module_params(
+            powerflex_module_mock,
+            self.get_module_args,
+            {
+                "volumes": [dict(MockVolumeBulkApi.VOLUME_SPEC, vol_name="vol_1")]
+            })
+        powerflex_module_mock.powerflex_conn.volume.get = MagicMock(
+            side_effect=MockApiException)
+        self.capture_fail_json_call(
+            MockVolumeBulkApi.get_failed_msgs('get_volumes'),
+            powerflex_module_mock, invoke_perform_module=True)
@@ -34,6 +34,7 @@ utils.PowerFlexClient = MagicMock()
 from ansible.module_utils import basic
 
 basic.AnsibleModule = MagicMock()
+basic.AnsibleModule.return_value.params = {}
 from ansible_collections.dellemc.powerflex.plugins.modules.volume_v2 import (
     PowerFlexVolumeV2,
 )